@@ -59,6 +59,10 @@ class ADHDFramework:
             'up': self.update_module,
         }
 
+        if getattr(args, 'rescan', False):
+            from modules_controller_core import ModulesController
+            ModulesController().scan_all_modules(rescan=True)
+
         handler = command_map.get(args.command)
         if handler:
             handler(args)
@@ -108,11 +112,21 @@ class ADHDFramework:
     def refresh_project(self, args) -> None:
         from modules_controller_core import ModulesController
         try:
-            ModulesController().refresh(
+            controller = ModulesController()
+            controller.refresh(
                 module_name=getattr(args, 'module', None),
                 skip_sync=getattr(args, 'no_sync', False),
                 full=getattr(args, 'full', False),
+                jobs=getattr(args, 'jobs', 1),
+                inprocess=getattr(args, 'inprocess', False),
+                force=getattr(args, 'force', False),
+                profile=getattr(args, 'profile', False),
             )
+            if getattr(args, 'watch', False):
+                controller.watch_refresh(
+                    full=getattr(args, 'full', False),
+                    inprocess=getattr(args, 'inprocess', False),
+                )
         except ADHDError as e:
             self.logger.error(f"\u274c {e}")
             sys.exit(1)
@@ -239,13 +253,8 @@ class ADHDFramework:
 
         print(f"\n\U0001f50d Checking layer violations across {len(report.modules)} modules...\n")
 
-        results = []
-        for module in report.modules:
-            try:
-                closure = walker.walk_dependencies(module.name)
-                results.append((module.name, closure))
-            except Exception as e:
-                self.logger.warning(f"\u26a0\ufe0f  Could not check {module.name}: {e}")
+        closures = walker.analyze_all()
+        results = [(module.name, closures[module.name]) for module in report.modules]
 
         print(format_all_violations(results, len(report.modules)))
 
@@ -426,6 +435,8 @@ def setup_parser() -> argparse.ArgumentParser:
         description="ADHD Framework CLI - AI-Driven High-speed Development Framework",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
+    parser.add_argument('--rescan', action='store_true',
+                        help='Ignore the cached module index and re-parse every pyproject.toml')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
     subparsers.add_parser('create-project', aliases=['cp'], help='Create a new ADHD project')
@@ -439,6 +450,16 @@ def setup_parser() -> argparse.ArgumentParser:
     refresh_parser = subparsers.add_parser('refresh', aliases=['r'], help='Refresh project modules')
     refresh_parser.add_argument('--no-sync', '-n', action='store_true', help='Skip running uv sync before refreshing')
     refresh_parser.add_argument('--full', '-f', action='store_true', help='Also run refresh_full.py scripts (heavy operations)')
+    refresh_parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                                help='Refresh up to N independent modules concurrently (default: 1)')
+    refresh_parser.add_argument('--inprocess', action='store_true',
+                                help='Run refresh scripts inside this interpreter instead of one process each')
+    refresh_parser.add_argument('--force', action='store_true',
+                                help='Refresh every module, even those unchanged since their last refresh')
+    refresh_parser.add_argument('--profile', action='store_true',
+                                help='Run each refresh script under cProfile and write a .prof file per module')
+    refresh_parser.add_argument('--watch', '-w', action='store_true',
+                                help='After refreshing, keep watching modules and refresh the ones that change')
     refresh_arg = refresh_parser.add_argument('--module', '-m', help='Refresh specific module by name')
     if argcomplete:
         refresh_arg.completer = module_completer
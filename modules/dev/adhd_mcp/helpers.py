@@ -12,6 +12,8 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from modules_controller_core import read_porcelain_status
+
 # ADHD framework module prefixes
 ADHD_PREFIXES = ("cores.", "managers.", "utils.", "plugins.", "mcps.", "project.")
 
@@ -249,32 +251,6 @@ def _parse_numstat_output(
     return changes
 
 
-def _get_ahead_behind_counts(repo_path: Path) -> tuple[int, int]:
-    """Get the ahead/behind commit counts relative to upstream.
-
-    Args:
-        repo_path: Path to the git repository
-
-    Returns:
-        Tuple of (ahead_count, behind_count)
-    """
-    ahead = 0
-    behind = 0
-    ahead_result = run_git_command(["rev-list", "--count", "@{u}..HEAD"], cwd=repo_path)
-    if ahead_result.returncode == 0:
-        try:
-            ahead = int(ahead_result.stdout.decode().strip())
-        except ValueError:
-            pass
-    behind_result = run_git_command(["rev-list", "--count", "HEAD..@{u}"], cwd=repo_path)
-    if behind_result.returncode == 0:
-        try:
-            behind = int(behind_result.stdout.decode().strip())
-        except ValueError:
-            pass
-    return ahead, behind
-
-
 def _determine_sync_status(ahead: int, behind: int) -> dict[str, Any]:
     """Determine repository sync status from ahead/behind counts.
 
@@ -294,31 +270,32 @@ def _determine_sync_status(ahead: int, behind: int) -> dict[str, Any]:
     return {"status": "clean"}
 
 
-def _count_porcelain_changes(status_output: str) -> dict[str, int]:
-    """Count changes from git status --porcelain output.
+def _count_porcelain_changes(entries: list[tuple[str, str]]) -> dict[str, int]:
+    """Count changes from parsed git status porcelain entries.
 
     Args:
-        status_output: Output from git status --porcelain
+        entries: (XY status code, path) pairs; untracked paths use "??"
 
     Returns:
         Dict with changed, added, deleted counts
     """
     changed = added = deleted = 0
-    for line in status_output.splitlines():
-        if len(line) >= 2:
-            status_code = line[:2]
-            if "?" in status_code:
-                added += 1
-            elif "D" in status_code:
-                deleted += 1
-            else:
-                changed += 1
+    for status_code, _ in entries:
+        if "?" in status_code:
+            added += 1
+        elif "D" in status_code:
+            deleted += 1
+        else:
+            changed += 1
     return {"changed": changed, "added": added, "deleted": deleted}
 
 
 def get_git_status(repo_path: Path) -> dict[str, Any]:
     """Get git status information for a repository.
 
+    Uses a single ``git status --porcelain=v2 --branch`` call, which reports
+    the branch, ahead/behind counts and changed paths together.
+
     Args:
         repo_path: Path to the git repository
 
@@ -332,25 +309,18 @@ def get_git_status(repo_path: Path) -> dict[str, Any]:
         result["status"] = "not_a_repo"
         return result
 
-    # Get current branch
-    branch_result = run_git_command(["rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_path)
-    if branch_result.returncode == 0:
-        result["branch"] = branch_result.stdout.decode("utf-8").strip()
-
-    # Get status (porcelain format)
-    status_result = run_git_command(["status", "--porcelain"], cwd=repo_path)
-    if status_result.returncode != 0:
+    status = read_porcelain_status(repo_path)
+    if status is None:
         return result
 
-    status_output = status_result.stdout.decode("utf-8").strip()
-    if not status_output:
+    result["branch"] = status.branch
+    if not status.is_dirty:
         # Clean working tree - check ahead/behind
-        ahead, behind = _get_ahead_behind_counts(repo_path)
-        result.update(_determine_sync_status(ahead, behind))
+        result.update(_determine_sync_status(status.ahead, status.behind))
     else:
         # Dirty working tree - count changes
         result["status"] = "dirty"
-        result.update(_count_porcelain_changes(status_output))
+        result.update(_count_porcelain_changes(status.entries))
 
     return result
 
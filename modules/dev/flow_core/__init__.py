@@ -36,10 +36,17 @@ from .models import (
 )
 from .dependency_graph import DependencyGraph, EdgeType, Tier
 from .tokenizer import Tokenizer
-from .parser import Parser, parse
+from .parser import Parser, parse, parse_stream
+from .incremental import IncrementalParser
 from .resolver import Resolver, resolve, resolve_with_graph
 from .compiler import Compiler, compile_resolved
-from .flow_controller import FlowController, compile_flow, compile_flow_file
+from .flow_controller import FlowController, PipelineStats, compile_flow, compile_flow_file
+from .flow_cache import FlowCache, shared_cache
+from .batch_compile import BatchSummary, compile_directory
+from .flow_daemon import FlowDaemon, forward_command
+from .import_cache import ImportCache
+from .import_index import ImportIndex
+from .symbol_index import SymbolIndex, SymbolLocation
 from .errors import (
     FlowError,
     TokenizerError,
@@ -83,6 +90,8 @@ __all__ = [
     # Parser
     "Parser",
     "parse",
+    "parse_stream",
+    "IncrementalParser",
     # Resolver
     "Resolver",
     "resolve",
@@ -92,8 +101,20 @@ __all__ = [
     "compile_resolved",
     # Controller
     "FlowController",
+    "PipelineStats",
     "compile_flow",
     "compile_flow_file",
+    "compile_directory",
+    "BatchSummary",
+    "FlowDaemon",
+    "forward_command",
+    # Cache
+    "FlowCache",
+    "shared_cache",
+    "ImportCache",
+    "ImportIndex",
+    "SymbolIndex",
+    "SymbolLocation",
     # Errors
     "FlowError",
     "TokenizerError",
@@ -0,0 +1,188 @@
+"""
+Batch compilation of every compilable .flow file under a directory.
+
+Files under ``_lib/`` directories are shared fragments and are skipped. The
+rest are compiled across a process pool; each worker process keeps one
+FlowController with its own FlowCache, so the libraries a worker's files share
+are parsed once per worker. Outputs are written atomically (temp file +
+rename) to the mirrored path under the output directory, with ``.md`` in place
+of ``.flow``.
+
+Usage:
+    >>> summary = compile_directory(Path("data/flows"), Path("build"), jobs=4)
+    >>> summary.failed
+    []
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from logger_util import Logger
+from .errors import FlowError
+from .flow_cache import FlowCache
+from .flow_controller import FlowController
+
+LIB_DIR_NAME = "_lib"
+
+
+@dataclass
+class BatchFileResult:
+    """Outcome of compiling one file (paths relative to the batch roots)."""
+    file: str
+    output: Optional[str] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of a batch compile."""
+    root: str
+    out_dir: str
+    jobs: int
+    seconds: float = 0.0
+    results: List[BatchFileResult] = field(default_factory=list)
+
+    @property
+    def failed(self) -> List[BatchFileResult]:
+        """Results of files that did not compile."""
+        return [r for r in self.results if r.error is not None]
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable summary with per-file timings and failures."""
+        return {
+            "success": not self.failed,
+            "root": self.root,
+            "out": self.out_dir,
+            "jobs": self.jobs,
+            "compiled": len(self.results) - len(self.failed),
+            "failed": len(self.failed),
+            "seconds": round(self.seconds, 4),
+            "files": [
+                {k: v for k, v in asdict(r).items() if v is not None}
+                for r in self.results
+            ],
+        }
+
+
+# =============================================================================
+# Discovery
+# =============================================================================
+
+
+def discover_flow_files(root: Path) -> List[Path]:
+    """
+    Return every compilable .flow file under ``root``, sorted.
+
+    Files with a ``_lib`` directory anywhere in their path below ``root`` are
+    import-only fragments and are left out.
+    """
+    root = Path(root)
+    return sorted(
+        path for path in root.rglob("*.flow")
+        if LIB_DIR_NAME not in path.relative_to(root).parts[:-1]
+    )
+
+
+def output_path_for(flow_file: Path, root: Path, out_dir: Path) -> Path:
+    """Mirror ``flow_file``'s location under ``root`` into ``out_dir`` as .md."""
+    return Path(out_dir) / Path(flow_file).relative_to(root).with_suffix(".md")
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+# One controller (and FlowCache) per worker process, created by _init_worker
+_worker_controller: Optional[FlowController] = None
+
+
+def _init_worker() -> None:
+    global _worker_controller
+    # Workers share the parent's stdout; keep per-file info lines out of it
+    logger = Logger(name="FlowBatchWorker", level="WARNING")
+    _worker_controller = FlowController(logger=logger, cache=FlowCache(logger=logger))
+
+
+def _compile_one(flow_file: Path, output: Path) -> BatchFileResult:
+    """Compile one file and write its output; errors are returned, not raised."""
+    if _worker_controller is None:
+        _init_worker()
+    start = time.perf_counter()
+    result = BatchFileResult(file=str(flow_file))
+    try:
+        markdown = _worker_controller.compile_file(flow_file)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(output, markdown)
+        result.output = str(output)
+    except FlowError as e:
+        result.error = f"Flow error: {e}"
+    except (OSError, UnicodeDecodeError) as e:
+        result.error = f"Cannot compile: {e}"
+    except Exception as e:  # e.g. RecursionError or a compiler bug; keep the batch going
+        result.error = f"Internal error: {e!r}"
+    result.seconds = round(time.perf_counter() - start, 4)
+    return result
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+# =============================================================================
+# Batch
+# =============================================================================
+
+
+def compile_directory(
+    root: Path,
+    out_dir: Path,
+    jobs: Optional[int] = None,
+    logger: Optional[Logger] = None,
+) -> BatchSummary:
+    """
+    Compile every compilable .flow file under ``root`` into ``out_dir``.
+
+    Args:
+        root: Directory to search for .flow files.
+        out_dir: Directory receiving the compiled Markdown (mirrors ``root``).
+        jobs: Worker processes (default: CPU count). 1 compiles in-process.
+        logger: Optional logger instance.
+
+    Returns:
+        BatchSummary with one result per file, in discovery order. A failing
+        file does not stop the batch.
+    """
+    logger = logger or Logger(name="FlowBatch")
+    root, out_dir = Path(root).resolve(), Path(out_dir).resolve()
+    files = discover_flow_files(root)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(files) or 1))
+    outputs = [output_path_for(f, root, out_dir) for f in files]
+    logger.info(f"Compiling {len(files)} .flow file(s) from {root} with {jobs} worker(s)")
+
+    start = time.perf_counter()
+    if jobs == 1:
+        results = [_compile_one(f, o) for f, o in zip(files, outputs)]
+    else:
+        # Contiguous chunks keep files from the same directory (and _lib) on one worker
+        chunksize = max(1, len(files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            results = list(pool.map(_compile_one, files, outputs, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        result.file = str(Path(result.file).relative_to(root))
+        if result.output:
+            result.output = str(Path(result.output).relative_to(out_dir))
+        if result.error:
+            logger.warning(f"{result.file}: {result.error}")
+
+    return BatchSummary(
+        root=str(root), out_dir=str(out_dir), jobs=jobs, seconds=elapsed, results=results,
+    )
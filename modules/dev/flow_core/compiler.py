@@ -10,6 +10,7 @@ Key responsibilities:
 - Style application via StyleRegistry (pre/per_item/wrap/post phases)
 - Whitespace handling (trim vs preserve modes)
 - Layer-based heading generation
+- Per-compile memo so a node referenced from many places is compiled once
 
 Compilation phases per node:
 1. PRE: Emit before content (headings via style.title)
@@ -26,7 +27,7 @@ Usage:
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Set
+from typing import Dict, Optional, List, Set, Tuple
 
 from logger_util import Logger
 from .models import (
@@ -57,6 +58,11 @@ class Compiler:
     4. JOIN: Combine items into single string
     5. WRAP: Transform joined content (blockquotes, codefences)
     6. POST: Emit post-content (dividers via style.divider)
+    
+    Nodes are immutable after resolution, so each distinct node's output is
+    memoized per compile() call and reused for every further reference.
+    Output that contains a [CIRCULAR] marker depends on the path it was
+    reached by and is never memoized.
     """
     
     def __init__(self, logger: Optional[Logger] = None) -> None:
@@ -70,6 +76,14 @@ class Compiler:
         self._style_registry = StyleRegistry()
         self._nodes: dict[str, FlowNode] = {}
         self._visited: Set[str] = set()  # For debugging/cycle detection
+        self._memo: Dict[Tuple[int, int], str] = {}  # (id(node), layer) -> output
+        self._memo_hits = 0
+        self._memo_misses = 0
+    
+    @property
+    def memo_stats(self) -> Dict[str, int]:
+        """Node memo hits and misses for the last compile() call."""
+        return {"hits": self._memo_hits, "misses": self._memo_misses}
     
     def compile(
         self,
@@ -92,6 +106,9 @@ class Compiler:
         """
         self._nodes = resolved.nodes
         self._visited = set()
+        self._memo = {}
+        self._memo_hits = 0
+        self._memo_misses = 0
         
         self.logger.debug(f"Compiling FlowFile with {len(self._nodes)} nodes")
         
@@ -106,7 +123,10 @@ class Compiler:
         # Compile starting from @out
         result = self._compile_node(resolved.out_node)
         
-        self.logger.debug(f"Compilation complete: {len(result)} chars")
+        self.logger.debug(
+            f"Compilation complete: {len(result)} chars "
+            f"(memo hits={self._memo_hits}, misses={self._memo_misses})"
+        )
         return result
     
     def _compile_node(self, node: FlowNode, _compilation_stack: Optional[Set[str]] = None) -> str:
@@ -144,6 +164,7 @@ class Compiler:
             join_hints: List[str] = field(default_factory=list)  # Separator between items
             pre: str = ""                   # PRE phase result
             in_compilation: bool = False    # Have we added to compilation_stack?
+            circular: bool = False          # Output contains a [CIRCULAR] marker
         
         # Initialize compilation stack for cycle detection
         if _compilation_stack is None:
@@ -180,8 +201,20 @@ class Compiler:
                     self.logger.warning(f"Circular reference detected: @{current_node.id}")
                     work_stack.pop()
                     result_stack.append(f"[CIRCULAR: @{current_node.id}]")
+                    if work_stack:
+                        work_stack[-1].circular = True
                     continue
                 
+                # Reuse output of a node already compiled in this pass
+                memo_key = (id(current_node), current_node.layer)
+                cached = self._memo.get(memo_key)
+                if cached is not None:
+                    self._memo_hits += 1
+                    work_stack.pop()
+                    result_stack.append(cached)
+                    continue
+                self._memo_misses += 1
+                
                 # Add to stack for cycle detection
                 _compilation_stack.add(current_node.id)
                 frame.in_compilation = True
@@ -281,6 +314,13 @@ class Compiler:
                 # Remove from compilation stack
                 _compilation_stack.discard(current_node.id)
                 
+                # Memoize unless the output depends on the reference path
+                if frame.circular:
+                    if len(work_stack) > 1:
+                        work_stack[-2].circular = True
+                else:
+                    self._memo[(id(current_node), current_node.layer)] = result
+                
                 # Pop this frame and push result
                 work_stack.pop()
                 result_stack.append(result)
@@ -6,7 +6,8 @@ Supports tiered visibility filtering and export to DOT, Mermaid, and JSON format
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Set
+from functools import cached_property
+from typing import Optional, Dict, Iterable, List, Set, Tuple
 from pathlib import Path
 import json
 import hashlib
@@ -62,6 +63,65 @@ def _make_display_name(name: str, source_dir: Optional[Path]) -> str:
     return name
 
 
+def _strongly_connected(successors: List[List[int]]) -> Tuple[List[int], List[List[int]]]:
+    """
+    Strongly connected components of a graph on vertices 0..n-1 (Tarjan, iterative).
+    
+    Args:
+        successors: Adjacency list per vertex.
+        
+    Returns:
+        (component id per vertex, member vertices per component). Components
+        are numbered in completion order: every component a vertex can reach
+        has a lower (or its own) id.
+    """
+    count = len(successors)
+    order = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    component = [-1] * count
+    members: List[List[int]] = []
+    stack: List[int] = []
+    counter = 0
+    
+    for root in range(count):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work: List[Tuple[int, Iterable[int]]] = [(root, iter(successors[root]))]
+        while work:
+            v, pending = work[-1]
+            for w in pending:
+                if order[w] == -1:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, iter(successors[w])))
+                    break
+                if on_stack[w]:
+                    low[v] = min(low[v], order[w])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] == order[v]:
+                    scc: List[int] = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = len(members)
+                        scc.append(w)
+                        if w == v:
+                            break
+                    members.append(scc)
+    return component, members
+
+
 @dataclass(frozen=True)
 class DependencyGraph:
     """
@@ -77,6 +137,9 @@ class DependencyGraph:
         
     Properties:
         file_refs: Computed from context_ref edges - all ++path references
+        
+    Adjacency lookups and the transitive-dependents closure are built on first
+    use and cached on the instance (the graph is immutable).
     """
     nodes: frozenset[str]
     edges: frozenset[tuple[str, str, str]]
@@ -105,7 +168,7 @@ class DependencyGraph:
         Returns:
             Set of node IDs that reference this node.
         """
-        return {from_id for from_id, to_id, _ in self.edges if to_id == node_id}
+        return {edge[0] for edge in self._edges_by_target.get(node_id, ())}
     
     def dependencies(self, node_id: str) -> Set[str]:
         """
@@ -117,15 +180,99 @@ class DependencyGraph:
         Returns:
             Set of node IDs that this node references.
         """
-        return {to_id for from_id, to_id, _ in self.edges if from_id == node_id}
+        return {edge[1] for edge in self._edges_by_source.get(node_id, ())}
     
     def edges_from(self, node_id: str) -> Set[tuple[str, str, str]]:
         """Get all edges originating from a node."""
-        return {edge for edge in self.edges if edge[0] == node_id}
+        return set(self._edges_by_source.get(node_id, ()))
     
     def edges_to(self, node_id: str) -> Set[tuple[str, str, str]]:
         """Get all edges pointing to a node."""
-        return {edge for edge in self.edges if edge[1] == node_id}
+        return set(self._edges_by_target.get(node_id, ()))
+    
+    def transitive_dependents(self, node_id: str) -> Set[str]:
+        """
+        Get every node that directly or transitively depends on this node.
+        
+        Answered from a reachability closure computed once per graph, so
+        repeated queries (e.g. the impact of a whole changeset) cost only
+        the size of their answers.
+        
+        Args:
+            node_id: The node to find dependents for.
+            
+        Returns:
+            Set of node IDs that would be affected if this node changed.
+            The node itself is not included, even when it is on a cycle.
+        """
+        index = self._vertex_index.get(node_id)
+        if index is None:
+            return set()
+        vertices = self._vertices
+        reach = self._dependents_closure[index] & ~(1 << index)
+        result: Set[str] = set()
+        while reach:
+            low_bit = reach & -reach
+            result.add(vertices[low_bit.bit_length() - 1])
+            reach ^= low_bit
+        return result
+    
+    # -------------------------------------------------------------------------
+    # Cached indexes
+    # -------------------------------------------------------------------------
+    
+    @cached_property
+    def _edges_by_source(self) -> Dict[str, List[tuple[str, str, str]]]:
+        index: Dict[str, List[tuple[str, str, str]]] = {}
+        for edge in self.edges:
+            index.setdefault(edge[0], []).append(edge)
+        return index
+    
+    @cached_property
+    def _edges_by_target(self) -> Dict[str, List[tuple[str, str, str]]]:
+        index: Dict[str, List[tuple[str, str, str]]] = {}
+        for edge in self.edges:
+            index.setdefault(edge[1], []).append(edge)
+        return index
+    
+    @cached_property
+    def _vertices(self) -> List[str]:
+        """Every node ID and edge endpoint, sorted; positions are bit indices."""
+        names = set(self.nodes)
+        for from_id, to_id, _ in self.edges:
+            names.add(from_id)
+            names.add(to_id)
+        return sorted(names)
+    
+    @cached_property
+    def _vertex_index(self) -> Dict[str, int]:
+        return {name: i for i, name in enumerate(self._vertices)}
+    
+    @cached_property
+    def _dependents_closure(self) -> List[int]:
+        """
+        Bitset per vertex of every vertex that reaches it (itself included).
+        
+        Components of the reverse graph are found with an iterative Tarjan pass,
+        which emits each component after every component it reaches; one sweep
+        in that order ORs each component's successors into it.
+        """
+        vertex_index = self._vertex_index
+        reverse: List[List[int]] = [[] for _ in self._vertices]
+        for from_id, to_id, _ in self.edges:
+            reverse[vertex_index[to_id]].append(vertex_index[from_id])
+        
+        component, members = _strongly_connected(reverse)
+        component_reach: List[int] = []
+        for vertices in members:
+            reach = 0
+            for v in vertices:
+                reach |= 1 << v
+                for w in reverse[v]:
+                    if component[w] != len(component_reach):
+                        reach |= component_reach[component[w]]
+            component_reach.append(reach)
+        return [component_reach[c] for c in component]
     
     def to_dot(
         self,
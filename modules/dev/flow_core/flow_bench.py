@@ -0,0 +1,338 @@
+"""
+Flow Bench - Per-stage benchmarks of the Flow pipeline.
+
+Runs tokenize → parse → resolve → compile over corpora of .flow files and
+reports, per corpus, the time spent in each stage (best of ``repeat`` runs,
+summed over the corpus' entry files) and the tracemalloc peak of one full run.
+Caching is off, so every run does all the work; the resolve stage includes
+reading and parsing imported files.
+
+Corpora:
+    wide_library   - one library of many small nodes, all used by the entry file
+    deep_chain     - a long $ref chain (n1 uses n0, n2 uses n1, ...)
+    huge_strings   - a few nodes holding very large <<< >>> blocks
+    many_imports   - an entry file importing many small library files
+    instruction_flows - the real instruction_core/data/flows set (if present)
+
+A report can be saved as a baseline and later runs compared against it;
+compare_reports() lists every stage (and peak memory) that got slower by more
+than the threshold, and every corpus that lost files to new failures.
+
+Usage:
+    >>> report = run_benchmarks(Path(tmp), repeat=5)
+    >>> regressions = compare_reports(report, json.loads(baseline.read_text()))
+"""
+
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from logger_util import Logger
+from .batch_compile import discover_flow_files
+from .errors import FlowError
+from .flow_controller import STAGES, FlowController
+
+BENCH_VERSION = 1
+
+# A stage regresses when it is this much slower than the baseline ...
+DEFAULT_THRESHOLD = 0.25
+# ... and slower by more than these absolute amounts (timer / allocator noise)
+TIME_NOISE_FLOOR = 0.002
+MEMORY_NOISE_FLOOR = 256 * 1024
+
+INSTRUCTION_FLOWS_DIR = Path(__file__).resolve().parent.parent / "instruction_core" / "data" / "flows"
+
+
+@dataclass
+class CorpusResult:
+    """Benchmark result of one corpus."""
+    name: str
+    files: int = 0
+    chars: int = 0
+    stages: Dict[str, float] = field(default_factory=lambda: {stage: 0.0 for stage in STAGES})
+    peak_memory: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        """Sum of all stage times in seconds."""
+        return sum(self.stages.values())
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable result (seconds, bytes)."""
+        data = {
+            "files": self.files,
+            "chars": self.chars,
+            "stages": {stage: round(seconds, 6) for stage, seconds in self.stages.items()},
+            "total": round(self.total, 6),
+            "peak_memory": self.peak_memory,
+        }
+        if self.errors:
+            data["errors"] = self.errors
+        return data
+
+
+# =============================================================================
+# Corpora
+# =============================================================================
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _wide_library(root: Path, size: int) -> None:
+    _write(root / "_lib" / "wide.flow",
+           "".join(f"@item{i} |<<<Item {i} of the wide library.>>>|.\n" for i in range(size)))
+    _write(root / "entry.flow",
+           "+./_lib/wide.flow |.\n\n@out " + "".join(f"|$item{i}" for i in range(size)) + "|.\n")
+
+
+def _deep_chain(root: Path, size: int) -> None:
+    lines = ["@n0 |<<<Start of the chain.>>>|."]
+    lines += [f"@n{i} |$n{i - 1}|<<< step {i}>>>|." for i in range(1, size)]
+    lines.append(f"@out |$n{size - 1}|.")
+    _write(root / "entry.flow", "\n".join(lines) + "\n")
+
+
+def _huge_strings(root: Path, size: int) -> None:
+    paragraph = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 16 + "\n"
+    block = paragraph * max(1, size // len(paragraph))
+    nodes = [f"@block{i} |<<<{block}>>>|." for i in range(8)]
+    nodes.append("@out " + "".join(f"|$block{i}" for i in range(8)) + "|.")
+    _write(root / "entry.flow", "\n".join(nodes) + "\n")
+
+
+def _many_imports(root: Path, size: int) -> None:
+    for i in range(size):
+        _write(root / "_lib" / f"part{i}.flow",
+               "".join(f"@p{i}_{j} |<<<Part {i}.{j}>>>|.\n" for j in range(5)))
+    imports = "".join(f"+./_lib/part{i}.flow |.\n" for i in range(size))
+    _write(root / "entry.flow", imports + "\n@out " + "".join(f"|$p{i}_0" for i in range(size)) + "|.\n")
+
+
+# name -> (generator, size at scale 1.0)
+SYNTHETIC_CORPORA: Dict[str, tuple] = {
+    "wide_library": (_wide_library, 2000),
+    "deep_chain": (_deep_chain, 2000),
+    "huge_strings": (_huge_strings, 64 * 1024),
+    "many_imports": (_many_imports, 200),
+}
+REAL_CORPUS = "instruction_flows"
+CORPUS_NAMES = tuple(SYNTHETIC_CORPORA) + (REAL_CORPUS,)
+
+
+def generate_corpora(
+    root: Path, scale: float = 1.0, names: Optional[Iterable[str]] = None
+) -> Dict[str, Path]:
+    """
+    Write the synthetic corpora under ``root`` and locate the real one.
+
+    Args:
+        root: Directory to generate into (one sub-directory per corpus).
+        scale: Multiplier for every corpus size.
+        names: Corpora to include (default: all).
+
+    Returns:
+        Corpus name -> directory, in CORPUS_NAMES order. The real corpus is
+        left out when instruction_core's flows are not installed.
+    """
+    wanted = set(names or CORPUS_NAMES)
+    corpora: Dict[str, Path] = {}
+    for name, (generate, size) in SYNTHETIC_CORPORA.items():
+        if name in wanted:
+            directory = Path(root) / name
+            generate(directory, max(1, int(size * scale)))
+            corpora[name] = directory
+    if REAL_CORPUS in wanted and INSTRUCTION_FLOWS_DIR.is_dir():
+        corpora[REAL_CORPUS] = INSTRUCTION_FLOWS_DIR
+    return corpora
+
+
+# =============================================================================
+# Measuring
+# =============================================================================
+
+
+def _run_stages(controller: FlowController, path: Path, source: str) -> Dict[str, float]:
+    """Run every stage once on one file; return seconds per stage."""
+    times: Dict[str, float] = {}
+    clock = time.perf_counter
+
+    start = clock()
+    tokens = controller.tokenize(source)
+    times["tokenize"] = clock() - start
+
+    start = clock()
+    flow_file = controller.parse(tokens)
+    times["parse"] = clock() - start
+
+    start = clock()
+    resolved = controller.resolve(flow_file, base_path=path.parent, source_path=str(path))
+    times["resolve"] = clock() - start
+
+    start = clock()
+    controller.compile(resolved)
+    times["compile"] = clock() - start
+    return times
+
+
+def bench_corpus(
+    name: str, directory: Path, repeat: int = 5, logger: Optional[Logger] = None
+) -> CorpusResult:
+    """
+    Benchmark every compilable file of one corpus.
+
+    Args:
+        name: Corpus name for the report.
+        directory: Directory holding the corpus (``_lib/`` files are imports only).
+        repeat: Runs per file; the best time of each stage is kept.
+        logger: Optional logger instance (use a quiet one: the pipeline logs per file).
+
+    Returns:
+        CorpusResult. Files that fail to compile are listed in ``errors`` and
+        left out of the timings.
+    """
+    logger = logger or Logger(name="FlowBench", level="WARNING")
+    controller = FlowController(logger=logger, use_cache=False)
+    result = CorpusResult(name=name)
+
+    sources = []
+    for path in discover_flow_files(directory):
+        source = path.read_text(encoding="utf-8")
+        try:
+            _run_stages(controller, path, source)  # Warm-up, and drop failing files
+        except FlowError as e:
+            result.errors.append(f"{path.relative_to(directory)}: {e}")
+            continue
+        sources.append((path, source))
+        result.files += 1
+        result.chars += len(source)
+
+    for path, source in sources:
+        best = {stage: float("inf") for stage in STAGES}
+        for _ in range(max(1, repeat)):
+            for stage, seconds in _run_stages(controller, path, source).items():
+                best[stage] = min(best[stage], seconds)
+        for stage in STAGES:
+            result.stages[stage] += best[stage]
+
+    # Peak memory of one full pass, measured separately (tracing slows everything down)
+    tracemalloc.start()
+    try:
+        for path, source in sources:
+            _run_stages(controller, path, source)
+        result.peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def run_benchmarks(
+    work_dir: Path,
+    repeat: int = 5,
+    scale: float = 1.0,
+    names: Optional[Iterable[str]] = None,
+    logger: Optional[Logger] = None,
+    progress: Optional[Callable[[CorpusResult], None]] = None,
+) -> Dict:
+    """
+    Generate the corpora in ``work_dir`` and benchmark each of them.
+
+    Args:
+        work_dir: Scratch directory for the synthetic corpora.
+        repeat: Runs per file; the best time of each stage is kept.
+        scale: Multiplier for the synthetic corpus sizes.
+        names: Corpora to run (default: all).
+        logger: Optional logger instance.
+        progress: Called with each CorpusResult as it completes.
+
+    Returns:
+        The report: {"version", "python", "repeat", "scale", "corpora": {name: result}}.
+    """
+    corpora: Dict[str, Dict] = {}
+    for name, directory in generate_corpora(work_dir, scale, names).items():
+        result = bench_corpus(name, directory, repeat, logger)
+        corpora[name] = result.to_dict()
+        if progress:
+            progress(result)
+    return {
+        "version": BENCH_VERSION,
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "scale": scale,
+        "corpora": corpora,
+    }
+
+
+# =============================================================================
+# Baselines
+# =============================================================================
+
+
+def comparable(report: Dict, baseline: Dict) -> bool:
+    """True if ``baseline`` has the same scale and shares a corpus with ``report``."""
+    return report.get("scale") == baseline.get("scale") and bool(
+        set(report.get("corpora", {})) & set(baseline.get("corpora", {}))
+    )
+
+
+def compare_reports(
+    report: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict]:
+    """
+    List the measurements of ``report`` that regressed against ``baseline``.
+
+    A stage time or peak memory regresses when it exceeds the baseline by more
+    than ``threshold`` (a fraction) and by more than the noise floor. Fewer
+    benchmarked files or more failing files than the baseline also count, since
+    files that fail are left out of the timings. Corpora or stages missing from
+    either report are skipped; so is everything when the scales differ, since
+    sizes are then not comparable (see comparable()).
+
+    Returns:
+        One {"corpus", "metric", "baseline", "current", "change"} dict per
+        regression ("change" is the relative increase for times and memory,
+        the difference in count for "files" and "errors").
+    """
+    if not comparable(report, baseline):
+        return []
+
+    regressions: List[Dict] = []
+    for name, current in report.get("corpora", {}).items():
+        base = baseline.get("corpora", {}).get(name)
+        if not base:
+            continue
+        counts = [("files", current.get("files"), base.get("files")),
+                  ("errors", len(current.get("errors", [])), len(base.get("errors", [])))]
+        for metric, value, base_value in counts:
+            if value is None or base_value is None:
+                continue
+            if (value < base_value) if metric == "files" else (value > base_value):
+                regressions.append({
+                    "corpus": name,
+                    "metric": metric,
+                    "baseline": base_value,
+                    "current": value,
+                    "change": value - base_value,
+                })
+        metrics = [(f"stages.{stage}", current["stages"].get(stage), base.get("stages", {}).get(stage),
+                    TIME_NOISE_FLOOR) for stage in STAGES]
+        metrics.append(("peak_memory", current.get("peak_memory"), base.get("peak_memory"),
+                        MEMORY_NOISE_FLOOR))
+        for metric, value, base_value, floor in metrics:
+            if value is None or not base_value:
+                continue
+            if value > base_value * (1 + threshold) and value - base_value > floor:
+                regressions.append({
+                    "corpus": name,
+                    "metric": metric,
+                    "baseline": base_value,
+                    "current": value,
+                    "change": round(value / base_value - 1, 3),
+                })
+    return regressions
@@ -0,0 +1,313 @@
+"""
+Flow Cache - Content-addressed cache for parsed and compiled Flow files.
+
+Two layers, both keyed by SHA-256 so stale entries can never be returned:
+
+1. Parsed ASTs: sha256(source) → FlowFile. The resolver loads every imported
+   ``_lib`` fragment through this cache, so compiling 50 agents that import
+   the same fragments tokenizes and parses each fragment once per process.
+2. Compiled output: for each entry file, the set of .flow files that took part
+   in its last resolve and their content hashes (the "manifest"), plus
+   transitive hash → Markdown. A compile whose manifest still matches the files
+   on disk returns the stored Markdown without tokenizing anything.
+
+Parsed ASTs are shared between callers and must be treated as read-only.
+The resolver never mutates parsed nodes: imports share them and assignments
+clone only the node whose slot they replace.
+
+Layer 2 can optionally be persisted to a directory (``cache_dir``) so separate
+processes reuse compiled output. Compiled Markdown does not depend on ``++``
+file refs (they are emitted as literal paths), so .flow content is the whole
+input; CACHE_VERSION is part of every transitive hash to invalidate entries
+when compiler output changes.
+
+Usage:
+    >>> cache = FlowCache(cache_dir=Path(".flow_cache"))
+    >>> controller = FlowController(cache=cache)
+    >>> controller.compile_file(Path("agent.flow"))
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from logger_util import Logger
+from .models import FlowFile
+
+# Bump when compiler/style output changes so persisted Markdown is discarded.
+CACHE_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 512
+MANIFEST_FILENAME = "manifest.json"
+
+
+def hash_source(source: str) -> str:
+    """Return the SHA-256 hex digest of Flow source text."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for both cache layers."""
+    parse_hits: int = 0
+    parse_misses: int = 0
+    compile_hits: int = 0
+    compile_misses: int = 0
+
+
+class FlowCache:
+    """
+    Content-addressed cache of parsed FlowFiles and compiled Markdown.
+
+    Safe to share between FlowController instances and threads. Both layers
+    are bounded LRU maps (``max_entries`` each).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Optional directory to persist compiled output in.
+            max_entries: Maximum entries kept in memory per layer.
+            logger: Optional logger instance.
+        """
+        self.logger = logger or Logger(name="FlowCache")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+        self._parsed: "OrderedDict[str, FlowFile]" = OrderedDict()
+        self._compiled: "OrderedDict[str, str]" = OrderedDict()
+        # entry key -> (transitive hash, {file path: content hash})
+        self._manifests: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        if self.cache_dir:
+            self._load_manifests()
+
+    # =========================================================================
+    # Layer 1: Parsed ASTs
+    # =========================================================================
+
+    def parse(self, source: str, parse_fn: Callable[[str], FlowFile]) -> FlowFile:
+        """
+        Return the parsed FlowFile for ``source``, parsing it on a miss.
+
+        The returned FlowFile is shared; do not mutate it.
+
+        Args:
+            source: Flow source text.
+            parse_fn: Tokenizes and parses source (called only on a miss).
+        """
+        key = hash_source(source)
+        with self._lock:
+            flow_file = self._parsed.get(key)
+            if flow_file is not None:
+                self._parsed.move_to_end(key)
+                self.stats.parse_hits += 1
+                return flow_file
+            self.stats.parse_misses += 1
+
+        flow_file = parse_fn(source)
+        with self._lock:
+            self._remember(self._parsed, key, flow_file)
+        return flow_file
+
+    def load_flow_file(self, file_path: Path, parse_fn: Callable[[str], FlowFile]) -> FlowFile:
+        """Read a .flow file and return its (shared, read-only) parsed FlowFile."""
+        source = Path(file_path).read_text(encoding="utf-8")
+        return self.parse(source, parse_fn)
+
+    # =========================================================================
+    # Layer 2: Compiled Markdown
+    # =========================================================================
+
+    @staticmethod
+    def entry_key(file_path: Path, require_out: bool) -> str:
+        """Return the manifest key for an entry file compiled with ``require_out``."""
+        return f"{Path(file_path).resolve()}|{int(require_out)}"
+
+    @staticmethod
+    def transitive_hash(file_hashes: Dict[str, str], require_out: bool) -> str:
+        """Hash the content hashes of every participating file into one key."""
+        digest = hashlib.sha256(f"v{CACHE_VERSION}|{int(require_out)}".encode())
+        for path in sorted(file_hashes):
+            digest.update(b"\0")
+            digest.update(path.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(file_hashes[path].encode())
+        return digest.hexdigest()
+
+    def get_compiled(
+        self, file_path: Path, require_out: bool
+    ) -> Optional[Tuple[str, Tuple[Path, ...]]]:
+        """
+        Return cached Markdown for an entry file if none of its inputs changed.
+
+        Returns:
+            Tuple of (markdown, participating .flow files), or None on a miss.
+        """
+        key = self.entry_key(file_path, require_out)
+        with self._lock:
+            manifest = self._manifests.get(key)
+        if manifest is None:
+            self._count_compile(hit=False)
+            return None
+
+        digest, file_hashes = manifest
+        for path, expected in file_hashes.items():
+            try:
+                current = hash_source(Path(path).read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError):
+                current = None
+            if current != expected:
+                self._count_compile(hit=False)
+                return None
+
+        markdown = self._lookup_compiled(digest)
+        self._count_compile(hit=markdown is not None)
+        if markdown is None:
+            return None
+        return markdown, tuple(Path(p) for p in file_hashes)
+
+    def put_compiled(
+        self,
+        file_path: Path,
+        require_out: bool,
+        files: Iterable[Path],
+        markdown: str,
+    ) -> None:
+        """
+        Store compiled Markdown for an entry file.
+
+        Args:
+            file_path: The entry .flow file.
+            require_out: The require_out flag used for this compile.
+            files: Every .flow file that participated in the resolve.
+            markdown: The compiled output.
+        """
+        file_hashes: Dict[str, str] = {}
+        for path in files:
+            try:
+                file_hashes[str(Path(path).resolve())] = hash_source(
+                    Path(path).read_text(encoding="utf-8")
+                )
+            except (OSError, UnicodeDecodeError):
+                return  # Input vanished mid-compile; do not cache
+
+        digest = self.transitive_hash(file_hashes, require_out)
+        key = self.entry_key(file_path, require_out)
+        with self._lock:
+            self._manifests[key] = (digest, file_hashes)
+            self._remember(self._compiled, digest, markdown)
+        if self.cache_dir:
+            self._persist(digest, markdown)
+
+    def _lookup_compiled(self, digest: str) -> Optional[str]:
+        with self._lock:
+            markdown = self._compiled.get(digest)
+            if markdown is not None:
+                self._compiled.move_to_end(digest)
+                return markdown
+        if not self.cache_dir:
+            return None
+        try:
+            markdown = (self.cache_dir / f"{digest}.md").read_text(encoding="utf-8")
+        except OSError:
+            return None
+        with self._lock:
+            self._remember(self._compiled, digest, markdown)
+        return markdown
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (persisted files are left in place)."""
+        with self._lock:
+            self._parsed.clear()
+            self._compiled.clear()
+            self._manifests.clear()
+            self.stats = CacheStats()
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _remember(self, store: "OrderedDict", key: str, value: object) -> None:
+        """Insert into an LRU store (caller holds the lock)."""
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def _count_compile(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.stats.compile_hits += 1
+            else:
+                self.stats.compile_misses += 1
+
+    def _load_manifests(self) -> None:
+        manifest_file = self.cache_dir / MANIFEST_FILENAME
+        if not manifest_file.exists():
+            return
+        try:
+            raw = json.loads(manifest_file.read_text(encoding="utf-8"))
+            if raw.get("version") != CACHE_VERSION:
+                return
+            self._manifests = {
+                key: (entry["digest"], dict(entry["files"]))
+                for key, entry in raw["entries"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            self.logger.debug(f"Discarding flow cache manifest {manifest_file}: {e}")
+            self._manifests = {}
+
+    def _persist(self, digest: str, markdown: str) -> None:
+        """Write one compiled entry and the manifest atomically (best effort)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            output_file = self.cache_dir / f"{digest}.md"
+            if not output_file.exists():
+                self._atomic_write(output_file, markdown)
+            with self._lock:
+                payload = {
+                    "version": CACHE_VERSION,
+                    "entries": {
+                        key: {"digest": d, "files": files}
+                        for key, (d, files) in sorted(self._manifests.items())
+                    },
+                }
+            self._atomic_write(self.cache_dir / MANIFEST_FILENAME, json.dumps(payload, indent=2))
+        except OSError as e:
+            self.logger.debug(f"Could not persist flow cache entry {digest}: {e}")
+
+    @staticmethod
+    def _atomic_write(path: Path, text: str) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+# =============================================================================
+# Process-wide default cache
+# =============================================================================
+
+_shared_cache: Optional[FlowCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> FlowCache:
+    """Return the process-wide in-memory FlowCache used by FlowController by default."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = FlowCache()
+        return _shared_cache
@@ -8,13 +8,15 @@ Commands:
     tokenize    - Tokenize a Flow file and display tokens
     parse       - Parse a Flow file and show AST structure
     resolve     - Resolve a Flow file and show resolved structure
-    compile     - Compile a Flow file to Markdown
+    compile     - Compile a Flow file (or a directory with --all) to Markdown
     graph       - Export dependency graph (DOT, JSON, Mermaid)
     validate    - Validate a Flow file with multi-error reporting
     impact      - Show all nodes affected if a given node changes
     usages      - Find all references to a node across files
     rename      - Rename a node across all files (dry-run by default)
     stats       - Show complexity metrics for a Flow file
+    bench       - Benchmark each pipeline stage and compare against a baseline
+    serve       - Run a daemon that serves compile/validate/graph/stats warm
     lsp         - Start the FLOW Language Server Protocol (LSP) server
 """
 
@@ -58,15 +60,28 @@ import json
 import os
 import re
 import sys
+import tempfile
 from pathlib import Path
 from typing import Optional, List, Dict, Set
 
 from logger_util import Logger
+from .batch_compile import compile_directory
+from .flow_bench import CORPUS_NAMES, DEFAULT_THRESHOLD, STAGES, comparable, compare_reports, run_benchmarks
+from .flow_daemon import (
+    DEFAULT_POLL_INTERVAL,
+    FlowDaemon,
+    default_socket_path,
+    forward_command,
+    output_stream,
+    request as daemon_request,
+)
 from .flow_controller import FlowController
+from .flow_cache import FlowCache, shared_cache
 from .dependency_graph import DependencyGraph, EdgeType
 from .errors import FlowError
 from .models import FlowNode, NodeRef
 from .resolver import Resolver, resolve_with_graph, validate_with_errors
+from .symbol_index import INDEX_FILENAME, SymbolIndex
 from .tokenizer import Tokenizer
 from .parser import Parser
 
@@ -77,10 +92,27 @@ from .parser import Parser
 
 def _print_result(result: dict) -> int:
     """Print result as JSON and return exit code."""
-    print(json.dumps(result, indent=2, default=str))
+    _emit(json.dumps(result, indent=2, default=str))
     return 0 if result.get("success", True) else 1
 
 
+def _emit(text: str = "") -> None:
+    """Print command output (captured per request when run by `flow serve`)."""
+    print(text, file=output_stream())
+
+
+def _forwarded(command: str, args: argparse.Namespace) -> Optional[int]:
+    """
+    Run ``command`` in a `flow serve` daemon if one is listening.
+    
+    Returns:
+        The daemon's exit code, or None to run the command in-process.
+    """
+    if getattr(args, 'no_daemon', False):
+        return None
+    return forward_command(command, args)
+
+
 # =============================================================================
 # Handler Functions (cli_manager compatible)
 # =============================================================================
@@ -231,25 +263,48 @@ def resolve_command(args: argparse.Namespace) -> int:
 
 def compile_command(args: argparse.Namespace) -> int:
     """
-    Compile a Flow file to Markdown.
+    Compile a Flow file to Markdown, or every .flow file in a directory.
     
     Args:
-        args: Namespace with 'file' and optional 'output' attributes.
+        args: Namespace with 'file' and optional 'output' / 'cache_dir' / 'stats'
+              attributes, or 'all' / 'out' / 'jobs' for batch mode.
         
     Returns:
         Exit code (0 for success, 1 for error).
     """
+    if getattr(args, 'all', None):
+        return _compile_all(args)
+    forwarded = _forwarded("compile", args)
+    if forwarded is not None:
+        return forwarded
     file_path = args.file
     output = getattr(args, 'output', None)
+    cache_dir = getattr(args, 'cache_dir', None)
+    with_stats = getattr(args, 'stats', False)
     logger = Logger(name="FlowCLI")
     
+    if not file_path:
+        return _print_result({"success": False, "error": "Give a .flow file or --all <dir>"})
+    
     try:
-        controller = FlowController(logger=logger)
+        cache = FlowCache(cache_dir=Path(cache_dir), logger=logger) if cache_dir else None
+        # --stats measures a full run: cached output would hide every stage
+        controller = FlowController(logger=logger, cache=cache, use_cache=not with_stats,
+                                    stats=with_stats)
         path = Path(file_path)
         
         # Full compilation pipeline
         markdown = controller.compile_file(path)
         
+        if with_stats:
+            if output:
+                Path(output).write_text(markdown, encoding="utf-8")
+            result = {"success": True, "file": file_path, "output": output,
+                      "stats": controller.stats.to_dict()}
+            if not output:
+                result["markdown"] = markdown
+            return _print_result(result)
+        
         if output:
             output_path = Path(output)
             output_path.write_text(markdown, encoding="utf-8")
@@ -261,7 +316,7 @@ def compile_command(args: argparse.Namespace) -> int:
             })
         else:
             # Direct markdown output (not JSON) for piping
-            print(markdown)
+            _emit(markdown)
         
         return 0
         
@@ -271,6 +326,28 @@ def compile_command(args: argparse.Namespace) -> int:
         return _print_result({"success": False, "error": f"Flow error: {e}"})
 
 
+def _compile_all(args: argparse.Namespace) -> int:
+    """
+    Batch mode of compile_command: compile a directory across worker processes.
+    
+    Prints a JSON summary with per-file timings and failures.
+    """
+    root = Path(args.all)
+    out_dir = getattr(args, 'out', None)
+    if not root.is_dir():
+        return _print_result({"success": False, "error": f"Not a directory: {root}"})
+    if not out_dir:
+        return _print_result({"success": False, "error": "--all requires --out <dir>"})
+    if getattr(args, 'cache_dir', None):
+        return _print_result({"success": False, "error": "--cache-dir is not supported with --all"})
+    if getattr(args, 'stats', False):
+        return _print_result({"success": False, "error": "--stats is not supported with --all"})
+    
+    summary = compile_directory(root, Path(out_dir), jobs=getattr(args, 'jobs', None),
+                                logger=Logger(name="FlowCLI"))
+    return _print_result(summary.to_dict())
+
+
 def graph_command(args: argparse.Namespace) -> int:
     """
     Export dependency graph in DOT, JSON, or Mermaid format.
@@ -281,6 +358,9 @@ def graph_command(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for error).
     """
+    forwarded = _forwarded("graph", args)
+    if forwarded is not None:
+        return forwarded
     file_path = args.file
     format_type = getattr(args, 'format', 'mermaid')
     tier = getattr(args, 'tier', 0)
@@ -304,7 +384,8 @@ def graph_command(args: argparse.Namespace) -> int:
             flow_file, 
             base_path=path.parent,
             source_path=str(path),
-            logger=logger
+            logger=logger,
+            cache=shared_cache(),
         )
         
         # Build node badges for structural tier
@@ -316,11 +397,11 @@ def graph_command(args: argparse.Namespace) -> int:
         
         # Export in requested format (direct output for piping)
         if format_type == "dot":
-            print(graph.to_dot(tier=tier, node_badges=node_badges))
+            _emit(graph.to_dot(tier=tier, node_badges=node_badges))
         elif format_type == "json":
-            print(graph.to_json(tier=tier, node_badges=node_badges))
+            _emit(graph.to_json(tier=tier, node_badges=node_badges))
         elif format_type == "mermaid":
-            print(graph.to_mermaid(tier=tier, node_badges=node_badges))
+            _emit(graph.to_mermaid(tier=tier, node_badges=node_badges))
         else:
             return _print_result({
                 "success": False,
@@ -587,41 +668,6 @@ def debug_command(args: argparse.Namespace) -> int:
 # =============================================================================
 
 
-def _collect_transitive_dependents(
-    graph: "DependencyGraph", 
-    node_id: str, 
-    visited: Optional[Set[str]] = None
-) -> Set[str]:
-    """
-    Recursively collect all nodes that depend on the given node.
-    
-    Args:
-        graph: The dependency graph to traverse.
-        node_id: The starting node to find dependents for.
-        visited: Set of already visited nodes (to prevent cycles).
-        
-    Returns:
-        Set of all node IDs that transitively depend on this node.
-    """
-    if visited is None:
-        visited = set()
-    
-    if node_id in visited:
-        return set()
-    
-    visited.add(node_id)
-    
-    direct_dependents = graph.dependents(node_id)
-    all_dependents: Set[str] = set()
-    
-    for dep in direct_dependents:
-        if dep not in visited:
-            all_dependents.add(dep)
-            all_dependents.update(_collect_transitive_dependents(graph, dep, visited))
-    
-    return all_dependents
-
-
 def _is_node_id(name: str) -> bool:
     """
     Check if a name is a Flow node ID (not a file path or context ref).
@@ -661,34 +707,82 @@ def _get_node_source_file(graph: "DependencyGraph", node_id: str) -> Optional[st
         return node_id
     
     # Look for import edges that point to this file
-    for from_id, to_id, edge_type in graph.edges:
-        if edge_type == EdgeType.IMPORT and from_id == node_id:
-            # The 'to_id' is the file this node imports from
-            return to_id
+    import_targets = [
+        to_id for _, to_id, edge_type in graph.edges_from(node_id)
+        if edge_type == EdgeType.IMPORT
+    ]
+    if import_targets:
+        # The 'to_id' is the file this node imports from
+        return min(import_targets)
     
     # Default to first file in the graph if available
     if graph.files:
-        return str(sorted(graph.files)[0])
+        return str(min(graph.files))
     
     return None
 
 
+def _node_impact(graph: "DependencyGraph", node_id: str, base_dir: Path) -> Dict:
+    """
+    Direct and transitive dependents of one node, with their source files.
+    
+    Args:
+        graph: The dependency graph of the resolved file.
+        node_id: The node whose change is analyzed.
+        base_dir: Directory that source files are reported relative to.
+        
+    Returns:
+        Dict with direct/total impact counts and the sorted 'affected' entries.
+    """
+    direct_dependents = graph.dependents(node_id)
+    all_dependents = graph.transitive_dependents(node_id)
+    
+    # Build affected list with source files
+    affected = []
+    for dep_id in sorted(all_dependents):
+        source_file = _get_node_source_file(graph, dep_id)
+        entry = {"node": dep_id, "direct": dep_id in direct_dependents}
+        if source_file:
+            # Use relative path if possible
+            try:
+                rel_path = Path(source_file).relative_to(base_dir)
+                entry["file"] = str(rel_path)
+            except ValueError:
+                entry["file"] = source_file
+        affected.append(entry)
+    
+    return {
+        "direct_impact_count": len(direct_dependents),
+        "total_impact_count": len(all_dependents),
+        "affected": affected,
+    }
+
+
 def impact_command(args: argparse.Namespace) -> int:
     """
     Show all nodes that would be affected if a given node changes.
     
-    Performs recursive traversal to find all transitive dependents.
+    Transitive dependents come from the graph's cached reachability closure.
+    With --batch, any number of nodes (default: every node) is answered from
+    a single resolve, plus the combined impact of all of them.
     
     Args:
-        args: Namespace with 'file' and 'node' attributes.
+        args: Namespace with 'file' and 'node' attributes, and optional 'batch'.
         
     Returns:
         Exit code (0 for success, 1 for error).
     """
     file_path = args.file
-    node_id = args.node
+    node_ids = [args.node] if isinstance(args.node, str) else list(args.node or [])
+    batch = getattr(args, 'batch', False)
     logger = Logger(name="FlowCLI")
     
+    if not batch and len(node_ids) != 1:
+        return _print_result({
+            "success": False,
+            "error": "Give exactly one node, or use --batch for several",
+        })
+    
     try:
         path = Path(file_path)
         
@@ -709,6 +803,11 @@ def impact_command(args: argparse.Namespace) -> int:
             logger=logger
         )
         
+        if batch:
+            return _print_result(_batch_impact(graph, node_ids, file_path, path.parent))
+        
+        node_id = node_ids[0]
+        
         # Check if node exists
         if node_id not in graph.nodes:
             return _print_result({
@@ -717,32 +816,14 @@ def impact_command(args: argparse.Namespace) -> int:
                 "available_nodes": sorted([n for n in graph.nodes if _is_node_id(n)]),
             })
         
-        # Collect direct and transitive dependents
-        direct_dependents = graph.dependents(node_id)
-        all_dependents = _collect_transitive_dependents(graph, node_id)
-        
-        # Build affected list with source files
-        affected = []
-        for dep_id in sorted(all_dependents):
-            source_file = _get_node_source_file(graph, dep_id)
-            entry = {"node": dep_id, "direct": dep_id in direct_dependents}
-            if source_file:
-                # Use relative path if possible
-                try:
-                    rel_path = Path(source_file).relative_to(path.parent)
-                    entry["file"] = str(rel_path)
-                except ValueError:
-                    entry["file"] = source_file
-            affected.append(entry)
-        
+        impact = _node_impact(graph, node_id, path.parent)
+        total = impact["total_impact_count"]
         return _print_result({
             "success": True,
             "file": file_path,
             "target_node": node_id,
-            "direct_impact_count": len(direct_dependents),
-            "total_impact_count": len(all_dependents),
-            "affected": affected,
-            "message": f"If '{node_id}' changes, {len(all_dependents)} node(s) would be affected",
+            **impact,
+            "message": f"If '{node_id}' changes, {total} node(s) would be affected",
         })
         
     except FileNotFoundError as e:
@@ -753,14 +834,59 @@ def impact_command(args: argparse.Namespace) -> int:
         return _print_result({"success": False, "error": f"Flow error: {e}"})
 
 
+def _batch_impact(
+    graph: "DependencyGraph", node_ids: List[str], file_path: str, base_dir: Path
+) -> Dict:
+    """
+    Impact of several nodes from one dependency graph (`flow impact --batch`).
+    
+    Args:
+        graph: The dependency graph of the resolved file.
+        node_ids: Nodes to analyze; empty means every node in the graph.
+        file_path: The file as given on the command line.
+        base_dir: Directory that source files are reported relative to.
+        
+    Returns:
+        Result dict with per-node impact, the union of all affected nodes, and
+        any requested nodes missing from the graph (which make it unsuccessful).
+    """
+    targets = node_ids or sorted(n for n in graph.nodes if _is_node_id(n))
+    unknown = [n for n in targets if n not in graph.nodes]
+    
+    impacts: Dict[str, Dict] = {}
+    combined: Set[str] = set()
+    for node_id in targets:
+        if node_id in unknown:
+            continue
+        impacts[node_id] = _node_impact(graph, node_id, base_dir)
+        combined.update(entry["node"] for entry in impacts[node_id]["affected"])
+    
+    result = {
+        "success": not unknown,
+        "file": file_path,
+        "target_nodes": [n for n in targets if n not in unknown],
+        "impacts": impacts,
+        "combined_affected": sorted(combined),
+        "total_impact_count": len(combined),
+        "message": f"If these {len(impacts)} node(s) change, {len(combined)} node(s) would be affected",
+    }
+    if unknown:
+        result["error"] = f"Node(s) not found in dependency graph: {', '.join(unknown)}"
+        result["unknown_nodes"] = unknown
+    return result
+
+
 def usages_command(args: argparse.Namespace) -> int:
     """
     Find all references to a node across files.
     
     Uses graph.edges_to() to find all nodes that reference the target.
+    With --workspace, searches every .flow file under the file's directory
+    (or the given directory) through the workspace symbol index instead.
     
     Args:
-        args: Namespace with 'file' and 'node' attributes.
+        args: Namespace with 'file' and 'node' attributes, and optional
+              'workspace' and 'cache_dir' attributes.
         
     Returns:
         Exit code (0 for success, 1 for error).
@@ -769,6 +895,9 @@ def usages_command(args: argparse.Namespace) -> int:
     node_id = args.node
     logger = Logger(name="FlowCLI")
     
+    if getattr(args, "workspace", False):
+        return _workspace_usages(Path(file_path), node_id, getattr(args, "cache_dir", None), logger)
+    
     try:
         path = Path(file_path)
         
@@ -833,6 +962,69 @@ def usages_command(args: argparse.Namespace) -> int:
         return _print_result({"success": False, "error": f"Flow error: {e}"})
 
 
+def _workspace_usages(
+    path: Path, node_id: str, cache_dir: Optional[str], logger: Logger
+) -> int:
+    """
+    Find definitions of and references to a node in every .flow file under a directory.
+    
+    Uses the SymbolIndex; with a cache dir the index is kept between runs and
+    only files changed since the last run are parsed again.
+    """
+    if not path.exists():
+        return _print_result({"success": False, "error": f"Path not found: {path}"})
+    root = path if path.is_dir() else path.parent
+    
+    index_path = Path(cache_dir) / INDEX_FILENAME if cache_dir else None
+    if index_path:
+        index = SymbolIndex.load(index_path, root, logger=logger)
+    else:
+        index = SymbolIndex(root, logger=logger)
+    reparsed = index.refresh()
+    if index_path:
+        try:
+            index.save(index_path)
+        except OSError as e:
+            logger.warning(f"Could not save symbol index to {index_path}: {e}")
+    
+    def relative(file: Path) -> str:
+        try:
+            return str(file.relative_to(index.root))
+        except ValueError:
+            return str(file)
+    
+    definitions = index.definitions(node_id)
+    references = index.references(node_id)
+    if not definitions and not references:
+        return _print_result({
+            "success": False,
+            "error": f"Node '{node_id}' not found in any .flow file under {root}",
+        })
+    
+    usages: List[Dict] = []
+    for loc in references:
+        entry = {"ref_type": loc.kind, "file": relative(loc.file_path),
+                 "line": loc.line, "column": loc.column}
+        if loc.container:
+            entry["referencing_node"] = loc.container
+        usages.append(entry)
+    
+    return _print_result({
+        "success": True,
+        "workspace": str(root),
+        "target_node": node_id,
+        "files_indexed": index.file_count,
+        "files_parsed": reparsed,
+        "definitions": [
+            {"file": relative(loc.file_path), "line": loc.line, "column": loc.column}
+            for loc in definitions
+        ],
+        "usage_count": len(usages),
+        "usages": usages,
+        "message": f"Found {len(usages)} reference(s) to '{node_id}' in {index.file_count} file(s)",
+    })
+
+
 def rename_command(args: argparse.Namespace) -> int:
     """
     Rename a node across all files.
@@ -1053,6 +1245,8 @@ def stats_command(args: argparse.Namespace) -> int:
     Show complexity metrics for a Flow file.
     
     Calculates: token count, node count, reference count, max nesting, import count.
+    Also runs the full pipeline once without cache and reports its per-stage
+    timings and counters (FlowController stats) under "pipeline".
     
     Args:
         args: Namespace with 'file' and optional 'format' attributes.
@@ -1060,6 +1254,9 @@ def stats_command(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for error).
     """
+    forwarded = _forwarded("stats", args)
+    if forwarded is not None:
+        return forwarded
     file_path = args.file
     output_format = getattr(args, 'format', 'json')
     logger = Logger(name="FlowCLI")
@@ -1072,11 +1269,17 @@ def stats_command(args: argparse.Namespace) -> int:
         
         source = path.read_text(encoding="utf-8")
         
-        # Tokenize and parse
-        tokenizer = Tokenizer(logger=logger)
-        tokens = tokenizer.tokenize(source)
-        parser = Parser(logger=logger)
-        flow_file = parser.parse(tokens)
+        # Tokenize and parse (timed), then resolve and compile for the pipeline stats
+        controller = FlowController(logger=logger, use_cache=False, stats=True)
+        tokens = controller.tokenize(source)
+        flow_file = controller.parse(tokens)
+        try:
+            resolved = controller.resolve(flow_file, base_path=path.parent.resolve(),
+                                          source_path=str(path))
+            controller.compile(resolved, require_out=False)
+            pipeline = controller.stats.to_dict()
+        except FlowError as e:
+            pipeline = {**controller.stats.to_dict(), "error": str(e)}
         
         # Calculate metrics
         total_nodes = len(flow_file.nodes)
@@ -1128,27 +1331,40 @@ def stats_command(args: argparse.Namespace) -> int:
                 "has_out": flow_file.out_node is not None,
             },
             "node_stats": node_stats,
+            "pipeline": pipeline,
         }
         
         if output_format == "table":
             # Print as table format (human-readable)
-            print(f"Flow File Statistics: {file_path}")
-            print("=" * 60)
-            print(f"  Token estimate (chars/4):  {token_estimate:,}")
-            print(f"  Node count:                {total_nodes}")
-            print(f"  Import count:              {import_count}")
-            print(f"  Assignment count:          {assignment_count}")
-            print(f"  Total references:          {total_refs}")
-            print(f"  Total slots:               {total_slot_count}")
-            print(f"  Max nesting depth:         {max_nesting}")
-            print(f"  Has @out:                  {'Yes' if flow_file.out_node else 'No'}")
-            print()
-            print("Per-Node Statistics:")
-            print("-" * 60)
-            print(f"  {'Node':<20} {'Layer':>6} {'Slots':>6} {'Refs':>6} {'Depth':>6}")
-            print("-" * 60)
+            _emit(f"Flow File Statistics: {file_path}")
+            _emit("=" * 60)
+            _emit(f"  Token estimate (chars/4):  {token_estimate:,}")
+            _emit(f"  Node count:                {total_nodes}")
+            _emit(f"  Import count:              {import_count}")
+            _emit(f"  Assignment count:          {assignment_count}")
+            _emit(f"  Total references:          {total_refs}")
+            _emit(f"  Total slots:               {total_slot_count}")
+            _emit(f"  Max nesting depth:         {max_nesting}")
+            _emit(f"  Has @out:                  {'Yes' if flow_file.out_node else 'No'}")
+            _emit()
+            _emit("Pipeline (one uncached run):")
+            _emit("-" * 60)
+            for stage, seconds in pipeline["stages"].items():
+                _emit(f"  {stage.capitalize() + ':':<27}{seconds * 1000:.2f} ms")
+            _emit(f"  Tokens:                    {pipeline['tokens']:,}")
+            _emit(f"  Import files:              {pipeline['import_files']}")
+            _emit(f"  Resolved nodes:            {pipeline['resolved_nodes']}")
+            _emit(f"  Node clones:               {pipeline['node_clones']}")
+            _emit(f"  Compiler memo hits/misses: {pipeline['memo_hits']}/{pipeline['memo_misses']}")
+            if "error" in pipeline:
+                _emit(f"  Stopped at: {pipeline['error']}")
+            _emit()
+            _emit("Per-Node Statistics:")
+            _emit("-" * 60)
+            _emit(f"  {'Node':<20} {'Layer':>6} {'Slots':>6} {'Refs':>6} {'Depth':>6}")
+            _emit("-" * 60)
             for node_id, stats in sorted(node_stats.items()):
-                print(f"  {node_id:<20} {stats['layer']:>6} {stats['slot_count']:>6} {stats['ref_count']:>6} {stats['nesting_depth']:>6}")
+                _emit(f"  {node_id:<20} {stats['layer']:>6} {stats['slot_count']:>6} {stats['ref_count']:>6} {stats['nesting_depth']:>6}")
             return 0
         else:
             return _print_result(result)
@@ -1173,6 +1389,9 @@ def validate_unused_command(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for valid, 1 for errors/warnings).
     """
+    forwarded = _forwarded("validate", args)
+    if forwarded is not None:
+        return forwarded
     file_path = args.file
     warn_unused = getattr(args, 'warn_unused', False)
     logger = Logger(name="FlowCLI")
@@ -1209,6 +1428,7 @@ def validate_unused_command(args: argparse.Namespace) -> int:
             base_path=path.parent,
             source_path=str(path),
             logger=logger,
+            cache=shared_cache(),
         )
         for e in semantic_errors:
             errors.append(f"Resolver: {e}")
@@ -1221,7 +1441,8 @@ def validate_unused_command(args: argparse.Namespace) -> int:
                 flow_file,
                 base_path=path.parent,
                 source_path=str(path),
-                logger=logger
+                logger=logger,
+                cache=shared_cache(),
             )
             
             # Find all defined nodes (excluding @out)
@@ -1290,6 +1511,85 @@ def validate_unused_command(args: argparse.Namespace) -> int:
         return _print_result({"success": False, "error": f"Unexpected error: {e}"})
 
 
+def bench_command(args: argparse.Namespace) -> int:
+    """
+    Benchmark every pipeline stage on synthetic and real corpora.
+    
+    Reports tokenize/parse/resolve/compile time and peak memory per corpus.
+    With --baseline, fails when a stage regressed past --threshold, when a
+    corpus has new failing files, or when the baseline cannot be compared
+    (other --scale, no shared corpus); with --save, writes the report for use
+    as a later baseline.
+    
+    Args:
+        args: Namespace with optional 'corpus', 'repeat', 'scale', 'baseline',
+              'save', 'threshold' and 'format' attributes.
+        
+    Returns:
+        Exit code (0 for success, 1 for error or regression).
+    """
+    repeat = getattr(args, 'repeat', None) or 5
+    scale = getattr(args, 'scale', None) or 1.0
+    threshold = getattr(args, 'threshold', None)
+    threshold = DEFAULT_THRESHOLD if threshold is None else threshold
+    output_format = getattr(args, 'format', 'json')
+    
+    baseline = None
+    baseline_path = getattr(args, 'baseline', None)
+    if baseline_path:
+        try:
+            baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            return _print_result({"success": False, "error": f"Cannot read baseline: {e}"})
+    
+    logger = Logger(name="FlowBench", level="WARNING")
+    with tempfile.TemporaryDirectory(prefix="flow_bench_") as work_dir:
+        report = run_benchmarks(Path(work_dir), repeat=repeat, scale=scale,
+                                names=getattr(args, 'corpus', None) or None, logger=logger)
+    
+    save_path = getattr(args, 'save', None)
+    if save_path:
+        Path(save_path).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    
+    regressions = compare_reports(report, baseline, threshold) if baseline else []
+    result = {"success": not regressions, **report}
+    if baseline:
+        result["baseline"] = baseline_path
+        result["regressions"] = regressions
+        if not comparable(report, baseline):
+            result["success"] = False
+            result["error"] = (
+                f"Baseline cannot be compared: recorded at --scale {baseline.get('scale')} "
+                f"with corpora {', '.join(baseline.get('corpora', {})) or '(none)'}"
+            )
+    
+    if output_format != "table":
+        return _print_result(result)
+    
+    _emit(f"Flow Pipeline Benchmark (best of {repeat}, scale {scale})")
+    _emit("=" * 78)
+    _emit(f"  {'Corpus':<18} {'Files':>5} {'Tokenize':>9} {'Parse':>9} {'Resolve':>9} "
+          f"{'Compile':>9} {'Peak KiB':>9}")
+    _emit("-" * 78)
+    for name, corpus in report["corpora"].items():
+        stages = corpus["stages"]
+        times = " ".join(f"{stages[stage] * 1000:>7.1f}ms" for stage in STAGES)
+        _emit(f"  {name:<18} {corpus['files']:>5} {times} {corpus['peak_memory'] // 1024:>9,}")
+        for error in corpus.get("errors", []):
+            _emit(f"    ! {error}")
+    if "error" in result:
+        _emit()
+        _emit(f"  {result['error']}")
+    if regressions:
+        _emit()
+        _emit(f"Regressions vs {baseline_path} (threshold {threshold:.0%}):")
+        for item in regressions:
+            change = f"{item['change']:+d}" if item['metric'] in ("files", "errors") else f"+{item['change']:.0%}"
+            _emit(f"  {item['corpus']:<18} {item['metric']:<18} {item['baseline']} -> "
+                  f"{item['current']} ({change})")
+    return 0 if result["success"] else 1
+
+
 def lsp_command(args: argparse.Namespace) -> int:
     """
     Start the FLOW Language Server Protocol (LSP) server.
@@ -1324,6 +1624,54 @@ def lsp_command(args: argparse.Namespace) -> int:
         return _print_result({"success": False, "error": f"LSP server error: {e}"})
 
 
+def serve_command(args: argparse.Namespace) -> int:
+    """
+    Run the Flow daemon, or query / stop a running one.
+    
+    While it runs, `flow compile/validate/graph/stats` are executed by the
+    daemon with warm caches (pass --no-daemon to any of them to opt out).
+    
+    Args:
+        args: Namespace with optional 'socket', 'root', 'poll', 'status' and
+              'stop' attributes.
+        
+    Returns:
+        Exit code (0 for success, 1 for error).
+    """
+    socket_path = Path(args.socket) if getattr(args, 'socket', None) else default_socket_path()
+    
+    if getattr(args, 'status', False) or getattr(args, 'stop', False):
+        method = "status" if getattr(args, 'status', False) else "shutdown"
+        try:
+            response = daemon_request(method, socket_path=socket_path)
+        except (OSError, ValueError) as e:
+            return _print_result({"success": False, "error": f"No Flow daemon on {socket_path}: {e}"})
+        return _print_result({"success": "result" in response, **response.get("result", response)})
+    
+    logger = Logger(name="FlowCLI")
+    daemon = FlowDaemon(
+        DAEMON_COMMANDS,
+        socket_path=socket_path,
+        root=Path(args.root) if getattr(args, 'root', None) else None,
+        poll_interval=getattr(args, 'poll', None) or DEFAULT_POLL_INTERVAL,
+        logger=logger,
+    )
+    try:
+        daemon.serve_forever()
+    except (OSError, RuntimeError) as e:
+        return _print_result({"success": False, "error": f"Flow daemon error: {e}"})
+    return 0
+
+
+# Commands `flow serve` runs for thin clients (CLI name -> handler)
+DAEMON_COMMANDS = {
+    "compile": compile_command,
+    "validate": validate_unused_command,
+    "graph": graph_command,
+    "stats": stats_command,
+}
+
+
 # =============================================================================
 # CLI Registration (cli_manager integration)
 # =============================================================================
@@ -1370,8 +1718,19 @@ def register_cli() -> None:
                 help="Compile a Flow file to Markdown",
                 handler="flow_core.flow_cli:compile_command",
                 args=[
-                    CommandArg(name="file", help="Path to the .flow file"),
+                    CommandArg(name="file", help="Path to the .flow file", nargs="?"),
                     CommandArg(name="--output", short="-o", help="Output file path"),
+                    CommandArg(name="--stats", action="store_true",
+                              help="Print JSON with per-stage timings and counters (compiles without cache)"),
+                    CommandArg(name="--cache-dir",
+                              help="Persist compiled output in this directory and reuse it while inputs are unchanged"),
+                    CommandArg(name="--all",
+                              help="Compile every .flow file under this directory (skips _lib/)"),
+                    CommandArg(name="--out", help="Output directory for --all"),
+                    CommandArg(name="--jobs", short="-j", type="int",
+                              help="Worker processes for --all (default: CPU count)"),
+                    CommandArg(name="--no-daemon", action="store_true",
+                              help="Run in this process even if `flow serve` is running"),
                 ],
             ),
             Command(
@@ -1384,6 +1743,8 @@ def register_cli() -> None:
                               choices=["dot", "json", "mermaid"], help="Output format"),
                     CommandArg(name="--tier", short="-t", default="0",
                               choices=["0", "1"], help="Visibility tier (0=structural, 1=detailed)"),
+                    CommandArg(name="--no-daemon", action="store_true",
+                              help="Run in this process even if `flow serve` is running"),
                 ],
             ),
             Command(
@@ -1394,6 +1755,8 @@ def register_cli() -> None:
                     CommandArg(name="file", help="Path to the .flow file"),
                     CommandArg(name="--warn-unused", action="store_true",
                               help="Warn about nodes defined but never referenced (dead code)"),
+                    CommandArg(name="--no-daemon", action="store_true",
+                              help="Run in this process even if `flow serve` is running"),
                 ],
             ),
             Command(
@@ -1423,7 +1786,10 @@ def register_cli() -> None:
                 handler="flow_core.flow_cli:impact_command",
                 args=[
                     CommandArg(name="file", help="Path to the .flow file"),
-                    CommandArg(name="node", help="Node name to analyze impact for (without @)"),
+                    CommandArg(name="node", nargs="*",
+                              help="Node name(s) to analyze impact for (without @)"),
+                    CommandArg(name="--batch", short="-b", action="store_true",
+                              help="Analyze several nodes (default: all) from one resolve"),
                 ],
             ),
             Command(
@@ -1431,8 +1797,12 @@ def register_cli() -> None:
                 help="Find all references to a node across files",
                 handler="flow_core.flow_cli:usages_command",
                 args=[
-                    CommandArg(name="file", help="Path to the .flow file"),
+                    CommandArg(name="file", help="Path to the .flow file (or workspace directory with --workspace)"),
                     CommandArg(name="node", help="Node name to find usages for (without @)"),
+                    CommandArg(name="--workspace", short="-w", action="store_true",
+                              help="Search every .flow file under the file's directory via the symbol index"),
+                    CommandArg(name="--cache-dir",
+                              help="Keep the workspace symbol index in this directory between runs"),
                 ],
             ),
             Command(
@@ -1455,6 +1825,42 @@ def register_cli() -> None:
                     CommandArg(name="file", help="Path to the .flow file"),
                     CommandArg(name="--format", short="-f", default="json",
                               choices=["json", "table"], help="Output format"),
+                    CommandArg(name="--no-daemon", action="store_true",
+                              help="Run in this process even if `flow serve` is running"),
+                ],
+            ),
+            Command(
+                name="bench",
+                help="Benchmark tokenize/parse/resolve/compile on synthetic and real corpora",
+                handler="flow_core.flow_cli:bench_command",
+                args=[
+                    CommandArg(name="--corpus", short="-c", nargs="*",
+                              choices=list(CORPUS_NAMES),
+                              help="Corpora to run (default: all)"),
+                    CommandArg(name="--repeat", short="-r", type="int", default=5,
+                              help="Runs per file; the best time is kept (default: 5)"),
+                    CommandArg(name="--scale", type="float", default=1.0,
+                              help="Size multiplier for the synthetic corpora (default: 1.0)"),
+                    CommandArg(name="--baseline", short="-b",
+                              help="Report JSON to compare against; exit 1 on regression"),
+                    CommandArg(name="--save", short="-s", help="Write the report JSON to this file"),
+                    CommandArg(name="--threshold", type="float",
+                              help=f"Allowed slowdown before a stage counts as regressed (default: {DEFAULT_THRESHOLD})"),
+                    CommandArg(name="--format", short="-f", default="json",
+                              choices=["json", "table"], help="Output format"),
+                ],
+            ),
+            Command(
+                name="serve",
+                help="Run a Flow daemon that keeps parsed/compiled files warm for the CLI",
+                handler="flow_core.flow_cli:serve_command",
+                args=[
+                    CommandArg(name="--socket", help="Unix socket path (default: $FLOW_DAEMON_SOCKET or a per-user path)"),
+                    CommandArg(name="--root", help="Directory whose .flow files are watched (default: cwd)"),
+                    CommandArg(name="--poll", type="float",
+                              help=f"Seconds between file watcher passes (default: {DEFAULT_POLL_INTERVAL})"),
+                    CommandArg(name="--status", action="store_true", help="Show the running daemon's status"),
+                    CommandArg(name="--stop", action="store_true", help="Stop the running daemon"),
                 ],
             ),
             Command(
@@ -13,10 +13,21 @@ Usage:
     >>> markdown = controller.compile_source(source_code)
     >>> # Or from file:
     >>> markdown = controller.compile_file(Path("document.flow"))
+
+Parsed files and compiled output are cached by content hash in a FlowCache
+shared across controllers in the process (see flow_cache).
+
+Pass ``stats=True`` to record per-stage timings and counters in
+``controller.stats`` (a PipelineStats):
+    >>> controller = FlowController(stats=True, use_cache=False)
+    >>> controller.compile_file(Path("agent.flow"))
+    >>> controller.stats.to_dict()["stages"]["resolve"]
 """
 
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 from logger_util import Logger
 from .models import Token, FlowFile, ResolvedFlowFile
@@ -24,6 +35,46 @@ from .tokenizer import Tokenizer
 from .parser import Parser
 from .resolver import Resolver
 from .compiler import Compiler
+from .flow_cache import FlowCache, shared_cache
+
+STAGES = ("tokenize", "parse", "resolve", "compile")
+
+
+@dataclass
+class PipelineStats:
+    """
+    Stage timings and counters accumulated by FlowController(stats=True).
+    
+    Counters add up over every call until reset(). Imported files are
+    tokenized and parsed inside the resolve stage.
+    """
+    stages: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+    files: int = 0              # compile_file / compile_source calls
+    tokens: int = 0             # tokens of entry sources
+    nodes: int = 0              # nodes parsed from entry sources
+    resolved_nodes: int = 0     # nodes after imports were merged
+    import_files: int = 0       # files imported per resolve (directly or transitively)
+    node_clones: int = 0        # shallow clones (import renames, assignments); nothing is deep-copied
+    memo_hits: int = 0          # Compiler.memo_stats, summed over compile() calls
+    memo_misses: int = 0
+    parse_cache_hits: int = 0   # entry and imported files served by the FlowCache
+    compile_cache_hits: int = 0
+    output_chars: int = 0
+    
+    def add_stage(self, stage: str, seconds: float) -> None:
+        """Add ``seconds`` to a stage's running total."""
+        self.stages[stage] += seconds
+    
+    def reset(self) -> None:
+        """Zero every timing and counter."""
+        self.__init__()
+    
+    def to_dict(self) -> Dict:
+        """JSON-serializable view (stage times in seconds)."""
+        data = {name: value for name, value in vars(self).items() if name != "stages"}
+        data["stages"] = {stage: round(seconds, 6) for stage, seconds in self.stages.items()}
+        data["total"] = round(sum(self.stages.values()), 6)
+        return data
 
 
 class FlowController:
@@ -44,18 +95,31 @@ class FlowController:
         - compile_file(): File path → Markdown (reads file, runs all stages)
     """
     
-    def __init__(self, logger: Optional[Logger] = None) -> None:
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        cache: Optional[FlowCache] = None,
+        use_cache: bool = True,
+        stats: bool = False,
+    ) -> None:
         """
         Initialize the Flow controller.
         
         Args:
             logger: Optional logger instance. Creates one if not provided.
+            cache: FlowCache for parsed files and compiled output. Defaults to
+                   the process-wide shared cache.
+            use_cache: If False, always run every stage from scratch.
+            stats: If True, record stage timings and counters in ``self.stats``.
         """
         self.logger = logger or Logger(name="FlowController")
+        self.cache: Optional[FlowCache] = (cache or shared_cache()) if use_cache else None
         self._tokenizer = Tokenizer(logger=self.logger)
         self._parser = Parser(logger=self.logger)
-        self._resolver = Resolver(logger=self.logger)
+        self._resolver = Resolver(logger=self.logger, cache=self.cache)
         self._compiler = Compiler(logger=self.logger)
+        self._last_resolved_files: Optional[Set[Path]] = None
+        self.stats: Optional[PipelineStats] = PipelineStats() if stats else None
     
     # =========================================================================
     # Stage 1: Tokenization
@@ -75,7 +139,11 @@ class FlowController:
             TokenizerError: If tokenization fails.
         """
         self.logger.debug("Starting tokenization")
+        start = time.perf_counter()
         tokens = self._tokenizer.tokenize(source)
+        if self.stats is not None:
+            self.stats.add_stage("tokenize", time.perf_counter() - start)
+            self.stats.tokens += len(tokens)
         self.logger.debug(f"Tokenization complete: {len(tokens)} tokens")
         return tokens
     
@@ -105,12 +173,12 @@ class FlowController:
     # Stage 2: Parsing
     # =========================================================================
     
-    def parse(self, tokens: List[Token]) -> FlowFile:
+    def parse(self, tokens: Iterable[Token]) -> FlowFile:
         """
         Parse tokens into a FlowFile AST.
         
         Args:
-            tokens: List of tokens from tokenization.
+            tokens: Tokens from tokenization (a list or a lazy iterator).
             
         Returns:
             FlowFile AST.
@@ -120,7 +188,11 @@ class FlowController:
             DuplicateNodeError: On duplicate node definitions.
         """
         self.logger.debug("Starting parsing")
+        start = time.perf_counter()
         flow_file = self._parser.parse(tokens)
+        if self.stats is not None:
+            self.stats.add_stage("parse", time.perf_counter() - start)
+            self.stats.nodes += len(flow_file.nodes)
         self.logger.debug(f"Parsing complete: {len(flow_file.nodes)} nodes")
         return flow_file
     
@@ -128,14 +200,20 @@ class FlowController:
         """
         Tokenize and parse source code in one step.
         
+        Tokens are streamed into the parser (Tokenizer.iter_tokens), so no
+        token list is built and syntax errors surface before the rest of the
+        file is scanned. With stats enabled the token list is built first, so
+        tokenizing and parsing are timed separately.
+        
         Args:
             source: The Flow language source code string.
             
         Returns:
             FlowFile AST.
         """
-        tokens = self.tokenize(source)
-        return self.parse(tokens)
+        if self.stats is not None:
+            return self.parse(self.tokenize(source))
+        return self.parse(self._tokenizer.iter_tokens(source))
     
     # =========================================================================
     # Stage 3: Resolution
@@ -167,7 +245,17 @@ class FlowController:
             ImportFileNotFoundError: Import file not found.
         """
         self.logger.debug("Starting resolution")
+        self._last_resolved_files = None
+        start = time.perf_counter()
+        parse_hits = self.cache.stats.parse_hits if self.cache is not None else 0
         resolved = self._resolver.resolve(flow_file, base_path, source_path)
+        if self.stats is not None:
+            self.stats.add_stage("resolve", time.perf_counter() - start)
+            self.stats.resolved_nodes += len(resolved.nodes)
+            self.stats.import_files += len(self._resolver._graph_files) - (1 if source_path else 0)
+            self.stats.node_clones += self._resolver.clone_count
+            if self.cache is not None:
+                self.stats.parse_cache_hits += self.cache.stats.parse_hits - parse_hits
         self.logger.debug(f"Resolution complete: {len(resolved.nodes)} nodes")
         return resolved
     
@@ -178,10 +266,15 @@ class FlowController:
         file.  Useful for computing transitive hashes so that changes in shared
         fragments trigger recompilation of dependants.
 
+        After a compile_file() served from the cache, this is the file set
+        recorded when the output was cached.
+
         Returns:
             A **copy** of the resolver's graph-files set, or an empty set if
             no resolve has been performed yet.
         """
+        if self._last_resolved_files is not None:
+            return set(self._last_resolved_files)
         return set(self._resolver._graph_files)
     
     # =========================================================================
@@ -207,7 +300,14 @@ class FlowController:
             MissingOutNodeError: If require_out=True and no @out.
         """
         self.logger.debug("Starting compilation")
+        start = time.perf_counter()
         markdown = self._compiler.compile(resolved, require_out)
+        if self.stats is not None:
+            self.stats.add_stage("compile", time.perf_counter() - start)
+            memo = self._compiler.memo_stats
+            self.stats.memo_hits += memo["hits"]
+            self.stats.memo_misses += memo["misses"]
+            self.stats.output_chars += len(markdown)
         self.logger.debug(f"Compilation complete: {len(markdown)} chars")
         return markdown
     
@@ -247,12 +347,11 @@ class FlowController:
             Hello, World!
         """
         self.logger.info("Compiling source (full pipeline)")
+        if self.stats is not None:
+            self.stats.files += 1
         
-        # Stage 1: Tokenize
-        tokens = self.tokenize(source)
-        
-        # Stage 2: Parse
-        flow_file = self.parse(tokens)
+        # Stages 1-2: Tokenize and parse
+        flow_file = self._parse_for_resolve(source)
         
         # Stage 3: Resolve
         resolved = self.resolve(flow_file, base_path)
@@ -291,6 +390,19 @@ class FlowController:
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"Flow file not found: {file_path}")
+        if self.stats is not None:
+            self.stats.files += 1
+        
+        # Unchanged entry file and imports: reuse the cached Markdown
+        if self.cache is not None:
+            cached = self.cache.get_compiled(file_path, require_out)
+            if cached is not None:
+                markdown, files = cached
+                self._last_resolved_files = set(files)
+                if self.stats is not None:
+                    self.stats.compile_cache_hits += 1
+                self.logger.debug(f"Compile cache hit: {file_path}")
+                return markdown
         
         # Read source
         source = file_path.read_text(encoding="utf-8")
@@ -298,11 +410,8 @@ class FlowController:
         # Use file's directory as base path for imports
         base_path = file_path.parent.resolve()
         
-        # Stage 1: Tokenize
-        tokens = self.tokenize(source)
-        
-        # Stage 2: Parse
-        flow_file = self.parse(tokens)
+        # Stages 1-2: Tokenize and parse
+        flow_file = self._parse_for_resolve(source)
         
         # Stage 3: Resolve (with file context)
         resolved = self.resolve(
@@ -312,7 +421,21 @@ class FlowController:
         )
         
         # Stage 4: Compile
-        return self.compile(resolved, require_out)
+        markdown = self.compile(resolved, require_out)
+        
+        if self.cache is not None:
+            self.cache.put_compiled(file_path, require_out, self.get_last_resolved_files(), markdown)
+        return markdown
+    
+    def _parse_for_resolve(self, source: str) -> FlowFile:
+        """Tokenize and parse an entry file's source, through the cache when enabled."""
+        if self.cache is None:
+            return self.parse_source(source)
+        parse_hits = self.cache.stats.parse_hits
+        flow_file = self.cache.parse(source, self.parse_source)
+        if self.stats is not None:
+            self.stats.parse_cache_hits += self.cache.stats.parse_hits - parse_hits
+        return flow_file
 
 
 # =============================================================================
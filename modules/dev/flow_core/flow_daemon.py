@@ -0,0 +1,549 @@
+"""
+Flow Daemon - Keeps parsed and compiled Flow files warm between CLI calls.
+
+``flow serve`` starts a FlowDaemon on a Unix domain socket. The ``flow
+compile/validate/graph/stats`` commands first try to forward themselves to it
+(forward_command) and run in-process when no daemon answers, so every call
+skips interpreter start-up, imports and re-parsing of shared ``_lib``
+fragments once a daemon is running.
+
+The daemon runs the same command handlers as the CLI, in its own process, with
+the process-wide FlowCache (see flow_cache.shared_cache). A watcher thread polls
+the ``.flow`` files under its root: changed files are parsed again right away
+and entry files compiled through the daemon are recompiled, so the next
+request finds both layers warm. The cache is content-addressed, so a missed
+change can cost time but never returns stale output.
+
+Protocol: JSON-RPC 2.0, one request or response object per line.
+
+    run(command, args, cwd, protocol) -> {"exit_code": int, "stdout": str}
+    status() -> {"pid", "root", "uptime", "requests", "watched_files", ...}
+    shutdown() -> {"stopping": true}
+
+While it works on a request the daemon sends {"method": "heartbeat"}
+notifications every HEARTBEAT_INTERVAL seconds. A client that hears nothing
+for HEARTBEAT_TIMEOUT gives up and runs the command in-process, so a hung
+daemon costs seconds, not the whole REQUEST_TIMEOUT.
+
+Usage:
+    >>> daemon = FlowDaemon({"compile": compile_command}, root=Path("flows"))
+    >>> daemon.serve_forever()                      # flow serve
+    >>> forward_command("compile", args)            # client side; None = no daemon
+"""
+
+import argparse
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+from logger_util import Logger
+from .errors import FlowError
+from .flow_cache import FlowCache, shared_cache
+from .flow_controller import FlowController
+from .parser import parse_stream
+
+# Bump when the run() parameters or command output change incompatibly;
+# clients then fall back to in-process execution instead of using the daemon.
+DAEMON_PROTOCOL = 2
+
+SOCKET_ENV = "FLOW_DAEMON_SOCKET"
+NO_DAEMON_ENV = "FLOW_NO_DAEMON"
+DEFAULT_POLL_INTERVAL = 1.0
+CONNECT_TIMEOUT = 0.5
+HEARTBEAT_INTERVAL = 0.5
+# Silence (no heartbeat, no response) after which a client abandons the daemon
+HEARTBEAT_TIMEOUT = 2.0
+# Upper bound for one request, heartbeats or not
+REQUEST_TIMEOUT = 300.0
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+CommandHandler = Callable[[argparse.Namespace], int]
+FileStamp = Tuple[int, int]
+
+
+def default_socket_path() -> Path:
+    """
+    Return the daemon socket path.
+
+    ``$FLOW_DAEMON_SOCKET`` if set, else ``flow-daemon-<uid>.sock`` in
+    ``$XDG_RUNTIME_DIR`` (or the temp directory).
+    """
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(base) / f"flow-daemon-{uid}.sock"
+
+
+# =============================================================================
+# Command output
+# =============================================================================
+
+_output = threading.local()
+
+
+def output_stream() -> TextIO:
+    """
+    Return the stream command output goes to on this thread.
+
+    sys.stdout normally; while the daemon serves a request, that request's
+    buffer. Log output is not affected and stays in the daemon.
+    """
+    return getattr(_output, "stream", None) or sys.stdout
+
+
+@contextmanager
+def _captured_output() -> Iterator[io.StringIO]:
+    buffer = io.StringIO()
+    _output.stream = buffer
+    try:
+        yield buffer
+    finally:
+        _output.stream = None
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+def request(
+    method: str,
+    params: Optional[Dict] = None,
+    socket_path: Optional[Path] = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> Dict:
+    """
+    Send one JSON-RPC request to the daemon and return the response object.
+
+    Args:
+        method: Method name ("run", "status", "shutdown").
+        params: Method parameters.
+        socket_path: Daemon socket (default: default_socket_path()).
+        timeout: Seconds to wait for the response in total. The wait also
+                 ends after HEARTBEAT_TIMEOUT without a heartbeat.
+
+    Raises:
+        OSError: No daemon is listening, the connection failed, or the daemon
+                 went silent or ran past ``timeout``.
+        ValueError: The response is not valid JSON.
+    """
+    path = Path(socket_path or default_socket_path())
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not available on this platform")
+    message = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+    deadline = time.monotonic() + timeout
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(path))
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise OSError(f"Daemon did not answer within {timeout}s")
+                sock.settimeout(min(HEARTBEAT_TIMEOUT, remaining))
+                line = reader.readline()
+                if not line:
+                    raise OSError("Daemon closed the connection")
+                response = json.loads(line)
+                if not isinstance(response, dict) or response.get("method") != "heartbeat":
+                    return response
+
+
+def forward_command(
+    command: str, args: argparse.Namespace, socket_path: Optional[Path] = None
+) -> Optional[int]:
+    """
+    Run a CLI command in the daemon, if one is listening, and print its output.
+
+    Args:
+        command: CLI command name (e.g. "compile").
+        args: The parsed command arguments.
+        socket_path: Daemon socket (default: default_socket_path()).
+
+    Returns:
+        The command's exit code, or None if no daemon handled it (no socket,
+        connection refused, protocol mismatch, daemon error); the caller
+        then runs the command in-process.
+    """
+    if os.environ.get(NO_DAEMON_ENV):
+        return None
+    path = Path(socket_path or default_socket_path())
+    if not path.exists():
+        return None
+
+    params = {
+        "command": command,
+        "args": _plain_args(args),
+        "cwd": os.getcwd(),
+        "protocol": DAEMON_PROTOCOL,
+    }
+    try:
+        response = request("run", params, socket_path=path)
+    except (OSError, ValueError):
+        return None
+    result = response.get("result")
+    if not isinstance(result, dict):
+        return None
+    output_stream().write(result.get("stdout", ""))
+    return int(result.get("exit_code", 1))
+
+
+def _plain_args(args: argparse.Namespace) -> Dict:
+    """The JSON-serializable arguments of a Namespace (drops handlers etc.)."""
+    plain: Dict = {}
+    for key, value in vars(args).items():
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            plain[key] = value
+        elif isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+            plain[key] = list(value)
+    return plain
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads JSON-RPC requests line by line and writes one response per line."""
+
+    def handle(self) -> None:
+        daemon: "FlowDaemon" = self.server.daemon  # type: ignore[attr-defined]
+        self._write_lock = threading.Lock()
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError as e:
+                response = _error(None, PARSE_ERROR, f"Invalid JSON: {e}")
+            else:
+                with self._heartbeats():
+                    response = daemon.dispatch(message)
+            self._send(response)
+
+    def _send(self, message: Dict) -> None:
+        with self._write_lock:
+            self.wfile.write(json.dumps(message, default=str).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+    @contextmanager
+    def _heartbeats(self) -> Iterator[None]:
+        """Send heartbeat notifications every HEARTBEAT_INTERVAL until the block ends."""
+        stop = threading.Event()
+
+        def beat() -> None:
+            while not stop.wait(HEARTBEAT_INTERVAL):
+                try:
+                    self._send({"jsonrpc": "2.0", "method": "heartbeat"})
+                except OSError:
+                    return  # Client gave up
+
+        thread = threading.Thread(target=beat, name="FlowDaemonHeartbeat", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class FlowDaemon:
+    """
+    Serves Flow CLI commands over a Unix domain socket with warm caches.
+
+    Commands run one at a time (they change into the client's working
+    directory); status and shutdown are answered concurrently.
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, CommandHandler],
+        socket_path: Optional[Path] = None,
+        root: Optional[Path] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        cache: Optional[FlowCache] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Initialize the daemon.
+
+        Args:
+            handlers: CLI command name -> handler, as run by the CLI.
+            socket_path: Socket to listen on (default: default_socket_path()).
+            root: Directory whose .flow files are watched (default: cwd).
+            poll_interval: Seconds between watcher passes.
+            cache: Cache kept warm (default: the process-wide shared cache,
+                   which the command handlers use).
+            logger: Optional logger instance.
+        """
+        self.logger = logger or Logger(name="FlowDaemon")
+        self.handlers = dict(handlers)
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.root = Path(root or Path.cwd()).resolve()
+        self.poll_interval = poll_interval
+        self.cache = cache or shared_cache()
+        self.requests = 0
+        self.started = time.time()
+        self._controller = FlowController(logger=self.logger, cache=self.cache)
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: Optional[_UnixServer] = None
+        self._threads: List[threading.Thread] = []
+        # Watched .flow files and their (mtime_ns, size) at the last pass
+        self._stamps: Dict[Path, FileStamp] = {}
+        # Entry files compiled through the daemon; recompiled when files change
+        self._entries: Set[Path] = set()
+        self._state_lock = threading.Lock()
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """
+        Bind the socket, warm the cache and start serving in background threads.
+
+        Raises:
+            RuntimeError: Another daemon is already listening on the socket.
+        """
+        if self.socket_path.exists():
+            try:
+                request("status", socket_path=self.socket_path, timeout=CONNECT_TIMEOUT)
+            except (OSError, ValueError):
+                self.socket_path.unlink()  # Stale socket of a daemon that died
+            else:
+                raise RuntimeError(f"A Flow daemon is already listening on {self.socket_path}")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o177)  # Socket readable/writable by this user only
+        try:
+            self._server = _UnixServer(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.daemon = self  # type: ignore[attr-defined]
+
+        warmed = len(self.poll_changes())
+        self.logger.info(f"Flow daemon on {self.socket_path} (root {self.root}, {warmed} file(s) parsed)")
+
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.1},
+                             name="FlowDaemonServer", daemon=True),
+            threading.Thread(target=self._watch, name="FlowDaemonWatcher", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def serve_forever(self) -> None:
+        """Start the daemon and block until shutdown() (or Ctrl+C)."""
+        self.start()
+        try:
+            while not self._stop.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop serving and remove the socket."""
+        self._stop.set()
+        server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+            self.logger.info("Flow daemon stopped")
+
+    # =========================================================================
+    # Requests
+    # =========================================================================
+
+    def dispatch(self, message: Dict) -> Dict:
+        """
+        Answer one JSON-RPC request object.
+
+        Args:
+            message: The decoded request.
+
+        Returns:
+            The JSON-RPC response object.
+        """
+        request_id = message.get("id") if isinstance(message, dict) else None
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            return _error(request_id, INVALID_REQUEST, "Expected a JSON-RPC request object")
+        params = message.get("params") or {}
+        if not isinstance(params, dict):
+            return _error(request_id, INVALID_PARAMS, "params must be an object")
+
+        method = message["method"]
+        try:
+            if method == "run":
+                return self._run(request_id, params)
+            if method == "status":
+                return _result(request_id, self.status())
+            if method == "shutdown":
+                threading.Thread(target=self.shutdown, name="FlowDaemonShutdown").start()
+                return _result(request_id, {"stopping": True})
+        except Exception as e:  # Keep serving whatever a command does
+            self.logger.warning(f"Daemon request failed: {e}")
+            return _error(request_id, INTERNAL_ERROR, str(e))
+        return _error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+    def _run(self, request_id: object, params: Dict) -> Dict:
+        if params.get("protocol") != DAEMON_PROTOCOL:
+            return _error(request_id, INVALID_PARAMS,
+                          f"Protocol {params.get('protocol')} not supported (daemon: {DAEMON_PROTOCOL})")
+        command = params.get("command")
+        if command not in self.handlers:
+            return _error(request_id, METHOD_NOT_FOUND, f"Command not served by the daemon: {command}")
+        args = params.get("args") or {}
+        cwd = params.get("cwd") or str(self.root)
+        if not isinstance(args, dict) or not Path(cwd).is_dir():
+            return _error(request_id, INVALID_PARAMS, "args must be an object and cwd a directory")
+        return _result(request_id, self.run_command(command, args, Path(cwd)))
+
+    def run_command(self, command: str, args: Dict, cwd: Path) -> Dict:
+        """
+        Run a CLI command handler as the CLI would in ``cwd``.
+
+        Args:
+            command: Name of a registered handler.
+            args: The command's arguments.
+            cwd: The client's working directory (relative paths resolve there).
+
+        Returns:
+            {"exit_code": int, "stdout": str}
+        """
+        namespace = argparse.Namespace(**args)
+        namespace.no_daemon = True
+        with self._run_lock:
+            previous = os.getcwd()
+            os.chdir(cwd)
+            try:
+                with _captured_output() as buffer:
+                    exit_code = self.handlers[command](namespace)
+            finally:
+                os.chdir(previous)
+            self.requests += 1
+
+        file_arg = args.get("file")
+        if command == "compile" and exit_code == 0 and isinstance(file_arg, str):
+            with self._state_lock:
+                self._entries.add((cwd / file_arg).resolve())
+        return {"exit_code": exit_code, "stdout": buffer.getvalue()}
+
+    def status(self) -> Dict:
+        """Return daemon state and cache counters."""
+        stats = self.cache.stats
+        with self._state_lock:
+            watched, entries = len(self._stamps), len(self._entries)
+        return {
+            "pid": os.getpid(),
+            "protocol": DAEMON_PROTOCOL,
+            "socket": str(self.socket_path),
+            "root": str(self.root),
+            "uptime": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "commands": sorted(self.handlers),
+            "watched_files": watched,
+            "compiled_entries": entries,
+            "cache": {
+                "parse_hits": stats.parse_hits,
+                "parse_misses": stats.parse_misses,
+                "compile_hits": stats.compile_hits,
+                "compile_misses": stats.compile_misses,
+            },
+        }
+
+    # =========================================================================
+    # Watching
+    # =========================================================================
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll_changes()
+            except Exception as e:  # A bad pass must not kill the watcher
+                self.logger.warning(f"Daemon watcher pass failed: {e}")
+
+    def poll_changes(self) -> List[Path]:
+        """
+        Run one watcher pass over the .flow files under ``root``.
+
+        New and changed files are parsed into the cache; if any file changed,
+        the entry files compiled through the daemon are recompiled.
+
+        Returns:
+            The new or changed files.
+        """
+        stamps: Dict[Path, FileStamp] = {}
+        for path in _scan(self.root):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+
+        with self._state_lock:
+            changed = [p for p, stamp in stamps.items() if self._stamps.get(p) != stamp]
+            removed = [p for p in self._stamps if p not in stamps]
+            self._stamps = stamps
+            entries = sorted(self._entries) if changed or removed else []
+
+        for path in changed:
+            try:
+                self.cache.load_flow_file(path, parse_stream)
+            except (FlowError, OSError, UnicodeDecodeError):
+                pass  # Reported when a command uses the file
+        for entry in entries:
+            try:
+                self._controller.compile_file(entry)
+            except (FlowError, OSError, UnicodeDecodeError):
+                pass
+        if entries:
+            self.logger.debug(f"{len(changed) + len(removed)} file(s) changed, "
+                              f"{len(entries)} entry file(s) recompiled")
+        return changed
+
+
+def _scan(root: Path) -> Iterator[Path]:
+    """Yield every .flow file under ``root``, skipping hidden directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.endswith(".flow"):
+                yield Path(dirpath, name).resolve()
+
+
+def _result(request_id: object, result: Dict) -> Dict:
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _error(request_id: object, code: int, message: str) -> Dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
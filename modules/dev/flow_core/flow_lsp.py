@@ -5,6 +5,18 @@ Provides Language Server Protocol support for FLOW files:
 - Diagnostics: Real-time error reporting
 - Completion: Autocomplete for $node_id references (trigger on $)
 - Go-to-Definition: Jump to node definitions
+- References / Workspace Symbols: Find node usages and definitions workspace-wide
+
+Edits arrive as incremental text changes. Each open document keeps an
+IncrementalParser that re-parses only from the last top-level statement
+boundary above the first edited line, and validation after a change is
+debounced so a burst of keystrokes is validated once. Imported files are
+parsed once for all open documents through a shared ImportCache, which reads
+open documents from their buffers and is invalidated by watched-file events.
+When a file changes, the open documents importing it (found through a reverse
+ImportIndex) are re-validated on worker threads; superseded runs are cancelled.
+References and workspace symbols come from a SymbolIndex of every .flow file
+under the workspace root, built on first use and then updated per file.
 
 Usage:
     python -m flow_core.flow_lsp
@@ -17,10 +29,13 @@ Library: pygls >= 1.0.0
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import sys
+import threading
 from pathlib import Path
-from typing import Optional, Dict, List, Set
+from typing import Optional, Dict, Iterable, List, Set
 from urllib.parse import unquote
 
 from lsprotocol import types as lsp
@@ -30,9 +45,13 @@ from pygls.workspace import TextDocument
 from logger_util import Logger
 from .tokenizer import Tokenizer
 from .parser import Parser
+from .incremental import IncrementalParser
+from .import_cache import ImportCache
+from .import_index import ImportIndex
+from .symbol_index import SymbolIndex, SymbolKind, SymbolLocation
 from .resolver import Resolver
 from .models import FlowFile, FlowNode, Position, NodeRef
-from .errors import FlowError
+from .errors import FlowError, ImportFileNotFoundError
 
 
 # =============================================================================
@@ -44,6 +63,12 @@ FLOW_FILE_PATTERN = "**/*.flow"
 SERVER_NAME = "flow-lsp"
 SERVER_VERSION = "0.1.0"
 
+# Quiet period after the last edit before a changed document is re-validated
+DIAGNOSTICS_DEBOUNCE_SECONDS = 0.15
+
+# Maximum results returned for a workspace/symbol query
+WORKSPACE_SYMBOL_LIMIT = 200
+
 # Path targets for file clickability in go-to-definition.
 # Match ./ or ../ relative paths ending in .flow/.md and require a safe boundary
 # after extension to avoid partial captures (e.g. ".flowx" should not match).
@@ -70,8 +95,13 @@ class FlowLanguageServer(LanguageServer):
     """
     
     def __init__(self, logger: Optional[Logger] = None) -> None:
-        super().__init__(name=SERVER_NAME, version=SERVER_VERSION)
+        super().__init__(
+            name=SERVER_NAME,
+            version=SERVER_VERSION,
+            text_document_sync_kind=lsp.TextDocumentSyncKind.Incremental,
+        )
         self.logger = logger or Logger(name="FlowLSP")
+        self.debounce_delay = DIAGNOSTICS_DEBOUNCE_SECONDS
         
         # Cache for parsed files: uri -> (version, FlowFile, node_positions)
         self._file_cache: Dict[str, tuple[int, FlowFile, Dict[str, Position]]] = {}
@@ -79,10 +109,32 @@ class FlowLanguageServer(LanguageServer):
         # Cache for imported node source maps: uri -> {node_id: (file_path, Position)}
         self._import_source_map: Dict[str, Dict[str, tuple[str, Position]]] = {}
         
+        # Per-document incremental parsers: uri -> IncrementalParser
+        self._incremental: Dict[str, IncrementalParser] = {}
+        
+        # First edited line (1-based) per document since its last parse
+        self._changed_lines: Dict[str, int] = {}
+        
+        # Parsed imported files shared by every open document
+        self.import_cache = ImportCache(logger=self.logger)
+        
+        # Reverse import index: imported file -> open documents importing it
+        self.import_index = ImportIndex()
+        
+        # Pending background revalidations: uri -> task (superseded runs are cancelled)
+        self._revalidations: Dict[str, asyncio.Task] = {}
+        
+        # Per-document locks: a document is parsed/validated by one thread at a time
+        self._document_locks: Dict[str, threading.Lock] = {}
+        
+        # Definitions/references across the workspace; scanned on first use
+        self.symbol_index = SymbolIndex(logger=self.logger)
+        self._symbol_index_ready = False
+        
         # Tokenizer, parser, resolver instances
         self._tokenizer = Tokenizer(logger=self.logger)
         self._parser = Parser(logger=self.logger)
-        self._resolver = Resolver(logger=self.logger)
+        self._resolver = Resolver(logger=self.logger, cache=self.import_cache)
     
     def get_file_path(self, uri: str) -> Path:
         """Convert a file URI to a Path."""
@@ -112,6 +164,95 @@ class FlowLanguageServer(LanguageServer):
         self._file_cache[uri] = (version, flow_file, node_positions)
         return node_positions
     
+    def record_changes(
+        self, uri: str, changes: List[lsp.TextDocumentContentChangeEvent]
+    ) -> None:
+        """
+        Remember the first line touched by a batch of edits to a document.
+        
+        Lines above the earliest change start are unchanged, whatever order the
+        changes are applied in. A whole-document change marks line 1.
+        """
+        first_line = self._changed_lines.get(uri, sys.maxsize)
+        for change in changes:
+            change_range = getattr(change, "range", None)
+            line = change_range.start.line + 1 if change_range is not None else 1
+            first_line = min(first_line, line)
+        self._changed_lines[uri] = first_line
+    
+    def parse_source(self, uri: str, source: str) -> FlowFile:
+        """
+        Parse a document's current text, re-parsing only from its first edit.
+        
+        Raises:
+            FlowError: On tokenizer or parser errors.
+        """
+        incremental = self._incremental.get(uri)
+        if incremental is None:
+            incremental = IncrementalParser(logger=self.logger)
+            self._incremental[uri] = incremental
+            self._changed_lines.pop(uri, None)
+            return incremental.parse(source)
+        # No recorded edit: every statement whose text is unchanged is reused
+        changed_line = self._changed_lines.pop(uri, sys.maxsize)
+        return incremental.parse(source, changed_line=changed_line)
+    
+    def track_buffer(self, document: TextDocument) -> None:
+        """Make documents importing this one see its current (unsaved) text."""
+        self.import_cache.set_buffer(self.get_file_path(document.uri), document.source)
+    
+    def document_lock(self, uri: str) -> threading.Lock:
+        """Return the lock serializing parses and validations of a document."""
+        return self._document_locks.setdefault(uri, threading.Lock())
+    
+    def schedule_revalidation(self, uris: Iterable[str]) -> None:
+        """
+        Revalidate documents on the worker thread pool.
+        
+        A run still pending or in progress for the same document is cancelled;
+        its result is discarded. Must be called on the event loop thread.
+        """
+        for uri in uris:
+            previous = self._revalidations.pop(uri, None)
+            if previous is not None:
+                previous.cancel()
+            task = asyncio.ensure_future(_revalidate(self, uri))
+            self._revalidations[uri] = task
+            task.add_done_callback(self._revalidation_done)
+    
+    def _revalidation_done(self, task: asyncio.Task) -> None:
+        for uri, pending in list(self._revalidations.items()):
+            if pending is task:
+                del self._revalidations[uri]
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Background validation failed: {task.exception()}")
+    
+    def revalidate_dependents(self, file_path: Path, exclude: Optional[str] = None) -> None:
+        """Schedule revalidation of the open documents that import ``file_path``."""
+        uris = self.import_index.dependents(file_path)
+        uris.discard(exclude)
+        if uris:
+            self.logger.debug(f"Revalidating {len(uris)} dependents of {file_path}")
+            self.schedule_revalidation(sorted(uris))
+    
+    def forget_document(self, uri: str) -> None:
+        """Drop all per-document state for a closed or deleted document."""
+        file_path = self.get_file_path(uri)
+        self.import_cache.clear_buffer(file_path)
+        self.symbol_index.release_buffer(file_path)
+        if self._symbol_index_ready:
+            self.symbol_index.update_file(file_path)
+        else:
+            self.symbol_index.remove_file(file_path)
+        self.import_index.remove(uri)
+        pending = self._revalidations.pop(uri, None)
+        if pending is not None:
+            pending.cancel()
+        self._file_cache.pop(uri, None)
+        self._import_source_map.pop(uri, None)
+        self._incremental.pop(uri, None)
+        self._changed_lines.pop(uri, None)
+    
     def parse_document(self, document: TextDocument) -> Optional[FlowFile]:
         """
         Parse a document and cache the result.
@@ -119,12 +260,11 @@ class FlowLanguageServer(LanguageServer):
         Returns None if parsing fails.
         """
         try:
-            source = document.source
-            tokens = self._tokenizer.tokenize(source)
-            flow_file = self._parser.parse(tokens)
-            
-            # Cache the result
-            self._cache_flow_file(document.uri, document.version, flow_file)
+            with self.document_lock(document.uri):
+                flow_file = self.parse_source(document.uri, document.source)
+                
+                # Cache the result
+                self._cache_flow_file(document.uri, document.version, flow_file)
             
             return flow_file
         except FlowError as e:
@@ -184,7 +324,34 @@ class FlowLanguageServer(LanguageServer):
             target_uri = Path(file_path).as_uri()
             return target_uri, position
         
+        # Fall back to the workspace index when the id is defined exactly once
+        definitions = self.symbol_index.definitions(node_id)
+        if len(definitions) == 1:
+            loc = definitions[0]
+            return loc.file_path.as_uri(), Position(loc.line, loc.column)
+        
         return None
+    
+    def ensure_symbol_index(self) -> SymbolIndex:
+        """
+        Return the workspace symbol index, scanning the workspace on first use.
+        
+        Afterwards it is kept current by watched-file events and by the
+        validation of open documents, without rescanning.
+        """
+        if not self._symbol_index_ready:
+            root_path = self.workspace.root_path
+            if root_path:
+                self.symbol_index.root = Path(root_path).resolve()
+                count = self.symbol_index.refresh()
+                self.logger.info(f"Indexed {count} .flow file(s) under {root_path}")
+            self._symbol_index_ready = True
+        return self.symbol_index
+    
+    def refresh_symbols(self, file_path: Path) -> None:
+        """Re-index a file from disk if the workspace index has been built."""
+        if self._symbol_index_ready:
+            self.symbol_index.update_file(file_path)
 
 
 # =============================================================================
@@ -212,10 +379,10 @@ def initialize(ls: FlowLanguageServer, params: lsp.InitializeParams) -> lsp.Init
     
     # Build server capabilities
     capabilities = lsp.ServerCapabilities(
-        # Text document sync: Full document sync on open/change
+        # Text document sync: incremental changes on edit
         text_document_sync=lsp.TextDocumentSyncOptions(
             open_close=True,
-            change=lsp.TextDocumentSyncKind.Full,
+            change=lsp.TextDocumentSyncKind.Incremental,
             save=lsp.SaveOptions(include_text=False),
         ),
         # Completion with trigger characters
@@ -229,6 +396,9 @@ def initialize(ls: FlowLanguageServer, params: lsp.InitializeParams) -> lsp.Init
         hover_provider=True,
         # Document symbols (outline)
         document_symbol_provider=True,
+        # Workspace-wide references and symbol search
+        references_provider=True,
+        workspace_symbol_provider=True,
     )
     
     return lsp.InitializeResult(
@@ -271,25 +441,41 @@ def did_open(ls: FlowLanguageServer, params: lsp.DidOpenTextDocumentParams) -> N
     
     document = ls.workspace.get_text_document(uri)
     ls.logger.info(f"Flow document opened: {uri}")
+    ls.track_buffer(document)
     
     # Parse and publish diagnostics
     _publish_diagnostics(ls, document)
 
 
 @server.feature(lsp.TEXT_DOCUMENT_DID_CHANGE)
-def did_change(ls: FlowLanguageServer, params: lsp.DidChangeTextDocumentParams) -> None:
-    """Handle document change event."""
+async def did_change(ls: FlowLanguageServer, params: lsp.DidChangeTextDocumentParams) -> None:
+    """
+    Handle document change event.
+    
+    Records the first edited line, then waits for a quiet period; if another
+    change arrived meanwhile, that change's handler validates instead.
+    """
     uri = params.text_document.uri
     
     # Only process Flow files
     if not _is_flow_document(uri):
         return
     
+    ls.record_changes(uri, params.content_changes)
+    ls.track_buffer(ls.workspace.get_text_document(uri))
+    version = params.text_document.version
+    ls.logger.debug(f"Flow document changed: {uri} (version={version})")
+    
+    await asyncio.sleep(ls.debounce_delay)
     document = ls.workspace.get_text_document(uri)
-    ls.logger.debug(f"Flow document changed: {uri}")
+    if document.version != version:
+        return  # Superseded by a later edit
     
     # Reparse and publish diagnostics
     _publish_diagnostics(ls, document)
+    
+    # Open documents importing this one now see its new text
+    ls.revalidate_dependents(ls.get_file_path(uri), exclude=uri)
 
 
 @server.feature(lsp.TEXT_DOCUMENT_DID_CLOSE)
@@ -304,8 +490,7 @@ def did_close(ls: FlowLanguageServer, params: lsp.DidCloseTextDocumentParams) ->
     ls.logger.debug(f"Flow document closed: {uri}")
     
     # Clear caches
-    ls._file_cache.pop(uri, None)
-    ls._import_source_map.pop(uri, None)
+    ls.forget_document(uri)
     
     # Clear diagnostics
     ls.text_document_publish_diagnostics(
@@ -321,18 +506,26 @@ def did_close(ls: FlowLanguageServer, params: lsp.DidCloseTextDocumentParams) ->
 def did_change_watched_files(
     ls: FlowLanguageServer, params: lsp.DidChangeWatchedFilesParams
 ) -> None:
-    """Handle watched file changes — re-validate open .flow files."""
+    """
+    Handle watched file changes — re-validate open .flow files.
+    
+    The changed file itself is re-validated if open; open documents that
+    import it (directly or transitively) are re-validated in the background.
+    """
     for change in params.changes:
         uri = change.uri
         if not _is_flow_document(uri):
             continue
 
         ls.logger.debug(f"Watched file changed: {uri} (type={change.type})")
+        file_path = ls.get_file_path(uri)
+        ls.import_cache.invalidate(file_path)
+        ls.refresh_symbols(file_path)
+        ls.revalidate_dependents(file_path, exclude=uri)
 
         # If the file was deleted, clear its caches
         if change.type == lsp.FileChangeType.Deleted:
-            ls._file_cache.pop(uri, None)
-            ls._import_source_map.pop(uri, None)
+            ls.forget_document(uri)
             continue
 
         # For created/changed files, re-validate if the document is open
@@ -351,54 +544,94 @@ def _publish_diagnostics(ls: FlowLanguageServer, document: TextDocument) -> None
     
     Collects errors from tokenizer, parser, and resolver stages.
     """
-    diagnostics: List[lsp.Diagnostic] = []
-    uri = document.uri
-    source = document.source
+    diagnostics = _collect_diagnostics(ls, document, ls._resolver)
+    ls.text_document_publish_diagnostics(
+        lsp.PublishDiagnosticsParams(uri=document.uri, diagnostics=diagnostics)
+    )
+
+
+async def _revalidate(ls: FlowLanguageServer, uri: str) -> None:
+    """Validate an open document on a worker thread and publish if still current."""
+    document = ls.workspace.get_text_document(uri)
+    version = document.version
+    resolver = Resolver(logger=ls.logger, cache=ls.import_cache)
     
-    try:
-        # Stage 1: Tokenize
-        tokens = ls._tokenizer.tokenize(source)
-        
-        # Stage 2: Parse
-        flow_file = ls._parser.parse(tokens)
-        
-        # Cache the successful parse
-        ls._cache_flow_file(uri, document.version, flow_file)
-        
-        # Stage 3: Validate semantics (use instance resolver to retain source map)
-        file_path = ls.get_file_path(uri)
-        errors = ls._resolver.validate_with_errors(
-            flow_file,
-            base_path=file_path.parent,
-            source_path=str(file_path),
-        )
-        
-        # Cache the source map for cross-file go-to-definition
-        ls._import_source_map[uri] = ls._resolver.get_node_source_map()
-        
-        for error in errors:
-            diagnostics.append(_flow_error_to_diagnostic(error))
-    
-    except FlowError as e:
-        # Tokenizer or parser error
-        diagnostics.append(_flow_error_to_diagnostic(e))
-    except Exception as e:
-        # Unexpected error - report at beginning of file
-        diagnostics.append(lsp.Diagnostic(
-            range=lsp.Range(
-                start=lsp.Position(line=0, character=0),
-                end=lsp.Position(line=0, character=1),
-            ),
-            message=f"Internal error: {e}",
-            severity=lsp.DiagnosticSeverity.Error,
-            source="flow-lsp",
-        ))
+    loop = asyncio.get_running_loop()
+    diagnostics = await loop.run_in_executor(
+        ls.thread_pool, _collect_diagnostics, ls, document, resolver
+    )
     
+    if ls.workspace.get_text_document(uri).version != version:
+        return  # Edited meanwhile; that edit validates it
     ls.text_document_publish_diagnostics(
         lsp.PublishDiagnosticsParams(uri=uri, diagnostics=diagnostics)
     )
 
 
+def _collect_diagnostics(
+    ls: FlowLanguageServer, document: TextDocument, resolver: Resolver
+) -> List[lsp.Diagnostic]:
+    """
+    Parse and validate a document, caching the results on the server.
+    
+    Also records the files the document imports in the reverse import index.
+    Safe to call from worker threads as long as each thread uses its own
+    resolver.
+    """
+    diagnostics: List[lsp.Diagnostic] = []
+    uri = document.uri
+    
+    with ls.document_lock(uri):
+        source = document.source
+        try:
+            # Stages 1-2: Re-tokenize and re-parse from the first edited statement
+            flow_file = ls.parse_source(uri, source)
+            
+            # Cache the successful parse
+            ls._cache_flow_file(uri, document.version, flow_file)
+            file_path = ls.get_file_path(uri)
+            ls.symbol_index.update_flow_file(file_path, flow_file)
+            
+            # Stage 3: Validate semantics (resolver retains the source map)
+            errors = resolver.validate_with_errors(
+                flow_file,
+                base_path=file_path.parent,
+                source_path=str(file_path),
+            )
+            
+            # Cache the source map for cross-file go-to-definition
+            ls._import_source_map[uri] = resolver.get_node_source_map()
+            
+            # Index every loaded import, and missing ones so creating them revalidates us
+            imported = set(resolver.build_dependency_graph().files)
+            imported.update(
+                Path(error.resolved_path)
+                for error in errors
+                if isinstance(error, ImportFileNotFoundError)
+            )
+            ls.import_index.update(uri, imported)
+            
+            for error in errors:
+                diagnostics.append(_flow_error_to_diagnostic(error))
+        
+        except FlowError as e:
+            # Tokenizer or parser error
+            diagnostics.append(_flow_error_to_diagnostic(e))
+        except Exception as e:
+            # Unexpected error - report at beginning of file
+            diagnostics.append(lsp.Diagnostic(
+                range=lsp.Range(
+                    start=lsp.Position(line=0, character=0),
+                    end=lsp.Position(line=0, character=1),
+                ),
+                message=f"Internal error: {e}",
+                severity=lsp.DiagnosticSeverity.Error,
+                source="flow-lsp",
+            ))
+    
+    return diagnostics
+
+
 def _flow_error_to_diagnostic(error: FlowError) -> lsp.Diagnostic:
     """Convert a FlowError to an LSP Diagnostic."""
     # LSP uses 0-based line numbers, FlowError uses 1-based
@@ -634,6 +867,94 @@ def _get_node_ref_at_position(
     return None
 
 
+def _get_node_def_at_position(
+    document: TextDocument, position: lsp.Position
+) -> Optional[str]:
+    """Extract the node ID from an @id definition at the given position."""
+    lines = document.source.split("\n")
+    if position.line >= len(lines):
+        return None
+    
+    for match in re.finditer(r'@([a-zA-Z_][a-zA-Z0-9_]*)', lines[position.line]):
+        if match.start() <= position.character < match.end():
+            return match.group(1)
+    
+    return None
+
+
+# =============================================================================
+# References and Workspace Symbols
+# =============================================================================
+
+def _symbol_location(loc: SymbolLocation) -> lsp.Location:
+    """Convert an index location (1-based, at the sigil) to an LSP Location."""
+    line = max(0, loc.line - 1)
+    col = max(0, loc.column - 1)
+    return lsp.Location(
+        uri=loc.file_path.as_uri(),
+        range=lsp.Range(
+            start=lsp.Position(line=line, character=col),
+            end=lsp.Position(line=line, character=col + len(loc.node_id) + 1),  # +1 for sigil
+        ),
+    )
+
+
+@server.feature(lsp.TEXT_DOCUMENT_REFERENCES)
+def references(
+    ls: FlowLanguageServer, params: lsp.ReferenceParams
+) -> Optional[List[lsp.Location]]:
+    """
+    Find all references to a node across the workspace.
+    
+    Works on $node_id / ^node_id references and on @node_id definitions.
+    """
+    document = ls.workspace.get_text_document(params.text_document.uri)
+    node_id = (
+        _get_node_ref_at_position(document, params.position)
+        or _get_node_def_at_position(document, params.position)
+    )
+    if not node_id:
+        return None
+    
+    index = ls.ensure_symbol_index()
+    definition = ls.find_node_definition(document.uri, node_id)
+    defined_in = ls.get_file_path(definition[0]) if definition else None
+    
+    sites = index.references(node_id, defined_in=defined_in)
+    if params.context.include_declaration:
+        declarations = [
+            loc for loc in index.definitions(node_id)
+            if defined_in is None or loc.file_path == defined_in.resolve()
+        ]
+        sites = declarations + sites
+    
+    ls.logger.debug(f"References to {node_id}: {len(sites)}")
+    return [_symbol_location(loc) for loc in sites]
+
+
+@server.feature(lsp.WORKSPACE_SYMBOL)
+def workspace_symbols(
+    ls: FlowLanguageServer, params: lsp.WorkspaceSymbolParams
+) -> List[lsp.WorkspaceSymbol]:
+    """Search node and slot definitions across the workspace."""
+    index = ls.ensure_symbol_index()
+    symbols: List[lsp.WorkspaceSymbol] = []
+    for loc in index.search(params.query, limit=WORKSPACE_SYMBOL_LIMIT):
+        if loc.kind == SymbolKind.SLOT:
+            kind = lsp.SymbolKind.Field
+        elif loc.node_id == "out":
+            kind = lsp.SymbolKind.Module  # Entry point
+        else:
+            kind = lsp.SymbolKind.Function
+        symbols.append(lsp.WorkspaceSymbol(
+            name=f"@{loc.node_id}",
+            kind=kind,
+            location=_symbol_location(loc),
+            container_name=loc.file_path.name,
+        ))
+    return symbols
+
+
 # =============================================================================
 # Hover (Bonus Feature)
 # =============================================================================
@@ -854,7 +1175,8 @@ def start_server(
         # Propagate logger to internal instances
         server._tokenizer = Tokenizer(logger=logger)
         server._parser = Parser(logger=logger)
-        server._resolver = Resolver(logger=logger)
+        server.import_cache = ImportCache(logger=logger)
+        server._resolver = Resolver(logger=logger, cache=server.import_cache)
     
     server.logger.info(f"Starting FLOW LSP server ({transport})")
     
@@ -0,0 +1,158 @@
+"""
+Workspace-level cache of parsed imported .flow files.
+
+The language server validates every open document on each change, and each
+validation loads every file the document imports. ImportCache keeps one parsed
+FlowFile per imported path so documents sharing the same ``_lib`` fragments
+parse them once:
+
+- Files on disk are keyed by path + (mtime, size); a stat is enough to tell
+  whether the cached parse is still current, so nothing is read or hashed.
+- Files open in the editor are parsed from their buffer text instead, so
+  unsaved edits to a library are seen by the documents importing it. Setting
+  new buffer text invalidates that path's parse.
+
+It implements the ``load_flow_file(path, parse_fn)`` hook the Resolver calls
+for imports, so it can be passed as the Resolver's ``cache``.
+
+Usage:
+    >>> imports = ImportCache()
+    >>> resolver = Resolver(cache=imports)
+    >>> imports.set_buffer(lib_path, edited_text)   # didOpen / didChange
+    >>> imports.invalidate(lib_path)                # didChangeWatchedFiles
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from logger_util import Logger
+from .models import FlowFile
+
+# (st_mtime_ns, st_size) of a file when it was parsed
+FileStamp = Tuple[int, int]
+
+
+class ImportCache:
+    """
+    Parsed imported files keyed by path, checked against mtime or buffer text.
+
+    Safe to share between threads. Returned FlowFiles are shared; do not mutate
+    them (the Resolver applies assignments copy-on-write).
+
+    Attributes:
+        hits: Loads answered from the cache.
+        misses: Loads that had to parse.
+    """
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            logger: Optional logger instance.
+        """
+        self.logger = logger or Logger(name="FlowImportCache")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # path -> (stamp, FlowFile) for files read from disk
+        self._files: Dict[Path, Tuple[FileStamp, FlowFile]] = {}
+        # path -> (buffer text, FlowFile or None until first load) for open documents
+        self._buffers: Dict[Path, Tuple[str, Optional[FlowFile]]] = {}
+
+    # =========================================================================
+    # Resolver hook
+    # =========================================================================
+
+    def load_flow_file(self, file_path: Path, parse_fn: Callable[[str], FlowFile]) -> FlowFile:
+        """
+        Return the parsed FlowFile for ``file_path``, parsing it on a miss.
+
+        Args:
+            file_path: Absolute path of the imported file.
+            parse_fn: Tokenizes and parses source (called only on a miss).
+
+        Raises:
+            OSError: If the file is not open and cannot be read.
+            FlowError: If parsing fails (failures are not cached).
+        """
+        path = Path(file_path).resolve()
+        with self._lock:
+            buffer = self._buffers.get(path)
+        if buffer is not None:
+            return self._load_buffer(path, buffer, parse_fn)
+
+        stamp = self._stamp(path)
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        flow_file = parse_fn(path.read_text(encoding="utf-8"))
+        with self._lock:
+            self._files[path] = (stamp, flow_file)
+        self.logger.debug(f"Parsed import {path}")
+        return flow_file
+
+    def _load_buffer(
+        self,
+        path: Path,
+        buffer: Tuple[str, Optional[FlowFile]],
+        parse_fn: Callable[[str], FlowFile],
+    ) -> FlowFile:
+        """Return the parse of an open document's buffer text."""
+        source, flow_file = buffer
+        if flow_file is not None:
+            with self._lock:
+                self.hits += 1
+            return flow_file
+
+        with self._lock:
+            self.misses += 1
+        flow_file = parse_fn(source)
+        with self._lock:
+            # Keep the parse only if the buffer was not edited meanwhile
+            current = self._buffers.get(path)
+            if current is not None and current[0] is source:
+                self._buffers[path] = (source, flow_file)
+        self.logger.debug(f"Parsed open buffer {path}")
+        return flow_file
+
+    @staticmethod
+    def _stamp(path: Path) -> FileStamp:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    # =========================================================================
+    # Invalidation
+    # =========================================================================
+
+    def set_buffer(self, file_path: Path, source: str) -> None:
+        """Use ``source`` for ``file_path`` until clear_buffer(), dropping its parse."""
+        path = Path(file_path).resolve()
+        with self._lock:
+            current = self._buffers.get(path)
+            if current is not None and current[0] == source:
+                return
+            self._buffers[path] = (source, None)
+
+    def clear_buffer(self, file_path: Path) -> None:
+        """Go back to reading ``file_path`` from disk (its document was closed)."""
+        with self._lock:
+            self._buffers.pop(Path(file_path).resolve(), None)
+
+    def invalidate(self, file_path: Path) -> None:
+        """Drop the on-disk parse of ``file_path`` (it changed or was deleted)."""
+        with self._lock:
+            self._files.pop(Path(file_path).resolve(), None)
+
+    def clear(self) -> None:
+        """Drop every cached parse and buffer and reset the counters."""
+        with self._lock:
+            self._files.clear()
+            self._buffers.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,79 @@
+"""
+Reverse import index for open Flow documents.
+
+After each validation the language server records which files a document
+pulled in (the ``files`` of the DependencyGraph built from that resolution,
+i.e. every transitive import). ImportIndex inverts that: given a changed file
+it returns the open documents that import it, directly or transitively, so
+only those are revalidated.
+
+Imports that could not be found are recorded too, so creating the missing
+file revalidates the documents that were waiting for it.
+
+Usage:
+    >>> index = ImportIndex()
+    >>> index.update(uri, graph.files)
+    >>> index.dependents(changed_path)
+    {'file:///.../agent.flow'}
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Set
+
+
+class ImportIndex:
+    """
+    Maps each imported file to the open documents that (transitively) import it.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._lock = threading.Lock()
+        # document uri -> files it imports
+        self._imports: Dict[str, FrozenSet[Path]] = {}
+        # imported file -> document uris
+        self._dependents: Dict[Path, Set[str]] = {}
+
+    def update(self, uri: str, files: Iterable[Path]) -> None:
+        """
+        Replace the recorded imports of document ``uri``.
+
+        Args:
+            uri: The document URI.
+            files: Every file the document's last resolution loaded or
+                   failed to find. The document's own path may be included.
+        """
+        new = frozenset(Path(f).resolve() for f in files)
+        with self._lock:
+            old = self._imports.get(uri, frozenset())
+            for path in old - new:
+                self._discard(path, uri)
+            for path in new - old:
+                self._dependents.setdefault(path, set()).add(uri)
+            self._imports[uri] = new
+
+    def remove(self, uri: str) -> None:
+        """Forget document ``uri`` (closed or deleted)."""
+        with self._lock:
+            for path in self._imports.pop(uri, frozenset()):
+                self._discard(path, uri)
+
+    def dependents(self, file_path: Path) -> Set[str]:
+        """Return the URIs of documents that import ``file_path``."""
+        with self._lock:
+            return set(self._dependents.get(Path(file_path).resolve(), ()))
+
+    def imports(self, uri: str) -> FrozenSet[Path]:
+        """Return the files recorded for document ``uri``."""
+        with self._lock:
+            return self._imports.get(uri, frozenset())
+
+    def _discard(self, path: Path, uri: str) -> None:
+        uris = self._dependents.get(path)
+        if uris is not None:
+            uris.discard(uri)
+            if not uris:
+                del self._dependents[path]
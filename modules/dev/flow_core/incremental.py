@@ -0,0 +1,145 @@
+"""
+Incremental re-parsing of edited Flow documents.
+
+IncrementalParser keeps the top-level statements of the last successful
+(or partially successful) parse of one document. When told the first line an
+edit touched, it keeps every statement that ends above that line, re-tokenizes
+only from the start of the line after the last kept statement, and parses the
+tail. Kept statements are reused as-is, so the FlowNodes above an edit are the
+same objects as before.
+
+Statements are context-free once they start at a line start: the tokenizer
+only looks at column 1 for comments and imports, and the parser carries only
+the anonymous-node counter between statements (recorded per statement).
+
+Usage:
+    >>> incremental = IncrementalParser()
+    >>> flow_file = incremental.parse(source)
+    >>> # ...user edits line 120...
+    >>> flow_file = incremental.parse(new_source, changed_line=120)
+"""
+
+from itertools import chain, islice
+from typing import List, Optional
+
+from logger_util import Logger
+from .models import FlowFile
+from .tokenizer import Tokenizer
+from .parser import Parser, TopLevelStatement
+
+
+class IncrementalParser:
+    """
+    Re-parses one document from the last statement boundary above an edit.
+
+    Attributes:
+        reused_statements: Statements kept from the previous parse by the last parse().
+        parsed_statements: Statements parsed from tokens by the last parse().
+    """
+
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        tokenizer: Optional[Tokenizer] = None,
+        parser: Optional[Parser] = None,
+    ) -> None:
+        """
+        Initialize the incremental parser.
+
+        Args:
+            logger: Optional logger instance.
+            tokenizer: Tokenizer to scan with (default: a new fast one).
+            parser: Parser to parse with (default: a new one).
+        """
+        self.logger = logger or Logger(name="FlowIncrementalParser")
+        self._tokenizer = tokenizer or Tokenizer(logger=self.logger)
+        self._parser = parser or Parser(logger=self.logger)
+        self._source: str = ""
+        self._statements: List[TopLevelStatement] = []
+        self.reused_statements = 0
+        self.parsed_statements = 0
+
+    def parse(self, source: str, changed_line: Optional[int] = None) -> FlowFile:
+        """
+        Parse ``source``, reusing statements above ``changed_line``.
+
+        Args:
+            source: The full current document text.
+            changed_line: 1-based first line that may differ from the source
+                          passed to the previous parse(). None re-parses the
+                          whole document.
+
+        Returns:
+            FlowFile AST, identical to a full parse of ``source``.
+
+        Raises:
+            TokenizerError, ParserError: As for a full parse. Statements that
+            parsed before the error are kept for the next call.
+        """
+        if source.startswith("\ufeff"):
+            source = source[1:]
+
+        keep = self._reusable_count(changed_line) if changed_line is not None else 0
+        line = 1
+        offset = 0
+        anon_counter = 0
+        if keep:
+            last = self._statements[keep - 1]
+            line = last.end_line + 1
+            offset = self._line_offset(source, line)
+            # The text above the restart point must be byte-identical
+            if offset is None or self._source[:offset] != source[:offset]:
+                keep, line, offset = 0, 1, 0
+            else:
+                anon_counter = last.anon_counter
+
+        statements = self._statements[:keep]
+        self._source = source
+        self._statements = statements
+        self.reused_statements = keep
+        self.parsed_statements = 0
+
+        def values():
+            # Register while parsing so errors surface in the same order as a
+            # full parse, which reads one token past each statement (ends_line)
+            # before registering it: scan the tail's first token before handing
+            # over the last kept statement.
+            tokens = self._tokenizer.iter_tokens(source, offset, line)
+            for index, statement in enumerate(statements[:keep]):
+                if index == keep - 1:
+                    tokens = chain(list(islice(tokens, 1)), tokens)
+                yield statement.value
+            for statement in self._parser.iter_statements(tokens, anon_counter):
+                statements.append(statement)
+                self.parsed_statements += 1
+                yield statement.value
+
+        flow_file = self._parser.build_flow_file(values())
+        self.logger.debug(
+            f"Incremental parse from line {line}: reused {keep}, "
+            f"parsed {self.parsed_statements} statements"
+        )
+        return flow_file
+
+    def _reusable_count(self, changed_line: int) -> int:
+        """Number of leading statements that end on a line above ``changed_line``."""
+        keep = 0
+        for statement in self._statements:
+            if statement.end_line >= changed_line:
+                break
+            keep += 1
+        # Restart only at a line start: drop statements that share their last line
+        while keep and not self._statements[keep - 1].ends_line:
+            keep -= 1
+        return keep
+
+    @staticmethod
+    def _line_offset(source: str, line: int) -> Optional[int]:
+        """Offset of the start of 1-based ``line``, or None past the end."""
+        offset = 0
+        for _ in range(line - 1):
+            offset = source.find("\n", offset)
+            if offset == -1:
+                return None
+            offset += 1
+        return offset
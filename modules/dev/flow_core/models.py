@@ -46,7 +46,7 @@ class TokenType(Enum):
     EOF = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """
     Represents a single token from the Flow language source.
@@ -74,7 +74,7 @@ class Token:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Source location for error reporting.
@@ -90,7 +90,7 @@ class Position:
         return f"Position(line={self.line}, col={self.column})"
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowStyle:
     """
     Style parameters for a node.
@@ -117,7 +117,7 @@ class FlowStyle:
     level_offset: Optional[int] = None  # Relative offset (+N adds to layer)
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowLLMStrategy:
     """
     LLM mutation strategy parameters.
@@ -128,7 +128,7 @@ class FlowLLMStrategy:
     instruction: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowParams:
     """
     Parameters for a FlowNode.
@@ -145,7 +145,7 @@ class FlowParams:
     remutate: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeRef:
     """
     Reference to another node ($id or $id.slot).
@@ -164,7 +164,7 @@ class NodeRef:
         return f"NodeRef({prefix}{self.id})"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileRef:
     """
     Reference to an external file (++path).
@@ -184,14 +184,23 @@ class StringContent(str):
     """
     String subclass carrying inline-join metadata for boundary-aware joining.
     
-    Since str is immutable, metadata is set via __new__.
-    isinstance(x, str) returns True, and equality (x == "Hello") works normally.
+    Since str is immutable, metadata is fixed in __new__.
+    isinstance(x, StringContent) and isinstance(x, str) return True, and
+    equality (x == "Hello") works normally.
+    
+    str subclasses cannot have instance slots, so the metadata lives on the
+    class: __new__ returns an instance of one of nine dict-free subclasses,
+    one per (opener_trim, closer_trim) combination.
     
     Attributes:
         opener_trim: True if opener was <<< (trim), False if << (preserve), None if unknown.
         closer_trim: True if closer was >>> (trim), False if >> (preserve), None if unknown.
     """
     
+    __slots__ = ()
+    opener_trim: Optional[bool] = None
+    closer_trim: Optional[bool] = None
+    
     def __new__(
         cls,
         value: str = "",
@@ -199,22 +208,17 @@ class StringContent(str):
         opener_trim: Optional[bool] = None,
         closer_trim: Optional[bool] = None,
     ) -> "StringContent":
-        instance = super().__new__(cls, value)
-        instance.opener_trim = opener_trim
-        instance.closer_trim = closer_trim
-        return instance
+        variant = _STRING_CONTENT_VARIANTS[(opener_trim, closer_trim)]
+        return str.__new__(variant, value)
     
     def __copy__(self) -> "StringContent":
-        return StringContent(
-            str(self), opener_trim=self.opener_trim, closer_trim=self.closer_trim
-        )
+        return self
     
     def __deepcopy__(self, memo: dict) -> "StringContent":
-        result = StringContent(
-            str(self), opener_trim=self.opener_trim, closer_trim=self.closer_trim
-        )
-        memo[id(self)] = result
-        return result
+        return self
+    
+    def __reduce__(self):
+        return _make_string_content, (str(self), self.opener_trim, self.closer_trim)
     
     def __repr__(self) -> str:
         return (
@@ -223,11 +227,29 @@ class StringContent(str):
         )
 
 
+def _make_string_content(
+    value: str, opener_trim: Optional[bool], closer_trim: Optional[bool]
+) -> StringContent:
+    """Unpickle helper for StringContent."""
+    return StringContent(value, opener_trim=opener_trim, closer_trim=closer_trim)
+
+
+_STRING_CONTENT_VARIANTS: Dict[tuple, type] = {
+    (opener, closer): type(
+        "StringContent",
+        (StringContent,),
+        {"__slots__": (), "__module__": __name__, "opener_trim": opener, "closer_trim": closer},
+    )
+    for opener in (None, True, False)
+    for closer in (None, True, False)
+}
+
+
 # Content item types that can appear in node content
 ContentItem = Union[str, "StringContent", "NodeRef", "FileRef", "FlowNode"]
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowNode:
     """
     A node definition in the FLOW language.
@@ -264,7 +286,7 @@ class FlowNode:
         return f"FlowNode(@{self.id}, layer={self.layer}, slots={list(self.slots.keys())}, content_len={len(self.content)})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportSelector:
     """
     A single import selector (node to import, optionally with rename).
@@ -277,7 +299,7 @@ class ImportSelector:
     local_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportNode:
     """
     An import statement (+./path/to/file.flow).
@@ -299,7 +321,7 @@ class ImportNode:
         return f"ImportNode(+{self.path}{sel}{ren})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     """
     An assignment statement ($parent.slot = $child).
@@ -308,10 +330,12 @@ class Assignment:
         target: The target path (e.g., "main.greeting")
         source: The source node id (e.g., "greeting")
         position: Source location for error reporting
+        source_position: Source location of the $source reference
     """
     target: str
     source: str
     position: Optional[Position] = None
+    source_position: Optional[Position] = None
     
     def __repr__(self) -> str:
         return f"Assignment(${self.target} = ${self.source})"
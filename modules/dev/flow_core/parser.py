@@ -4,9 +4,18 @@ Flow Language Parser
 Transforms a token stream into a typed Abstract Syntax Tree (AST).
 Uses recursive descent parsing to build FlowFile, FlowNode, ImportNode,
 and Assignment structures from the tokenized input.
+
+Tokens are pulled from any iterable through a one-token lookahead buffer, so
+parse_stream() can consume Tokenizer.iter_tokens() lazily: syntax errors in
+the prefix of a file are raised before its tail is scanned.
+
+iter_statements() exposes the top-level statements with their line spans,
+which lets IncrementalParser reuse the statements above an edit.
 """
 
-from typing import List, Optional, Dict, Tuple
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from logger_util import Logger
 from .models import (
@@ -25,6 +34,7 @@ from .models import (
     ContentItem,
     StringContent,
 )
+from .tokenizer import Tokenizer
 from .errors import (
     ParserError,
     UnexpectedTokenError,
@@ -32,6 +42,30 @@ from .errors import (
 )
 
 
+# A parsed top-level statement (None for a comment)
+Statement = Union[ImportNode, FlowNode, Assignment, None]
+
+
+@dataclass(slots=True)
+class TopLevelStatement:
+    """
+    A top-level statement with the lines it spans.
+    
+    Attributes:
+        value: The ImportNode, FlowNode or Assignment (None for a comment)
+        start_line: Line of the statement's first token
+        end_line: Line of the statement's last token
+        ends_line: True if no other token follows on end_line, so parsing can
+                   restart at the start of the next line
+        anon_counter: Parser anonymous-node counter after this statement
+    """
+    value: Statement
+    start_line: int
+    end_line: int
+    ends_line: bool
+    anon_counter: int
+
+
 class Parser:
     """
     Recursive descent parser for the Flow language.
@@ -51,20 +85,24 @@ class Parser:
             logger: Optional logger instance for debugging.
         """
         self.logger = logger or Logger(name="FlowParser")
-        self._tokens: List[Token] = []
-        self._pos: int = 0
+        self._stream: Iterator[Token] = iter(())
+        self._lookahead: Deque[Token] = deque()
+        self._last_token: Optional[Token] = None  # Last token pulled from the stream
+        self._previous: Optional[Token] = None  # Last token consumed
+        self._consumed: int = 0
         self._nodes: Dict[str, FlowNode] = {}
         self._node_positions: Dict[str, Position] = {}  # Track first definition positions
         self._imports: List[ImportNode] = []
         self._assignments: List[Assignment] = []
         self._anon_counter: int = 0  # For generating anonymous node IDs
     
-    def parse(self, tokens: List[Token]) -> FlowFile:
+    def parse(self, tokens: Iterable[Token]) -> FlowFile:
         """
         Parse a token stream into a FlowFile AST.
         
         Args:
-            tokens: List of tokens from the tokenizer.
+            tokens: Tokens from the tokenizer - a list, or a lazy iterator
+                    such as Tokenizer.iter_tokens() (read one token ahead).
             
         Returns:
             FlowFile AST representing the parsed FLOW document.
@@ -74,31 +112,83 @@ class Parser:
             DuplicateNodeError: When a node ID is defined twice.
             UnexpectedTokenError: On unexpected token sequences.
         """
-        self._tokens = tokens
-        self._pos = 0
+        self.logger.debug("Parsing token stream")
+        flow_file = self.build_flow_file(
+            statement.value for statement in self.iter_statements(tokens)
+        )
+        self.logger.debug(f"Parsed {self._consumed} tokens: {flow_file}")
+        return flow_file
+    
+    def iter_statements(
+        self, tokens: Iterable[Token], anon_counter: int = 0
+    ) -> Iterator[TopLevelStatement]:
+        """
+        Parse a token stream into top-level statements, one at a time.
+        
+        Args:
+            tokens: Tokens from the tokenizer (a list or a lazy iterator).
+            anon_counter: Anonymous-node counter to continue from, when the
+                          tokens are the tail of a document.
+            
+        Yields:
+            Each statement with its line span, in source order.
+            
+        Raises:
+            ParserError: On syntax errors.
+            UnexpectedTokenError: On unexpected token sequences.
+        """
+        self._stream = iter(tokens)
+        self._lookahead = deque()
+        self._last_token = None
+        self._previous = None
+        self._consumed = 0
+        self._anon_counter = anon_counter
+        
+        while not self._at_end():
+            start_line = self._peek().line
+            value = self._parse_statement()
+            end_line = self._previous.line
+            yield TopLevelStatement(
+                value=value,
+                start_line=start_line,
+                end_line=end_line,
+                ends_line=self._peek().line > end_line,
+                anon_counter=self._anon_counter,
+            )
+        self._stream = iter(())  # Release the source iterator
+    
+    def build_flow_file(self, statements: Iterable[Statement]) -> FlowFile:
+        """
+        Assemble top-level statements into a FlowFile.
+        
+        Args:
+            statements: Parsed statements in source order.
+            
+        Returns:
+            FlowFile AST.
+            
+        Raises:
+            DuplicateNodeError: When a node ID is defined twice.
+        """
         self._nodes = {}
         self._node_positions = {}
         self._imports = []
         self._assignments = []
-        self._anon_counter = 0
-        
-        self.logger.debug(f"Parsing {len(tokens)} tokens")
-        
-        while not self._at_end():
-            self._parse_top_level()
         
-        # Build FlowFile
-        out_node = self._nodes.get("out")
+        for statement in statements:
+            if isinstance(statement, FlowNode):
+                self._register_node(statement)
+            elif isinstance(statement, ImportNode):
+                self._imports.append(statement)
+            elif isinstance(statement, Assignment):
+                self._assignments.append(statement)
         
-        flow_file = FlowFile(
+        return FlowFile(
             imports=self._imports,
             nodes=self._nodes,
             assignments=self._assignments,
-            out_node=out_node,
+            out_node=self._nodes.get("out"),
         )
-        
-        self.logger.debug(f"Parsed: {flow_file}")
-        return flow_file
     
     # =========================================================================
     # Token Navigation
@@ -106,20 +196,37 @@ class Parser:
     
     def _at_end(self) -> bool:
         """Check if we've reached EOF."""
-        return self._pos >= len(self._tokens) or self._peek().type == TokenType.EOF
+        return self._peek().type == TokenType.EOF
     
     def _peek(self, offset: int = 0) -> Token:
         """Look at token at current position + offset without consuming."""
-        pos = self._pos + offset
-        if pos >= len(self._tokens):
-            return self._tokens[-1]  # Return EOF token
-        return self._tokens[pos]
+        lookahead = self._lookahead
+        while len(lookahead) <= offset:
+            self._pull()
+        return lookahead[offset]
+    
+    def _pull(self) -> None:
+        """Move the next token from the stream into the lookahead buffer."""
+        token = next(self._stream, None)
+        if token is None:
+            # Stream ended (or had no EOF token): repeat EOF at the last position
+            last = self._last_token
+            token = Token(
+                type=TokenType.EOF,
+                value="",
+                line=last.line if last else 1,
+                column=last.column if last else 1,
+            )
+        self._last_token = token
+        self._lookahead.append(token)
     
     def _advance(self) -> Token:
         """Consume and return the current token."""
-        token = self._tokens[self._pos]
+        token = self._peek()
         if token.type != TokenType.EOF:
-            self._pos += 1
+            self._lookahead.popleft()
+            self._consumed += 1
+            self._previous = token
         return token
     
     def _check(self, *token_types: TokenType) -> bool:
@@ -155,32 +262,26 @@ class Parser:
     # Top-Level Parsing
     # =========================================================================
     
-    def _parse_top_level(self) -> None:
+    def _parse_statement(self) -> Statement:
         """Parse a top-level statement (import, node def, assignment, or comment)."""
         token = self._peek()
         
         if token.type == TokenType.COMMENT:
             # Skip comments
             self._advance()
+            return None
             
         elif token.type == TokenType.IMPORT:
             # Import statement
-            import_node = self._parse_import()
-            self._imports.append(import_node)
+            return self._parse_import()
             
         elif token.type == TokenType.NODE_DEF:
             # Node definition
-            node = self._parse_node_def(parent_layer=-1)
-            self._register_node(node)
+            return self._parse_node_def(parent_layer=-1)
             
         elif token.type == TokenType.NODE_REF:
             # Could be an assignment: $a.slot = $b
-            assignment = self._parse_assignment()
-            self._assignments.append(assignment)
-            
-        elif token.type == TokenType.EOF:
-            # End of file
-            return
+            return self._parse_assignment()
             
         else:
             raise UnexpectedTokenError(
@@ -544,6 +645,7 @@ class Parser:
             target=target,
             source=source,
             position=position,
+            source_position=self._position(source_token),
         )
 
 
@@ -580,3 +682,32 @@ def parse(tokens: List[Token], logger: Optional[Logger] = None) -> FlowFile:
     """
     parser = Parser(logger=logger)
     return parser.parse(tokens)
+
+
+def parse_stream(
+    source: str,
+    logger: Optional[Logger] = None,
+    tokenizer: Optional[Tokenizer] = None,
+) -> FlowFile:
+    """
+    Tokenize and parse source lazily, one token ahead.
+    
+    Unlike parse(tokenizer.tokenize(source)), the token list is never built:
+    memory for tokens is bounded by the parser's lookahead, and a syntax error
+    is raised as soon as the parser reaches it, before the rest of the file
+    is scanned.
+    
+    Args:
+        source: The Flow language source code string.
+        logger: Optional logger instance.
+        tokenizer: Optional tokenizer to scan with (default: a new fast one).
+        
+    Returns:
+        FlowFile AST representing the parsed document.
+        
+    Raises:
+        TokenizerError: On lexical errors reached while parsing.
+        ParserError: On syntax errors.
+    """
+    tokenizer = tokenizer or Tokenizer(logger=logger)
+    return Parser(logger=logger).parse(tokenizer.iter_tokens(source))
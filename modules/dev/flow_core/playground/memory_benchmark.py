@@ -0,0 +1,98 @@
+"""
+Memory benchmark: tracemalloc peak for tokenizing and parsing .flow files.
+
+Tokenizes and parses every .flow file under playground/ (or the paths given)
+``--copies`` times, keeping every token list and FlowFile alive the way the
+language server keeps open documents, and prints the tracemalloc peak and the
+memory still held at the end, plus per-instance sizes of the hot model types.
+
+Usage:
+    python -m flow_core.playground.memory_benchmark
+    python -m flow_core.playground.memory_benchmark --copies 50 path/to/flows/
+"""
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+from logger_util import Logger
+
+from flow_core.models import FileRef, FlowNode, NodeRef, Position, StringContent, Token, TokenType
+from flow_core.parser import Parser
+from flow_core.tokenizer import Tokenizer
+
+PLAYGROUND_DIR = Path(__file__).resolve().parent
+
+
+def _collect(paths: List[Path]) -> List[Path]:
+    files: List[Path] = []
+    for path in paths:
+        files.extend(sorted(path.rglob("*.flow")) if path.is_dir() else [path])
+    return files
+
+
+def _instance_size(obj: object) -> int:
+    """Size of an instance including its __dict__, if it has one."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure memory held by Flow tokens and ASTs")
+    parser.add_argument("paths", nargs="*", type=Path, default=[PLAYGROUND_DIR],
+                        help=".flow files or directories (default: playground/)")
+    parser.add_argument("--copies", type=int, default=20,
+                        help="How many times each file is tokenized and parsed and kept alive")
+    args = parser.parse_args()
+
+    logger = Logger(name="MemoryBenchmark", verbose=False)
+    tokenizer = Tokenizer(logger)
+    flow_parser = Parser(logger)
+
+    files = _collect(args.paths)
+    sources = []
+    for path in files:
+        source = path.read_text(encoding="utf-8")
+        try:
+            tokenizer.tokenize(source)
+        except Exception as exc:  # samples may contain deliberately broken syntax
+            print(f"Skipping {path.name}: {exc}")
+            continue
+        sources.append(source)
+    if not sources:
+        print("No parseable .flow files found")
+        return
+
+    kept = []
+    tracemalloc.start()
+    for _ in range(args.copies):
+        for source in sources:
+            tokens = tokenizer.tokenize(source)
+            kept.append((tokens, flow_parser.parse(tokens)))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    token_count = sum(len(tokens) for tokens, _ in kept)
+    print(f"{len(sources)} files x {args.copies} copies: {token_count} tokens")
+    print(f"Peak:     {peak / 1024:>10.1f} KiB")
+    print(f"Retained: {current / 1024:>10.1f} KiB")
+
+    print("\nPer-instance size (bytes, including __dict__):")
+    samples = {
+        "Token": Token(TokenType.IDENTIFIER, "name", 1, 1),
+        "Position": Position(1, 1),
+        "NodeRef": NodeRef("name"),
+        "FileRef": FileRef("./doc.md"),
+        "FlowNode": FlowNode("name"),
+        "StringContent": StringContent("text", opener_trim=True, closer_trim=True),
+    }
+    for name, obj in samples.items():
+        print(f"  {name:<14} {_instance_size(obj):>5}")
+
+
+if __name__ == "__main__":
+    main()
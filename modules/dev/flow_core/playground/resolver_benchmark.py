@@ -0,0 +1,107 @@
+"""
+Resolver stress benchmark: cycle detection and topological order on synthetic graphs.
+
+Generates deep reference chains (@n1 |$n0|., @n2 |$n1|., ...), wide graphs
+(many leaves referenced from one node) and a long cycle, resolves each and
+prints the resolve time and the time spent in the topological-order pass.
+Deep chains used to hit Python's recursion limit at ~1000 nodes.
+
+Usage:
+    python -m flow_core.playground.resolver_benchmark
+    python -m flow_core.playground.resolver_benchmark --sizes 1000 5000 20000 --repeat 3
+"""
+
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+from logger_util import Logger
+
+from flow_core.errors import CircularDependencyError
+from flow_core.parser import parse_stream
+from flow_core.resolver import Resolver
+
+
+def deep_chain(size: int) -> str:
+    """@n0 <- @n1 <- ... <- @out: one dependency per node, depth ``size``."""
+    lines = ["@n0 |<<<start>>>|."]
+    lines += [f"@n{i} |$n{i - 1}|." for i in range(1, size)]
+    lines.append(f"@out |$n{size - 1}|.")
+    return "\n".join(lines) + "\n"
+
+
+def wide_fan(size: int) -> str:
+    """``size`` leaves, all referenced from @out: depth 1, fan-out ``size``."""
+    lines = [f"@n{i} |<<<leaf {i}>>>|." for i in range(size)]
+    lines.append("@out " + "".join(f"|$n{i}" for i in range(size)) + "|.")
+    return "\n".join(lines) + "\n"
+
+
+def layered(size: int) -> str:
+    """Layers of 10 nodes, each referencing every node of the layer above."""
+    width = 10
+    lines = [f"@l0_{j} |<<<{j}>>>|." for j in range(width)]
+    layers = max(1, size // width)
+    for layer in range(1, layers):
+        refs = "".join(f"|$l{layer - 1}_{k}" for k in range(width))
+        lines += [f"@l{layer}_{j} {refs}|." for j in range(width)]
+    lines.append("@out " + "".join(f"|$l{layers - 1}_{k}" for k in range(width)) + "|.")
+    return "\n".join(lines) + "\n"
+
+
+def long_cycle(size: int) -> str:
+    """@n0 -> @n1 -> ... -> @n{size-1} -> @n0 via forward refs."""
+    lines = [f"@n{i} |^n{i + 1}|." for i in range(size - 1)]
+    lines.append(f"@n{size - 1} |$n0|.")
+    return "\n".join(lines) + "\n"
+
+
+SHAPES: List[Tuple[str, Callable[[int], str]]] = [
+    ("deep chain", deep_chain),
+    ("wide fan", wide_fan),
+    ("layered x10", layered),
+    ("long cycle", long_cycle),
+]
+
+
+def _best_of(source: str, logger: Logger, repeat: int) -> Tuple[float, float, str]:
+    """Best resolve time, best topological-order time and a result note."""
+    flow_file = parse_stream(source)
+    best_total = best_topo = float("inf")
+    note = ""
+    for _ in range(repeat):
+        resolver = Resolver(logger=logger)
+        start = time.perf_counter()
+        try:
+            resolver.resolve(flow_file)
+            note = "ok"
+        except CircularDependencyError as e:
+            note = f"cycle of {len(e.chain) - 1}"
+        best_total = min(best_total, time.perf_counter() - start)
+
+        # Time the ordering pass on its own, on the state resolve() left behind
+        resolver._collect_errors = True
+        start = time.perf_counter()
+        resolver._compute_topological_order()
+        best_topo = min(best_topo, time.perf_counter() - start)
+    return best_total, best_topo, note
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stress the resolver on deep and wide graphs")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 5000, 20000],
+                        help="Node counts per graph shape")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per graph; the best is kept")
+    args = parser.parse_args()
+
+    logger = Logger(name="ResolverBenchmark", level="WARNING")
+
+    print(f"{'Shape':<14} {'Nodes':>7} {'Resolve':>11} {'Topo order':>11}  Result")
+    for name, make in SHAPES:
+        for size in args.sizes:
+            total, topo, note = _best_of(make(size), logger, args.repeat)
+            print(f"{name:<14} {size:>7} {total * 1000:>9.1f}ms {topo * 1000:>9.1f}ms  {note}")
+
+
+if __name__ == "__main__":
+    main()
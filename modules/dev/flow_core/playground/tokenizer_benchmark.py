@@ -0,0 +1,80 @@
+"""
+Tokenizer benchmark: fast (regex/slice) scanner vs. character-at-a-time reference.
+
+Tokenizes every .flow file under playground/ (or the paths given) with both
+modes, checks the token lists are identical, and prints per-file and total
+timings.
+
+Usage:
+    python -m flow_core.playground.tokenizer_benchmark
+    python -m flow_core.playground.tokenizer_benchmark --repeat 50 path/to/flows/
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from logger_util import Logger
+
+from flow_core.tokenizer import Tokenizer
+
+PLAYGROUND_DIR = Path(__file__).resolve().parent
+
+
+def _collect(paths: List[Path]) -> List[Path]:
+    files: List[Path] = []
+    for path in paths:
+        files.extend(sorted(path.rglob("*.flow")) if path.is_dir() else [path])
+    return files
+
+
+def _best_of(tokenizer: Tokenizer, source: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokenizer.tokenize(source)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _as_tuples(tokens) -> List[Tuple]:
+    return [(t.type, t.value, t.line, t.column, t.closer_trim) for t in tokens]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Flow tokenizer scanning modes")
+    parser.add_argument("paths", nargs="*", type=Path, default=[PLAYGROUND_DIR],
+                        help=".flow files or directories (default: playground/)")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per file; the best is kept")
+    args = parser.parse_args()
+
+    # Quiet logger: per-token debug logging would dominate the reference timings
+    logger = Logger(name="TokenizerBenchmark", verbose=False)
+    fast = Tokenizer(logger, fast=True)
+    reference = Tokenizer(logger, fast=False)
+
+    files = _collect(args.paths)
+    if not files:
+        print("No .flow files found")
+        return
+
+    print(f"{'File':<40} {'Chars':>8} {'Reference':>11} {'Fast':>9} {'Speedup':>8}")
+    total_ref = total_fast = 0.0
+    for path in files:
+        source = path.read_text(encoding="utf-8")
+        if _as_tuples(fast.tokenize(source)) != _as_tuples(reference.tokenize(source)):
+            raise SystemExit(f"Token mismatch in {path}")
+        ref_time = _best_of(reference, source, args.repeat)
+        fast_time = _best_of(fast, source, args.repeat)
+        total_ref += ref_time
+        total_fast += fast_time
+        print(f"{path.name:<40} {len(source):>8} {ref_time * 1000:>9.2f}ms "
+              f"{fast_time * 1000:>7.2f}ms {ref_time / fast_time:>7.1f}x")
+
+    print(f"\n{len(files)} files: reference {total_ref * 1000:.2f}ms, "
+          f"fast {total_fast * 1000:.2f}ms ({total_ref / total_fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
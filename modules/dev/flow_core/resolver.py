@@ -6,13 +6,18 @@ where all references can be directly traversed. Handles:
 - Backward/forward reference validation
 - Circular dependency detection
 - Import file loading and merging
-- Assignment application (deep copy semantics)
+- Assignment application (copy-on-write semantics)
 - Topological ordering for deterministic compilation
+
+Parsed nodes are never mutated. Imported nodes are shared with the imported
+file's AST (which may live in the FlowCache), and renames and assignments
+shallow-clone only the node they change, so structure is shared between
+importing files instead of deep-copied.
 """
 
-import copy
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Union
 from enum import Enum, auto
 
 from logger_util import Logger
@@ -39,6 +44,10 @@ from .errors import (
     DuplicateNodeError,
 )
 
+if TYPE_CHECKING:
+    from .flow_cache import FlowCache
+    from .import_cache import ImportCache
+
 
 class VisitState(Enum):
     """Node visit states for cycle detection."""
@@ -55,20 +64,28 @@ class Resolver:
     with all references validated, imports merged, and dependencies ordered.
     """
     
-    def __init__(self, logger: Optional[Logger] = None) -> None:
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        cache: Optional[Union["FlowCache", "ImportCache"]] = None,
+    ) -> None:
         """
         Initialize the resolver.
         
         Args:
             logger: Optional logger instance for debugging.
+            cache: Optional FlowCache (or the language server's ImportCache)
+                   used to parse each imported file once.
         """
         self.logger = logger or Logger(name="FlowResolver")
+        self._cache = cache
         
         # Resolution state (reset per resolve call)
         self._symbol_table: Dict[str, FlowNode] = {}
         self._node_positions: Dict[str, Position] = {}
         self._node_source_files: Dict[str, str] = {}  # node_id -> source file path
         self._node_order: List[str] = []  # Order nodes appear in file (for backward ref check)
+        self._node_index: Dict[str, int] = {}  # node_id -> first index in _node_order
         self._file_refs: List[str] = []
         self._import_stack: List[str] = []  # For circular import detection
         self._base_path: Optional[Path] = None
@@ -77,17 +94,24 @@ class Resolver:
         self._graph_edges: Set[Tuple[str, str, str]] = set()  # (from_id, to_id, edge_type)
         self._graph_files: Set[Path] = set()  # All involved .flow files
         self._graph_file_refs: Set[Path] = set()  # All ++path references
+        self._clones: List[str] = []  # Node ids shallow-cloned (import renames, assignments)
         
         # Error collection mode (for validate_with_errors)
         self._collect_errors: bool = False
         self._errors: List[FlowError] = []
     
+    @property
+    def clone_count(self) -> int:
+        """Shallow node clones made by the last resolve (import renames and assignments)."""
+        return len(self._clones)
+    
     def _reset_state(self, base_path: Optional[Path] = None) -> None:
         """Reset all resolution state for a new resolve/validate call."""
         self._symbol_table = {}
         self._node_positions = {}
         self._node_source_files = {}
         self._node_order = []
+        self._node_index = {}
         self._file_refs = []
         self._import_stack = []
         self._base_path = base_path or Path.cwd()
@@ -96,6 +120,7 @@ class Resolver:
         self._graph_edges = set()
         self._graph_files = set()
         self._graph_file_refs = set()
+        self._clones = []
         
         # Reset error collection
         self._collect_errors = False
@@ -132,7 +157,7 @@ class Resolver:
         Returns:
             A new Resolver configured for import processing.
         """
-        child = Resolver(logger=self.logger)
+        child = Resolver(logger=self.logger, cache=self._cache)
         child._symbol_table = {}
         child._node_positions = {}
         child._node_source_files = {}
@@ -145,6 +170,7 @@ class Resolver:
         child._graph_edges = self._graph_edges
         child._graph_files = self._graph_files
         child._graph_file_refs = self._graph_file_refs
+        child._clones = self._clones
         
         # Share error collection mode
         child._collect_errors = self._collect_errors
@@ -199,7 +225,7 @@ class Resolver:
         # Step 3: Validate all references and build graph edges
         self._validate_references()
         
-        # Step 4: Apply assignments (deep copy semantics)
+        # Step 4: Apply assignments (copy-on-write semantics)
         self._apply_assignments(flow_file.assignments)
         
         # Step 5: Detect reference cycles (DFS with states)
@@ -351,20 +377,22 @@ class Resolver:
         return (self._base_path / import_path).resolve()
     
     def _load_flow_file(self, file_path: Path) -> FlowFile:
-        """Load and parse a .flow file."""
-        from .tokenizer import Tokenizer
-        from .parser import Parser
-        
+        """Load and parse a .flow file (through the FlowCache when one is set)."""
         self.logger.debug(f"Loading flow file: {file_path}")
         
+        if self._cache is not None:
+            return self._cache.load_flow_file(file_path, self._parse_source)
+        
         with open(file_path, "r", encoding="utf-8") as f:
             source = f.read()
         
-        tokenizer = Tokenizer(logger=self.logger)
-        tokens = tokenizer.tokenize(source)
+        return self._parse_source(source)
+    
+    def _parse_source(self, source: str) -> FlowFile:
+        """Tokenize and parse Flow source text."""
+        from .parser import parse_stream
         
-        parser = Parser(logger=self.logger)
-        return parser.parse(tokens)
+        return parse_stream(source, logger=self.logger)
     
     def _merge_imported_nodes(
         self,
@@ -421,12 +449,11 @@ class Resolver:
                 ))
                 continue  # Skip this node in collect mode
             
-            # Deep copy the node (to avoid mutation issues)
-            imported_node = copy.deepcopy(imported_nodes[original_name])
-            
-            # Update ID if renamed
+            # Share the imported node; a rename gets its own shallow clone
+            imported_node = imported_nodes[original_name]
             if local_name != original_name:
-                imported_node.id = local_name
+                imported_node = replace(imported_node, id=local_name)
+                self._clones.append(local_name)
             
             # Add to symbol table
             self._symbol_table[local_name] = imported_node
@@ -452,10 +479,13 @@ class Resolver:
         
         Also builds dependency graph edges (P1).
         """
+        self._node_index = {}
+        for index, node_id in enumerate(self._node_order):
+            self._node_index.setdefault(node_id, index)
+        
         for node_id in self._node_order:
             node = self._symbol_table[node_id]
-            node_index = self._node_order.index(node_id)
-            self._validate_node_refs(node, node_id, node_index)
+            self._validate_node_refs(node, node_id, self._node_index[node_id])
     
     def _validate_node_refs(
         self, node: FlowNode, from_node_id: str, node_index: int
@@ -508,7 +538,7 @@ class Resolver:
         # Check backward reference constraint
         if not ref.is_forward:
             # $ref must be defined ABOVE the referencing node
-            target_index = self._node_order.index(ref_id) if ref_id in self._node_order else -1
+            target_index = self._node_index.get(ref_id, -1)
             
             if target_index >= referencing_node_index:
                 self._record_error(UndefinedNodeError(
@@ -551,7 +581,7 @@ class Resolver:
         
         # Check backward constraint for the node part
         if not is_forward:
-            target_index = self._node_order.index(node_id) if node_id in self._node_order else -1
+            target_index = self._node_index.get(node_id, -1)
             if target_index >= referencing_node_index:
                 self._record_error(UndefinedNodeError(
                     ref_id=node_id,
@@ -583,10 +613,13 @@ class Resolver:
     
     def _apply_assignments(self, assignments: List[Assignment]) -> None:
         """
-        Apply slot assignments with deep copy semantics.
+        Apply slot assignments with copy-on-write semantics.
         
         For $parent.slot = $child:
-        - Deep copy child node into parent.slots[slot]
+        - Replace parent in the symbol table with a shallow clone whose
+          slots map holds child; parent's content and other slots are shared
+        - The parsed parent node is left untouched, so later assignments to
+          parent do not leak into earlier copies of it
         """
         for assignment in assignments:
             self._apply_single_assignment(assignment)
@@ -642,9 +675,12 @@ class Resolver:
             ))
             return  # Can't continue without valid slot
         
-        # Deep copy source into target slot
+        # Clone only the target node; the source subtree is shared
         self.logger.debug(f"Applying assignment: ${target} = ${source}")
-        target_node.slots[target_slot] = copy.deepcopy(source_node)
+        self._symbol_table[target_node_id] = replace(
+            target_node, slots={**target_node.slots, target_slot: source_node}
+        )
+        self._clones.append(target_node_id)
     
     # =========================================================================
     # Step 5 & 6: Cycle Detection and Topological Order
@@ -652,18 +688,25 @@ class Resolver:
     
     def _compute_topological_order(self) -> List[str]:
         """
-        Detect cycles and compute topological order using DFS.
+        Detect cycles and compute topological order using an iterative DFS.
         
         Uses three-state coloring:
         - UNVISITED: Not yet processed
         - VISITING: Currently in DFS path (cycle if revisited)
         - VISITED: Fully processed
         
+        The DFS path lives on an explicit stack (one dependency iterator per
+        node on the path) with an index of each path node's position, so
+        arbitrarily deep reference chains neither hit Python's recursion
+        limit nor copy the path per step. Each node's dependencies are
+        collected once, when it is first entered.
+        
         Returns:
             List of node IDs in topological order (dependencies first).
             
         Raises:
             CircularDependencyError: If a cycle is detected (in fail-fast mode).
+                Its chain runs from the first node of the cycle back to itself.
         """
         visit_state: Dict[str, VisitState] = {
             node_id: VisitState.UNVISITED for node_id in self._symbol_table
@@ -671,71 +714,77 @@ class Resolver:
         result: List[str] = []
         cycle_found: bool = False
         
-        def dfs(node_id: str, path: List[str]) -> None:
-            """DFS traversal with cycle detection."""
-            nonlocal cycle_found
-            
-            # In collect mode, skip if we already found a cycle (to avoid duplicates)
-            if cycle_found and self._collect_errors:
-                return
-            
-            state = visit_state[node_id]
-            
-            if state == VisitState.VISITED:
-                return
-            
-            if state == VisitState.VISITING:
-                # Found a cycle - find where the cycle starts
-                cycle_start = path.index(node_id)
-                cycle_chain = path[cycle_start:] + [node_id]
-                node = self._symbol_table.get(node_id)
-                pos = node.position if node else Position(0, 0)
-                cycle_found = True
-                self._record_error(CircularDependencyError(
-                    chain=cycle_chain,
-                    line=pos.line if pos else 0,
-                    column=pos.column if pos else 0,
-                ))
-                return  # Don't continue in this branch
-            
-            # Mark as visiting
-            visit_state[node_id] = VisitState.VISITING
-            current_path = path + [node_id]
-            
-            # Visit all dependencies (referenced nodes)
-            node = self._symbol_table.get(node_id)
-            if node:
-                deps = self._get_node_dependencies(node)
-                for dep_id in deps:
-                    if dep_id in self._symbol_table:
-                        dfs(dep_id, current_path)
-            
-            # Mark as visited and add to result
-            visit_state[node_id] = VisitState.VISITED
-            result.append(node_id)
+        path: List[str] = []
+        path_index: Dict[str, int] = {}
+        pending: List[Iterator[str]] = []
         
-        # Process all nodes
-        for node_id in self._symbol_table:
-            if visit_state[node_id] == VisitState.UNVISITED:
-                dfs(node_id, [])
+        def enter(node_id: str) -> None:
+            visit_state[node_id] = VisitState.VISITING
+            path_index[node_id] = len(path)
+            path.append(node_id)
+            node = self._symbol_table[node_id]
+            pending.append(iter([
+                dep_id for dep_id in self._get_node_dependencies(node)
+                if dep_id in self._symbol_table
+            ]))
         
-        # Result is in reverse post-order (dependencies first)
+        for root_id in self._symbol_table:
+            # In collect mode, stop after the first cycle (to avoid duplicates)
+            if cycle_found and self._collect_errors:
+                break
+            if visit_state[root_id] != VisitState.UNVISITED:
+                continue
+            
+            enter(root_id)
+            while pending:
+                dep_id = next(pending[-1], None)
+                if dep_id is None:
+                    # All dependencies done: mark as visited and add to result
+                    node_id = path.pop()
+                    del path_index[node_id]
+                    pending.pop()
+                    visit_state[node_id] = VisitState.VISITED
+                    result.append(node_id)
+                    continue
+                
+                if cycle_found and self._collect_errors:
+                    continue
+                
+                state = visit_state[dep_id]
+                if state == VisitState.VISITED:
+                    continue
+                
+                if state == VisitState.VISITING:
+                    # Found a cycle - it starts where dep_id sits on the path
+                    cycle_chain = path[path_index[dep_id]:] + [dep_id]
+                    pos = self._symbol_table[dep_id].position
+                    cycle_found = True
+                    self._record_error(CircularDependencyError(
+                        chain=cycle_chain,
+                        line=pos.line if pos else 0,
+                        column=pos.column if pos else 0,
+                    ))
+                    continue  # Don't continue in this branch
+                
+                enter(dep_id)
+        
+        # Result is in post-order (dependencies first)
         return result
     
-    def _get_node_dependencies(self, node: FlowNode) -> Set[str]:
+    def _get_node_dependencies(self, node: FlowNode) -> List[str]:
         """
-        Get all node IDs that a node depends on.
+        Get all node IDs that a node depends on, in source order.
         
         Includes references in content and slots.
         """
-        deps: Set[str] = set()
+        deps: Dict[str, None] = {}
         
         def collect_refs(items: List[ContentItem]) -> None:
             for item in items:
                 if isinstance(item, NodeRef):
                     # Extract base node ID (handle $a.slot case)
                     ref_id = item.id.split(".")[0] if "." in item.id else item.id
-                    deps.add(ref_id)
+                    deps[ref_id] = None
                 elif isinstance(item, FlowNode):
                     collect_refs(item.content)
                     for slot_node in item.slots.values():
@@ -745,7 +794,7 @@ class Resolver:
         for slot_node in node.slots.values():
             collect_refs(slot_node.content)
         
-        return deps
+        return list(deps)
     
     # =========================================================================
     # Step 7: Collect File Refs
@@ -959,7 +1008,8 @@ def resolve_with_graph(
     flow_file: FlowFile,
     base_path: Optional[Path] = None,
     source_path: Optional[str] = None,
-    logger: Optional[Logger] = None
+    logger: Optional[Logger] = None,
+    cache: Optional[Union["FlowCache", "ImportCache"]] = None,
 ) -> Tuple[ResolvedFlowFile, DependencyGraph]:
     """
     Resolve a FlowFile AST and return both resolved file and dependency graph.
@@ -969,6 +1019,7 @@ def resolve_with_graph(
         base_path: Base directory for resolving import paths.
         source_path: Path to the source .flow file.
         logger: Optional logger instance.
+        cache: Optional cache that imported files are parsed through.
         
     Returns:
         Tuple of (ResolvedFlowFile, DependencyGraph).
@@ -978,7 +1029,7 @@ def resolve_with_graph(
         >>> resolved, graph = resolve_with_graph(ast)
         >>> print(graph.to_mermaid())
     """
-    resolver = Resolver(logger=logger)
+    resolver = Resolver(logger=logger, cache=cache)
     return resolver.resolve_with_graph(flow_file, base_path=base_path, source_path=source_path)
 
 
@@ -987,10 +1038,12 @@ def validate_with_errors(
     base_path: Optional[Path] = None,
     source_path: Optional[str] = None,
     logger: Optional[Logger] = None,
+    cache: Optional[Union["FlowCache", "ImportCache"]] = None,
 ) -> List[FlowError]:
     """Validate a FlowFile and collect multiple semantic errors.
 
     Intended for CLI `validate` and tooling that wants best-effort reporting.
+    Imported files are parsed through ``cache`` when one is given.
     """
-    resolver = Resolver(logger=logger)
+    resolver = Resolver(logger=logger, cache=cache)
     return resolver.validate_with_errors(flow_file, base_path=base_path, source_path=source_path)
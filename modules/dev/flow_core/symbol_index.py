@@ -0,0 +1,467 @@
+"""
+Workspace-wide index of Flow node definitions and references.
+
+SymbolIndex records, for every .flow file under a workspace root, where each
+node (and slot) is defined and where it is referenced ($id, ^id, $id.slot and
+both sides of assignments). Lookups go through per-node maps, so answering
+"where is @greeting used?" touches only the files that mention it, without
+resolving any file.
+
+The index is incremental: refresh() re-parses only files whose mtime or size
+changed since they were indexed, and the language server feeds it the ASTs of
+open documents as they are validated. It can be saved to and loaded from a
+JSON file so the CLI keeps it between runs.
+
+Usage:
+    >>> index = SymbolIndex(workspace_root)
+    >>> index.refresh()                       # parses changed files only
+    >>> index.definitions("greeting")
+    [SymbolLocation(node_id='greeting', ...)]
+    >>> index.references("greeting")
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from logger_util import Logger
+from .dependency_graph import EdgeType
+from .errors import FlowError
+from .models import FlowFile, FlowNode, NodeRef, Position
+
+# Bump when the persisted format or what is indexed changes
+INDEX_VERSION = 1
+
+# File name used inside a --cache-dir
+INDEX_FILENAME = "symbols.json"
+
+ANONYMOUS_PREFIX = "_anon_"
+
+# (st_mtime_ns, st_size) of a file when it was indexed
+FileStamp = Tuple[int, int]
+
+
+class SymbolKind:
+    """Kinds of indexed symbol locations."""
+    NODE = "node"                        # @id definition
+    SLOT = "slot"                        # @slot definition inside a node
+    BACKWARD_REF = EdgeType.BACKWARD_REF # $id
+    FORWARD_REF = EdgeType.FORWARD_REF   # ^id
+    SLOT_REF = EdgeType.SLOT             # $id.slot / ^id.slot
+    ASSIGNMENT = "assignment"            # either side of $a.slot = $b
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolLocation:
+    """
+    One definition or reference site.
+
+    Attributes:
+        node_id: The identifier as written, without sigil ("main" or "main.slot")
+        file_path: Absolute path of the file
+        line: 1-based line of the sigil
+        column: 1-based column of the sigil (@, $ or ^)
+        kind: One of the SymbolKind values
+        container: Top-level node the reference appears in (None for
+                   definitions and assignments)
+    """
+    node_id: str
+    file_path: Path
+    line: int
+    column: int
+    kind: str
+    container: Optional[str] = None
+
+    @property
+    def base_id(self) -> str:
+        """The node part of ``node_id`` (before any ``.slot``)."""
+        return self.node_id.split(".", 1)[0]
+
+
+@dataclass(slots=True)
+class _FileSymbols:
+    """Everything indexed from one file."""
+    stamp: Optional[FileStamp]
+    definitions: List[SymbolLocation] = field(default_factory=list)
+    references: List[SymbolLocation] = field(default_factory=list)
+    imports: List[Path] = field(default_factory=list)
+
+
+class SymbolIndex:
+    """
+    Definitions and references of Flow nodes across a workspace.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, root: Optional[Path] = None, logger: Optional[Logger] = None) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            root: Workspace directory scanned by refresh(). May be set later.
+            logger: Optional logger instance.
+        """
+        self.logger = logger or Logger(name="FlowSymbolIndex")
+        self.root = Path(root).resolve() if root else None
+        self._lock = threading.RLock()
+        self._files: Dict[Path, _FileSymbols] = {}
+        # base node id -> files defining / referencing it
+        self._defined_in: Dict[str, Set[Path]] = {}
+        self._referenced_in: Dict[str, Set[Path]] = {}
+        # Files indexed from an editor buffer; refresh() leaves them alone
+        self._buffers: Set[Path] = set()
+
+    # =========================================================================
+    # Building
+    # =========================================================================
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the files under ``root``.
+
+        Parses only new files and files whose mtime or size changed, and
+        drops files that no longer exist.
+
+        Returns:
+            Number of files (re-)indexed.
+        """
+        if self.root is None:
+            return 0
+
+        seen: Set[Path] = set()
+        updated = 0
+        for path in self._scan(self.root):
+            seen.add(path)
+            if path in self._buffers:
+                continue
+            try:
+                stamp = self._stamp(path)
+            except OSError:
+                continue
+            with self._lock:
+                entry = self._files.get(path)
+            if entry is not None and entry.stamp == stamp:
+                continue
+            self._index_path(path, stamp)
+            updated += 1
+
+        with self._lock:
+            gone = [p for p in self._files if p not in seen and p not in self._buffers]
+        for path in gone:
+            self.remove_file(path)
+
+        if updated or gone:
+            self.logger.debug(f"Symbol index: {updated} file(s) indexed, {len(gone)} removed")
+        return updated
+
+    def update_file(self, file_path: Path) -> None:
+        """Re-index one file from disk (e.g. after a watched-file change)."""
+        path = Path(file_path).resolve()
+        if path in self._buffers:
+            return
+        try:
+            stamp = self._stamp(path)
+        except OSError:
+            self.remove_file(path)
+            return
+        self._index_path(path, stamp)
+
+    def update_flow_file(self, file_path: Path, flow_file: FlowFile) -> None:
+        """
+        Index an open document from its already-parsed buffer.
+
+        The file stays buffer-owned (skipped by refresh()) until release_buffer().
+        """
+        path = Path(file_path).resolve()
+        with self._lock:
+            self._buffers.add(path)
+            self._store(path, self._collect(path, flow_file, stamp=None))
+
+    def release_buffer(self, file_path: Path) -> None:
+        """Go back to indexing ``file_path`` from disk (its document was closed)."""
+        path = Path(file_path).resolve()
+        with self._lock:
+            self._buffers.discard(path)
+            entry = self._files.get(path)
+            if entry is not None:
+                entry.stamp = None  # re-read on the next refresh()
+
+    def remove_file(self, file_path: Path) -> None:
+        """Drop everything indexed from ``file_path``."""
+        path = Path(file_path).resolve()
+        with self._lock:
+            self._buffers.discard(path)
+            entry = self._files.pop(path, None)
+            if entry is not None:
+                self._unlink(path, entry)
+
+    def _index_path(self, path: Path, stamp: FileStamp) -> None:
+        from .parser import parse_stream
+
+        try:
+            flow_file = parse_stream(path.read_text(encoding="utf-8"), logger=self.logger)
+        except (OSError, UnicodeDecodeError, FlowError) as e:
+            # Keep the stamp so a broken file is not re-read until it changes
+            self.logger.debug(f"Symbol index: skipping {path}: {e}")
+            entry = _FileSymbols(stamp=stamp)
+        else:
+            entry = self._collect(path, flow_file, stamp)
+        with self._lock:
+            if path not in self._buffers:
+                self._store(path, entry)
+
+    def _store(self, path: Path, entry: _FileSymbols) -> None:
+        old = self._files.get(path)
+        if old is not None:
+            self._unlink(path, old)
+        self._files[path] = entry
+        for loc in entry.definitions:
+            self._defined_in.setdefault(loc.base_id, set()).add(path)
+        for loc in entry.references:
+            self._referenced_in.setdefault(loc.base_id, set()).add(path)
+
+    def _unlink(self, path: Path, entry: _FileSymbols) -> None:
+        for store, locations in (
+            (self._defined_in, entry.definitions),
+            (self._referenced_in, entry.references),
+        ):
+            for base_id in {loc.base_id for loc in locations}:
+                paths = store.get(base_id)
+                if paths is not None:
+                    paths.discard(path)
+                    if not paths:
+                        del store[base_id]
+
+    @staticmethod
+    def _collect(path: Path, flow_file: FlowFile, stamp: Optional[FileStamp]) -> _FileSymbols:
+        """Extract definition and reference sites from a parsed file."""
+        entry = _FileSymbols(stamp=stamp)
+        entry.imports = [
+            (path.parent / import_node.path).resolve() for import_node in flow_file.imports
+        ]
+
+        def location(node_id: str, position: Optional[Position], kind: str,
+                     container: Optional[str] = None) -> SymbolLocation:
+            pos = position or Position(0, 0)
+            return SymbolLocation(node_id, path, pos.line, pos.column, kind, container)
+
+        def walk(node: FlowNode, container: str, visited: Set[int]) -> None:
+            if id(node) in visited:
+                return  # slots appear both in content and in node.slots
+            visited.add(id(node))
+            for item in node.content:
+                if isinstance(item, NodeRef):
+                    if "." in item.id:
+                        kind = SymbolKind.SLOT_REF
+                    elif item.is_forward:
+                        kind = SymbolKind.FORWARD_REF
+                    else:
+                        kind = SymbolKind.BACKWARD_REF
+                    entry.references.append(location(item.id, item.position, kind, container))
+                elif isinstance(item, FlowNode):
+                    walk(item, container, visited)
+            for slot_node in node.slots.values():
+                walk(slot_node, container, visited)
+
+        for node_id, node in flow_file.nodes.items():
+            if node_id.startswith(ANONYMOUS_PREFIX):
+                walk(node, node_id, set())
+                continue
+            entry.definitions.append(location(node_id, node.position, SymbolKind.NODE))
+            for slot_name, slot_node in node.slots.items():
+                entry.definitions.append(
+                    location(f"{node_id}.{slot_name}", slot_node.position, SymbolKind.SLOT)
+                )
+            walk(node, node_id, set())
+
+        for assignment in flow_file.assignments:
+            entry.references.append(
+                location(assignment.target, assignment.position, SymbolKind.ASSIGNMENT)
+            )
+            entry.references.append(
+                location(assignment.source, assignment.source_position, SymbolKind.ASSIGNMENT)
+            )
+        return entry
+
+    @staticmethod
+    def _scan(root: Path) -> Iterable[Path]:
+        """Yield every .flow file under ``root``, skipping hidden directories."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if name.endswith(".flow"):
+                    yield Path(dirpath, name).resolve()
+
+    @staticmethod
+    def _stamp(path: Path) -> FileStamp:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def definitions(self, node_id: str) -> List[SymbolLocation]:
+        """
+        Return the definition sites of ``node_id`` ("node" or "node.slot").
+
+        A node defined in several files (e.g. the same id in different agents)
+        yields one location per file.
+        """
+        base_id = node_id.split(".", 1)[0]
+        with self._lock:
+            return sorted((
+                loc
+                for path in self._defined_in.get(base_id, ())
+                for loc in self._files[path].definitions
+                if loc.node_id == node_id
+            ), key=_site_key)
+
+    def references(
+        self, node_id: str, defined_in: Optional[Path] = None
+    ) -> List[SymbolLocation]:
+        """
+        Return every reference site of ``node_id``.
+
+        For a node id, references to its slots ($id.slot) are included.
+
+        Args:
+            node_id: "node" or "node.slot".
+            defined_in: File holding the definition the caller means. Only
+                        that file and files importing it (transitively)
+                        without defining the id themselves are searched.
+        """
+        base_id = node_id.split(".", 1)[0]
+        exact = "." in node_id
+        with self._lock:
+            paths = set(self._referenced_in.get(base_id, ()))
+            if defined_in is not None:
+                owner = Path(defined_in).resolve()
+                shadowing = self._defined_in.get(base_id, set()) - {owner}
+                paths = {
+                    path for path in paths - shadowing
+                    if path == owner or owner in self._transitive_imports(path)
+                }
+            return sorted((
+                loc
+                for path in paths
+                for loc in self._files[path].references
+                if loc.base_id == base_id and (not exact or loc.node_id == node_id)
+            ), key=_site_key)
+
+    def _transitive_imports(self, path: Path) -> Set[Path]:
+        """Files ``path`` imports, directly or through other indexed files."""
+        seen: Set[Path] = set()
+        stack = [path]
+        while stack:
+            entry = self._files.get(stack.pop())
+            if entry is None:
+                continue
+            for imported in entry.imports:
+                if imported not in seen:
+                    seen.add(imported)
+                    stack.append(imported)
+        return seen
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SymbolLocation]:
+        """
+        Return definitions whose id contains ``query`` (case-insensitive).
+
+        Exact matches come first, then prefix matches, then the rest.
+        """
+        needle = query.lower()
+        with self._lock:
+            matches = [
+                loc
+                for entry in self._files.values()
+                for loc in entry.definitions
+                if needle in loc.node_id.lower()
+            ]
+        matches.sort(key=lambda loc: (
+            loc.node_id.lower() != needle,
+            not loc.node_id.lower().startswith(needle),
+            loc.node_id,
+            _site_key(loc),
+        ))
+        return matches[:limit] if limit is not None else matches
+
+    @property
+    def file_count(self) -> int:
+        """Number of indexed files."""
+        with self._lock:
+            return len(self._files)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def save(self, index_path: Path) -> None:
+        """Write the disk-backed entries (not open buffers) to ``index_path``."""
+        with self._lock:
+            files = {
+                str(path): {
+                    "stamp": list(entry.stamp),
+                    "definitions": [_dump(loc) for loc in entry.definitions],
+                    "references": [_dump(loc) for loc in entry.references],
+                    "imports": [str(p) for p in entry.imports],
+                }
+                for path, entry in self._files.items()
+                if entry.stamp is not None and path not in self._buffers
+            }
+        data = {"version": INDEX_VERSION, "root": str(self.root) if self.root else None, "files": files}
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, index_path)
+
+    @classmethod
+    def load(
+        cls, index_path: Path, root: Path, logger: Optional[Logger] = None
+    ) -> "SymbolIndex":
+        """
+        Load an index saved by save(), or return an empty one.
+
+        A missing, unreadable, malformed or outdated file, or one saved for
+        another root, yields an empty index; refresh() then rebuilds it.
+        """
+        index = cls(root, logger=logger)
+        try:
+            data = json.loads(Path(index_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if not isinstance(data, dict):
+            return index
+        if data.get("version") != INDEX_VERSION or data.get("root") != str(index.root):
+            return index
+
+        try:
+            with index._lock:
+                for path_str, raw in data.get("files", {}).items():
+                    path = Path(path_str)
+                    index._store(path, _FileSymbols(
+                        stamp=tuple(raw["stamp"]),
+                        definitions=[_load(path, item) for item in raw["definitions"]],
+                        references=[_load(path, item) for item in raw["references"]],
+                        imports=[Path(p) for p in raw["imports"]],
+                    ))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return cls(root, logger=logger)
+        return index
+
+
+def _site_key(loc: SymbolLocation) -> Tuple[str, int, int]:
+    return str(loc.file_path), loc.line, loc.column
+
+
+def _dump(loc: SymbolLocation) -> list:
+    return [loc.node_id, loc.line, loc.column, loc.kind, loc.container]
+
+
+def _load(path: Path, item: list) -> SymbolLocation:
+    node_id, line, column, kind, container = item
+    return SymbolLocation(node_id, path, line, column, kind, container)
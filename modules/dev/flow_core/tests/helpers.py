@@ -0,0 +1,21 @@
+"""
+Shared helpers for the flow_core tests
+"""
+
+import os
+from io import StringIO
+from unittest.mock import patch
+
+
+def touch(path, text):
+    """Rewrite ``path`` and move its mtime forward so the change is visible."""
+    stat = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def run_captured(handler, args):
+    """Run a CLI handler with stdout captured; return (exit code, output)."""
+    with patch('sys.stdout', new_callable=StringIO) as fake_out:
+        exit_code = handler(args)
+    return exit_code, fake_out.getvalue()
@@ -0,0 +1,100 @@
+"""
+Tests for batch compilation
+
+Covers:
+- Discovery skips _lib/ fragments
+- Outputs mirror the source tree and match single-file compilation
+- Failures, including unexpected exceptions, are reported per file without
+  stopping the batch
+- Process-pool run (jobs > 1)
+"""
+
+import pytest
+
+from flow_core.batch_compile import compile_directory, discover_flow_files
+from flow_core.flow_controller import FlowController
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def flows(tmp_path):
+    root = tmp_path / "flows"
+    (root / "_lib").mkdir(parents=True)
+    (root / "agents").mkdir()
+    (root / "_lib" / "common.flow").write_text("@greeting |<<<Hello>>>|.\n", encoding="utf-8")
+    (root / "agents" / "a.flow").write_text(
+        "+../_lib/common.flow |.\n@out |$greeting|<<< from a>>>|.\n", encoding="utf-8"
+    )
+    (root / "b.flow").write_text(
+        "+./_lib/common.flow |.\n@out |$greeting|<<< from b>>>|.\n", encoding="utf-8"
+    )
+    return root
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestDiscovery:
+    """Only compilable files are picked up."""
+
+    def test_lib_is_skipped(self, flows):
+        found = [p.relative_to(flows).as_posix() for p in discover_flow_files(flows)]
+
+        assert found == ["agents/a.flow", "b.flow"]
+
+
+class TestCompileDirectory:
+    """compile_directory writes every output and summarizes the run."""
+
+    def test_outputs_mirror_tree(self, flows, tmp_path):
+        out = tmp_path / "out"
+        summary = compile_directory(flows, out, jobs=1)
+
+        assert summary.failed == []
+        assert [r.output for r in summary.results] == ["agents/a.md", "b.md"]
+        assert (out / "b.md").read_text(encoding="utf-8") == \
+            FlowController().compile_file(flows / "b.flow")
+        assert not list(out.rglob("*.tmp"))
+
+    def test_failure_does_not_stop_batch(self, flows, tmp_path):
+        (flows / "broken.flow").write_text("@x |$missing|.\n", encoding="utf-8")
+        summary = compile_directory(flows, tmp_path / "out", jobs=1)
+        data = summary.to_dict()
+
+        assert data["success"] is False
+        assert (data["compiled"], data["failed"]) == (2, 1)
+        assert summary.failed[0].file == "broken.flow"
+        assert summary.failed[0].error.startswith("Flow error")
+        assert not (tmp_path / "out" / "broken.md").exists()
+
+    def test_unexpected_exception_does_not_stop_batch(self, flows, tmp_path, monkeypatch):
+        compile_file = FlowController.compile_file
+
+        def compile_or_overflow(self, path, *args, **kwargs):
+            if path.name == "a.flow":
+                raise RecursionError("maximum recursion depth exceeded")
+            return compile_file(self, path, *args, **kwargs)
+
+        monkeypatch.setattr(FlowController, "compile_file", compile_or_overflow)
+        summary = compile_directory(flows, tmp_path / "out", jobs=1)
+
+        assert [r.file for r in summary.failed] == ["agents/a.flow"]
+        assert summary.failed[0].error.startswith("Internal error: RecursionError")
+        assert (tmp_path / "out" / "b.md").exists()
+
+    def test_process_pool(self, flows, tmp_path):
+        out = tmp_path / "out"
+        summary = compile_directory(flows, out, jobs=2)
+
+        assert summary.jobs == 2
+        assert summary.failed == []
+        assert "from a" in (out / "agents" / "a.md").read_text(encoding="utf-8")
+
+    def test_jobs_capped_by_file_count(self, flows, tmp_path):
+        assert compile_directory(flows, tmp_path / "out", jobs=16).jobs == 2
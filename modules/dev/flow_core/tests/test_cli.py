@@ -8,6 +8,9 @@ Tests covering:
 - compile command
 - graph command (DOT, JSON, Mermaid formats)
 - validate command
+- impact command (single node and --batch)
+- usages --workspace command
+- compile --stats and stats pipeline counters
 """
 
 import pytest
@@ -24,6 +27,9 @@ from flow_core.flow_cli import (
     compile_command,
     graph_command,
     validate_command,
+    impact_command,
+    usages_command,
+    stats_command,
 )
 
 
@@ -314,3 +320,196 @@ class TestValidateCommand:
         
         # Empty file is valid (library mode)
         assert exit_code == 0
+
+
+# =============================================================================
+# Impact Command Tests
+# =============================================================================
+
+
+class TestImpactCommand:
+    """Tests for `flow impact` and `flow impact --batch`."""
+    
+    @pytest.fixture
+    def chain_file(self, tmp_path):
+        flow_file = tmp_path / "chain.flow"
+        flow_file.write_text(
+            "@base |<<<Base>>>|.\n"
+            "@mid |$base|.\n"
+            "@side |$base|.\n"
+            "@top |$mid|.\n"
+            "@out |$top|$side|.\n"
+        )
+        return flow_file
+    
+    def _run(self, **kwargs):
+        with patch('sys.stdout', new_callable=StringIO) as fake_out:
+            exit_code = impact_command(argparse.Namespace(**kwargs))
+        return exit_code, json.loads(fake_out.getvalue())
+    
+    def test_single_node(self, chain_file):
+        exit_code, data = self._run(file=str(chain_file), node="mid")
+        
+        assert exit_code == 0
+        assert data["direct_impact_count"] == 1
+        assert [(a["node"], a["direct"]) for a in data["affected"]] == [("out", False), ("top", True)]
+    
+    def test_batch_many_nodes(self, chain_file):
+        exit_code, data = self._run(file=str(chain_file), node=["mid", "side"], batch=True)
+        
+        assert exit_code == 0
+        assert set(data["impacts"]) == {"mid", "side"}
+        assert data["impacts"]["side"]["total_impact_count"] == 1
+        assert data["combined_affected"] == ["out", "top"]
+    
+    def test_batch_defaults_to_every_node(self, chain_file):
+        exit_code, data = self._run(file=str(chain_file), node=[], batch=True)
+        
+        assert exit_code == 0
+        assert data["impacts"]["base"]["total_impact_count"] == 4
+        assert data["impacts"]["out"]["total_impact_count"] == 0
+    
+    def test_batch_unknown_node(self, chain_file):
+        exit_code, data = self._run(file=str(chain_file), node=["mid", "gone"], batch=True)
+        
+        assert exit_code == 1
+        assert data["unknown_nodes"] == ["gone"]
+        assert "mid" in data["impacts"]
+    
+    def test_several_nodes_require_batch(self, chain_file):
+        exit_code, data = self._run(file=str(chain_file), node=["mid", "side"])
+        
+        assert exit_code == 1
+        assert "--batch" in data["error"]
+
+
+# =============================================================================
+# Usages Command Tests
+# =============================================================================
+
+
+class TestUsagesWorkspace:
+    """Tests for `flow usages --workspace`."""
+    
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        (tmp_path / "_lib").mkdir()
+        (tmp_path / "_lib" / "common.flow").write_text("@greeting |<<<Hello>>>|.\n")
+        (tmp_path / "a.flow").write_text("+./_lib/common.flow |.\n@out |$greeting|.\n")
+        (tmp_path / "b.flow").write_text("+./_lib/common.flow |.\n@out |^greeting|.\n")
+        return tmp_path
+    
+    def _run(self, **kwargs):
+        with patch('sys.stdout', new_callable=StringIO) as fake_out:
+            exit_code = usages_command(argparse.Namespace(workspace=True, **kwargs))
+        return exit_code, json.loads(fake_out.getvalue())
+    
+    def test_usages_across_workspace(self, workspace):
+        exit_code, data = self._run(file=str(workspace), node="greeting", cache_dir=None)
+        
+        assert exit_code == 0
+        assert data["definitions"] == [{"file": "_lib/common.flow", "line": 1, "column": 1}]
+        assert [(u["file"], u["ref_type"], u["referencing_node"]) for u in data["usages"]] == [
+            ("a.flow", "backward", "out"),
+            ("b.flow", "forward", "out"),
+        ]
+    
+    def test_file_argument_searches_its_directory(self, workspace):
+        exit_code, data = self._run(file=str(workspace / "a.flow"), node="greeting", cache_dir=None)
+        
+        assert exit_code == 0
+        assert data["usage_count"] == 2
+    
+    def test_cache_dir_skips_unchanged_files(self, workspace, tmp_path_factory):
+        cache_dir = str(tmp_path_factory.mktemp("cache"))
+        _, first = self._run(file=str(workspace), node="greeting", cache_dir=cache_dir)
+        _, second = self._run(file=str(workspace), node="greeting", cache_dir=cache_dir)
+        
+        assert first["files_parsed"] == 3
+        assert second["files_parsed"] == 0
+        assert second["usages"] == first["usages"]
+    
+    def test_unknown_node(self, workspace):
+        exit_code, data = self._run(file=str(workspace), node="missing", cache_dir=None)
+        
+        assert exit_code == 1
+        assert data["success"] is False
+
+
+# =============================================================================
+# Batch Compile Tests
+# =============================================================================
+
+
+class TestCompileAll:
+    """Tests for `flow compile --all <dir> --out <dir>`."""
+    
+    def _run(self, **kwargs):
+        args = dict(file=None, output=None, cache_dir=None, out=None, jobs=1)
+        args.update(kwargs)
+        with patch('sys.stdout', new_callable=StringIO) as fake_out:
+            exit_code = compile_command(argparse.Namespace(**args))
+        return exit_code, json.loads(fake_out.getvalue())
+    
+    def test_compile_all(self, sample_flow_file, tmp_path):
+        out = tmp_path / "out"
+        exit_code, data = self._run(all=str(tmp_path), out=str(out))
+        
+        assert exit_code == 0
+        assert data["compiled"] == 1
+        assert data["files"][0]["file"] == "test.flow"
+        assert (out / "test.md").exists()
+    
+    def test_requires_out(self, sample_flow_file, tmp_path):
+        exit_code, data = self._run(all=str(tmp_path))
+        
+        assert exit_code == 1
+        assert "--out" in data["error"]
+
+
+# =============================================================================
+# Pipeline Stats Tests
+# =============================================================================
+
+
+class TestPipelineStatsOutput:
+    """Tests for `flow compile --stats` and the pipeline section of `flow stats`."""
+    
+    def _run(self, handler, **kwargs):
+        with patch('sys.stdout', new_callable=StringIO) as fake_out:
+            exit_code = handler(argparse.Namespace(no_daemon=True, **kwargs))
+        return exit_code, json.loads(fake_out.getvalue())
+    
+    def test_compile_stats(self, sample_flow_file):
+        exit_code, data = self._run(compile_command, file=str(sample_flow_file), output=None,
+                                    cache_dir=None, stats=True)
+        
+        assert exit_code == 0
+        assert "Hello, World!" in data["markdown"]
+        assert data["stats"]["files"] == 1
+        assert data["stats"]["memo_misses"] == 2
+        assert data["stats"]["compile_cache_hits"] == 0
+    
+    def test_compile_stats_with_output(self, sample_flow_file, tmp_path):
+        output = tmp_path / "out.md"
+        exit_code, data = self._run(compile_command, file=str(sample_flow_file), output=str(output),
+                                    cache_dir=None, stats=True)
+        
+        assert exit_code == 0
+        assert "markdown" not in data
+        assert "Hello, World!" in output.read_text()
+    
+    def test_stats_pipeline(self, complex_flow_file):
+        exit_code, data = self._run(stats_command, file=str(complex_flow_file), format="json")
+        
+        assert exit_code == 0
+        assert data["pipeline"]["resolved_nodes"] == 4
+        assert set(data["pipeline"]["stages"]) == {"tokenize", "parse", "resolve", "compile"}
+    
+    def test_stats_pipeline_error(self, invalid_flow_file):
+        exit_code, data = self._run(stats_command, file=str(invalid_flow_file), format="json")
+        
+        assert exit_code == 0
+        assert data["metrics"]["node_count"] == 1
+        assert "undefined_node" in data["pipeline"]["error"]
+
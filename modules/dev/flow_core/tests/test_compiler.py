@@ -743,5 +743,75 @@ class TestInlineSubstitution:
         assert result.strip() == "AB"
 
 
+# =============================================================================
+# Node Memo Tests
+# =============================================================================
+
+
+class TestNodeMemo:
+    """Tests for the per-compile node output memo."""
+
+    def test_shared_fragment_compiled_once(self):
+        """A node referenced from many places is compiled once and reused."""
+        shared = FlowNode(id="shared", layer=0, content=["Shared"])
+        refs = [NodeRef(id="shared", is_forward=False) for _ in range(30)]
+        out_node = FlowNode(id="out", layer=0, content=refs)
+        resolved = ResolvedFlowFile(
+            nodes={"shared": shared, "out": out_node},
+            out_node=out_node,
+            dependency_order=["shared", "out"],
+        )
+
+        compiler = Compiler()
+        result = compiler.compile(resolved)
+
+        assert result.count("Shared") == 30
+        assert compiler.memo_stats == {"hits": 29, "misses": 2}
+
+    def test_memo_reset_per_compile(self):
+        """Stats and memoized output do not leak between compile() calls."""
+        source = (
+            '@a |<<<Alpha>>>|.\n'
+            '@out |$a|$a|.\n'
+        )
+        compiler = Compiler()
+        resolved = resolve(parse(Tokenizer().tokenize(source)))
+        first = compiler.compile(resolved)
+        second = compiler.compile(resolved)
+
+        assert first == second == "Alpha\nAlpha"
+        assert compiler.memo_stats == {"hits": 1, "misses": 2}
+
+    def test_styled_shared_node_matches_unmemoized_output(self):
+        """Memoized output of a styled node is identical at every reference."""
+        item = '@item\n|style.title=<<Section>>\n|<<<Item>>>|.\n'
+        result = full_pipeline(item + '@out |$item|$item|.\n')
+        single = full_pipeline(item + '@out |$item|.\n')
+
+        assert result == f"{single}\n{single}"
+
+    def test_circular_output_not_memoized(self):
+        """Output containing a CIRCULAR marker depends on the path and is not reused."""
+        a_node = FlowNode(id="a", layer=0, content=["A", NodeRef(id="b", is_forward=False)])
+        b_node = FlowNode(id="b", layer=0, content=["B", NodeRef(id="a", is_forward=False)])
+        out_node = FlowNode(
+            id="out",
+            layer=0,
+            content=[NodeRef(id="a", is_forward=False), NodeRef(id="b", is_forward=False)],
+        )
+        resolved = ResolvedFlowFile(
+            nodes={"a": a_node, "b": b_node, "out": out_node},
+            out_node=out_node,
+            dependency_order=["a", "b", "out"],
+        )
+
+        compiler = Compiler()
+        result = compiler.compile(resolved)
+
+        # b reached via a cycles back to @a; b compiled at top level cycles back to @b
+        assert result == "A\nB\n[CIRCULAR: @a]\nB\nA\n[CIRCULAR: @b]"
+        assert compiler.memo_stats["hits"] == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
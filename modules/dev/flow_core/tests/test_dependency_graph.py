@@ -7,6 +7,7 @@ Comprehensive tests covering:
 - Graph export formats (DOT, JSON, Mermaid)
 - Cross-file graph merging
 - dependents() and dependencies() methods
+- transitive_dependents() reachability closure
 """
 
 import pytest
@@ -165,6 +166,65 @@ class TestDependencyGraphDataclass:
         assert len(edges) == 2
 
 
+# =============================================================================
+# Transitive Dependents Tests
+# =============================================================================
+
+
+def _graph(edges) -> DependencyGraph:
+    nodes = {n for edge in edges for n in edge[:2]}
+    return DependencyGraph(
+        nodes=frozenset(nodes),
+        edges=frozenset((a, b, EdgeType.BACKWARD_REF) for a, b in edges),
+        files=frozenset(),
+    )
+
+
+class TestTransitiveDependents:
+    """transitive_dependents() answers from the cached closure."""
+    
+    def test_chain_and_diamond(self):
+        # top -> left -> base, top -> right -> base, base -> leaf
+        graph = _graph([("top", "left"), ("top", "right"), ("left", "base"),
+                        ("right", "base"), ("base", "leaf")])
+        
+        assert graph.transitive_dependents("leaf") == {"base", "left", "right", "top"}
+        assert graph.transitive_dependents("left") == {"top"}
+        assert graph.transitive_dependents("top") == set()
+    
+    def test_cycle_members_exclude_self(self):
+        graph = _graph([("a", "b"), ("b", "c"), ("c", "a"), ("d", "a")])
+        
+        assert graph.transitive_dependents("a") == {"b", "c", "d"}
+        assert graph.transitive_dependents("d") == set()
+    
+    def test_unknown_node(self):
+        assert _graph([("a", "b")]).transitive_dependents("missing") == set()
+    
+    def test_matches_traversal_on_layered_graph(self):
+        edges = [(f"l{i + 1}_{j}", f"l{i}_{k}") for i in range(20)
+                 for j in range(5) for k in range(5) if (j + k) % 2 == 0]
+        graph = _graph(edges)
+        
+        def walk(node_id):
+            seen, todo = set(), [node_id]
+            while todo:
+                for dep in graph.dependents(todo.pop()):
+                    if dep not in seen and dep != node_id:
+                        seen.add(dep)
+                        todo.append(dep)
+            return seen
+        
+        for node_id in graph.nodes:
+            assert graph.transitive_dependents(node_id) == walk(node_id)
+    
+    def test_deep_chain(self):
+        graph = _graph([(f"n{i + 1}", f"n{i}") for i in range(5000)])
+        
+        assert len(graph.transitive_dependents("n0")) == 5000
+        assert graph.transitive_dependents("n4999") == {"n5000"}
+
+
 # =============================================================================
 # Graph Building During Resolution Tests
 # =============================================================================
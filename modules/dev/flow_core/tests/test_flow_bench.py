@@ -0,0 +1,184 @@
+"""
+Tests for the pipeline benchmark suite (`flow bench`)
+
+Covers:
+- Generated corpora compile cleanly at small scale
+- Report shape: per-stage times, totals and peak memory per corpus
+- Failing files are reported instead of aborting the corpus
+- Baseline comparison: threshold, noise floor, new failing files, scale mismatch
+- CLI: --save / --baseline round trip, exit code on regression and on an
+  incomparable baseline
+"""
+
+import argparse
+import json
+
+import pytest
+
+from flow_core.flow_bench import (
+    STAGES,
+    SYNTHETIC_CORPORA,
+    bench_corpus,
+    comparable,
+    compare_reports,
+    generate_corpora,
+    run_benchmarks,
+)
+from flow_core.flow_cli import bench_command
+from flow_core.flow_controller import FlowController
+from flow_core.flow_cache import FlowCache
+from flow_core.tests.helpers import run_captured
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def make_report(scale=1.0, **stage_times):
+    stages = {stage: 0.010 for stage in STAGES}
+    stages.update(stage_times)
+    return {"scale": scale, "corpora": {"deep_chain": {"stages": stages, "peak_memory": 1_000_000}}}
+
+
+def bench_args(**kwargs):
+    defaults = dict(corpus=["deep_chain"], repeat=1, scale=0.01, baseline=None, save=None,
+                    threshold=None, format="json")
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+# =============================================================================
+# Corpora and measuring
+# =============================================================================
+
+
+class TestCorpora:
+    """Synthetic corpora are valid Flow projects."""
+
+    @pytest.mark.parametrize("name", list(SYNTHETIC_CORPORA))
+    def test_corpus_compiles(self, tmp_path, name):
+        directory = generate_corpora(tmp_path, scale=0.01, names=[name])[name]
+
+        output = FlowController(cache=FlowCache()).compile_file(directory / "entry.flow")
+
+        assert output.strip()
+
+    def test_only_requested_corpora(self, tmp_path):
+        corpora = generate_corpora(tmp_path, scale=0.01, names=["wide_library"])
+
+        assert list(corpora) == ["wide_library"]
+
+
+class TestMeasuring:
+    """Reports carry per-stage times and peak memory."""
+
+    def test_report_shape(self, tmp_path):
+        report = run_benchmarks(tmp_path, repeat=1, scale=0.01, names=["many_imports", "huge_strings"])
+
+        assert list(report["corpora"]) == ["huge_strings", "many_imports"]
+        corpus = report["corpora"]["many_imports"]
+        assert corpus["files"] == 1
+        assert set(corpus["stages"]) == set(STAGES)
+        assert corpus["total"] == pytest.approx(sum(corpus["stages"].values()), abs=1e-5)
+        assert corpus["peak_memory"] > 0
+
+    def test_failing_file_reported(self, tmp_path):
+        (tmp_path / "good.flow").write_text("@out |<<<ok>>>|.\n", encoding="utf-8")
+        (tmp_path / "bad.flow").write_text("@out |$missing|.\n", encoding="utf-8")
+
+        result = bench_corpus("mixed", tmp_path, repeat=1)
+
+        assert result.files == 1
+        assert len(result.errors) == 1 and result.errors[0].startswith("bad.flow")
+
+
+# =============================================================================
+# Baselines
+# =============================================================================
+
+
+class TestCompareReports:
+    """Only real slowdowns count as regressions."""
+
+    def test_slower_stage_regresses(self):
+        regressions = compare_reports(make_report(resolve=0.020), make_report())
+
+        assert [(r["corpus"], r["metric"]) for r in regressions] == [("deep_chain", "stages.resolve")]
+        assert regressions[0]["change"] == 1.0
+
+    def test_within_threshold(self):
+        assert compare_reports(make_report(resolve=0.012), make_report()) == []
+
+    def test_below_noise_floor(self):
+        baseline = make_report(tokenize=0.0001)
+
+        assert compare_reports(make_report(tokenize=0.0010), baseline) == []
+
+    def test_memory_regression(self):
+        report = make_report()
+        report["corpora"]["deep_chain"]["peak_memory"] = 2_000_000
+
+        assert [r["metric"] for r in compare_reports(report, make_report())] == ["peak_memory"]
+
+    def test_new_failing_file_regresses(self):
+        report, baseline = make_report(), make_report()
+        baseline["corpora"]["deep_chain"]["files"] = 2
+        report["corpora"]["deep_chain"].update(files=1, errors=["entry.flow: broken"])
+
+        regressions = compare_reports(report, baseline)
+
+        assert [(r["metric"], r["change"]) for r in regressions] == [("files", -1), ("errors", 1)]
+
+    def test_scale_mismatch_not_compared(self):
+        assert not comparable(make_report(scale=2.0), make_report())
+        assert compare_reports(make_report(scale=2.0, resolve=1.0), make_report()) == []
+
+    def test_no_shared_corpus_not_comparable(self):
+        baseline = make_report()
+        baseline["corpora"] = {"wide_library": baseline["corpora"].pop("deep_chain")}
+
+        assert not comparable(make_report(), baseline)
+
+
+class TestBenchCommand:
+    """`flow bench` saves reports and fails on regressions."""
+
+    def test_save_then_compare(self, tmp_path):
+        saved = tmp_path / "baseline.json"
+
+        exit_code, _ = run_captured(bench_command, bench_args(save=str(saved)))
+        assert exit_code == 0
+        exit_code, output = run_captured(bench_command, bench_args(baseline=str(saved), threshold=100.0))
+
+        assert exit_code == 0
+        assert json.loads(output)["regressions"] == []
+
+    def test_regression_exit_code(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("flow_core.flow_bench.TIME_NOISE_FLOOR", 0.0)
+        baseline = tmp_path / "baseline.json"
+        _, output = run_captured(bench_command, bench_args())
+        report = json.loads(output)
+        for stage in STAGES:
+            report["corpora"]["deep_chain"]["stages"][stage] = 1e-9
+        baseline.write_text(json.dumps(report), encoding="utf-8")
+
+        exit_code, output = run_captured(bench_command, bench_args(baseline=str(baseline)))
+
+        assert exit_code == 1
+        assert json.loads(output)["success"] is False
+
+    def test_scale_mismatch_fails(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        run_captured(bench_command, bench_args(save=str(baseline)))
+
+        exit_code, output = run_captured(bench_command, bench_args(baseline=str(baseline), scale=0.02))
+
+        assert exit_code == 1
+        assert "cannot be compared" in json.loads(output)["error"]
+
+    def test_unreadable_baseline(self, tmp_path):
+        exit_code, output = run_captured(bench_command, bench_args(baseline=str(tmp_path / "missing.json")))
+
+        assert exit_code == 1
+        assert "Cannot read baseline" in json.loads(output)["error"]
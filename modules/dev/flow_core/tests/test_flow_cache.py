@@ -0,0 +1,233 @@
+"""
+Tests for the content-addressed Flow cache
+
+Covers:
+- Shared _lib fragments parsed once across many compiles
+- Compiled output reuse and invalidation on entry / import edits
+- Entry files with assignments are not corrupted by caching
+- Imported nodes shared, not copied, between importing files
+- On-disk persistence across FlowCache instances
+- get_last_resolved_files() after a cache hit
+- FlowController(stats=True) stage timings and counters
+"""
+
+import pytest
+from pathlib import Path
+
+from flow_core.flow_cache import FlowCache
+from flow_core.flow_controller import FlowController
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+LIB_SOURCE = """\
+@shared |<<<Shared fragment>>>|.
+@frame
+|@body |<<<Frame body>>>|.
+|.
+"""
+
+
+@pytest.fixture
+def flows(tmp_path: Path) -> Path:
+    """A flows dir with one _lib fragment imported by three agents."""
+    lib_dir = tmp_path / "_lib"
+    lib_dir.mkdir()
+    (lib_dir / "common.flow").write_text(LIB_SOURCE, encoding="utf-8")
+    for i in range(3):
+        (tmp_path / f"agent_{i}.flow").write_text(
+            f"+./_lib/common.flow |.\n@intro |<<<Agent {i}>>>|.\n@out |$intro|$shared|.\n",
+            encoding="utf-8",
+        )
+    return tmp_path
+
+
+@pytest.fixture
+def cache() -> FlowCache:
+    return FlowCache()
+
+
+# =============================================================================
+# Parse cache
+# =============================================================================
+
+
+class TestParseCache:
+    """Layer 1: parsed FlowFiles keyed by source hash."""
+
+    def test_shared_fragment_parsed_once(self, flows, cache):
+        controller = FlowController(cache=cache)
+        outputs = [controller.compile_file(flows / f"agent_{i}.flow") for i in range(3)]
+
+        assert "Agent 2" in outputs[2]
+        assert "Shared fragment" in outputs[0]
+        # 3 entry files + 1 fragment parsed; the fragment is reused twice
+        assert cache.stats.parse_misses == 4
+        assert cache.stats.parse_hits == 2
+
+    def test_identical_sources_share_parse(self, cache):
+        controller = FlowController(cache=cache)
+        source = "@a |<<<A>>>|.\n@out |$a|.\n"
+
+        assert controller.compile_source(source) == controller.compile_source(source)
+        assert cache.stats.parse_hits == 1
+
+    def test_assignments_do_not_leak_between_compiles(self, cache):
+        controller = FlowController(cache=cache)
+        source = (
+            "@greeting |<<<Hi>>>|.\n"
+            "@main\n|@slot |<<<default>>>|.\n|.\n"
+            "$main.slot = $greeting\n"
+            "@out |$main|.\n"
+        )
+        first = controller.compile_source(source)
+        second = controller.compile_source(source)
+
+        assert first == second == FlowController(use_cache=False).compile_source(source)
+        parsed = cache.parse(source, lambda s: pytest.fail("should be cached"))
+        assert "default" in parsed.nodes["main"].slots["slot"].content[0]
+
+    def test_imported_nodes_shared_between_entry_files(self, flows, cache):
+        controller = FlowController(cache=cache)
+        first = controller.resolve(
+            controller.parse_source((flows / "agent_0.flow").read_text()), base_path=flows
+        )
+        second = controller.resolve(
+            controller.parse_source((flows / "agent_1.flow").read_text()), base_path=flows
+        )
+
+        # Both importers reference the cached fragment's nodes, no copies
+        assert first.nodes["shared"] is second.nodes["shared"]
+        assert first.nodes["frame"] is second.nodes["frame"]
+
+
+# =============================================================================
+# Compiled output cache
+# =============================================================================
+
+
+class TestCompiledCache:
+    """Layer 2: compiled Markdown keyed by transitive content hash."""
+
+    def test_unchanged_compile_is_a_hit(self, flows, cache):
+        controller = FlowController(cache=cache)
+        first = controller.compile_file(flows / "agent_0.flow")
+        misses = cache.stats.parse_misses
+
+        assert controller.compile_file(flows / "agent_0.flow") == first
+        assert cache.stats.compile_hits == 1
+        assert cache.stats.parse_misses == misses
+
+    def test_import_edit_invalidates_dependants(self, flows, cache):
+        controller = FlowController(cache=cache)
+        controller.compile_file(flows / "agent_0.flow")
+        (flows / "_lib" / "common.flow").write_text(
+            LIB_SOURCE.replace("Shared fragment", "Edited fragment"), encoding="utf-8"
+        )
+
+        assert "Edited fragment" in controller.compile_file(flows / "agent_0.flow")
+
+    def test_entry_edit_invalidates(self, flows, cache):
+        controller = FlowController(cache=cache)
+        agent = flows / "agent_1.flow"
+        controller.compile_file(agent)
+        agent.write_text(agent.read_text().replace("Agent 1", "Agent one"), encoding="utf-8")
+
+        assert "Agent one" in controller.compile_file(agent)
+
+    def test_last_resolved_files_after_hit(self, flows, cache):
+        controller = FlowController(cache=cache)
+        controller.compile_file(flows / "agent_0.flow")
+        expected = controller.get_last_resolved_files()
+
+        FlowController(cache=cache).compile_file(flows / "agent_0.flow")
+        other = FlowController(cache=cache)
+        other.compile_file(flows / "agent_0.flow")
+
+        assert other.get_last_resolved_files() == expected
+        assert (flows / "_lib" / "common.flow").resolve() in expected
+
+    def test_persisted_across_instances(self, flows, tmp_path):
+        cache_dir = tmp_path / "cache"
+        FlowController(cache=FlowCache(cache_dir=cache_dir)).compile_file(flows / "agent_2.flow")
+
+        fresh = FlowCache(cache_dir=cache_dir)
+        markdown = FlowController(cache=fresh).compile_file(flows / "agent_2.flow")
+
+        assert "Agent 2" in markdown
+        assert fresh.stats.compile_hits == 1
+        assert fresh.stats.parse_misses == 0
+
+    def test_use_cache_false_bypasses_cache(self, flows):
+        controller = FlowController(use_cache=False)
+        assert controller.cache is None
+        assert "Agent 0" in controller.compile_file(flows / "agent_0.flow")
+
+
+# =============================================================================
+# Pipeline stats
+# =============================================================================
+
+
+class TestPipelineStats:
+    """FlowController(stats=True) records where a compile spends its time."""
+
+    def test_disabled_by_default(self, cache):
+        assert FlowController(cache=cache).stats is None
+
+    def test_counters(self, flows):
+        (flows / "assign.flow").write_text(
+            "@slot_host |@body |<<<default>>>|.|.\n@filler |<<<filled>>>|.\n"
+            "$slot_host.body = $filler\n@out |$slot_host|$slot_host|.\n",
+            encoding="utf-8",
+        )
+        controller = FlowController(use_cache=False, stats=True)
+
+        controller.compile_file(flows / "agent_0.flow")
+        controller.compile_file(flows / "assign.flow")
+        stats = controller.stats.to_dict()
+
+        assert stats["files"] == 2
+        assert stats["nodes"] == 2 + 3
+        assert stats["tokens"] > 0
+        assert stats["import_files"] == 1
+        assert stats["node_clones"] == 1
+        assert stats["memo_hits"] == 1
+        assert set(stats["stages"]) == {"tokenize", "parse", "resolve", "compile"}
+        assert all(seconds > 0 for seconds in stats["stages"].values())
+
+    def test_node_clones_counted_per_replace(self, flows):
+        (flows / "rename.flow").write_text(
+            "+./_lib/common.flow |@greeting |. = $shared |@page |. = $frame |.\n"
+            "@filler |<<<filled>>>|.\n$page.body = $filler\n@out |$greeting|$page|.\n",
+            encoding="utf-8",
+        )
+        controller = FlowController(use_cache=False, stats=True)
+
+        controller.compile_file(flows / "rename.flow")
+        assert controller.stats.node_clones == 2 + 1  # two renamed imports, one assignment
+        controller.compile_file(flows / "rename.flow")
+        assert controller.stats.node_clones == 2 * 3
+
+    def test_cache_hits_counted(self, flows, cache):
+        controller = FlowController(cache=cache, stats=True)
+
+        controller.compile_file(flows / "agent_0.flow")
+        controller.compile_file(flows / "agent_1.flow")
+        controller.compile_file(flows / "agent_0.flow")
+
+        assert controller.stats.parse_cache_hits == 1  # common.flow for agent_1
+        assert controller.stats.compile_cache_hits == 1
+
+    def test_reset(self, flows):
+        controller = FlowController(use_cache=False, stats=True)
+        controller.compile_file(flows / "agent_0.flow")
+
+        controller.stats.reset()
+
+        assert controller.stats.files == 0
+        assert controller.stats.to_dict()["total"] == 0
+
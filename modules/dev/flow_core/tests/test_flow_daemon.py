@@ -0,0 +1,240 @@
+"""
+Tests for the Flow daemon (`flow serve`)
+
+Covers:
+- JSON-RPC dispatch: status, unknown methods, protocol mismatch, bad requests
+- Thin clients: forwarded commands match in-process output, relative paths
+  resolve in the client's directory
+- Fallback to in-process execution when no daemon is listening or it goes
+  silent; heartbeats keep slow commands forwarded
+- Watcher: changed files are re-parsed and compiled entries recompiled
+- Shutdown removes the socket
+"""
+
+import argparse
+import json
+import socket
+import time
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from flow_core.flow_cache import FlowCache
+from flow_core.flow_cli import DAEMON_COMMANDS, stats_command
+from flow_core.flow_controller import FlowController
+from flow_core.flow_daemon import (
+    DAEMON_PROTOCOL,
+    METHOD_NOT_FOUND,
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    FlowDaemon,
+    forward_command,
+    request,
+)
+from flow_core.tests.helpers import run_captured
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "_lib").mkdir()
+    (tmp_path / "_lib" / "common.flow").write_text("@greeting |<<<Hello>>>|.\n", encoding="utf-8")
+    (tmp_path / "agent.flow").write_text(
+        "+./_lib/common.flow |.\n@out |$greeting|.\n", encoding="utf-8"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def daemon(workspace, tmp_path_factory):
+    socket_path = tmp_path_factory.mktemp("sock") / "flow.sock"
+    daemon = FlowDaemon(DAEMON_COMMANDS, socket_path=socket_path, root=workspace,
+                        poll_interval=3600, cache=FlowCache())
+    daemon.start()
+    yield daemon
+    daemon.shutdown()
+
+
+def compile_args(file, **kwargs):
+    return argparse.Namespace(file=str(file), output=None, cache_dir=None, **kwargs)
+
+
+# =============================================================================
+# Dispatch
+# =============================================================================
+
+
+class TestDispatch:
+    """JSON-RPC requests are answered without touching the socket."""
+
+    @pytest.fixture
+    def offline(self, workspace, tmp_path):
+        return FlowDaemon(DAEMON_COMMANDS, socket_path=tmp_path / "unused.sock", root=workspace)
+
+    def test_status(self, offline):
+        response = offline.dispatch({"jsonrpc": "2.0", "id": 7, "method": "status"})
+
+        assert response["id"] == 7
+        assert response["result"]["commands"] == ["compile", "graph", "stats", "validate"]
+
+    def test_unknown_method(self, offline):
+        response = offline.dispatch({"jsonrpc": "2.0", "id": 1, "method": "reboot"})
+
+        assert response["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_invalid_request(self, offline):
+        assert offline.dispatch(["run"])["error"]["code"] == INVALID_REQUEST
+
+    def test_protocol_mismatch(self, offline, workspace):
+        params = {"command": "compile", "args": {"file": "agent.flow"}, "cwd": str(workspace),
+                  "protocol": DAEMON_PROTOCOL + 1}
+        response = offline.dispatch({"jsonrpc": "2.0", "id": 1, "method": "run", "params": params})
+
+        assert response["error"]["code"] == INVALID_PARAMS
+
+    def test_command_not_served(self, offline, workspace):
+        params = {"command": "rename", "args": {}, "cwd": str(workspace), "protocol": DAEMON_PROTOCOL}
+        response = offline.dispatch({"jsonrpc": "2.0", "id": 1, "method": "run", "params": params})
+
+        assert response["error"]["code"] == METHOD_NOT_FOUND
+
+
+# =============================================================================
+# Thin clients
+# =============================================================================
+
+
+class TestForwarding:
+    """CLI handlers forward to a running daemon and fall back without one."""
+
+    def test_forwarded_compile_matches_in_process(self, daemon, workspace, monkeypatch):
+        monkeypatch.chdir(workspace)
+        local = FlowController(cache=FlowCache()).compile_file(workspace / "agent.flow")
+
+        # Only the client's stream: the in-process daemon logs to sys.stdout
+        client_out = StringIO()
+        with patch('flow_core.flow_daemon.output_stream', return_value=client_out):
+            exit_code = forward_command("compile", compile_args("agent.flow"),
+                                        socket_path=daemon.socket_path)
+
+        assert exit_code == 0
+        assert client_out.getvalue() == local + "\n"
+        assert daemon.requests == 1
+
+    def test_handler_uses_daemon_from_env(self, daemon, workspace, monkeypatch):
+        monkeypatch.setenv("FLOW_DAEMON_SOCKET", str(daemon.socket_path))
+        monkeypatch.chdir(workspace)
+
+        exit_code, output = run_captured(stats_command, argparse.Namespace(file="agent.flow", format="json"))
+
+        assert exit_code == 0
+        assert json.loads(output)["metrics"]["import_count"] == 1
+        assert daemon.requests == 1
+
+    def test_output_written_in_client_directory(self, daemon, workspace, monkeypatch):
+        monkeypatch.chdir(workspace)
+        args = argparse.Namespace(file="agent.flow", output="agent.md", cache_dir=None)
+
+        with patch('sys.stdout', new_callable=StringIO):
+            exit_code = forward_command("compile", args, socket_path=daemon.socket_path)
+
+        assert exit_code == 0
+        assert "Hello" in (workspace / "agent.md").read_text(encoding="utf-8")
+
+    def test_no_daemon_falls_back(self, tmp_path):
+        assert forward_command("compile", compile_args("x.flow"), socket_path=tmp_path / "none.sock") is None
+
+    def test_stale_socket_falls_back(self, tmp_path):
+        stale = tmp_path / "stale.sock"
+        stale.write_text("")
+
+        assert forward_command("compile", compile_args("x.flow"), socket_path=stale) is None
+
+    def test_silent_daemon_falls_back(self, tmp_path_factory, monkeypatch):
+        monkeypatch.setattr("flow_core.flow_daemon.HEARTBEAT_TIMEOUT", 0.2)
+        socket_path = tmp_path_factory.mktemp("sock") / "stuck.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stuck:
+            stuck.bind(str(socket_path))
+            stuck.listen(1)  # Connections queue up but are never answered
+            start = time.monotonic()
+
+            result = forward_command("compile", compile_args("x.flow"), socket_path=socket_path)
+
+        assert result is None
+        assert time.monotonic() - start < 5
+
+    def test_heartbeats_keep_slow_command_forwarded(self, workspace, tmp_path_factory, monkeypatch):
+        monkeypatch.setattr("flow_core.flow_daemon.HEARTBEAT_INTERVAL", 0.05)
+        monkeypatch.setattr("flow_core.flow_daemon.HEARTBEAT_TIMEOUT", 0.2)
+
+        def slow(args):
+            time.sleep(0.6)
+            return 3
+
+        slow_daemon = FlowDaemon({"compile": slow}, root=workspace, poll_interval=3600, cache=FlowCache(),
+                                 socket_path=tmp_path_factory.mktemp("sock") / "flow.sock")
+        slow_daemon.start()
+        try:
+            result = forward_command("compile", compile_args("x.flow"), socket_path=slow_daemon.socket_path)
+        finally:
+            slow_daemon.shutdown()
+
+        assert result == 3
+
+    def test_opt_out_env(self, daemon, monkeypatch):
+        monkeypatch.setenv("FLOW_NO_DAEMON", "1")
+
+        assert forward_command("compile", compile_args("x.flow"), socket_path=daemon.socket_path) is None
+
+
+# =============================================================================
+# Watching and lifecycle
+# =============================================================================
+
+
+class TestWatcher:
+    """A watcher pass re-warms the cache after file changes."""
+
+    def test_changed_library_recompiles_entries(self, daemon, workspace):
+        with patch('sys.stdout', new_callable=StringIO):
+            daemon.run_command("compile", {"file": "agent.flow", "output": None, "cache_dir": None},
+                               workspace)
+        (workspace / "_lib" / "common.flow").write_text("@greeting |<<<Hi there>>>|.\n",
+                                                        encoding="utf-8")
+        misses = daemon.cache.stats.compile_misses
+
+        changed = daemon.poll_changes()
+
+        assert changed == [(workspace / "_lib" / "common.flow").resolve()]
+        assert daemon.cache.stats.compile_misses == misses + 1
+        result = daemon.run_command("compile", {"file": "agent.flow", "output": None,
+                                                "cache_dir": None}, workspace)
+        assert "Hi there" in result["stdout"]
+
+    def test_unchanged_pass_does_nothing(self, daemon):
+        assert daemon.poll_changes() == []
+
+
+class TestLifecycle:
+    """Start-up and shutdown manage the socket."""
+
+    def test_second_daemon_refused(self, daemon, workspace):
+        other = FlowDaemon(DAEMON_COMMANDS, socket_path=daemon.socket_path, root=workspace)
+
+        with pytest.raises(RuntimeError):
+            other.start()
+
+    def test_status_over_socket(self, daemon):
+        result = request("status", socket_path=daemon.socket_path)["result"]
+
+        assert result["watched_files"] == 2
+
+    def test_shutdown_removes_socket(self, daemon):
+        daemon.shutdown()
+
+        assert not daemon.socket_path.exists()
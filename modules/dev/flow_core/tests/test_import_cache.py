@@ -0,0 +1,154 @@
+"""
+Tests for the workspace-level ImportCache
+
+Covers:
+- One parse per imported file while its mtime/size are unchanged
+- Re-parse after the file changes on disk or is invalidated
+- Open-buffer text overrides the file and is re-parsed only after edits
+- Resolver integration: shared imports across entry files
+"""
+
+import pytest
+
+from flow_core.import_cache import ImportCache
+from flow_core.parser import parse_stream
+from flow_core.resolver import Resolver
+from flow_core.tests.helpers import touch
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def lib_file(tmp_path):
+    path = tmp_path / "_lib" / "common.flow"
+    path.parent.mkdir()
+    path.write_text("@shared |<<<Shared>>>|.\n", encoding="utf-8")
+    return path
+
+
+class CountingParse:
+    """parse_fn that counts how often it is called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, source):
+        self.calls += 1
+        return parse_stream(source)
+
+
+# =============================================================================
+# Files on disk
+# =============================================================================
+
+
+class TestDiskFiles:
+    """Parses are reused while the file's stamp is unchanged."""
+
+    def test_second_load_is_a_hit(self, lib_file):
+        cache, parse = ImportCache(), CountingParse()
+
+        first = cache.load_flow_file(lib_file, parse)
+        second = cache.load_flow_file(lib_file, parse)
+
+        assert second is first
+        assert parse.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_file_is_reparsed(self, lib_file):
+        cache, parse = ImportCache(), CountingParse()
+        cache.load_flow_file(lib_file, parse)
+
+        touch(lib_file, "@shared |<<<Changed>>>|.\n")
+        flow_file = cache.load_flow_file(lib_file, parse)
+
+        assert flow_file.nodes["shared"].content == ["Changed"]
+        assert parse.calls == 2
+
+    def test_invalidate_forces_reparse(self, lib_file):
+        cache, parse = ImportCache(), CountingParse()
+        cache.load_flow_file(lib_file, parse)
+
+        cache.invalidate(lib_file)
+        cache.load_flow_file(lib_file, parse)
+
+        assert parse.calls == 2
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            ImportCache().load_flow_file(tmp_path / "missing.flow", CountingParse())
+
+
+# =============================================================================
+# Open buffers
+# =============================================================================
+
+
+class TestBuffers:
+    """Open documents are read from their buffer text."""
+
+    def test_buffer_overrides_disk(self, lib_file):
+        cache, parse = ImportCache(), CountingParse()
+        cache.set_buffer(lib_file, "@shared |<<<Unsaved>>>|.\n")
+
+        flow_file = cache.load_flow_file(lib_file, parse)
+        again = cache.load_flow_file(lib_file, parse)
+
+        assert flow_file.nodes["shared"].content == ["Unsaved"]
+        assert again is flow_file
+        assert parse.calls == 1
+
+    def test_buffer_edit_invalidates(self, lib_file):
+        cache, parse = ImportCache(), CountingParse()
+        cache.set_buffer(lib_file, "@shared |<<<One>>>|.\n")
+        cache.load_flow_file(lib_file, parse)
+
+        cache.set_buffer(lib_file, "@shared |<<<Two>>>|.\n")
+        flow_file = cache.load_flow_file(lib_file, parse)
+
+        assert flow_file.nodes["shared"].content == ["Two"]
+        assert parse.calls == 2
+
+    def test_same_buffer_text_keeps_parse(self, lib_file):
+        cache, parse = ImportCache(), CountingParse()
+        cache.set_buffer(lib_file, "@shared |<<<One>>>|.\n")
+        cache.load_flow_file(lib_file, parse)
+
+        cache.set_buffer(lib_file, "@shared |<<<One>>>|.\n")
+        cache.load_flow_file(lib_file, parse)
+
+        assert parse.calls == 1
+
+    def test_clear_buffer_reads_disk_again(self, lib_file):
+        cache, parse = ImportCache(), CountingParse()
+        cache.set_buffer(lib_file, "@shared |<<<Unsaved>>>|.\n")
+        cache.load_flow_file(lib_file, parse)
+
+        cache.clear_buffer(lib_file)
+        flow_file = cache.load_flow_file(lib_file, parse)
+
+        assert flow_file.nodes["shared"].content == ["Shared"]
+
+
+# =============================================================================
+# Resolver integration
+# =============================================================================
+
+
+class TestResolverIntegration:
+    """Entry files importing the same library parse it once."""
+
+    def test_shared_library_parsed_once(self, tmp_path, lib_file):
+        cache = ImportCache()
+        resolver = Resolver(cache=cache)
+        for name in ("a", "b", "c"):
+            entry = parse_stream("+./_lib/common.flow |.\n@out |$shared|.\n")
+            errors = resolver.validate_with_errors(
+                entry, base_path=tmp_path, source_path=str(tmp_path / f"{name}.flow")
+            )
+            assert errors == []
+
+        assert (cache.hits, cache.misses) == (2, 1)
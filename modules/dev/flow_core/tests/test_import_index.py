@@ -0,0 +1,53 @@
+"""
+Tests for the LSP reverse import index
+
+Covers:
+- Dependents of a file across documents
+- Updating a document's imports drops stale entries
+- Removing a document
+"""
+
+from pathlib import Path
+
+from flow_core.import_index import ImportIndex
+
+
+LIB = Path("/ws/_lib/common.flow")
+BASE = Path("/ws/_lib/base.flow")
+
+
+class TestImportIndex:
+    """ImportIndex maps imported files back to documents."""
+
+    def test_dependents_across_documents(self):
+        index = ImportIndex()
+        index.update("file:///ws/a.flow", [LIB, BASE])
+        index.update("file:///ws/b.flow", [LIB])
+
+        assert index.dependents(LIB) == {"file:///ws/a.flow", "file:///ws/b.flow"}
+        assert index.dependents(BASE) == {"file:///ws/a.flow"}
+        assert index.dependents(Path("/ws/other.flow")) == set()
+
+    def test_update_replaces_imports(self):
+        index = ImportIndex()
+        index.update("file:///ws/a.flow", [LIB, BASE])
+        index.update("file:///ws/a.flow", [BASE])
+
+        assert index.dependents(LIB) == set()
+        assert index.imports("file:///ws/a.flow") == frozenset({BASE})
+
+    def test_remove_document(self):
+        index = ImportIndex()
+        index.update("file:///ws/a.flow", [LIB])
+        index.remove("file:///ws/a.flow")
+        index.remove("file:///ws/never-opened.flow")
+
+        assert index.dependents(LIB) == set()
+        assert index.imports("file:///ws/a.flow") == frozenset()
+
+    def test_dependents_is_a_copy(self):
+        index = ImportIndex()
+        index.update("file:///ws/a.flow", [LIB])
+        index.dependents(LIB).clear()
+
+        assert index.dependents(LIB) == {"file:///ws/a.flow"}
@@ -0,0 +1,212 @@
+"""
+Tests for incremental re-parsing of edited documents
+
+Covers:
+- Incremental results equal a full parse after edits anywhere in the file
+- Statements above the edit are reused (same FlowNode objects)
+- Restart only at line boundaries (two statements on one line)
+- Anonymous node ids and duplicate / tokenizer error order match a full parse
+- Recovery after a syntax error
+- Tokenizer start offset / line numbering
+"""
+
+import pytest
+
+from flow_core.incremental import IncrementalParser
+from flow_core.parser import parse_stream
+from flow_core.tokenizer import Tokenizer
+from flow_core.errors import DuplicateNodeError, ParserError, TokenizerError
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+SOURCE = """\
+# Header comment
++./_lib/common.flow |.
+
+@intro |<<<Intro>>>|.
+
+@main
+|style.title=<<Main>>
+|<<<Body>>>|$intro
+|@slot |<<<default>>>|.
+|.
+
+$main.slot = $intro
+
+@out |$main|.
+"""
+
+
+def edit_line(source: str, line: int, text: str) -> str:
+    """Replace 1-based ``line`` of ``source`` with ``text``."""
+    lines = source.split("\n")
+    lines[line - 1] = text
+    return "\n".join(lines)
+
+
+def outcome(parse, *args, **kwargs):
+    """Parse result, or (error type, message) if parsing raises."""
+    try:
+        return parse(*args, **kwargs)
+    except Exception as exc:
+        return type(exc), str(exc)
+
+
+@pytest.fixture
+def incremental() -> IncrementalParser:
+    parser = IncrementalParser()
+    parser.parse(SOURCE)
+    return parser
+
+
+# =============================================================================
+# Equivalence with a full parse
+# =============================================================================
+
+
+class TestEquivalence:
+    """Incremental output is identical to parsing the new text from scratch."""
+
+    @pytest.mark.parametrize("line", range(1, 16))
+    def test_edit_any_line(self, incremental, line):
+        # A comment line: valid between statements, a syntax error inside a node
+        new_source = edit_line(SOURCE, line, SOURCE.split("\n")[line - 1] + "\n# added")
+
+        assert outcome(incremental.parse, new_source, changed_line=line) == outcome(
+            parse_stream, new_source
+        )
+
+    def test_insert_node_in_middle(self, incremental):
+        new_source = SOURCE.replace("@main\n", "@extra |<<<Extra>>>|.\n\n@main\n")
+        flow_file = incremental.parse(new_source, changed_line=6)
+
+        assert flow_file == parse_stream(new_source)
+        assert flow_file.nodes["main"].position.line == 8
+
+    def test_no_edit_reuses_everything(self, incremental):
+        flow_file = incremental.parse(SOURCE, changed_line=10_000)
+
+        assert flow_file == parse_stream(SOURCE)
+        assert incremental.parsed_statements == 0
+
+    def test_wrong_hint_falls_back_to_full_parse(self, incremental):
+        """A changed line below the real edit is caught by the prefix check."""
+        new_source = SOURCE.replace("Intro", "Changed")
+        flow_file = incremental.parse(new_source, changed_line=14)
+
+        assert incremental.reused_statements == 0
+        assert flow_file.nodes["intro"].content == ["Changed"]
+
+
+# =============================================================================
+# Reuse
+# =============================================================================
+
+
+class TestReuse:
+    """Statements above the first edited line are kept."""
+
+    def test_prefix_nodes_are_same_objects(self, incremental):
+        before = incremental.parse(SOURCE)
+        new_source = edit_line(SOURCE, 14, "@out |$main|$intro|.")
+        after = incremental.parse(new_source, changed_line=14)
+
+        assert after.nodes["intro"] is before.nodes["intro"]
+        assert after.nodes["main"] is before.nodes["main"]
+        assert after.nodes["out"] is not before.nodes["out"]
+        # comment, import, intro, main, assignment reused; out re-parsed
+        assert incremental.reused_statements == 5
+        assert incremental.parsed_statements == 1
+
+    def test_statements_sharing_a_line_are_reparsed_together(self):
+        source = "@a |<<<A>>>|. @b\n|<<<B>>>|.\n@c |<<<C>>>|.\n"
+        incremental = IncrementalParser()
+        incremental.parse(source)
+        new_source = source.replace("<<<B>>>", "<<<D>>>")
+
+        flow_file = incremental.parse(new_source, changed_line=2)
+
+        # @a ends on the line @b starts on, so line 2 is no restart point
+        assert incremental.reused_statements == 0
+        assert flow_file == parse_stream(new_source)
+
+    def test_anonymous_ids_continue_from_prefix(self):
+        source = "@_ |<<<one>>>|.\n@_ |<<<two>>>|.\n@out |<<<x>>>|.\n"
+        incremental = IncrementalParser()
+        incremental.parse(source)
+        new_source = source + "@_ |<<<three>>>|.\n"
+
+        flow_file = incremental.parse(new_source, changed_line=4)
+
+        assert incremental.reused_statements == 3
+        assert flow_file == parse_stream(new_source)
+
+
+# =============================================================================
+# Errors
+# =============================================================================
+
+
+class TestErrors:
+    """Errors match a full parse and do not poison later parses."""
+
+    def test_syntax_error_then_fix(self, incremental):
+        broken = edit_line(SOURCE, 14, "@out |$main")
+        with pytest.raises(ParserError):
+            incremental.parse(broken, changed_line=14)
+
+        fixed = edit_line(SOURCE, 14, "@out |$main|$intro|.")
+        flow_file = incremental.parse(fixed, changed_line=14)
+
+        assert incremental.reused_statements == 5
+        assert flow_file == parse_stream(fixed)
+
+    def test_duplicate_reported_before_later_syntax_error(self, incremental):
+        new_source = SOURCE.replace("@out |$main|.", "@intro |<<<again>>>|.\n@out |$main")
+
+        with pytest.raises(DuplicateNodeError):
+            incremental.parse(new_source, changed_line=14)
+        with pytest.raises(DuplicateNodeError):
+            parse_stream(new_source)
+
+    def test_tokenizer_error_in_tail_before_duplicate_in_prefix(self):
+        incremental = IncrementalParser()
+        source = "@a |<<<1>>>|.\n@a |<<<2>>>|.\n\n@b |$a|.\n"
+        with pytest.raises(DuplicateNodeError):
+            incremental.parse(source)
+        new_source = edit_line(source, 4, "<<<unclosed")
+
+        result = outcome(incremental.parse, new_source, changed_line=4)
+
+        assert incremental.reused_statements == 2
+        assert issubclass(result[0], TokenizerError)
+        assert result == outcome(parse_stream, new_source)
+
+
+# =============================================================================
+# Tokenizer offsets
+# =============================================================================
+
+
+class TestTokenizerStart:
+    """Tokenizing from a line start numbers lines from the given line."""
+
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_tail_tokens_match_full_tokenize(self, fast):
+        tokenizer = Tokenizer(fast=fast)
+        offset = SOURCE.index("@main")
+        full = [t for t in tokenizer.tokenize(SOURCE) if t.line >= 6]
+
+        assert tokenizer.tokenize(SOURCE, offset, 6) == full
+
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_error_position_in_tail(self, fast):
+        source = "@a |<<<A>>>|.\n@b |<<<unclosed\n"
+        with pytest.raises(TokenizerError) as excinfo:
+            Tokenizer(fast=fast).tokenize(source, source.index("@b"), 2)
+
+        assert (excinfo.value.line, excinfo.value.column) == (2, 5)
@@ -10,8 +10,15 @@ Comprehensive tests covering:
 - Go-to-definition
 - Hover information
 - Document symbols
+- Incremental sync and debounced validation
+- Shared import cache and reverse-dependency revalidation
+- Workspace references and symbol search
 """
 
+import asyncio
+from pathlib import Path
+from urllib.parse import unquote
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -20,7 +27,12 @@ from pygls.workspace import TextDocument
 
 from flow_core.flow_lsp import (
     FlowLanguageServer,
+    did_change,
+    did_change_watched_files,
     goto_definition,
+    references,
+    workspace_symbols,
+    _publish_diagnostics,
     _flow_error_to_diagnostic,
     _get_node_ref_at_position,
     _get_node_content_preview,
@@ -661,6 +673,346 @@ class TestDocumentOperations:
         assert "new_node" in cached_file.nodes
 
 
+# =============================================================================
+# Incremental Sync Tests
+# =============================================================================
+
+
+def _change(start_line: int, text: str = "x") -> lsp.TextDocumentContentChangePartial:
+    """A one-character replacement at the start of 0-based ``start_line``."""
+    return lsp.TextDocumentContentChangePartial(
+        range=lsp.Range(
+            start=lsp.Position(line=start_line, character=0),
+            end=lsp.Position(line=start_line, character=1),
+        ),
+        text=text,
+    )
+
+
+class TestIncrementalSync:
+    """Tests for incremental re-parsing and debounced validation."""
+    
+    def test_server_requests_incremental_sync(self, lsp_server):
+        """Server advertises incremental text document sync."""
+        assert lsp_server._text_document_sync_kind == lsp.TextDocumentSyncKind.Incremental
+    
+    def test_record_changes_keeps_first_line(self, lsp_server):
+        """The earliest change across events is remembered (1-based)."""
+        uri = "file:///test/doc.flow"
+        lsp_server.record_changes(uri, [_change(9), _change(4)])
+        lsp_server.record_changes(uri, [_change(7)])
+        
+        assert lsp_server._changed_lines[uri] == 5
+    
+    def test_record_full_change_marks_line_one(self, lsp_server):
+        """A whole-document change re-parses from the top."""
+        uri = "file:///test/doc.flow"
+        lsp_server.record_changes(uri, [lsp.TextDocumentContentChangeWholeDocument(text="")])
+        
+        assert lsp_server._changed_lines[uri] == 1
+    
+    def test_parse_source_reuses_nodes_above_edit(self, lsp_server, mock_document):
+        """Nodes above the first edited line are reused across parses."""
+        uri = mock_document.uri
+        before = lsp_server.parse_source(uri, mock_document.source)
+        
+        new_source = mock_document.source.replace("Footer text", "New footer")
+        lsp_server.record_changes(uri, [_change(4)])
+        after = lsp_server.parse_source(uri, new_source)
+        
+        assert after.nodes["header"] is before.nodes["header"]
+        assert after.nodes["main"] is before.nodes["main"]
+        assert after.nodes["footer"].content[0] == "New footer"
+        assert uri not in lsp_server._changed_lines
+    
+    def test_forget_document_drops_state(self, lsp_server, mock_document):
+        """Closing a document drops its incremental parser."""
+        lsp_server.parse_document(mock_document)
+        lsp_server.forget_document(mock_document.uri)
+        
+        assert mock_document.uri not in lsp_server._incremental
+        assert lsp_server.get_cached_file(mock_document.uri) is None
+    
+    def test_did_change_debounces_superseded_edits(self):
+        """Only the last of a burst of changes is validated."""
+        ls = MagicMock()
+        ls.debounce_delay = 0
+        document = MagicMock(spec=TextDocument)
+        document.version = 3
+        ls.workspace.get_text_document.return_value = document
+        
+        def params(version):
+            return lsp.DidChangeTextDocumentParams(
+                text_document=lsp.VersionedTextDocumentIdentifier(
+                    uri="file:///test/doc.flow", version=version
+                ),
+                content_changes=[_change(0)],
+            )
+        
+        with patch("flow_core.flow_lsp._publish_diagnostics") as publish:
+            asyncio.run(did_change(ls, params(2)))
+            publish.assert_not_called()
+            
+            asyncio.run(did_change(ls, params(3)))
+            publish.assert_called_once_with(ls, document)
+        assert ls.record_changes.call_count == 2
+
+
+def _watched(path, change_type) -> lsp.DidChangeWatchedFilesParams:
+    return lsp.DidChangeWatchedFilesParams(
+        changes=[lsp.FileEvent(uri=path.as_uri(), type=change_type)]
+    )
+
+
+def _open_document(path, source: str) -> MagicMock:
+    doc = MagicMock(spec=TextDocument)
+    doc.uri = path.as_uri()
+    doc.source = source
+    doc.version = 1
+    return doc
+
+
+class TestWorkspaceImportCache:
+    """Tests for the import cache shared by all open documents."""
+    
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        lib = tmp_path / "_lib" / "common.flow"
+        lib.parent.mkdir()
+        lib.write_text("@shared |<<<Shared>>>|.\n", encoding="utf-8")
+        return tmp_path, lib
+    
+    def _diagnostics(self, ls, document):
+        with patch.object(ls, "text_document_publish_diagnostics") as publish:
+            _publish_diagnostics(ls, document)
+        return publish.call_args[0][0].diagnostics
+    
+    def test_open_documents_share_parsed_imports(self, lsp_server, workspace):
+        """Validating several importers parses the shared library once."""
+        root, _ = workspace
+        for name in ("a", "b", "c"):
+            doc = _open_document(root / f"{name}.flow", "+./_lib/common.flow |.\n@out |$shared|.\n")
+            assert self._diagnostics(lsp_server, doc) == []
+        
+        assert lsp_server.import_cache.misses == 1
+        assert lsp_server.import_cache.hits == 2
+    
+    def test_open_library_buffer_is_used(self, lsp_server, workspace):
+        """Unsaved edits to an open library are seen by its importers."""
+        root, lib = workspace
+        lsp_server.track_buffer(_open_document(lib, "@renamed |<<<Shared>>>|.\n"))
+        doc = _open_document(root / "a.flow", "+./_lib/common.flow |.\n@out |$shared|.\n")
+        
+        diagnostics = self._diagnostics(lsp_server, doc)
+        
+        assert len(diagnostics) == 1
+        assert "shared" in diagnostics[0].message
+        
+        lsp_server.forget_document(lib.as_uri())
+        assert self._diagnostics(lsp_server, doc) == []
+    
+    def test_watched_file_change_invalidates(self, lsp_server, workspace):
+        """A didChangeWatchedFiles event drops the library's cached parse."""
+        root, lib = workspace
+        doc = _open_document(root / "a.flow", "+./_lib/common.flow |.\n@out |$shared|.\n")
+        self._diagnostics(lsp_server, doc)
+        
+        lsp_server.import_index.remove(doc.uri)  # no background revalidation
+        with patch.object(FlowLanguageServer, "workspace") as workspace_mock:
+            workspace_mock.get_text_document.return_value = None
+            did_change_watched_files(lsp_server, _watched(lib, lsp.FileChangeType.Changed))
+        self._diagnostics(lsp_server, doc)
+        
+        assert lsp_server.import_cache.misses == 2
+
+
+class TestReverseDependencies:
+    """Tests for revalidating open documents that import a changed file."""
+    
+    @pytest.fixture
+    def workspace(self, tmp_path, lsp_server):
+        """Open a.flow -> _lib/mid.flow -> _lib/base.flow, plus unrelated b.flow."""
+        lib = tmp_path / "_lib"
+        lib.mkdir()
+        (lib / "base.flow").write_text("@base |<<<Base>>>|.\n", encoding="utf-8")
+        (lib / "mid.flow").write_text("+./base.flow |.\n@mid |$base|.\n", encoding="utf-8")
+        documents = {
+            doc.uri: doc
+            for doc in (
+                _open_document(tmp_path / "a.flow", "+./_lib/mid.flow |.\n@out |$mid|.\n"),
+                _open_document(tmp_path / "b.flow", "@out |<<<B>>>|.\n"),
+            )
+        }
+        with patch.object(FlowLanguageServer, "workspace") as workspace_mock, \
+                patch.object(lsp_server, "text_document_publish_diagnostics") as publish:
+            workspace_mock.get_text_document.side_effect = documents.get
+            for doc in documents.values():
+                _publish_diagnostics(lsp_server, doc)
+            publish.reset_mock()
+            yield tmp_path, documents, publish
+    
+    @staticmethod
+    async def _settle(ls, handler, *args):
+        handler(ls, *args)
+        await asyncio.gather(*ls._revalidations.values(), return_exceptions=True)
+    
+    def test_index_records_transitive_imports(self, lsp_server, workspace):
+        """Both the direct and the transitive import map back to a.flow."""
+        root, _, _ = workspace
+        a_uri = (root / "a.flow").as_uri()
+        
+        assert lsp_server.import_index.dependents(root / "_lib" / "mid.flow") == {a_uri}
+        assert lsp_server.import_index.dependents(root / "_lib" / "base.flow") == {a_uri}
+    
+    def test_changed_library_revalidates_only_dependents(self, lsp_server, workspace):
+        """Renaming a node in a transitive import reports it in a.flow only."""
+        root, _, publish = workspace
+        base = root / "_lib" / "base.flow"
+        base.write_text("@renamed |<<<Base>>>|.\n", encoding="utf-8")
+        
+        asyncio.run(self._settle(
+            lsp_server, did_change_watched_files, _watched(base, lsp.FileChangeType.Changed)
+        ))
+        
+        published = {call.args[0].uri: call.args[0].diagnostics for call in publish.call_args_list}
+        assert list(published) == [(root / "a.flow").as_uri()]
+        assert any("base" in d.message for d in published[(root / "a.flow").as_uri()])
+    
+    def test_created_missing_import_revalidates(self, lsp_server, workspace, tmp_path):
+        """Documents waiting on a missing import are revalidated when it appears."""
+        root, documents, publish = workspace
+        doc = _open_document(root / "c.flow", "+./_lib/new.flow |.\n@out |$new|.\n")
+        documents[doc.uri] = doc
+        _publish_diagnostics(lsp_server, doc)
+        publish.reset_mock()
+        
+        new = root / "_lib" / "new.flow"
+        new.write_text("@new |<<<New>>>|.\n", encoding="utf-8")
+        asyncio.run(self._settle(
+            lsp_server, did_change_watched_files, _watched(new, lsp.FileChangeType.Created)
+        ))
+        
+        publish.assert_called_once()
+        assert publish.call_args.args[0].diagnostics == []
+    
+    def test_superseded_revalidation_is_cancelled(self, lsp_server, workspace):
+        """Scheduling a document again cancels its pending run."""
+        root, _, publish = workspace
+        a_uri = (root / "a.flow").as_uri()
+        
+        async def run():
+            lsp_server.schedule_revalidation([a_uri])
+            first = lsp_server._revalidations[a_uri]
+            lsp_server.schedule_revalidation([a_uri])
+            await asyncio.gather(*lsp_server._revalidations.values(), first, return_exceptions=True)
+            return first
+        
+        first = asyncio.run(run())
+        
+        assert first.cancelled()
+        publish.assert_called_once()
+        assert lsp_server._revalidations == {}
+    
+    def test_stale_result_not_published(self, lsp_server, workspace):
+        """A document edited while validating in the background is not published."""
+        root, documents, publish = workspace
+        a_doc = documents[(root / "a.flow").as_uri()]
+        
+        def bump_version(*args):
+            a_doc.version += 1
+            return []
+        
+        with patch("flow_core.flow_lsp._collect_diagnostics", side_effect=bump_version):
+            asyncio.run(self._settle(lsp_server, lambda ls: ls.schedule_revalidation([a_doc.uri])))
+        
+        publish.assert_not_called()
+    
+    def test_forget_document_removes_from_index(self, lsp_server, workspace):
+        """Closed documents are no longer revalidated."""
+        root, _, _ = workspace
+        lsp_server.forget_document((root / "a.flow").as_uri())
+        
+        assert lsp_server.import_index.dependents(root / "_lib" / "mid.flow") == set()
+
+
+class TestWorkspaceSymbols:
+    """Tests for workspace-wide references and symbol search."""
+    
+    @pytest.fixture
+    def workspace(self, tmp_path, lsp_server):
+        lib = tmp_path / "_lib"
+        lib.mkdir()
+        (lib / "common.flow").write_text("@greeting |<<<Hello>>>|.\n", encoding="utf-8")
+        (tmp_path / "a.flow").write_text(
+            "+./_lib/common.flow |.\n@out |$greeting|.\n", encoding="utf-8"
+        )
+        (tmp_path / "b.flow").write_text(
+            "+./_lib/common.flow |.\n@intro |$greeting|.\n@out |$intro|.\n", encoding="utf-8"
+        )
+        with patch.object(FlowLanguageServer, "workspace") as workspace_mock:
+            workspace_mock.root_path = str(tmp_path)
+            yield tmp_path, workspace_mock
+    
+    def test_references_across_files(self, lsp_server, workspace):
+        """References to a library node are found in every importing file."""
+        root, workspace_mock = workspace
+        doc = _open_document(root / "_lib" / "common.flow", "@greeting |<<<Hello>>>|.\n")
+        workspace_mock.get_text_document.return_value = doc
+        
+        result = references(lsp_server, lsp.ReferenceParams(
+            text_document=lsp.TextDocumentIdentifier(uri=doc.uri),
+            position=lsp.Position(line=0, character=3),
+            context=lsp.ReferenceContext(include_declaration=True),
+        ))
+        
+        assert [(Path(unquote(loc.uri[7:])).name, loc.range.start.line, loc.range.start.character)
+                for loc in result] == [("common.flow", 0, 0), ("a.flow", 1, 6), ("b.flow", 1, 8)]
+        assert result[1].range.end.character == 6 + len("$greeting")
+    
+    def test_references_use_open_buffer(self, lsp_server, workspace):
+        """An unsaved reference in an open document is found."""
+        root, workspace_mock = workspace
+        doc = _open_document(root / "a.flow", "+./_lib/common.flow |.\n@out |<<<none>>>|.\n")
+        lsp_server.parse_document(doc)
+        with patch.object(lsp_server, "text_document_publish_diagnostics"):
+            _publish_diagnostics(lsp_server, doc)
+        workspace_mock.get_text_document.return_value = doc
+        
+        lsp_server.ensure_symbol_index()
+        files = {loc.file_path.name for loc in lsp_server.symbol_index.references("greeting")}
+        
+        assert files == {"b.flow"}
+    
+    def test_workspace_symbol_search(self, lsp_server, workspace):
+        """workspace/symbol matches definitions in every file."""
+        result = workspace_symbols(lsp_server, lsp.WorkspaceSymbolParams(query="gree"))
+        
+        assert [(symbol.name, symbol.container_name) for symbol in result] == [
+            ("@greeting", "common.flow"),
+        ]
+        assert result[0].kind == lsp.SymbolKind.Function
+    
+    def test_index_built_once(self, lsp_server, workspace):
+        """Later queries do not rescan the workspace."""
+        lsp_server.ensure_symbol_index()
+        with patch.object(lsp_server.symbol_index, "refresh") as refresh:
+            workspace_symbols(lsp_server, lsp.WorkspaceSymbolParams(query="out"))
+        
+        refresh.assert_not_called()
+    
+    def test_watched_change_updates_index(self, lsp_server, workspace):
+        """A changed file on disk is re-indexed from the watcher event."""
+        root, workspace_mock = workspace
+        workspace_mock.get_text_document.return_value = None
+        lsp_server.ensure_symbol_index()
+        
+        (root / "c.flow").write_text("@greeting_two |$greeting|.\n", encoding="utf-8")
+        did_change_watched_files(lsp_server, _watched(root / "c.flow", lsp.FileChangeType.Created))
+        
+        assert len(lsp_server.symbol_index.references("greeting")) == 3
+        assert lsp_server.symbol_index.definitions("greeting_two")
+
+
 # =============================================================================
 # Error Handling Tests
 # =============================================================================
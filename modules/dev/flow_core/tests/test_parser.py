@@ -9,6 +9,7 @@ Comprehensive tests covering:
 - Import statements (with selectors, renames)
 - Assignments
 - Error cases
+- Compact (dict-free) model instances
 """
 
 import pytest
@@ -27,6 +28,8 @@ from flow_core.models import (
     FlowParams,
     FlowStyle,
     FlowLLMStrategy,
+    Position,
+    StringContent,
 )
 from flow_core.errors import (
     ParserError,
@@ -780,6 +783,58 @@ $container.section.header = $greeting
         assert node.content[2] == "Also Trimmed"
 
 
+# =============================================================================
+# Compact Model Tests
+# =============================================================================
+
+
+class TestCompactModels:
+    """Tests that hot model types carry no per-instance __dict__."""
+    
+    def test_slotted_dataclasses_have_no_dict(self):
+        """Token, Position, refs and nodes are slotted dataclasses."""
+        instances = [
+            Token(TokenType.IDENTIFIER, "name", 1, 1),
+            Position(1, 1),
+            NodeRef("name"),
+            FileRef("./doc.md"),
+            FlowNode("name"),
+        ]
+        for obj in instances:
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+    
+    def test_parsed_string_content_has_no_dict(self):
+        """Parsed strings keep their join metadata without a __dict__."""
+        ast = tokenize_and_parse('@node |<<<Trim >>|<< Preserve>>>|.')
+        
+        first, second = ast.nodes["node"].content
+        assert isinstance(first, StringContent)
+        assert not hasattr(first, "__dict__")
+        assert (first.opener_trim, first.closer_trim) == (True, False)
+        assert (second.opener_trim, second.closer_trim) == (False, True)
+    
+    def test_string_content_copy_and_pickle(self):
+        """StringContent survives copy and pickling with its metadata."""
+        import copy
+        import pickle
+        
+        original = StringContent("text", opener_trim=False, closer_trim=True)
+        for clone in (copy.deepcopy(original), pickle.loads(pickle.dumps(original))):
+            assert clone == "text"
+            assert isinstance(clone, StringContent)
+            assert (clone.opener_trim, clone.closer_trim) == (False, True)
+    
+    def test_pickle_parsed_flow_file(self):
+        """Slotted ASTs can be pickled (e.g. to hand to worker processes)."""
+        import pickle
+        
+        ast = tokenize_and_parse('@greeting |<<<Hi>>>|.\n@out |$greeting|++./a.md|.')
+        clone = pickle.loads(pickle.dumps(ast))
+        
+        assert clone.nodes["out"].content[0].id == "greeting"
+        assert clone.nodes["out"].content[1].path == "./a.md"
+
+
 # =============================================================================
 # Run Tests
 # =============================================================================
@@ -7,7 +7,7 @@ Comprehensive tests covering:
 - Slot reference validation ($node.slot)
 - Circular dependency detection
 - Import file loading and merging
-- Assignment application (deep copy semantics)
+- Assignment application (copy-on-write semantics)
 - Topological ordering
 - Error cases
 """
@@ -290,6 +290,44 @@ class TestCircularDependencies:
         assert "b" in error.chain
         assert "c" in error.chain
     
+    def test_cycle_chain_is_exact(self):
+        """The chain runs from the cycle's first node back to itself, in reference order."""
+        source = """
+@start |^a|.
+@a |^b|.
+@b |^c|.
+@c |$a|.
+"""
+        with pytest.raises(CircularDependencyError) as exc_info:
+            tokenize_parse_resolve(source)
+        
+        error = exc_info.value
+        assert error.chain == ["a", "b", "c", "a"]
+        assert (error.line, error.column) == (3, 1)
+    
+    def test_deep_chain_no_recursion_error(self):
+        """Reference chains far deeper than the recursion limit resolve in order."""
+        depth = 3000
+        lines = ["@n0 |<<<start>>>|."]
+        lines += [f"@n{i} |$n{i - 1}|." for i in range(1, depth)]
+        lines.append(f"@out |$n{depth - 1}|.")
+        
+        resolved = tokenize_parse_resolve("\n".join(lines) + "\n")
+        
+        assert resolved.dependency_order == [f"n{i}" for i in range(depth)] + ["out"]
+    
+    def test_deep_cycle_reported(self):
+        """A cycle through thousands of nodes is reported with its full chain."""
+        depth = 3000
+        lines = [f"@n{i} |^n{i + 1}|." for i in range(depth - 1)]
+        lines.append(f"@n{depth - 1} |$n0|.")
+        
+        with pytest.raises(CircularDependencyError) as exc_info:
+            tokenize_parse_resolve("\n".join(lines) + "\n")
+        
+        chain = exc_info.value.chain
+        assert chain == [f"n{i}" for i in range(depth)] + ["n0"]
+    
     def test_no_cycle_linear(self):
         """Test that linear dependencies don't trigger cycle detection."""
         source = """
@@ -316,7 +354,7 @@ class TestCircularDependencies:
 
 
 class TestAssignments:
-    """Tests for slot assignment with deep copy semantics."""
+    """Tests for slot assignment with copy-on-write semantics."""
     
     def test_simple_assignment(self):
         """Test basic slot assignment."""
@@ -334,12 +372,12 @@ $template.greeting = $hello
         
         template = resolved.nodes["template"]
         assert "greeting" in template.slots
-        # Slot should contain deep copy of hello
+        # Slot should hold hello
         slot_content = template.slots["greeting"]
         assert slot_content is not None
     
-    def test_assignment_deep_copy(self):
-        """Test that assignment creates a deep copy."""
+    def test_assignment_copy_on_write(self):
+        """Test that assignment clones the target and leaves the parsed AST alone."""
         source = """
 @template 
 |@slot|.|.
@@ -350,14 +388,43 @@ $template.slot = $content
 
 @out |$template|.
 """
-        resolved = tokenize_parse_resolve(source)
+        tokenizer = Tokenizer()
+        ast = parse(tokenizer.tokenize(source))
+        parsed_template = ast.nodes["template"]
+        parsed_slot = parsed_template.slots["slot"]
+        resolved = resolve(ast)
         
         template = resolved.nodes["template"]
-        original = resolved.nodes["content"]
-        slot_copy = template.slots["slot"]
+        # Target is a clone; the source subtree is shared, not copied
+        assert template is not parsed_template
+        assert template.slots["slot"] is resolved.nodes["content"]
+        assert template.content is parsed_template.content
+        # Parsed node keeps its original slot
+        assert parsed_template.slots["slot"] is parsed_slot
+    
+    def test_assignment_not_visible_in_earlier_copy(self):
+        """A later assignment to a node does not change earlier assigned copies."""
+        source = """
+@inner 
+|@slot|.|.
+
+@outer 
+|@slot|.|.
+
+@a |<<<A>>>|.
+
+@b |<<<B>>>|.
+
+$inner.slot = $a
+$outer.slot = $inner
+$inner.slot = $b
+
+@out |$outer|.
+"""
+        resolved = tokenize_parse_resolve(source)
         
-        # Should be different objects (deep copy)
-        assert slot_copy is not original
+        assert resolved.nodes["outer"].slots["slot"].slots["slot"].content == ["A"]
+        assert resolved.nodes["inner"].slots["slot"].content == ["B"]
     
     def test_assignment_to_undefined_slot(self):
         """Test assignment to non-existent slot."""
@@ -0,0 +1,223 @@
+"""
+Tests for the workspace symbol index
+
+Covers:
+- Definitions (nodes, slots) and references ($, ^, $id.slot, assignments)
+- Incremental refresh: only changed files are re-parsed, deleted files dropped
+- Open-buffer entries override disk until released
+- Scoping references to one definition
+- Search ranking
+- Save/load round trip; corrupted index files start empty
+"""
+
+import json
+
+import pytest
+
+from flow_core.parser import parse_stream
+from flow_core.symbol_index import SymbolIndex, SymbolKind
+from flow_core.tests.helpers import touch
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+LIB = """\
+@greeting |<<<Hello>>>|.
+
+@frame
+|@body |.
+|.
+"""
+
+AGENT = """\
++./_lib/common.flow |.
+
+@intro |$greeting|^outro|.
+@outro |<<<Bye>>>|$frame.body|.
+
+$frame.body = $intro
+
+@out |$intro|$greeting|.
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "_lib").mkdir()
+    (tmp_path / "_lib" / "common.flow").write_text(LIB, encoding="utf-8")
+    (tmp_path / "agent.flow").write_text(AGENT, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def index(workspace):
+    index = SymbolIndex(workspace)
+    index.refresh()
+    return index
+
+
+def sites(locations):
+    return [(loc.file_path.name, loc.line, loc.column, loc.kind) for loc in locations]
+
+
+# =============================================================================
+# Indexing
+# =============================================================================
+
+
+class TestIndexing:
+    """Definitions and references are recorded with their positions."""
+
+    def test_definitions(self, index):
+        assert sites(index.definitions("greeting")) == [("common.flow", 1, 1, SymbolKind.NODE)]
+        assert sites(index.definitions("frame.body")) == [("common.flow", 4, 2, SymbolKind.SLOT)]
+
+    def test_references_of_node(self, index):
+        assert sites(index.references("greeting")) == [
+            ("agent.flow", 3, 9, SymbolKind.BACKWARD_REF),
+            ("agent.flow", 8, 14, SymbolKind.BACKWARD_REF),
+        ]
+        assert [loc.container for loc in index.references("greeting")] == ["intro", "out"]
+
+    def test_references_include_slots_and_assignments(self, index):
+        assert sites(index.references("frame")) == [
+            ("agent.flow", 4, 19, SymbolKind.SLOT_REF),
+            ("agent.flow", 6, 1, SymbolKind.ASSIGNMENT),
+        ]
+        assert sites(index.references("intro")) == [
+            ("agent.flow", 6, 15, SymbolKind.ASSIGNMENT),
+            ("agent.flow", 8, 7, SymbolKind.BACKWARD_REF),
+        ]
+
+    def test_forward_reference(self, index):
+        assert sites(index.references("outro")) == [("agent.flow", 3, 19, SymbolKind.FORWARD_REF)]
+
+    def test_broken_file_is_indexed_empty(self, workspace):
+        (workspace / "broken.flow").write_text("@x |<<<unclosed\n", encoding="utf-8")
+        index = SymbolIndex(workspace)
+
+        assert index.refresh() == 3
+        assert index.file_count == 3
+
+
+# =============================================================================
+# Incremental updates
+# =============================================================================
+
+
+class TestIncremental:
+    """refresh() only parses what changed."""
+
+    def test_unchanged_workspace_parses_nothing(self, index):
+        assert index.refresh() == 0
+
+    def test_changed_file_reindexed(self, index, workspace):
+        touch(workspace / "agent.flow", AGENT.replace("|$greeting|.", "|."))
+
+        assert index.refresh() == 1
+        assert len(index.references("greeting")) == 1
+
+    def test_deleted_file_dropped(self, index, workspace):
+        (workspace / "agent.flow").unlink()
+        index.refresh()
+
+        assert index.references("greeting") == []
+        assert index.file_count == 1
+
+    def test_buffer_overrides_disk_until_released(self, index, workspace):
+        agent = workspace / "agent.flow"
+        index.update_flow_file(agent, parse_stream("@out |<<<x>>>|.\n"))
+
+        assert index.references("greeting") == []
+        assert index.refresh() == 0  # buffer-owned file is left alone
+
+        index.release_buffer(agent)
+        assert index.refresh() == 1
+        assert len(index.references("greeting")) == 2
+
+    def test_update_file_removes_missing(self, index, workspace):
+        (workspace / "agent.flow").unlink()
+        index.update_file(workspace / "agent.flow")
+
+        assert index.definitions("intro") == []
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+
+class TestQueries:
+    """Reference scoping and symbol search."""
+
+    def test_references_scoped_to_definition(self, index, workspace):
+        # other.flow defines its own @greeting; its references are its own
+        (workspace / "other.flow").write_text(
+            "@greeting |<<<Local>>>|.\n@out |$greeting|.\n", encoding="utf-8"
+        )
+        index.refresh()
+
+        lib_refs = index.references("greeting", defined_in=workspace / "_lib" / "common.flow")
+        other_refs = index.references("greeting", defined_in=workspace / "other.flow")
+
+        assert {loc.file_path.name for loc in lib_refs} == {"agent.flow"}
+        assert {loc.file_path.name for loc in other_refs} == {"other.flow"}
+        assert len(index.references("greeting")) == 3
+
+    def test_search_ranks_exact_then_prefix(self, index):
+        names = [loc.node_id for loc in index.search("out")]
+
+        assert names == ["out", "outro"]
+
+    def test_search_limit(self, index):
+        assert len(index.search("", limit=2)) == 2
+
+
+# =============================================================================
+# Persistence
+# =============================================================================
+
+
+class TestPersistence:
+    """A saved index reloads without re-parsing unchanged files."""
+
+    def test_round_trip(self, index, workspace, tmp_path_factory):
+        index_path = tmp_path_factory.mktemp("cache") / "symbols.json"
+        index.save(index_path)
+
+        loaded = SymbolIndex.load(index_path, workspace)
+
+        assert loaded.refresh() == 0
+        assert sites(loaded.references("greeting")) == sites(index.references("greeting"))
+
+    def test_other_root_starts_empty(self, index, workspace, tmp_path_factory):
+        index_path = tmp_path_factory.mktemp("cache") / "symbols.json"
+        index.save(index_path)
+
+        loaded = SymbolIndex.load(index_path, workspace / "_lib")
+
+        assert loaded.file_count == 0
+
+    def test_missing_file_starts_empty(self, workspace):
+        assert SymbolIndex.load(workspace / "nope.json", workspace).file_count == 0
+
+    @pytest.mark.parametrize("corrupt", [
+        lambda data: [data],
+        lambda data: {**data, "files": list(data["files"])},
+        lambda data: {**data, "files": {p: {k: v for k, v in raw.items() if k != "stamp"}
+                                        for p, raw in data["files"].items()}},
+        lambda data: {**data, "files": {p: {**raw, "definitions": [[1]]}
+                                        for p, raw in data["files"].items()}},
+    ], ids=["list", "files-list", "no-stamp", "short-location"])
+    def test_corrupt_file_starts_empty(self, index, workspace, tmp_path_factory, corrupt):
+        index_path = tmp_path_factory.mktemp("cache") / "symbols.json"
+        index.save(index_path)
+        index_path.write_text(json.dumps(corrupt(json.loads(index_path.read_text()))))
+
+        loaded = SymbolIndex.load(index_path, workspace)
+
+        assert loaded.file_count == 0
+        assert loaded.refresh() == 2
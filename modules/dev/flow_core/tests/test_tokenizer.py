@@ -0,0 +1,134 @@
+"""
+Tests for the Flow Tokenizer scanning modes and streaming API
+
+The fast (regex/slice) scanner must produce exactly the tokens of the
+character-at-a-time reference scanner (fast=False): same types, values,
+line/column positions and closer_trim flags, and the same errors.
+iter_tokens() / parse_stream() must match tokenize() / parse() while only
+scanning as far as the consumer reads.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from flow_core.tokenizer import Tokenizer
+from flow_core.parser import Parser, parse, parse_stream
+from flow_core.models import TokenType
+from flow_core.errors import ParserError, TokenizerError
+
+
+MODULE_DIR = Path(__file__).resolve().parent.parent
+SAMPLE_FILES = sorted((MODULE_DIR / "playground").rglob("*.flow"))
+
+
+def _scan(source: str, fast: bool):
+    """Return comparable token tuples, or (exception type, message) on error."""
+    try:
+        tokens = Tokenizer(fast=fast).tokenize(source)
+    except Exception as e:  # errors must match too
+        return type(e).__name__, str(e)
+    return [(t.type, t.value, t.line, t.column, t.closer_trim) for t in tokens]
+
+
+def _assert_same(source: str) -> None:
+    assert _scan(source, fast=True) == _scan(source, fast=False)
+
+
+# =============================================================================
+# Equivalence
+# =============================================================================
+
+
+class TestFastMatchesReference:
+    """Fast path output is identical to the reference scanner."""
+
+    @pytest.mark.parametrize("path", SAMPLE_FILES, ids=lambda p: p.name)
+    def test_playground_samples(self, path):
+        _assert_same(path.read_text(encoding="utf-8"))
+
+    @pytest.mark.parametrize("source", [
+        "",
+        "\ufeff@a |<<<bom>>>|.",
+        "@a |<<< both trimmed >>>|.\n@b |<< kept >>|.\n@c |<<< mixed >>|.\n@d |<< mixed >>>|.",
+        "@a |<<<esc >>>\\| tail>>>|.\n@b |<<esc >>\\| tail>>|.",
+        "@a |<<<escape at eof >>>\\|",
+        "@a |<<<nul after escape >>\\|\0>>|.",
+        "@a |<<<\r\nwindows\r\nlines\r\n>>>|.\r\n",
+        "# comment\n  # not a comment\n",
+        "+./lib.flow |.\n + not an import",
+        "+ \t./spaced.flow|.\n@x |++ ../file.md|.",
+        "@héllo.wörld |$ref.slot|^fwd|.\n$a.b = $c\n\\| \\",
+        "@x |<<<never closed",
+        "@x |<<never closed",
+        "@a |>|.",
+        "@a |%|.",
+        "@ |.",
+        "$",
+        "+",
+        "@a\n  ++",
+        "@a |<<<multi\n\nline >>>>|.",
+    ])
+    def test_edge_cases(self, source):
+        _assert_same(source)
+
+    def test_positions_after_multiline_string(self):
+        tokens = Tokenizer().tokenize("@a |<<<one\ntwo\n>>>|.\n  $b")
+        ref = next(t for t in tokens if t.type == TokenType.NODE_REF)
+        eof = tokens[-1]
+
+        assert (ref.line, ref.column) == (4, 3)
+        assert (eof.type, eof.line, eof.column) == (TokenType.EOF, 4, 5)
+
+    def test_reference_mode_is_selectable(self):
+        assert Tokenizer().fast is True
+        assert Tokenizer(fast=False).fast is False
+
+
+# =============================================================================
+# Streaming
+# =============================================================================
+
+
+class TestStreaming:
+    """iter_tokens() is lazy and parse_stream() matches parse()."""
+
+    @pytest.mark.parametrize("path", SAMPLE_FILES, ids=lambda p: p.name)
+    def test_iter_tokens_matches_tokenize(self, path):
+        source = path.read_text(encoding="utf-8")
+        tokenizer = Tokenizer()
+
+        assert list(tokenizer.iter_tokens(source)) == tokenizer.tokenize(source)
+
+    @pytest.mark.parametrize("path", SAMPLE_FILES, ids=lambda p: p.name)
+    def test_parse_stream_matches_parse(self, path):
+        source = path.read_text(encoding="utf-8")
+
+        assert parse_stream(source) == parse(Tokenizer().tokenize(source))
+
+    def test_tail_error_raised_only_when_reached(self):
+        tokens = Tokenizer().iter_tokens("@a |<<<ok>>>|.\n@b |%|.")
+
+        assert [next(tokens).type for _ in range(4)] == [
+            TokenType.NODE_DEF, TokenType.PIPE, TokenType.STRING_TRIM, TokenType.DOT_END,
+        ]
+        with pytest.raises(TokenizerError):
+            list(tokens)
+
+    def test_prefix_syntax_error_reported_before_tail_is_scanned(self):
+        source = "@a |<<<ok>>>|.\n= oops\n" + "@n |<<<x>>>|.\n" * 1000 + "@z |%|."
+        pulled = []
+
+        def counting():
+            for token in Tokenizer().iter_tokens(source):
+                pulled.append(token)
+                yield token
+
+        with pytest.raises(ParserError):
+            Parser().parse(counting())
+        assert len(pulled) < 10
+
+    def test_stream_without_eof_token(self):
+        tokens = [t for t in Tokenizer().tokenize("@out |<<<hi>>>|.") if t.type != TokenType.EOF]
+
+        assert Parser().parse(iter(tokens)).out_node is not None
@@ -4,9 +4,17 @@ Flow Language Tokenizer
 Converts Flow language source code into a stream of tokens.
 Handles all Flow syntax elements including string blocks with
 asymmetric pairing, node definitions, references, and operators.
+
+Two scanning modes produce identical token lists:
+- fast (default): jumps with compiled regexes / str.find over whitespace,
+  comments, paths and string-block content, and derives line/column only
+  where a token starts by counting newlines since the previous token.
+- reference (fast=False): the original character-at-a-time scanner, kept as
+  the executable specification the fast path is tested against.
 """
 
-from typing import List, Optional
+import re
+from typing import Iterator, List, Optional
 
 from logger_util import Logger
 from .models import Token, TokenType
@@ -17,6 +25,14 @@ from .errors import (
 )
 
 
+# Whitespace skipped between tokens (other whitespace is an invalid token)
+_WHITESPACE_RE = re.compile(r"[ \t\r\n]*")
+# Inline whitespace skipped after '+' and '++'
+_INLINE_WS_RE = re.compile(r"[ \t]*")
+# Import / file-ref path: everything up to whitespace or a pipe
+_PATH_RE = re.compile(r"[^ \t\n\r|]*")
+
+
 class Tokenizer:
     """
     Tokenizer for the Flow language.
@@ -37,14 +53,17 @@ class Tokenizer:
         - String blocks: <<<...>>> (trim) or <<...>> (preserve)
     """
     
-    def __init__(self, logger: Optional[Logger] = None) -> None:
+    def __init__(self, logger: Optional[Logger] = None, fast: bool = True) -> None:
         """
         Initialize the tokenizer.
         
         Args:
             logger: Optional logger instance.
+            fast: Use the regex/slice scanner (default). False selects the
+                  character-at-a-time reference scanner.
         """
         self.logger = logger or Logger(name="FlowTokenizer")
+        self.fast = fast
         self._source: str = ""
         self._pos: int = 0
         self._line: int = 1
@@ -52,12 +71,15 @@ class Tokenizer:
         self._tokens: List[Token] = []
         self._line_start: bool = True  # Track if we're at line start
     
-    def tokenize(self, source: str) -> List[Token]:
+    def tokenize(self, source: str, start: int = 0, line: int = 1) -> List[Token]:
         """
         Tokenize Flow language source code.
         
         Args:
             source: The source code string to tokenize.
+            start: Offset to start scanning at. Must be the start of a line
+                   (used to re-tokenize the tail of an edited document).
+            line: 1-based line number of ``start``.
             
         Returns:
             List of Token objects.
@@ -66,11 +88,16 @@ class Tokenizer:
             TokenizerError: On tokenization errors.
             UnclosedStringError: If a string block is not closed.
         """
-        if source.startswith('\ufeff'):
+        if start == 0 and source.startswith('\ufeff'):
             source = source[1:]
+        if self.fast:
+            self.logger.debug(f"Tokenizing {len(source) - start} characters (fast)")
+            self._tokens = list(self._iter_fast(source, start, line))
+            self.logger.debug(f"Produced {len(self._tokens)} tokens")
+            return self._tokens
         self._source = source
-        self._pos = 0
-        self._line = 1
+        self._pos = start
+        self._line = line
         self._column = 1
         self._tokens = []
         self._line_start = True
@@ -86,6 +113,30 @@ class Tokenizer:
         self.logger.debug(f"Produced {len(self._tokens)} tokens")
         return self._tokens
     
+    def iter_tokens(self, source: str, start: int = 0, line: int = 1) -> Iterator[Token]:
+        """
+        Lazily tokenize Flow language source code.
+        
+        Yields the same tokens as tokenize(), ending with EOF, but scans only as
+        far as the consumer has read: a TokenizerError in the tail of the file
+        is raised when the consumer reaches it, not before. The reference
+        scanner (fast=False) has no lazy mode and tokenizes eagerly.
+        
+        Args:
+            source: The Flow language source code string.
+            start: Offset of a line start to begin scanning at.
+            line: 1-based line number of ``start``.
+            
+        Yields:
+            Tokens in source order.
+        """
+        if not self.fast:
+            yield from self.tokenize(source, start, line)
+            return
+        if start == 0 and source.startswith('\ufeff'):
+            source = source[1:]
+        yield from self._iter_fast(source, start, line)
+    
     def _at_end(self) -> bool:
         """Check if we've reached the end of source."""
         return self._pos >= len(self._source)
@@ -466,6 +517,167 @@ class Tokenizer:
         # Reached end without finding closer
         raise UnclosedStringError(opener, start_line, start_column)
     
+    # =========================================================================
+    # Fast scanner
+    # =========================================================================
+    
+    def _iter_fast(self, source: str, start: int = 0, line: int = 1) -> Iterator[Token]:
+        """
+        Tokenize with regex/str.find jumps; yields the same tokens as the reference scanner.
+        
+        Positions are only computed where a token (or error) starts. Token
+        starts only move forward, so the line is tracked by counting the
+        newlines between the previous token start and this one; the column is
+        the distance from the last newline.
+        """
+        src = source
+        n = len(src)
+        line_begin = start - 1  # Offset of the newline ending the previous line
+        located = start         # Offset up to which newlines have been counted
+        
+        pending: List[Token] = []  # Tokens produced by the current step
+        append = pending.append
+        is_ident_start = self._is_identifier_start
+        is_ident_char = self._is_identifier_char
+        pos = start
+        
+        def scan_name(prefix: str, begin: int, line: int, column: int) -> int:
+            """Return the end offset of the identifier starting at ``begin``."""
+            if begin >= n or not is_ident_start(src[begin]):
+                got = src[begin] if begin < n else "EOF"
+                raise TokenizerError(
+                    f"Expected identifier after '{prefix}', got '{got}'",
+                    line=line,
+                    column=column,
+                )
+            end = begin + 1
+            while end < n and is_ident_char(src[end]):
+                end += 1
+            return end
+        
+        while True:
+            pos = _WHITESPACE_RE.match(src, pos).end()
+            
+            newline_count = src.count("\n", located, pos)
+            if newline_count:
+                line += newline_count
+                line_begin = src.rfind("\n", located, pos)
+            located = pos
+            column = pos - line_begin
+            
+            if pos >= n:
+                break
+            char = src[pos]
+            
+            if char == "<" and src.startswith("<<", pos):
+                pos = self._scan_string_block_fast(
+                    src, pos, src.startswith("<<<", pos), line, column, append
+                )
+            elif src.startswith("++", pos):
+                start = _INLINE_WS_RE.match(src, pos + 2).end()
+                end = _PATH_RE.match(src, start).end()
+                if end == start:
+                    raise TokenizerError("Expected path after '++'", line=line, column=column)
+                append(Token(TokenType.FILE_REF, src[start:end], line, column))
+                pos = end
+            elif src.startswith("|.", pos):
+                append(Token(TokenType.DOT_END, "|.", line, column))
+                pos += 2
+            elif char == "#" and column == 1:
+                end = src.find("\n", pos)
+                if end == -1:
+                    end = n
+                append(Token(TokenType.COMMENT, src[pos:end], line, column))
+                pos = end
+            elif char == "+" and column == 1:
+                start = _INLINE_WS_RE.match(src, pos + 1).end()
+                end = _PATH_RE.match(src, start).end()
+                if end == start:
+                    raise TokenizerError("Expected path after '+'", line=line, column=column)
+                append(Token(TokenType.IMPORT, src[start:end], line, column))
+                pos = end
+            elif char in "@$^":
+                end = scan_name(char, pos + 1, line, column)
+                token_type = (
+                    TokenType.NODE_DEF if char == "@"
+                    else TokenType.NODE_REF if char == "$"
+                    else TokenType.FORWARD_REF
+                )
+                append(Token(token_type, src[pos + 1:end], line, column))
+                pos = end
+            elif char == "|":
+                append(Token(TokenType.PIPE, "|", line, column))
+                pos += 1
+            elif char == "=":
+                append(Token(TokenType.ASSIGN, "=", line, column))
+                pos += 1
+            elif char == "\\":
+                if pos + 1 < n and src[pos + 1] == "|":
+                    append(Token(TokenType.IDENTIFIER, "\\|", line, column))
+                    pos += 2
+                else:
+                    append(Token(TokenType.IDENTIFIER, "\\", line, column))
+                    pos += 1
+            elif is_ident_start(char):
+                end = pos + 1
+                while end < n and is_ident_char(src[end]):
+                    end += 1
+                append(Token(TokenType.IDENTIFIER, src[pos:end], line, column))
+                pos = end
+            elif char == ">":
+                raise TokenizerError(
+                    "Unexpected '>' - did you mean '>>' or '>>>' to close a string block?",
+                    line=line,
+                    column=column
+                )
+            else:
+                raise InvalidTokenError(char, line, column)
+            
+            yield pending.pop()
+        
+        yield Token(TokenType.EOF, "", line, column)
+    
+    def _scan_string_block_fast(
+        self, src: str, pos: int, trim: bool, line: int, column: int, append
+    ) -> int:
+        """
+        Scan a string block starting at ``pos`` by jumping between '>>' candidates.
+        
+        Same closer/escape rules as _scan_string_block. Returns the offset
+        just past the closer.
+        """
+        n = len(src)
+        opener = "<<<" if trim else "<<"
+        cursor = pos + len(opener)
+        parts: List[str] = []
+        
+        while True:
+            candidate = src.find(">>", cursor)
+            if candidate == -1:
+                raise UnclosedStringError(opener, line, column)
+            parts.append(src[cursor:candidate])
+            
+            if src.startswith(">>>", candidate):
+                # >>>\| followed by more input is an escaped literal >>>|
+                after = candidate + 5
+                if src.startswith(">>>\\|", candidate) and after < n and src[after] != "\0":
+                    parts.append(">>>|")
+                    cursor = after
+                    continue
+                closer_is_trim, end = True, candidate + 3
+            else:
+                after = candidate + 4
+                if src.startswith(">>\\|", candidate) and after < n and src[after] != "\0":
+                    parts.append(">>|")
+                    cursor = after
+                    continue
+                closer_is_trim, end = False, candidate + 2
+            
+            token_type = TokenType.STRING_TRIM if trim else TokenType.STRING_PRESERVE
+            content = self._process_string_content("".join(parts), trim, closer_is_trim)
+            append(Token(token_type, content, line, column, closer_trim=closer_is_trim))
+            return end
+    
     def _process_string_content(self, content: str, trim_leading: bool, trim_trailing: bool) -> str:
         """
         Process string block content with asymmetric trimming.
@@ -43,7 +43,8 @@ from .dependency_walker import (
     format_dependency_tree,
     format_all_violations,
 )
-from .refresh_order import sort_modules_for_refresh
+from .refresh_order import sort_modules_for_refresh, prepare_refresh_sorter
+from .git_state import collect_git_states, read_porcelain_status, PorcelainStatus
 
 __all__ = [
     "ModulesController",
@@ -71,6 +72,10 @@ __all__ = [
     "FilterDimension",
     "FilterInfo",
     "GitState",
+    # Git state lookup
+    "collect_git_states",
+    "read_porcelain_status",
+    "PorcelainStatus",
     # Dependency Walker
     "DependencyWalker",
     "DependencyClosure",
@@ -81,4 +86,5 @@ __all__ = [
     "format_all_violations",
     # Refresh ordering
     "sort_modules_for_refresh",
+    "prepare_refresh_sorter",
 ]
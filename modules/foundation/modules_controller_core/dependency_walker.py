@@ -4,6 +4,7 @@ This module provides functionality to:
 1. Walk the dependency tree from a starting module
 2. Build a complete closure set of all transitive dependencies
 3. Detect cross-layer violations (e.g., runtime depending on dev)
+4. Analyze every module at once (SCC condensation + bitset closures)
 """
 
 from __future__ import annotations
@@ -16,7 +17,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 from .module_types import ModuleLayer
 
 if TYPE_CHECKING:
-    from .modules_controller import ModulesController, ModuleInfo
+    from .modules_controller import ModulesController, ModuleInfo, ModulesReport
 
 
 class ViolationType(str, Enum):
@@ -110,6 +111,37 @@ def _can_depend_on(source_layer: Optional[ModuleLayer], target_layer: Optional[M
     return target_level <= source_level
 
 
+def _cross_layer_violation(
+    module: "ModuleInfo",
+    dep_name: str,
+    dep_module: "ModuleInfo",
+) -> DependencyViolation:
+    """Build the CROSS_LAYER violation for module -> dep_module."""
+    source_layer = module.layer.value if module.layer else '?'
+    target_layer = dep_module.layer.value if dep_module.layer else '?'
+    return DependencyViolation(
+        violation_type=ViolationType.CROSS_LAYER,
+        source_module=module.name,
+        source_layer=module.layer,
+        target_dep=dep_name,
+        target_layer=dep_module.layer,
+        message=(
+            f"Layer violation: {module.name} [{source_layer}] "
+            f"depends on {dep_name} [{target_layer}]. "
+            f"A {source_layer} module cannot depend on a "
+            f"{target_layer} module."
+        ),
+    )
+
+
+def _iter_bits(bits: int):
+    """Yield the indices of set bits in *bits*, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
 def _package_name_to_module_name(package_name: str) -> str:
     """Convert package name (kebab-case) to module name (snake_case).
     
@@ -131,14 +163,21 @@ class DependencyWalker:
     
     def __init__(self, controller: "ModulesController"):
         self.controller = controller
-        self._module_cache: Dict[str, Optional["ModuleInfo"]] = {}
+        self._report: Optional["ModulesReport"] = None
         self._visited: Set[str] = set()
 
+    @property
+    def report(self) -> "ModulesReport":
+        """Scan report whose name index and dependency adjacency back every lookup."""
+        if self._report is None:
+            self._report = self.controller.list_all_modules()
+        return self._report
+
     def get_reverse_deps(self, module_name: str) -> Set[str]:
         """Find all modules that depend on the given module.
 
-        Iterates every discovered module and checks whether *module_name*
-        appears in its dependency list (after kebab→snake normalisation).
+        Reads the report's reverse dependency adjacency, so no pyproject.toml
+        is re-parsed (names are compared after kebab→snake normalisation).
 
         Args:
             module_name: Module name in snake_case **or** kebab-case.
@@ -149,33 +188,19 @@ class DependencyWalker:
             dependency.  Returns an empty set when nothing depends on it.
         """
         target = _package_name_to_module_name(module_name)
-        report = self.controller.list_all_modules()
-        dependants: Set[str] = set()
-        for module in report.modules:
-            if module.name == target:
-                continue  # skip self
-            deps = self._get_module_dependencies(module)
-            if target in deps:
-                dependants.add(module.name)
-        return dependants
+        return self.report.dependents(target) - {target}  # skip self
 
     def _get_module(self, module_name: str) -> Optional["ModuleInfo"]:
-        """Get module info by name, with caching."""
-        if module_name not in self._module_cache:
-            self._module_cache[module_name] = self.controller.get_module_by_name(module_name)
-        return self._module_cache[module_name]
+        """Get module info by name from the report's name index."""
+        return self.report.find(module_name)
     
     def _get_module_dependencies(self, module: "ModuleInfo") -> List[str]:
-        """Extract dependencies from a module's pyproject.toml.
+        """Return a module's declared dependencies as module names.
         
-        Returns list of dependency names (converted from package to module names).
+        Served from the report's forward adjacency (built from pyproject.toml
+        [project].dependencies at scan time).
         """
-        try:
-            pyproject = self.controller.get_module_pyproject(module.path)
-            deps = pyproject.get("project", {}).get("dependencies", [])
-            return [_package_name_to_module_name(d) for d in deps]
-        except (FileNotFoundError, ValueError):
-            return []
+        return self.report.dependency_names(module.name)
     
     def _is_adhd_module(self, dep_name: str) -> bool:
         """Check if a dependency name corresponds to an ADHD module."""
@@ -242,6 +267,101 @@ class DependencyWalker:
             violations=violations,
         )
     
+    def analyze_all(self) -> Dict[str, DependencyClosure]:
+        """Compute every module's closure and layer violations in one pass.
+
+        Equivalent to calling walk_dependencies() for each module, but shared
+        subgraphs are processed once: the ADHD dependency graph is condensed
+        into strongly connected components, and each component's reachable
+        modules, declared dependency names and violations are memoized as
+        bitsets that its dependents simply OR together.
+
+        The closures carry the same dependency sets and violations as
+        walk_dependencies(). Violations are ordered by source module rather than
+        walk order, and ``tree`` holds only the root's direct dependencies
+        (use walk_dependencies() to render a full tree).
+
+        Returns:
+            Dict mapping module name -> DependencyClosure, in report order.
+        """
+        report = self.report
+        modules: Dict[str, "ModuleInfo"] = {}
+        for module in report.modules:
+            modules.setdefault(module.name, module)
+
+        # Bit positions for every declared dependency name and every violation.
+        name_bit: Dict[str, int] = {}
+        names: List[str] = []
+        violations: List[DependencyViolation] = []
+        dep_bits: Dict[str, int] = {}
+        violation_bits: Dict[str, int] = {}
+        graph: Dict[str, List[str]] = {}
+
+        for name, module in modules.items():
+            bits = 0
+            vbits = 0
+            adhd_children: List[str] = []
+            for dep_name in self._get_module_dependencies(module):
+                if dep_name not in name_bit:
+                    name_bit[dep_name] = len(names)
+                    names.append(dep_name)
+                bits |= 1 << name_bit[dep_name]
+                dep_module = self._get_module(dep_name)
+                if dep_module is None:
+                    continue
+                adhd_children.append(dep_module.name)
+                if not _can_depend_on(module.layer, dep_module.layer):
+                    vbits |= 1 << len(violations)
+                    violations.append(_cross_layer_violation(module, dep_name, dep_module))
+            dep_bits[name] = bits
+            violation_bits[name] = vbits
+            graph[name] = adhd_children
+
+        # Condense and fold closures bottom-up over the component DAG.
+        component_of: Dict[str, int] = {}
+        component_deps: List[int] = []
+        component_violations: List[int] = []
+        for comp_id, component in enumerate(_strongly_connected_components(graph)):
+            for member in component:
+                component_of[member] = comp_id
+            bits = 0
+            vbits = 0
+            for member in component:
+                bits |= dep_bits[member]
+                vbits |= violation_bits[member]
+                for child in graph[member]:
+                    child_comp = component_of[child]
+                    if child_comp != comp_id:
+                        bits |= component_deps[child_comp]
+                        vbits |= component_violations[child_comp]
+            component_deps.append(bits)
+            component_violations.append(vbits)
+
+        results: Dict[str, DependencyClosure] = {}
+        for name, module in modules.items():
+            comp_id = component_of[name]
+            all_deps = {names[i] for i in _iter_bits(component_deps[comp_id])}
+            adhd_deps = {d for d in all_deps if self._get_module(d) is not None}
+            root = DependencyNode(name=name, layer=module.layer, depth=0)
+            for dep_name in self._get_module_dependencies(module):
+                dep_module = self._get_module(dep_name)
+                root.children.append(DependencyNode(
+                    name=dep_name,
+                    layer=dep_module.layer if dep_module else None,
+                    depth=1,
+                    is_external=dep_module is None,
+                ))
+            results[name] = DependencyClosure(
+                root_module=name,
+                root_layer=module.layer,
+                tree=root,
+                all_deps=all_deps,
+                adhd_deps=adhd_deps,
+                external_deps=all_deps - adhd_deps,
+                violations=[violations[i] for i in _iter_bits(component_violations[comp_id])],
+            )
+        return results
+
     def _walk_recursive(
         self,
         module: "ModuleInfo",
@@ -290,19 +410,7 @@ class DependencyWalker:
                 
                 # Check for layer violations
                 if not _can_depend_on(module.layer, dep_module.layer):
-                    violations.append(DependencyViolation(
-                        violation_type=ViolationType.CROSS_LAYER,
-                        source_module=module.name,
-                        source_layer=module.layer,
-                        target_dep=dep_name,
-                        target_layer=dep_module.layer,
-                        message=(
-                            f"Layer violation: {module.name} [{module.layer.value if module.layer else '?'}] "
-                            f"depends on {dep_name} [{dep_module.layer.value if dep_module.layer else '?'}]. "
-                            f"A {module.layer.value if module.layer else '?'} module cannot depend on a "
-                            f"{dep_module.layer.value if dep_module.layer else '?'} module."
-                        ),
-                    ))
+                    violations.append(_cross_layer_violation(module, dep_name, dep_module))
                 
                 # Recursively walk if not already visited
                 if dep_name not in self._visited:
@@ -327,6 +435,57 @@ class DependencyWalker:
         return node
 
 
+def _strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """Iterative Tarjan SCC. Components are returned dependencies-first
+    (every component appears after all components it points to)."""
+    index_of: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    counter = 0
+
+    for start in graph:
+        if start in index_of:
+            continue
+        work: List[Tuple[str, int]] = [(start, 0)]
+        while work:
+            node, child_pos = work.pop()
+            if child_pos == 0:
+                index_of[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+            children = graph[node]
+            recursed = False
+            while child_pos < len(children):
+                child = children[child_pos]
+                child_pos += 1
+                if child not in index_of:
+                    work.append((node, child_pos))
+                    work.append((child, 0))
+                    recursed = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[child])
+            if recursed:
+                continue
+            if lowlink[node] == index_of[node]:
+                component: List[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    return components
+
+
 def format_all_violations(
     results: List[tuple[str, DependencyClosure]],
     modules_checked: int,
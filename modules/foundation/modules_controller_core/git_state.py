@@ -0,0 +1,219 @@
+"""Git State - Batched git state lookup for ModuleFilter state filters.
+
+Determines GitState (dirty / unpushed / clean) for many modules with as few
+git processes as possible:
+
+- Modules inside the enclosing project repository share ONE
+  ``git status --porcelain=v2 --branch -z`` call; changed paths are bucketed by
+  module directory. Only if the branch is ahead of its upstream is a second
+  ``git log --name-only @{upstream}..HEAD`` call made to attribute unpushed
+  commits to modules.
+- Modules that are separate repositories (own ``.git``) each need a single
+  porcelain v2 status call, which also carries ahead/behind counts. These run
+  on a small thread pool.
+
+Modules outside any git repository get no state (they never match a state filter).
+"""
+
+from __future__ import annotations
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .module_filter import GitState
+
+if TYPE_CHECKING:
+    from .modules_controller import ModuleInfo
+
+GIT_TIMEOUT = 30
+DEFAULT_MAX_WORKERS = 8
+
+# Number of space-separated fields preceding the path in porcelain v2 records
+_V2_PATH_FIELDS = {"1": 8, "2": 9, "u": 10}
+
+
+@dataclass
+class PorcelainStatus:
+    """Parsed ``git status --porcelain=v2 --branch -z`` output.
+
+    Attributes:
+        branch: Branch name ("HEAD" when detached, "unknown" if not reported).
+        has_upstream: Whether the branch tracks an upstream.
+        ahead: Commits ahead of upstream.
+        behind: Commits behind upstream.
+        entries: (XY status code, repo-relative path) per changed path.
+            Untracked paths use "??".
+    """
+    branch: str = "unknown"
+    has_upstream: bool = False
+    ahead: int = 0
+    behind: int = 0
+    entries: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self.entries)
+
+
+def parse_porcelain_v2(output: bytes) -> PorcelainStatus:
+    """Parse NUL-separated porcelain v2 status output (with --branch)."""
+    status = PorcelainStatus()
+    records = output.decode("utf-8", errors="replace").split("\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+        kind = record[0]
+        if kind == "#":
+            parts = record.split(" ")
+            if len(parts) >= 3 and parts[1] == "branch.head":
+                status.branch = "HEAD" if parts[2] == "(detached)" else parts[2]
+            elif len(parts) >= 3 and parts[1] == "branch.upstream":
+                status.has_upstream = True
+            elif len(parts) >= 4 and parts[1] == "branch.ab":
+                status.ahead = abs(int(parts[2]))
+                status.behind = abs(int(parts[3]))
+        elif kind in _V2_PATH_FIELDS:
+            fields = record.split(" ", _V2_PATH_FIELDS[kind])
+            status.entries.append((fields[1], fields[-1]))
+            if kind == "2" and i < len(records):
+                i += 1  # rename/copy: skip the original path record
+        elif kind == "?":
+            status.entries.append(("??", record[2:]))
+        # "!" (ignored) entries are not requested and not counted
+    return status
+
+
+def read_porcelain_status(repo_path: Path) -> Optional[PorcelainStatus]:
+    """Run one porcelain v2 status for *repo_path*; None if git fails."""
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch", "-z"],
+            cwd=str(repo_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return parse_porcelain_v2(result.stdout)
+
+
+def _find_repo_root(path: Path) -> Optional[Path]:
+    """Return the nearest directory at or above *path* containing .git."""
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def _state_from_status(status: PorcelainStatus) -> GitState:
+    if status.is_dirty:
+        return GitState.DIRTY
+    if status.ahead > 0:
+        return GitState.UNPUSHED
+    return GitState.CLEAN
+
+
+def _unpushed_paths(repo_root: Path) -> List[str]:
+    """Repo-relative paths touched by commits not yet on the upstream."""
+    try:
+        result = subprocess.run(
+            ["git", "log", "--name-only", "--format=", "-z", "@{upstream}..HEAD"],
+            cwd=str(repo_root),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    if result.returncode != 0:
+        return []
+    return [p.strip("\n") for p in result.stdout.decode("utf-8", errors="replace").split("\0") if p.strip()]
+
+
+class _PathBucketer:
+    """Map repo-relative paths to the module directory that contains them."""
+
+    def __init__(self, prefixes: Dict[str, str]):
+        self._prefixes = prefixes  # "modules/dev/foo" -> "foo"
+
+    def owners(self, path: str) -> Iterable[str]:
+        path = path.rstrip("/")
+        parts = path.split("/")
+        for depth in range(1, len(parts) + 1):
+            owner = self._prefixes.get("/".join(parts[:depth]))
+            if owner is not None:
+                return [owner]
+        # A collapsed untracked directory above module level covers every module below it
+        below = path + "/"
+        return [name for prefix, name in self._prefixes.items() if prefix.startswith(below)]
+
+
+def collect_git_states(
+    modules: List["ModuleInfo"],
+    root_path: Path,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Dict[str, GitState]:
+    """Determine the GitState of every module with batched git invocations.
+
+    Args:
+        modules: Modules to inspect.
+        root_path: Project root; its enclosing repository is queried once.
+        max_workers: Thread pool size for modules that are separate repositories.
+
+    Returns:
+        Dict mapping module name -> GitState. Modules not under git are omitted.
+    """
+    root_path = Path(root_path).resolve()
+    separate: List["ModuleInfo"] = []
+    shared: List["ModuleInfo"] = []
+    for module in modules:
+        if (module.path / ".git").exists():
+            separate.append(module)
+        else:
+            shared.append(module)
+
+    states: Dict[str, GitState] = {}
+
+    repo_root = _find_repo_root(root_path) if shared else None
+    if repo_root is not None:
+        prefixes: Dict[str, str] = {}
+        for module in shared:
+            try:
+                rel = Path(module.path).resolve().relative_to(repo_root)
+            except ValueError:
+                continue
+            prefixes[rel.as_posix()] = module.name
+
+        status = read_porcelain_status(repo_root)
+        if status is not None:
+            bucketer = _PathBucketer(prefixes)
+            for name in prefixes.values():
+                states[name] = GitState.CLEAN
+            for _, path in status.entries:
+                for name in bucketer.owners(path):
+                    states[name] = GitState.DIRTY
+            if status.ahead > 0:
+                for path in _unpushed_paths(repo_root):
+                    for name in bucketer.owners(path):
+                        if states.get(name) == GitState.CLEAN:
+                            states[name] = GitState.UNPUSHED
+
+    if separate:
+        workers = max(1, min(max_workers, len(separate)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda m: (m.name, read_porcelain_status(m.path)), separate)
+            for name, status in results:
+                if status is not None:
+                    states[name] = _state_from_status(status)
+
+    return states
@@ -0,0 +1,167 @@
+"""In-process Runner - Execute module refresh scripts inside the current interpreter.
+
+Spawning one Python process per refresh script pays interpreter startup and
+re-imports the foundation modules (logger_util, config_manager, cli_manager)
+for every module. This runner imports the script as ``<module>.<script stem>``
+and calls its entry point directly, so a full refresh shares the warm imports.
+
+Failures are isolated: exceptions and non-zero SystemExit are converted to
+ADHDError, and the working directory and sys.argv are always restored.
+
+Whether a script can run in-process is decided from its source (a top-level
+entry point definition) before any of it executes, so a script is never run
+twice. The script module is imported afresh on every run, and packages whose
+source files changed since a previous in-process run are dropped from
+sys.modules first, so long-lived callers (adhd refresh --watch) never run
+stale code.
+"""
+
+from __future__ import annotations
+
+import ast
+import cProfile
+import importlib
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from exceptions_core import ADHDError
+
+if TYPE_CHECKING:
+    from .modules_controller import ModuleInfo
+
+# Entry point names used by refresh scripts across the framework, in lookup order.
+REFRESH_ENTRY_POINTS = ("main", "refresh", "register_refresh")
+
+# sys.modules name -> (mtime_ns, size) of its source after the last in-process run
+_source_stamps: Dict[str, Tuple[int, int]] = {}
+
+
+def _ensure_importable(module: "ModuleInfo") -> None:
+    """Put the module's layer directory on sys.path if its package is not importable."""
+    if importlib.util.find_spec(module.name) is not None:
+        return
+    parent = str(module.path.parent)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    importlib.invalidate_caches()
+
+
+def find_entry_point(script_path: Path) -> Optional[str]:
+    """Return the entry point a script defines at top level, without running it.
+
+    Looks for ``def`` statements (or imported names) matching
+    REFRESH_ENTRY_POINTS, in lookup order.
+
+    Returns:
+        The entry point name, or None if there is none or the script does
+        not parse (the subprocess run then reports the error).
+    """
+    try:
+        tree = ast.parse(script_path.read_text(encoding="utf-8"), filename=str(script_path))
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return None
+    defined: Set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            defined.add(node.name)
+        elif isinstance(node, ast.ImportFrom):
+            defined.update(alias.asname or alias.name for alias in node.names)
+    return next((name for name in REFRESH_ENTRY_POINTS if name in defined), None)
+
+
+def _source_stamp(name: str) -> Optional[Tuple[int, int]]:
+    source = getattr(sys.modules.get(name), "__file__", None)
+    try:
+        stat = os.stat(source) if source else None
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size) if stat else None
+
+
+def _package_modules(package: str) -> List[str]:
+    prefix = package + "."
+    return [name for name in list(sys.modules) if name == package or name.startswith(prefix)]
+
+
+def _evict_stale_modules(script_import_name: str) -> None:
+    """Drop the script module, and every package with edited sources, from sys.modules."""
+    stale_packages = {
+        name.split(".", 1)[0]
+        for name, stamp in list(_source_stamps.items())
+        if name in sys.modules and _source_stamp(name) != stamp
+    }
+    for package in stale_packages:
+        for name in _package_modules(package):
+            del sys.modules[name]
+            _source_stamps.pop(name, None)
+    sys.modules.pop(script_import_name, None)
+    importlib.invalidate_caches()
+
+
+def _record_source_stamps(package: str) -> None:
+    for name in _package_modules(package):
+        stamp = _source_stamp(name)
+        if stamp is not None:
+            _source_stamps[name] = stamp
+
+
+def run_script_inprocess(
+    module: "ModuleInfo",
+    script_path: Path,
+    project_root: Path,
+    *,
+    profile_path: Optional[Path] = None,
+) -> bool:
+    """Import a module script and call its entry point in this interpreter.
+
+    Args:
+        module: The module that owns the script.
+        script_path: Absolute path to the script file (refresh.py, refresh_full.py).
+        project_root: Directory to use as cwd while the script runs.
+        profile_path: If set, run the import and entry point under cProfile and
+            dump the stats to this file.
+
+    Returns:
+        True if the script ran in-process, False if it defines no known entry
+        point (nothing was executed; the caller should fall back to a subprocess).
+
+    Raises:
+        ADHDError: If importing or running the script fails.
+    """
+    entry_name = find_entry_point(script_path)
+    if entry_name is None:
+        return False
+
+    import_name = f"{module.name}.{script_path.stem}"
+    previous_cwd = os.getcwd()
+    previous_argv = sys.argv
+    profiler = cProfile.Profile() if profile_path is not None else None
+    try:
+        os.chdir(project_root)
+        sys.argv = [str(script_path)]
+        _ensure_importable(module)
+        _evict_stale_modules(import_name)
+        if profiler is not None:
+            profiler.enable()
+        script_module = importlib.import_module(import_name)
+        entry_point = getattr(script_module, entry_name, None)
+        if not callable(entry_point):
+            raise TypeError(f"{entry_name} is not callable")
+        entry_point()
+        return True
+    except SystemExit as exc:
+        if exc.code in (None, 0):
+            return True
+        raise ADHDError(f"{script_path.name} failed for {module.name}: exited with status {exc.code}") from exc
+    except Exception as exc:
+        raise ADHDError(f"{script_path.name} failed for {module.name}: {exc!r}") from exc
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(str(profile_path))
+        _record_source_stamps(module.name)
+        sys.argv = previous_argv
+        os.chdir(previous_cwd)
@@ -0,0 +1,155 @@
+"""Module Index - Persisted discovery index for ModulesController scans.
+
+Caches the parsed pyproject.toml of every discovered module on disk so that
+repeated scans only re-parse modules whose files actually changed. Entries are
+validated against a cheap stat() fingerprint:
+
+- module directory inode
+- pyproject.toml size and mtime (nanoseconds)
+
+The index lives at project/data/modules_controller_core/module_index.json.
+A missing, unreadable, or version-mismatched index is treated as empty, which
+degrades to a full scan.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from logger_util import Logger
+
+# Bump when the entry layout changes so stale indexes are discarded.
+INDEX_VERSION = 1
+
+INDEX_DATA_DIR = Path("project") / "data" / "modules_controller_core"
+INDEX_FILENAME = "module_index.json"
+
+# (module dir inode, pyproject size, pyproject mtime_ns)
+Fingerprint = Tuple[int, int, int]
+
+
+@dataclass
+class IndexEntry:
+    """A cached pyproject.toml parse result for one module directory.
+
+    Attributes:
+        fingerprint: stat() fingerprint the entry was recorded against.
+        pyproject: Parsed pyproject.toml contents, or None if it was invalid.
+    """
+    fingerprint: Fingerprint
+    pyproject: Optional[Dict[str, Any]]
+
+
+def compute_fingerprint(module_dir: Path, pyproject_file: Path) -> Optional[Fingerprint]:
+    """Return the stat() fingerprint for a module, or None if it cannot be read."""
+    try:
+        dir_stat = module_dir.stat()
+        file_stat = pyproject_file.stat()
+    except OSError:
+        return None
+    return (dir_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+
+class ModuleIndex:
+    """On-disk cache of parsed module pyproject.toml files, keyed by module path."""
+
+    def __init__(self, root_path: Path, logger: Optional["Logger"] = None):
+        self.root_path = Path(root_path)
+        self.index_file = self.root_path / INDEX_DATA_DIR / INDEX_FILENAME
+        self.logger = logger
+        self._entries: Dict[str, IndexEntry] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    def _key(self, module_dir: Path) -> str:
+        try:
+            return module_dir.relative_to(self.root_path).as_posix()
+        except ValueError:
+            return module_dir.as_posix()
+
+    def load(self) -> None:
+        """Load the index from disk. Corrupt or outdated files are ignored."""
+        self._entries = {}
+        self._seen = set()
+        self._dirty = False
+        if not self.index_file.exists():
+            return
+        try:
+            raw = json.loads(self.index_file.read_text(encoding="utf-8"))
+            if raw.get("version") != INDEX_VERSION:
+                raise ValueError(f"index version {raw.get('version')!r} != {INDEX_VERSION}")
+            for key, entry in raw["modules"].items():
+                self._entries[key] = IndexEntry(
+                    fingerprint=tuple(entry["fingerprint"]),
+                    pyproject=entry["pyproject"],
+                )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            if self.logger:
+                self.logger.debug(f"Discarding module index {self.index_file}: {e}")
+            self._entries = {}
+            self._dirty = True
+
+    def lookup(self, module_dir: Path, fingerprint: Optional[Fingerprint]) -> Optional[IndexEntry]:
+        """Return the cached entry for *module_dir* if its fingerprint still matches."""
+        key = self._key(module_dir)
+        self._seen.add(key)
+        if fingerprint is None:
+            return None
+        entry = self._entries.get(key)
+        if entry is None or entry.fingerprint != fingerprint:
+            return None
+        return entry
+
+    def record(
+        self,
+        module_dir: Path,
+        fingerprint: Optional[Fingerprint],
+        pyproject: Optional[Dict[str, Any]],
+    ) -> None:
+        """Store a fresh parse result. Non-JSON-serializable data is not cached."""
+        key = self._key(module_dir)
+        self._seen.add(key)
+        if fingerprint is None:
+            return
+        try:
+            json.dumps(pyproject)
+        except (TypeError, ValueError):
+            # e.g. TOML datetimes; such modules are simply re-parsed every scan
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+            return
+        self._entries[key] = IndexEntry(fingerprint=fingerprint, pyproject=pyproject)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Prune entries not seen during the scan and write the index if it changed."""
+        stale = set(self._entries) - self._seen
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+        if not self._dirty:
+            return
+
+        payload = {
+            "version": INDEX_VERSION,
+            "modules": {
+                key: {"fingerprint": list(entry.fingerprint), "pyproject": entry.pyproject}
+                for key, entry in sorted(self._entries.items())
+            },
+        }
+        tmp_file = self.index_file.with_suffix(".json.tmp")
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp_file, self.index_file)
+            self._dirty = False
+        except OSError as e:
+            # The index is an optimization only; never fail a scan over it.
+            if self.logger:
+                self.logger.debug(f"Could not write module index {self.index_file}: {e}")
@@ -18,7 +18,7 @@ import tomllib
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from logger_util import Logger
 from exceptions_core import ADHDError
@@ -34,9 +34,12 @@ from .module_issues import (
     ModuleIssueCode,
     create_issue,
 )
+from .module_index import ModuleIndex, compute_fingerprint
 
 if TYPE_CHECKING:
-    from .module_filter import ModuleFilter
+    from .module_filter import GitState, ModuleFilter
+    from .refresh_state import IncrementalRefresh
+    from .refresh_timing import RefreshTimer
 
 
 class WorkspaceGenerationMode(str, Enum):
@@ -59,6 +62,8 @@ class ModuleInfo:
         requirements: List of dependencies from pyproject.toml
         issues: List of validation issues
         shows_in_workspace: Override for workspace visibility (None = visible)
+        refresh_inprocess: Run refresh scripts in the CLI interpreter instead of
+            a subprocess (refresh_inprocess=true in pyproject.toml)
     """
     name: str
     version: str
@@ -69,6 +74,7 @@ class ModuleInfo:
     requirements: List[str] = field(default_factory=list)
     issues: List[ModuleIssue] = field(default_factory=list)
     shows_in_workspace: Optional[bool] = None
+    refresh_inprocess: bool = False
     
     # Legacy compatibility - folder derived from layer
     @property
@@ -128,15 +134,66 @@ class ModuleInfo:
 
 @dataclass
 class ModulesReport:
+    """Result of a module scan.
+
+    Besides the module lists, the report lazily builds (once per scan) a
+    case-insensitive name index and forward/reverse dependency adjacency from
+    each module's declared requirements, so lookups and dependency queries
+    never re-read pyproject.toml files.
+    """
     modules: List[ModuleInfo] = field(default_factory=list)
     issued_modules: List[ModuleInfo] = field(default_factory=list)
     root_path: Path = Path.cwd()
 
+    _name_index: Optional[Dict[str, ModuleInfo]] = field(default=None, init=False, repr=False, compare=False)
+    _forward_deps: Dict[str, List[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _reverse_deps: Dict[str, Set[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _ensure_indexes(self) -> None:
+        if self._name_index is not None:
+            return
+        from .dependency_walker import _package_name_to_module_name
+
+        name_index: Dict[str, ModuleInfo] = {}
+        forward: Dict[str, List[str]] = {}
+        reverse: Dict[str, Set[str]] = {}
+        for module in self.modules:
+            # First module wins on duplicate names, matching a linear scan
+            name_index.setdefault(module.name.lower(), module)
+            if module.name in forward:
+                continue
+            deps = [_package_name_to_module_name(d) for d in module.requirements]
+            forward[module.name] = deps
+            for dep in deps:
+                reverse.setdefault(dep, set()).add(module.name)
+        self._name_index = name_index
+        self._forward_deps = forward
+        self._reverse_deps = reverse
+
+    def find(self, module_name: str) -> Optional[ModuleInfo]:
+        """Return the module with this name (case-insensitive), or None."""
+        self._ensure_indexes()
+        return self._name_index.get(module_name.lower().strip())
+
+    def dependency_names(self, module_name: str) -> List[str]:
+        """Return a module's declared dependencies as module names (ADHD and external)."""
+        self._ensure_indexes()
+        return self._forward_deps.get(module_name, [])
+
+    def adhd_dependencies(self, module_name: str) -> Set[str]:
+        """Return the names of discovered ADHD modules that *module_name* depends on."""
+        return {d for d in self.dependency_names(module_name) if self.find(d) is not None}
+
+    def dependents(self, module_name: str) -> Set[str]:
+        """Return names of modules that directly declare *module_name* as a dependency."""
+        self._ensure_indexes()
+        return set(self._reverse_deps.get(module_name, ()))
+
     def format(self, module_filter: Optional["ModuleFilter"] = None) -> str:
         """Format module list for terminal output with optional filtering."""
         modules = self.modules
         if module_filter and module_filter.has_filters:
-            modules = module_filter.filter_modules(modules)
+            modules = module_filter.filter_modules(modules, self.git_states_for(module_filter))
 
         lines = [f"\n\U0001f4e6 Found {len(modules)} modules:"]
         for module in modules:
@@ -149,6 +206,13 @@ class ModulesReport:
                     lines.append(f"     - {issue.message}")
         return "\n".join(lines)
 
+    def git_states_for(self, module_filter: "ModuleFilter") -> Optional[Dict[str, "GitState"]]:
+        """Collect git states (batched) only when the filter has state filters."""
+        if not module_filter.has_state_filters:
+            return None
+        from .git_state import collect_git_states
+        return collect_git_states(self.modules, self.root_path)
+
     def print_report(self) -> None:
         logger = Logger(name=__class__.__name__)
         total_modules = len(self.modules)
@@ -195,6 +259,7 @@ class ModulesController:
         self.root_path = root
         self.logger = Logger(name=__class__.__name__)
         self._report: Optional[ModulesReport] = None
+        self._timer: Optional["RefreshTimer"] = None
         self._initialized = True
     
     def list_all_modules(self) -> ModulesReport:
@@ -203,12 +268,18 @@ class ModulesController:
             return self.scan_all_modules()
         return self._report
 
-    def scan_all_modules(self) -> ModulesReport:
+    def scan_all_modules(self, *, rescan: bool = False) -> ModulesReport:
         """Scan modules/ directory and return a report for each discovered module.
 
         Scans modules/foundation/, modules/runtime/, modules/dev/.
         A module is any immediate subdirectory that contains a pyproject.toml
         with [tool.adhd] configuration.
+
+        Parsed pyproject.toml files are cached in the persisted module index and
+        only re-parsed when their stat() fingerprint changes.
+
+        Args:
+            rescan: If True, ignore the module index and re-parse every module.
         """
         modules: List[ModuleInfo] = []
         issued_modules: List[ModuleInfo] = []
@@ -219,7 +290,11 @@ class ModulesController:
             report = ModulesReport(modules=[], issued_modules=[], root_path=self.root_path)
             self._report = report
             return report
-        
+
+        index = ModuleIndex(self.root_path, logger=self.logger)
+        if not rescan:
+            index.load()
+
         for layer_name in LAYER_SUBFOLDERS:
             layer_dir = modules_dir / layer_name
             if not layer_dir.exists() or not layer_dir.is_dir():
@@ -229,8 +304,9 @@ class ModulesController:
             if layer is None:
                 continue
                 
-            self._scan_layer_for_modules(layer_dir, layer, modules, issued_modules)
-                
+            self._scan_layer_for_modules(layer_dir, layer, modules, issued_modules, index)
+
+        index.save()
         report = ModulesReport(modules=modules, issued_modules=issued_modules, root_path=self.root_path)
         self._report = report
         return report
@@ -241,6 +317,7 @@ class ModulesController:
         layer: ModuleLayer,
         modules: List[ModuleInfo],
         issued_modules: List[ModuleInfo],
+        index: Optional[ModuleIndex] = None,
     ) -> None:
         """Scan a single layer directory for modules."""
         for child in layer_dir.iterdir():
@@ -251,7 +328,7 @@ class ModulesController:
             if not pyproject_file.exists():
                 continue
             
-            mi = self._create_module_info_from_path(child, layer, pyproject_file)
+            mi = self._create_module_info_from_path(child, layer, pyproject_file, index)
             modules.append(mi)
             if mi.issues:
                 issued_modules.append(mi)
@@ -261,14 +338,27 @@ class ModulesController:
         module_dir: Path,
         layer: ModuleLayer,
         pyproject_file: Path,
+        index: Optional[ModuleIndex] = None,
     ) -> ModuleInfo:
         """Create ModuleInfo from a module directory path.
         
-        Handles pyproject.toml parsing errors gracefully.
+        Handles pyproject.toml parsing errors gracefully. When an index is
+        given, an unchanged pyproject.toml is served from it instead of re-parsed.
         """
-        try:
-            pyproject_data = self.get_module_pyproject(module_dir)
-        except (FileNotFoundError, ValueError):
+        fingerprint = compute_fingerprint(module_dir, pyproject_file) if index else None
+        entry = index.lookup(module_dir, fingerprint) if index else None
+
+        if entry is not None:
+            pyproject_data = entry.pyproject
+        else:
+            try:
+                pyproject_data = self.get_module_pyproject(module_dir)
+            except (FileNotFoundError, ValueError):
+                pyproject_data = None
+            if index:
+                index.record(module_dir, fingerprint, pyproject_data)
+
+        if pyproject_data is None:
             return self._create_error_module_info(module_dir, layer, pyproject_file)
         
         return self._build_module_info(module_dir, layer, pyproject_file, pyproject_data)
@@ -314,6 +404,7 @@ class ModulesController:
         shows_in_workspace = adhd_data.get("shows_in_workspace")
         
         is_mcp = self._parse_mcp_flag(adhd_data)
+        refresh_inprocess = self._parse_bool_flag(adhd_data, "refresh_inprocess")
         issues = self._validate_pyproject_fields(pyproject_file, version, requirements)
         
         if not isinstance(requirements, list):
@@ -329,6 +420,7 @@ class ModulesController:
             requirements=requirements,
             shows_in_workspace=shows_in_workspace if isinstance(shows_in_workspace, bool) else None,
             issues=issues,
+            refresh_inprocess=refresh_inprocess,
         )
         
         for issue in issues:
@@ -338,10 +430,14 @@ class ModulesController:
 
     def _parse_mcp_flag(self, adhd_data: Dict[str, Any]) -> bool:
         """Parse the mcp flag from [tool.adhd] section."""
-        is_mcp = adhd_data.get("mcp", False)
-        if not isinstance(is_mcp, bool):
-            is_mcp = str(is_mcp).lower() == "true"
-        return is_mcp
+        return self._parse_bool_flag(adhd_data, "mcp")
+
+    def _parse_bool_flag(self, adhd_data: Dict[str, Any], key: str) -> bool:
+        """Parse a boolean flag from [tool.adhd] section, accepting "true" strings."""
+        value = adhd_data.get(key, False)
+        if not isinstance(value, bool):
+            value = str(value).lower() == "true"
+        return value
 
     def _validate_pyproject_fields(
         self,
@@ -391,11 +487,7 @@ class ModulesController:
         if "/" in module_name:
             module_name = module_name.split("/")[-1]
 
-        target_name = module_name.lower().strip()
-        for module in report.modules:
-            if module.name.lower() == target_name:
-                return module
-        return None
+        return report.find(module_name)
 
     def require_module(self, module_name: str) -> ModuleInfo:
         """Get module by name or raise ADHDError with fuzzy suggestions.
@@ -455,7 +547,9 @@ class ModulesController:
         *,
         project_root: Optional[Path] = None,
         logger: Optional[Logger] = None,
-    ) -> None:
+        capture_output: bool = False,
+        inprocess: bool = False,
+    ) -> Optional[str]:
         """Execute a Python script for a module (refresh.py, refresh_full.py, etc.).
 
         Handles relative import detection and PYTHONPATH setup.
@@ -466,13 +560,64 @@ class ModulesController:
             script_label: Human-readable label for log messages.
             project_root: Override for project root directory.
             logger: Override logger instance.
+            capture_output: If True, collect stdout/stderr instead of streaming it.
+            inprocess: If True, import the script and call its entry point in this
+                interpreter. Scripts without a known entry point, and captured
+                runs, still use a subprocess.
+
+        While a refresh is running, each call is timed (and optionally
+        profiled) by the active RefreshTimer.
+
+        Returns:
+            Combined stdout/stderr when capture_output is True, otherwise None.
 
         Raises:
-            ADHDError: If the subprocess exits with non-zero status.
+            ADHDError: If the subprocess exits with non-zero status. With
+                capture_output, the script's output is appended to the message.
+        """
+        timer = self._timer
+        if timer is None:
+            return self._run_module_script(
+                module, script_path, script_label,
+                project_root=project_root, logger=logger,
+                capture_output=capture_output, inprocess=inprocess,
+            )
+        with timer.measure(module, script_path):
+            return self._run_module_script(
+                module, script_path, script_label,
+                project_root=project_root, logger=logger,
+                capture_output=capture_output, inprocess=inprocess,
+                profile_path=timer.profile_path(module, script_path),
+            )
+
+    def _run_module_script(
+        self,
+        module: ModuleInfo,
+        script_path: Path,
+        script_label: str,
+        *,
+        project_root: Optional[Path] = None,
+        logger: Optional[Logger] = None,
+        capture_output: bool = False,
+        inprocess: bool = False,
+        profile_path: Optional[Path] = None,
+    ) -> Optional[str]:
+        """Run a module script once; see _execute_module_script.
+
+        Args:
+            profile_path: If set, run the script under cProfile and write the
+                stats to this file.
         """
         target_root = Path(project_root).resolve() if project_root else self.root_path
         log = logger or self.logger
 
+        if inprocess and not capture_output:
+            from .inprocess_runner import run_script_inprocess
+            log.info(f"{script_label} {module.name} (in-process)...")
+            if run_script_inprocess(module, script_path, target_root, profile_path=profile_path):
+                return None
+            log.debug(f"{script_path.name} for {module.name} has no entry point; using a subprocess")
+
         uses_relative = self._refresh_uses_relative_imports(script_path)
 
         if uses_relative:
@@ -496,11 +641,22 @@ class ModulesController:
             cmd = [sys.executable, str(script_path)]
             env = None
 
+        if profile_path is not None:
+            cmd[1:1] = ["-m", "cProfile", "-o", str(profile_path)]
+
+        capture_kwargs: Dict[str, Any] = {}
+        if capture_output:
+            capture_kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT, "text": True}
+
         try:
             log.info(f"{script_label} {module.name}...")
-            subprocess.run(cmd, cwd=str(target_root), check=True, env=env)
+            result = subprocess.run(cmd, cwd=str(target_root), check=True, env=env, **capture_kwargs)
         except subprocess.CalledProcessError as exc:
-            raise ADHDError(f"{script_path.name} failed for {module.name}: {exc}") from exc
+            message = f"{script_path.name} failed for {module.name}: {exc}"
+            if capture_output and exc.output:
+                message = f"{message}\n{exc.output.rstrip()}"
+            raise ADHDError(message) from exc
+        return result.stdout if capture_output else None
 
     def run_module_refresh_script(
         self,
@@ -508,13 +664,16 @@ class ModulesController:
         *,
         project_root: Optional[Path] = None,
         logger: Optional[Logger] = None,
-    ) -> None:
+        capture_output: bool = False,
+        inprocess: bool = False,
+    ) -> Optional[str]:
         """Execute the refresh.py for a single module if present."""
         if not module.has_refresh_script():
-            return
-        self._execute_module_script(
+            return None
+        return self._execute_module_script(
             module, module.refresh_script_path(), "Refreshing",
             project_root=project_root, logger=logger,
+            capture_output=capture_output, inprocess=inprocess,
         )
 
     def run_module_refresh_full_script(
@@ -523,13 +682,16 @@ class ModulesController:
         *,
         project_root: Optional[Path] = None,
         logger: Optional[Logger] = None,
-    ) -> None:
+        capture_output: bool = False,
+        inprocess: bool = False,
+    ) -> Optional[str]:
         """Execute the refresh_full.py for a single module if present."""
         if not module.has_refresh_full_script():
-            return
-        self._execute_module_script(
+            return None
+        return self._execute_module_script(
             module, module.refresh_full_script_path(), "Running full refresh for",
             project_root=project_root, logger=logger,
+            capture_output=capture_output, inprocess=inprocess,
         )
 
     def run_initializers(
@@ -570,7 +732,7 @@ class ModulesController:
         # Apply module filter first (if provided)
         filter_provided = module_filter is not None and module_filter.has_filters
         if filter_provided:
-            modules = module_filter.filter_modules(modules)
+            modules = module_filter.filter_modules(modules, report.git_states_for(module_filter))
         
         visible_modules: List[Dict[str, Any]] = []
 
@@ -644,6 +806,10 @@ class ModulesController:
         *,
         skip_sync: bool = False,
         full: bool = False,
+        jobs: int = 1,
+        inprocess: bool = False,
+        force: bool = False,
+        profile: bool = False,
     ) -> None:
         """Refresh project: optionally sync, then run refresh scripts.
 
@@ -651,54 +817,252 @@ class ModulesController:
         refresh.py runs first; on --full, refresh_full.py runs after it. Modules
         without refresh scripts are silently skipped.
 
+        A full-project refresh is incremental: modules whose fingerprint (module
+        files plus dependency fingerprints) matches their last successful refresh
+        are skipped. Refreshing a single module always runs its scripts.
+
         Args:
             module_name: If provided, refresh only this module. Otherwise refresh all.
             skip_sync: If True, skip the uv sync step.
             full: If True, also run refresh_full.py scripts (heavy tier).
+            jobs: Maximum number of modules refreshed concurrently. With jobs > 1,
+                a module starts as soon as all of its dependencies have finished.
+            inprocess: If True, run every refresh script inside this interpreter.
+                Modules can opt in individually with refresh_inprocess = true
+                under [tool.adhd]. Ignored when jobs > 1, since concurrent
+                scripts need separate processes to keep output and cwd isolated.
+            force: If True, refresh every module regardless of fingerprints.
+            profile: If True, run each script under cProfile and write a .prof
+                file per module script (see refresh_timing).
+
+        Every script run is timed; a summary table is logged at the end and the
+        timings are appended to the refresh timing history.
 
         Raises:
             ADHDError: If module not found or uv missing. Individual script failures
                 are logged and do not halt the refresh.
         """
+        from .refresh_timing import RefreshTimer
+
         if not skip_sync:
             self.logger.info("Running uv sync before refresh...")
             self.sync()
             self.logger.info("\u2705 uv sync completed")
 
+        report = self.list_all_modules()
+        concurrent = jobs > 1 and not module_name
+        timer = RefreshTimer(self.root_path, profile=profile, concurrent=concurrent, logger=self.logger)
+        self._timer = timer
+        try:
+            if module_name:
+                self._refresh_single(report, module_name, full=full, inprocess=inprocess)
+            else:
+                self._refresh_all(report, full=full, jobs=jobs, inprocess=inprocess, force=force)
+        finally:
+            self._timer = None
+
+        if timer.timings:
+            self.logger.info(timer.format_summary(timer.previous_walls()))
+            timer.save(full=full, jobs=jobs if concurrent else 1)
+            if profile:
+                self.logger.info(f"cProfile stats written to {timer.profiles_dir}")
+
         if module_name:
-            module = self.require_module(module_name)
-            self._run_refresh_for_module(module, full=full)
             self.logger.info(f"\u2705 Module {module_name} refreshed!")
         else:
-            self.logger.info("Refreshing all modules...")
-            report = self.list_all_modules()
+            self.logger.info("\u2705 Project refresh completed!")
+
+    def _refresh_single(self, report: ModulesReport, module_name: str, *, full: bool, inprocess: bool) -> None:
+        """Refresh one module unconditionally, recording its fingerprint."""
+        from .refresh_state import IncrementalRefresh
+
+        module = self.require_module(module_name)
+        tracker = IncrementalRefresh(self.root_path, report.modules, force=True, logger=self.logger)
+        ok = self._run_refresh_for_module(module, full=full, inprocess=inprocess)
+        tracker.record(module, full=full, success=ok)
+        tracker.save()
+
+    def _refresh_all(
+        self,
+        report: ModulesReport,
+        *,
+        full: bool,
+        jobs: int,
+        inprocess: bool,
+        force: bool,
+    ) -> None:
+        """Refresh every changed module in dependency order (or in parallel)."""
+        from .refresh_state import IncrementalRefresh
 
+        self.logger.info("Refreshing all modules...")
+        tracker = IncrementalRefresh(self.root_path, report.modules, force=force, logger=self.logger)
+
+        if jobs > 1:
+            if inprocess:
+                self.logger.warning("--inprocess is ignored with --jobs > 1; using subprocesses")
+            self._refresh_parallel(report.modules, full=full, jobs=jobs, tracker=tracker)
+        else:
             from .refresh_order import sort_modules_for_refresh
             ordered_modules = sort_modules_for_refresh(report.modules)
             self.logger.debug(f"Refresh order: {[m.name for m in ordered_modules]}")
 
             for module in ordered_modules:
-                self._run_refresh_for_module(module, full=full)
+                if tracker.is_up_to_date(module, full=full):
+                    continue
+                ok = self._run_refresh_for_module(module, full=full, inprocess=inprocess)
+                tracker.record(module, full=full, success=ok)
+
+        tracker.save()
+        if tracker.skipped:
+            self.logger.info(
+                f"Skipped {len(tracker.skipped)} unchanged modules (use --force to refresh all)"
+            )
+            self.logger.debug(f"Unchanged: {tracker.skipped}")
 
-            self.logger.info("\u2705 Project refresh completed!")
+    def watch_refresh(
+        self,
+        *,
+        full: bool = False,
+        inprocess: bool = False,
+        interval: Optional[float] = None,
+        debounce: Optional[float] = None,
+    ) -> None:
+        """Keep refreshing modules as their files change, until Ctrl+C.
+
+        Changed paths are mapped to their owning modules; those modules and
+        everything that depends on them are refreshed in dependency order.
+        See RefreshWatcher for polling and debounce details.
+
+        Args:
+            full: If True, also run refresh_full.py scripts.
+            inprocess: If True, run refresh scripts inside this interpreter.
+            interval: Seconds between filesystem polls.
+            debounce: Quiet period (seconds) before a burst of changes is refreshed.
+        """
+        from .refresh_watcher import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, RefreshWatcher
+
+        watcher = RefreshWatcher(
+            self,
+            full=full,
+            inprocess=inprocess,
+            interval=DEFAULT_POLL_INTERVAL if interval is None else interval,
+            debounce=DEFAULT_DEBOUNCE if debounce is None else debounce,
+        )
+        try:
+            watcher.watch()
+        except KeyboardInterrupt:
+            self.logger.info("Stopped watching")
 
-    def _run_refresh_for_module(self, module: ModuleInfo, *, full: bool = False) -> None:
+    def _run_refresh_for_module(
+        self,
+        module: ModuleInfo,
+        *,
+        full: bool = False,
+        inprocess: bool = False,
+    ) -> bool:
         """Run refresh scripts for a single module, logging errors without halting.
 
         Silently skips scripts that don't exist. On failure, logs the error and
         continues (does not raise).
+
+        Returns:
+            True if every script that ran succeeded.
         """
+        inprocess = inprocess or module.refresh_inprocess
+        ok = True
+
         if module.has_refresh_script():
             try:
-                self.run_module_refresh_script(module)
+                self.run_module_refresh_script(module, inprocess=inprocess)
             except ADHDError as e:
                 self.logger.error(str(e))
+                ok = False
 
         if full and module.has_refresh_full_script():
             try:
-                self.run_module_refresh_full_script(module)
+                self.run_module_refresh_full_script(module, inprocess=inprocess)
             except ADHDError as e:
                 self.logger.error(str(e))
+                ok = False
+
+        return ok
+
+    def _refresh_parallel(
+        self,
+        modules: List[ModuleInfo],
+        *,
+        full: bool,
+        jobs: int,
+        tracker: Optional["IncrementalRefresh"] = None,
+    ) -> None:
+        """Refresh modules on a bounded thread pool, following the dependency graph.
+
+        Uses TopologicalSorter.get_ready()/done() so every module whose ADHD
+        dependencies have finished is scheduled immediately. Each module's script
+        output is buffered and printed in one block when it completes, so output
+        from concurrent scripts never interleaves.
+        """
+        from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+        from .refresh_order import prepare_refresh_sorter
+
+        sorter, name_to_module = prepare_refresh_sorter(modules)
+        self.logger.debug(f"Parallel refresh with {jobs} workers")
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            running: Dict[Future, str] = {}
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    future = pool.submit(
+                        self._refresh_module_captured, name_to_module[name], full=full, tracker=tracker,
+                    )
+                    running[future] = name
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    output, errors = future.result()
+                    if output:
+                        sys.stdout.write(output if output.endswith("\n") else output + "\n")
+                        sys.stdout.flush()
+                    for error in errors:
+                        self.logger.error(error)
+                    sorter.done(name)
+
+    def _refresh_module_captured(
+        self,
+        module: ModuleInfo,
+        *,
+        full: bool,
+        tracker: Optional["IncrementalRefresh"] = None,
+    ) -> Tuple[str, List[str]]:
+        """Worker for _refresh_parallel: run a module's scripts with buffered output.
+
+        Dependencies are always finished before this runs, so the tracker can
+        fingerprint the module here, off the scheduling thread.
+
+        Returns:
+            Tuple of (combined script output, error messages). Never raises for
+            script failures, mirroring _run_refresh_for_module.
+        """
+        if tracker is not None and tracker.is_up_to_date(module, full=full):
+            return "", []
+
+        chunks: List[str] = []
+        errors: List[str] = []
+
+        runners = [self.run_module_refresh_script]
+        if full:
+            runners.append(self.run_module_refresh_full_script)
+
+        for runner in runners:
+            try:
+                chunks.append(runner(module, capture_output=True) or "")
+            except ADHDError as e:
+                errors.append(str(e))
+
+        if tracker is not None:
+            tracker.record(module, full=full, success=not errors)
+        return "".join(chunks), errors
 
     # ========================================================================
     # DOCTOR COMMAND (delegated)
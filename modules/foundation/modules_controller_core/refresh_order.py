@@ -1,14 +1,15 @@
 """Refresh Order — Dependency-based topological sort for module refresh execution.
 
 Provides sort_modules_for_refresh() which orders modules so that dependencies
-are refreshed before their dependents. Uses graphlib.TopologicalSorter on
-declared pyproject.toml dependencies.
+are refreshed before their dependents, and prepare_refresh_sorter() for
+schedulers that run independent modules concurrently. Both use
+graphlib.TopologicalSorter on declared pyproject.toml dependencies.
 """
 
 from __future__ import annotations
 
 import graphlib
-from typing import TYPE_CHECKING, Dict, List, Set
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
 
 from logger_util import Logger
 from exceptions_core import ADHDError
@@ -48,10 +49,7 @@ def sort_modules_for_refresh(modules: List[ModuleInfo]) -> List[ModuleInfo]:
         sorter = graphlib.TopologicalSorter(graph)
         ordered_names = list(sorter.static_order())
     except graphlib.CycleError as exc:
-        raise ADHDError(
-            f"Circular dependency detected in module graph: {exc}. "
-            "Fix the cycle in pyproject.toml dependencies before refreshing."
-        ) from exc
+        raise _cycle_error(exc) from exc
 
     # Filter to only modules in the input list (topo sort may include names
     # that aren't in our module set if the graph references them).
@@ -60,6 +58,43 @@ def sort_modules_for_refresh(modules: List[ModuleInfo]) -> List[ModuleInfo]:
     return ordered
 
 
+def prepare_refresh_sorter(
+    modules: List[ModuleInfo],
+) -> Tuple[graphlib.TopologicalSorter, Dict[str, ModuleInfo]]:
+    """Build a prepared TopologicalSorter for incremental refresh scheduling.
+
+    The caller drives it with get_ready()/done(): every name returned by
+    get_ready() has all of its ADHD dependencies already marked done, so those
+    modules may be refreshed concurrently.
+
+    Args:
+        modules: Unordered list of ModuleInfo from list_all_modules().
+
+    Returns:
+        Tuple of (prepared sorter over module names, name -> ModuleInfo map).
+
+    Raises:
+        ADHDError: If circular dependencies are detected.
+    """
+    name_to_module = {m.name: m for m in modules}
+    graph = _build_dependency_graph(modules, known_modules=set(name_to_module.keys()))
+
+    sorter = graphlib.TopologicalSorter(graph)
+    try:
+        sorter.prepare()
+    except graphlib.CycleError as exc:
+        raise _cycle_error(exc) from exc
+
+    return sorter, name_to_module
+
+
+def _cycle_error(exc: graphlib.CycleError) -> ADHDError:
+    return ADHDError(
+        f"Circular dependency detected in module graph: {exc}. "
+        "Fix the cycle in pyproject.toml dependencies before refreshing."
+    )
+
+
 def _build_dependency_graph(
     modules: List[ModuleInfo],
     *,
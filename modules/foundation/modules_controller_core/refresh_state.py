@@ -0,0 +1,177 @@
+"""Refresh State - Per-module fingerprints for incremental refresh.
+
+A module's fingerprint is a SHA-256 over:
+
+- every file in the module directory (relative path + content), skipping
+  hidden entries, __pycache__ and compiled bytecode
+- the fingerprints of its ADHD dependencies (from _build_dependency_graph)
+
+so a change anywhere in a module also invalidates everything that depends on
+it. After a successful refresh the fingerprint is recomputed (scripts may
+write into their own module, e.g. config_keys.py) and stored in
+project/data/modules_controller_core/refresh_state.json. The next refresh
+skips modules whose fingerprint still matches.
+
+Inputs outside the module tree (root .config, .github/, ...) are not tracked;
+use ``adhd refresh --force`` after changing those.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .module_index import INDEX_DATA_DIR
+
+if TYPE_CHECKING:
+    from logger_util import Logger
+    from .modules_controller import ModuleInfo
+
+STATE_VERSION = 1
+STATE_FILENAME = "refresh_state.json"
+
+# Tier keys stored per module
+TIER_REFRESH = "refresh"
+TIER_REFRESH_FULL = "refresh_full"
+
+
+def is_tracked_dir(name: str) -> bool:
+    """Whether a directory inside a module counts as module input."""
+    return not name.startswith(".") and name != "__pycache__"
+
+
+def is_tracked_file(name: str) -> bool:
+    """Whether a file inside a module counts as module input."""
+    return not name.startswith(".") and not name.endswith((".pyc", ".pyo"))
+
+
+def hash_module_tree(module_path: Path) -> str:
+    """Return a SHA-256 hex digest of a module's files (paths and contents)."""
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(module_path):
+        dirnames[:] = sorted(d for d in dirnames if is_tracked_dir(d))
+        for filename in sorted(filenames):
+            if not is_tracked_file(filename):
+                continue
+            file_path = Path(dirpath) / filename
+            digest.update(file_path.relative_to(module_path).as_posix().encode())
+            digest.update(b"\0")
+            try:
+                with file_path.open("rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 16), b""):
+                        digest.update(chunk)
+            except OSError:
+                digest.update(b"<unreadable>")
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class IncrementalRefresh:
+    """Tracks module fingerprints across refresh runs to skip unchanged modules.
+
+    Usage:
+        tracker = IncrementalRefresh(root_path, modules, force=False)
+        for module in ordered_modules:
+            if tracker.is_up_to_date(module, full=full):
+                continue
+            ok = run_scripts(module)
+            tracker.record(module, full=full, success=ok)
+        tracker.save()
+    """
+
+    def __init__(
+        self,
+        root_path: Path,
+        modules: List["ModuleInfo"],
+        *,
+        force: bool = False,
+        logger: Optional["Logger"] = None,
+    ):
+        from .refresh_order import _build_dependency_graph
+
+        self.state_file = Path(root_path) / INDEX_DATA_DIR / STATE_FILENAME
+        self.logger = logger
+        self.force = force
+        self._modules = {m.name: m for m in modules}
+        self._graph = _build_dependency_graph(modules, known_modules=set(self._modules))
+        self._fingerprints: Dict[str, str] = {}
+        self._state: Dict[str, Dict[str, str]] = {}
+        self.skipped: List[str] = []
+        self._load()
+
+    def _load(self) -> None:
+        if not self.state_file.exists():
+            return
+        try:
+            raw = json.loads(self.state_file.read_text(encoding="utf-8"))
+            if raw.get("version") != STATE_VERSION:
+                return
+            self._state = {
+                name: dict(tiers) for name, tiers in raw["modules"].items() if isinstance(tiers, dict)
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            if self.logger:
+                self.logger.debug(f"Discarding refresh state {self.state_file}: {e}")
+            self._state = {}
+
+    def save(self) -> None:
+        """Write the refresh state, dropping modules that no longer exist."""
+        payload = {
+            "version": STATE_VERSION,
+            "modules": {name: tiers for name, tiers in sorted(self._state.items()) if name in self._modules},
+        }
+        tmp_file = self.state_file.with_suffix(".json.tmp")
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp_file, self.state_file)
+        except OSError as e:
+            if self.logger:
+                self.logger.debug(f"Could not write refresh state {self.state_file}: {e}")
+
+    def fingerprint(self, module_name: str) -> str:
+        """Return the current fingerprint of a module, computing dependencies first."""
+        cached = self._fingerprints.get(module_name)
+        if cached is not None:
+            return cached
+        module = self._modules[module_name]
+        digest = hashlib.sha256(hash_module_tree(module.path).encode())
+        for dep_name in sorted(self._graph.get(module_name, ())):
+            digest.update(dep_name.encode())
+            digest.update(self.fingerprint(dep_name).encode())
+        fingerprint = digest.hexdigest()
+        self._fingerprints[module_name] = fingerprint
+        return fingerprint
+
+    def is_up_to_date(self, module: "ModuleInfo", *, full: bool = False) -> bool:
+        """Check whether the module's last successful refresh saw its current inputs.
+
+        Always False when force is set. Records the module in ``skipped`` when True.
+        """
+        if self.force:
+            return False
+        recorded = self._state.get(module.name, {})
+        fingerprint = self.fingerprint(module.name)
+        up_to_date = recorded.get(TIER_REFRESH) == fingerprint
+        if full and module.has_refresh_full_script():
+            up_to_date = up_to_date and recorded.get(TIER_REFRESH_FULL) == fingerprint
+        if up_to_date:
+            self.skipped.append(module.name)
+        return up_to_date
+
+    def record(self, module: "ModuleInfo", *, full: bool = False, success: bool = True) -> None:
+        """Store the post-refresh fingerprint, or forget the module on failure."""
+        # Scripts may have rewritten files in the module; re-hash after the run.
+        self._fingerprints.pop(module.name, None)
+        if not success:
+            self._state.pop(module.name, None)
+            return
+        fingerprint = self.fingerprint(module.name)
+        tiers = {TIER_REFRESH: fingerprint}
+        # A lighter run keeps the full tier only if nothing changed since it last ran.
+        if full or self._state.get(module.name, {}).get(TIER_REFRESH_FULL) == fingerprint:
+            tiers[TIER_REFRESH_FULL] = fingerprint
+        self._state[module.name] = tiers
@@ -0,0 +1,212 @@
+"""Refresh Timing - Per-script timing, profiling and history for adhd refresh.
+
+Every refresh script run is measured for:
+
+- wall-clock time
+- CPU time: ``resource.getrusage`` deltas of RUSAGE_CHILDREN (subprocess
+  scripts) plus RUSAGE_SELF (in-process scripts)
+- peak RSS: ru_maxrss is a high-water mark, not a counter, so a script's peak
+  is only known when it raised the mark; otherwise it is reported as "-"
+
+With --jobs > 1 scripts overlap, so rusage deltas cannot be attributed to one
+script and only wall-clock time is recorded.
+
+After a refresh the timings are appended to
+project/data/modules_controller_core/refresh_timings.json (last HISTORY_LIMIT
+runs) and a summary table compares each script with its previous run. With
+--profile, each script runs under cProfile and writes
+project/data/modules_controller_core/profiles/<module>.<script>.prof.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .module_index import INDEX_DATA_DIR
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from logger_util import Logger
+    from .modules_controller import ModuleInfo
+
+TIMINGS_VERSION = 1
+TIMINGS_FILENAME = "refresh_timings.json"
+PROFILES_DIRNAME = "profiles"
+HISTORY_LIMIT = 20
+
+# A script is flagged as a regression when it got this much slower than its previous run
+REGRESSION_FACTOR = 1.5
+REGRESSION_MIN_SECONDS = 0.5
+
+
+@dataclass
+class ScriptTiming:
+    """Measurements for one refresh script run.
+
+    Attributes:
+        module: Module name.
+        script: Script file name (refresh.py, refresh_full.py).
+        wall: Wall-clock seconds.
+        cpu: User + system CPU seconds, or None if not attributable.
+        peak_rss_kb: Peak resident set size in KiB, or None if unknown.
+        ok: Whether the script succeeded.
+    """
+    module: str
+    script: str
+    wall: float
+    cpu: Optional[float] = None
+    peak_rss_kb: Optional[int] = None
+    ok: bool = True
+
+
+def _rusage_snapshot() -> Optional[Tuple[float, int, int]]:
+    """Return (self + children CPU seconds, self maxrss KiB, children maxrss KiB)."""
+    if resource is None:
+        return None
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+    # ru_maxrss is bytes on macOS, KiB elsewhere
+    scale = 1024 if sys.platform == "darwin" else 1
+    return cpu, own.ru_maxrss // scale, children.ru_maxrss // scale
+
+
+class RefreshTimer:
+    """Collects ScriptTiming entries during one refresh run (thread-safe)."""
+
+    def __init__(
+        self,
+        root_path: Path,
+        *,
+        profile: bool = False,
+        concurrent: bool = False,
+        logger: Optional["Logger"] = None,
+    ):
+        self.data_dir = Path(root_path) / INDEX_DATA_DIR
+        self.history_file = self.data_dir / TIMINGS_FILENAME
+        self.profiles_dir = self.data_dir / PROFILES_DIRNAME
+        self.profile = profile
+        self.concurrent = concurrent
+        self.logger = logger
+        self.timings: List[ScriptTiming] = []
+        self._lock = threading.Lock()
+
+    def profile_path(self, module: "ModuleInfo", script_path: Path) -> Optional[Path]:
+        """Return the .prof output path for a script, or None when not profiling."""
+        if not self.profile:
+            return None
+        self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        return self.profiles_dir / f"{module.name}.{script_path.stem}.prof"
+
+    @contextmanager
+    def measure(self, module: "ModuleInfo", script_path: Path) -> Iterator[None]:
+        """Time the enclosed script run and record it, marking it failed on exceptions."""
+        before = None if self.concurrent else _rusage_snapshot()
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            timing = ScriptTiming(
+                module=module.name,
+                script=script_path.name,
+                wall=time.perf_counter() - start,
+                ok=ok,
+            )
+            after = None if before is None else _rusage_snapshot()
+            if before is not None and after is not None:
+                timing.cpu = after[0] - before[0]
+                raised = [a for a, b in zip(after[1:], before[1:]) if a > b]
+                timing.peak_rss_kb = max(raised) if raised else None
+            with self._lock:
+                self.timings.append(timing)
+
+    # ── history ─────────────────────────────────────────────────────────────
+
+    def _load_runs(self) -> List[Dict]:
+        if not self.history_file.exists():
+            return []
+        try:
+            raw = json.loads(self.history_file.read_text(encoding="utf-8"))
+            if raw.get("version") != TIMINGS_VERSION:
+                return []
+            return [run for run in raw["runs"] if isinstance(run, dict)]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            if self.logger:
+                self.logger.debug(f"Discarding refresh timings {self.history_file}: {e}")
+            return []
+
+    def previous_walls(self) -> Dict[Tuple[str, str], float]:
+        """Return the most recent recorded wall time per (module, script)."""
+        previous: Dict[Tuple[str, str], float] = {}
+        for run in self._load_runs():  # oldest first; newer runs overwrite
+            for entry in run.get("timings", []):
+                try:
+                    previous[(entry["module"], entry["script"])] = float(entry["wall"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+        return previous
+
+    def save(self, *, full: bool = False, jobs: int = 1) -> None:
+        """Append this run to the timing history, keeping the last HISTORY_LIMIT runs."""
+        if not self.timings:
+            return
+        runs = self._load_runs()
+        runs.append({
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "full": full,
+            "jobs": jobs,
+            "timings": [asdict(t) for t in self.timings],
+        })
+        payload = {"version": TIMINGS_VERSION, "runs": runs[-HISTORY_LIMIT:]}
+        tmp_file = self.history_file.with_suffix(".json.tmp")
+        try:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp_file, self.history_file)
+        except OSError as e:
+            if self.logger:
+                self.logger.debug(f"Could not write refresh timings {self.history_file}: {e}")
+
+    # ── report ──────────────────────────────────────────────────────────────
+
+    def format_summary(self, previous: Optional[Dict[Tuple[str, str], float]] = None) -> str:
+        """Format a table of this run's timings, slowest first."""
+        previous = previous or {}
+        header = ("Module", "Script", "Wall", "CPU", "Peak RSS", "Previous")
+        rows: List[Tuple[str, ...]] = []
+        for t in sorted(self.timings, key=lambda t: t.wall, reverse=True):
+            prev = previous.get((t.module, t.script))
+            prev_str = "-" if prev is None else f"{prev:.2f}s"
+            if prev is not None and t.wall >= prev * REGRESSION_FACTOR and t.wall - prev >= REGRESSION_MIN_SECONDS:
+                prev_str += " \u26a0\ufe0f slower"
+            rows.append((
+                t.module if t.ok else f"{t.module} (failed)",
+                t.script,
+                f"{t.wall:.2f}s",
+                "-" if t.cpu is None else f"{t.cpu:.2f}s",
+                "-" if t.peak_rss_kb is None else f"{t.peak_rss_kb / 1024:.1f} MB",
+                prev_str,
+            ))
+
+        widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+        lines = ["\n\u23f1\ufe0f  Refresh timings:"]
+        for row in (header, *rows):
+            lines.append("  " + "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+        total = sum(t.wall for t in self.timings)
+        lines.append(f"  Total script time: {total:.2f}s")
+        return "\n".join(lines)
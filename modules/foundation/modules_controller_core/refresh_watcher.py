@@ -0,0 +1,207 @@
+"""Refresh Watcher - Long-lived ``adhd refresh --watch`` loop.
+
+Polls the modules/ tree with os.scandir (no extra dependencies) and, once a
+burst of changes has settled for the debounce window, re-runs the refresh
+scripts of:
+
+- every module owning a changed path (resolved against the scanned module
+  directories), and
+- every module that transitively depends on one of those,
+
+in dependency order. A changed pyproject.toml, or a path that belongs to no
+known module (e.g. a new module directory), triggers a rescan first; the
+persisted module index keeps that cheap.
+
+Files written by the refresh scripts themselves are absorbed after each batch,
+so a script that regenerates a file in its own module does not retrigger
+itself: a change is absorbed only when its owner ran in the batch and the file
+is not newer than the end of that owner's refresh. Every other change made
+while a batch runs (another module, or a module saved again after its script
+finished) stays pending and triggers the next batch.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .module_types import MODULES_DIR
+from .refresh_state import is_tracked_dir, is_tracked_file
+
+if TYPE_CHECKING:
+    from .modules_controller import ModuleInfo, ModulesController
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.3
+
+# path -> (mtime_ns, size)
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def snapshot_tree(root: Path) -> Snapshot:
+    """Stat every tracked file below *root* (iterative os.scandir walk)."""
+    snapshot: Snapshot = {}
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if is_tracked_dir(entry.name):
+                                stack.append(entry.path)
+                        elif is_tracked_file(entry.name):
+                            st = entry.stat()
+                            snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue  # vanished between listing and stat
+        except OSError:
+            continue
+    return snapshot
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot) -> Set[str]:
+    """Return paths that were added, removed, or modified between snapshots."""
+    changed = {path for path, sig in after.items() if before.get(path) != sig}
+    changed.update(path for path in before if path not in after)
+    return changed
+
+
+class RefreshWatcher:
+    """Re-run refresh scripts for modules affected by filesystem changes.
+
+    Usage:
+        watcher = RefreshWatcher(controller, full=False)
+        watcher.watch()  # blocks until KeyboardInterrupt
+    """
+
+    def __init__(
+        self,
+        controller: "ModulesController",
+        *,
+        full: bool = False,
+        inprocess: bool = False,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.controller = controller
+        self.logger = controller.logger
+        self.full = full
+        self.inprocess = inprocess
+        self.interval = interval
+        self.debounce = debounce
+        self._clock = clock
+        self._sleep = sleep
+        self._modules_dir = controller.root_path / MODULES_DIR
+        self._owners: Dict[str, "ModuleInfo"] = {}
+        self._index_modules()
+        self._snapshot = snapshot_tree(self._modules_dir)
+
+    def _index_modules(self) -> None:
+        report = self.controller.list_all_modules()
+        self._owners = {str(m.path.resolve()): m for m in report.modules}
+
+    def poll(self) -> Set[str]:
+        """Return paths changed since the previous poll and advance the baseline."""
+        current = snapshot_tree(self._modules_dir)
+        changed = diff_snapshots(self._snapshot, current)
+        self._snapshot = current
+        return changed
+
+    def _owner_of(self, path: str) -> Optional["ModuleInfo"]:
+        candidate = Path(path).resolve()
+        for parent in (candidate, *candidate.parents):
+            module = self._owners.get(str(parent))
+            if module is not None:
+                return module
+            if parent == self._modules_dir:
+                break
+        return None
+
+    def affected_modules(self, changed_paths: Iterable[str]) -> List["ModuleInfo"]:
+        """Map changed paths to owning modules plus dependents, in refresh order."""
+        from .refresh_order import sort_modules_for_refresh
+
+        changed_paths = list(changed_paths)
+        if any(Path(p).name == "pyproject.toml" or self._owner_of(p) is None for p in changed_paths):
+            self.controller.scan_all_modules()
+            self._index_modules()
+
+        report = self.controller.list_all_modules()
+        affected: Set[str] = set()
+        queue = [m.name for m in (self._owner_of(p) for p in changed_paths) if m is not None]
+        while queue:
+            name = queue.pop()
+            if name in affected:
+                continue
+            affected.add(name)
+            queue.extend(report.dependents(name) - affected)
+
+        # Dependents are upward-closed, so ordering the subset keeps every edge between members.
+        return sort_modules_for_refresh([m for m in report.modules if m.name in affected])
+
+    def refresh_changed(self, changed_paths: Iterable[str]) -> List[str]:
+        """Refresh modules affected by *changed_paths*; return their names in run order."""
+        from .refresh_state import IncrementalRefresh
+
+        modules = self.affected_modules(changed_paths)
+        if not modules:
+            return []
+
+        self.logger.info(f"Changes detected; refreshing {', '.join(m.name for m in modules)}")
+        report = self.controller.list_all_modules()
+        tracker = IncrementalRefresh(self.controller.root_path, report.modules, force=True, logger=self.logger)
+        finished: Dict[str, int] = {}
+        for module in modules:
+            ok = self.controller._run_refresh_for_module(module, full=self.full, inprocess=self.inprocess)
+            finished[module.name] = time.time_ns()
+            tracker.record(module, full=self.full, success=ok)
+        tracker.save()
+
+        self._absorb_refresh_writes(finished)
+        return [m.name for m in modules]
+
+    def _absorb_refresh_writes(self, finished: Dict[str, int]) -> None:
+        """Fold the batch's own writes into the baseline so they do not retrigger.
+
+        Args:
+            finished: Module name -> wall-clock ns at which its refresh ended.
+        """
+        current = snapshot_tree(self._modules_dir)
+        for path in diff_snapshots(self._snapshot, current):
+            owner = self._owner_of(path)
+            if owner is None or owner.name not in finished:
+                continue
+            sig = current.get(path)
+            if sig is None:
+                self._snapshot.pop(path, None)
+            elif sig[0] <= finished[owner.name]:
+                self._snapshot[path] = sig
+
+    def watch(self, *, max_batches: Optional[int] = None) -> None:
+        """Poll until interrupted, refreshing after each debounced burst of changes.
+
+        Args:
+            max_batches: Stop after this many refresh batches (None = run forever).
+        """
+        self.logger.info(f"Watching {self._modules_dir} for changes (Ctrl+C to stop)...")
+        pending: Set[str] = set()
+        last_change = 0.0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            changed = self.poll()
+            now = self._clock()
+            if changed:
+                pending |= changed
+                last_change = now
+            elif pending and now - last_change >= self.debounce:
+                self.refresh_changed(pending)
+                pending = set()
+                batches += 1
+                continue
+            self._sleep(self.interval)
@@ -0,0 +1,14 @@
+"""Shared fixtures for the modules_controller_core tests."""
+
+import pytest
+
+from modules_controller_core.modules_controller import ModulesController
+
+
+@pytest.fixture(autouse=True)
+def _forget_controllers():
+    """Drop the ModulesController singletons a test created (keyed by project root)."""
+    before = set(ModulesController._instances)
+    yield
+    for root in set(ModulesController._instances) - before:
+        del ModulesController._instances[root]
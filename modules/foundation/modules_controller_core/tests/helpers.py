@@ -0,0 +1,33 @@
+"""Shared helpers for the modules_controller_core tests."""
+
+from pathlib import Path
+from typing import Optional
+
+
+def write_module(
+    root: Path,
+    name: str,
+    *,
+    layer: str = "foundation",
+    version: str = "1.0.0",
+    deps: Optional[list[str]] = None,
+    trace: Optional[Path] = None,
+    script: Optional[str] = None,
+) -> Path:
+    """Write modules/<layer>/<name>/pyproject.toml and, optionally, a refresh.py.
+
+    With *trace*, refresh.py appends the module name to that file; otherwise
+    *script* (if given) is written as refresh.py.
+    """
+    module_dir = root / "modules" / layer / name
+    module_dir.mkdir(parents=True, exist_ok=True)
+    dep_list = ", ".join(f'"{d}"' for d in (deps or []))
+    (module_dir / "pyproject.toml").write_text(
+        f'[project]\nname = "{name}"\nversion = "{version}"\ndependencies = [{dep_list}]\n\n'
+        f'[tool.adhd]\nlayer = "{layer}"\n'
+    )
+    if trace is not None:
+        script = f"with open({str(trace)!r}, 'a') as f: f.write({name!r} + '\\n')\n"
+    if script is not None:
+        (module_dir / "refresh.py").write_text(script)
+    return module_dir
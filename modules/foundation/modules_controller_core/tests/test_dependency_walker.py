@@ -1,9 +1,10 @@
-"""Tests for DependencyWalker.get_reverse_deps — reverse dependency lookup.
+"""Tests for DependencyWalker.get_reverse_deps — reverse dependency lookup —
+and the ModulesReport name index / dependency adjacency backing it.
 
 MOCKS USED IN THIS FILE:
 - controller (MagicMock) – stands in for ModulesController.
-  list_all_modules() returns a pre-built ModulesReport.
-  get_module_pyproject() returns per-module dependency dicts.
+  list_all_modules() returns a pre-built ModulesReport whose modules'
+  requirements mirror the per-module dependency map.
 """
 
 import pytest
@@ -38,8 +39,8 @@ def _build_controller(
     modules: list[ModuleInfo],
     dep_map: dict[str, list[str]],
 ) -> MagicMock:
-    """Build a mock controller whose list_all_modules and get_module_pyproject
-    return data consistent with *modules* and *dep_map*.
+    """Build a mock controller whose list_all_modules report is consistent
+    with *modules* and *dep_map*.
 
     MOCK JUSTIFICATION:
     - controller is a collaborator with heavy filesystem I/O (scans module
@@ -52,19 +53,12 @@ def _build_controller(
         dep_map: module_name -> list of dependency strings (kebab-case ok).
     """
     controller = MagicMock()
+    for module in modules:
+        module.requirements = list(dep_map.get(module.name, []))
     report = ModulesReport(modules=modules, issued_modules=[], root_path=Path("/fake"))
     controller.list_all_modules.return_value = report
-
-    def _pyproject_for(path: Path) -> dict:
-        """Return a synthetic pyproject dict for the module at *path*."""
-        mod_name = path.name
-        deps = dep_map.get(mod_name, [])
-        return {
-            "project": {"dependencies": deps},
-            "tool": {"adhd": {"layer": "foundation"}},
-        }
-
-    controller.get_module_pyproject.side_effect = _pyproject_for
+    # The walker must never fall back to re-reading pyproject.toml
+    controller.get_module_pyproject.side_effect = AssertionError("pyproject re-read")
 
     # get_module_by_name — look up by name in our module list
     name_lookup = {m.name: m for m in modules}
@@ -201,3 +195,111 @@ class TestGetReverseDeps:
         result = walker.get_reverse_deps("does_not_exist")
 
         assert result == set()
+
+
+class TestModulesReportIndexes:
+    """Test the name index and dependency adjacency on ModulesReport."""
+
+    def test_find_is_case_insensitive(self):
+        a = _make_module("Config_Manager")
+        report = ModulesReport(modules=[a])
+
+        assert report.find("config_manager") is a
+        assert report.find(" CONFIG_MANAGER ") is a
+        assert report.find("missing") is None
+
+    def test_first_duplicate_wins(self):
+        first = _make_module("dup")
+        second = _make_module("dup", layer=ModuleLayer.DEV)
+        report = ModulesReport(modules=[first, second])
+
+        assert report.find("dup") is first
+
+    def test_forward_and_reverse_adjacency(self):
+        core = _make_module("core_lib")
+        app = _make_module("app", requirements=["core-lib>=1.0", "rich"])
+        report = ModulesReport(modules=[core, app])
+
+        assert report.dependency_names("app") == ["core_lib", "rich"]
+        assert report.adhd_dependencies("app") == {"core_lib"}
+        assert report.dependents("core_lib") == {"app"}
+        assert report.dependents("rich") == {"app"}
+        assert report.dependents("app") == set()
+
+
+class TestAnalyzeAll:
+    """Test DependencyWalker.analyze_all() against per-module walks."""
+
+    @staticmethod
+    def _assert_matches_walk(walker: DependencyWalker, names: list[str]) -> None:
+        closures = walker.analyze_all()
+        assert list(closures) == names
+        for name in names:
+            expected = walker.walk_dependencies(name)
+            got = closures[name]
+            assert got.all_deps == expected.all_deps, name
+            assert got.adhd_deps == expected.adhd_deps, name
+            assert got.external_deps == expected.external_deps, name
+            assert sorted(v.message for v in got.violations) == sorted(
+                v.message for v in expected.violations
+            ), name
+
+    def test_cross_layer_violation_propagates_to_dependents(self):
+        """A violation deep in the graph appears in every ancestor's closure.
+
+        MOCKS: controller (MagicMock)
+        """
+        tool = _make_module("dev_tool", layer=ModuleLayer.DEV)
+        lib = _make_module("runtime_lib", layer=ModuleLayer.RUNTIME)
+        app = _make_module("runtime_app", layer=ModuleLayer.RUNTIME)
+        controller = _build_controller(
+            [app, lib, tool],
+            {"runtime_app": ["runtime-lib", "rich"], "runtime_lib": ["dev-tool"], "dev_tool": []},
+        )
+
+        walker = DependencyWalker(controller)
+        closures = walker.analyze_all()
+
+        assert [v.source_module for v in closures["runtime_app"].violations] == ["runtime_lib"]
+        assert closures["runtime_app"].external_deps == {"rich"}
+        assert not closures["dev_tool"].has_violations
+        self._assert_matches_walk(walker, ["runtime_app", "runtime_lib", "dev_tool"])
+
+    def test_cycles_share_closure(self):
+        """Modules in a cycle each reach the whole cycle, including themselves.
+
+        MOCKS: controller (MagicMock)
+        """
+        a = _make_module("alpha")
+        b = _make_module("bravo")
+        c = _make_module("charlie")
+        controller = _build_controller(
+            [a, b, c],
+            {"alpha": ["bravo"], "bravo": ["alpha", "charlie"], "charlie": []},
+        )
+
+        walker = DependencyWalker(controller)
+        closures = walker.analyze_all()
+
+        assert closures["alpha"].adhd_deps == {"alpha", "bravo", "charlie"}
+        self._assert_matches_walk(walker, ["alpha", "bravo", "charlie"])
+
+    def test_random_graphs_match_walk(self):
+        """Randomised DAGs and cyclic graphs agree with walk_dependencies.
+
+        MOCKS: controller (MagicMock)
+        """
+        import random
+
+        rng = random.Random(1234)
+        layers = list(ModuleLayer)
+        for _ in range(25):
+            count = rng.randint(1, 12)
+            names = [f"mod_{i}" for i in range(count)]
+            modules = [_make_module(n, layer=rng.choice(layers)) for n in names]
+            dep_map = {
+                n: rng.sample(names + ["ext-a", "ext-b"], rng.randint(0, min(4, count)))
+                for n in names
+            }
+            walker = DependencyWalker(_build_controller(modules, dep_map))
+            self._assert_matches_walk(walker, names)
@@ -0,0 +1,136 @@
+"""Tests for batched git state lookup (collect_git_states, parse_porcelain_v2).
+
+Uses real git repositories under tmp_path; skipped when git is unavailable.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from modules_controller_core.git_state import collect_git_states, parse_porcelain_v2
+from modules_controller_core.module_filter import FilterMode, GitState, ModuleFilter
+from modules_controller_core.modules_controller import ModuleInfo, ModulesReport
+from modules_controller_core.module_types import ModuleLayer
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+        cwd=str(cwd), check=True, capture_output=True,
+    )
+
+
+def _make_module(root: Path, name: str) -> ModuleInfo:
+    module_dir = root / "modules" / "dev" / name
+    module_dir.mkdir(parents=True)
+    (module_dir / "main.py").write_text("x = 1\n")
+    return ModuleInfo(name=name, version="1.0.0", layer=ModuleLayer.DEV, path=module_dir)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Monorepo with three committed modules plus a pushed upstream."""
+    remote = tmp_path / "remote.git"
+    root = tmp_path / "project"
+    root.mkdir()
+    _git(tmp_path, "init", "-q", "--bare", str(remote))
+    _git(root, "init", "-q", "-b", "main")
+    modules = [_make_module(root, n) for n in ("alpha", "bravo", "charlie")]
+    _git(root, "add", ".")
+    _git(root, "commit", "-qm", "init")
+    _git(root, "remote", "add", "origin", str(remote))
+    _git(root, "push", "-q", "-u", "origin", "main")
+    return root, {m.name: m for m in modules}
+
+
+# ── tests ───────────────────────────────────────────────────────────────────
+
+
+class TestParsePorcelainV2:
+    """Parsing of NUL-separated porcelain v2 output."""
+
+    def test_branch_headers_and_entries(self):
+        output = (
+            "# branch.oid abc\0# branch.head main\0# branch.upstream origin/main\0"
+            "# branch.ab +2 -1\0"
+            "1 .M N... 100644 100644 100644 aaa bbb dir/file name.py\0"
+            "2 R. N... 100644 100644 100644 aaa bbb R100 new.py\0old.py\0"
+            "? untracked/\0"
+        ).encode()
+
+        status = parse_porcelain_v2(output)
+
+        assert status.branch == "main"
+        assert status.has_upstream
+        assert (status.ahead, status.behind) == (2, 1)
+        assert status.entries == [(".M", "dir/file name.py"), ("R.", "new.py"), ("??", "untracked/")]
+
+    def test_detached_head(self):
+        status = parse_porcelain_v2(b"# branch.head (detached)\0")
+        assert status.branch == "HEAD"
+        assert not status.is_dirty
+
+
+class TestCollectGitStates:
+    """State bucketing across monorepo and separate-repo modules."""
+
+    def test_clean_repo(self, project):
+        root, modules = project
+        states = collect_git_states(list(modules.values()), root)
+        assert states == {name: GitState.CLEAN for name in modules}
+
+    def test_dirty_and_untracked_bucketed_by_module(self, project):
+        root, modules = project
+        (modules["alpha"].path / "main.py").write_text("x = 2\n")
+        (modules["bravo"].path / "new_file.py").write_text("y = 1\n")
+
+        states = collect_git_states(list(modules.values()), root)
+
+        assert states["alpha"] == GitState.DIRTY
+        assert states["bravo"] == GitState.DIRTY
+        assert states["charlie"] == GitState.CLEAN
+
+    def test_unpushed_commit_attributed_to_touched_module(self, project):
+        root, modules = project
+        (modules["charlie"].path / "main.py").write_text("x = 3\n")
+        _git(root, "commit", "-qam", "touch charlie")
+
+        states = collect_git_states(list(modules.values()), root)
+
+        assert states["charlie"] == GitState.UNPUSHED
+        assert states["alpha"] == GitState.CLEAN
+
+    def test_separate_repository_module(self, project):
+        root, modules = project
+        nested = _make_module(root, "nested")
+        _git(nested.path, "init", "-q")
+        _git(nested.path, "add", ".")
+        _git(nested.path, "commit", "-qm", "init")
+        (nested.path / "main.py").write_text("x = 9\n")
+
+        states = collect_git_states([*modules.values(), nested], root)
+
+        assert states["nested"] == GitState.DIRTY
+        assert states["alpha"] == GitState.CLEAN
+
+    def test_outside_git_has_no_state(self, tmp_path):
+        module = _make_module(tmp_path / "plain", "loose")
+        assert collect_git_states([module], tmp_path / "plain") == {}
+
+    def test_report_format_applies_state_filter(self, project):
+        root, modules = project
+        (modules["bravo"].path / "main.py").write_text("x = 2\n")
+        report = ModulesReport(modules=list(modules.values()), root_path=root)
+        module_filter = ModuleFilter.from_args(FilterMode.INCLUDE, ["dirty"])
+
+        output = report.format(module_filter)
+
+        assert "Found 1 modules" in output
+        assert "bravo" in output
@@ -0,0 +1,138 @@
+"""Tests for in-process refresh script execution (adhd refresh --inprocess).
+
+Builds throwaway module packages under tmp_path; each test uses a unique
+package name so sys.modules entries never collide.
+"""
+
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+from exceptions_core import ADHDError
+from modules_controller_core.modules_controller import ModuleInfo, ModulesController
+from modules_controller_core.module_types import ModuleLayer
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def project(tmp_path):
+    saved_path = list(sys.path)
+    saved_modules = set(sys.modules)
+    yield tmp_path
+    sys.path[:] = saved_path
+    for name in set(sys.modules) - saved_modules:
+        del sys.modules[name]
+
+
+def _make_module(root: Path, script: str, *, script_name: str = "refresh.py") -> ModuleInfo:
+    name = f"inproc_{uuid.uuid4().hex[:8]}"
+    module_dir = root / "modules" / "foundation" / name
+    module_dir.mkdir(parents=True)
+    (module_dir / "__init__.py").write_text("")
+    (module_dir / "helper.py").write_text("VALUE = 'relative-ok'\n")
+    (module_dir / script_name).write_text(script)
+    return ModuleInfo(name=name, version="1.0.0", layer=ModuleLayer.FOUNDATION, path=module_dir)
+
+
+PID_SCRIPT = """\
+import os
+from .helper import VALUE
+
+def main():
+    with open("marker.txt", "w") as f:
+        f.write(f"{os.getpid()} {VALUE}")
+"""
+
+
+# ── tests ───────────────────────────────────────────────────────────────────
+
+
+class TestInprocessRefresh:
+    """Scripts run in the current interpreter with isolated failures."""
+
+    def test_runs_in_current_process_with_project_cwd(self, project):
+        module = _make_module(project, PID_SCRIPT)
+        cwd_before = os.getcwd()
+
+        ModulesController(project).run_module_refresh_script(module, inprocess=True)
+
+        pid, value = (project / "marker.txt").read_text().split()
+        assert int(pid) == os.getpid()
+        assert value == "relative-ok"
+        assert os.getcwd() == cwd_before
+
+    def test_alternate_entry_point(self, project):
+        module = _make_module(
+            project,
+            "def refresh():\n    open('marker.txt', 'w').write('refresh')\n",
+            script_name="refresh_full.py",
+        )
+
+        ModulesController(project).run_module_refresh_full_script(module, inprocess=True)
+
+        assert (project / "marker.txt").read_text() == "refresh"
+
+    def test_exception_becomes_adhd_error(self, project):
+        module = _make_module(project, "def main():\n    raise RuntimeError('boom')\n")
+
+        with pytest.raises(ADHDError, match="refresh.py failed for .*boom"):
+            ModulesController(project).run_module_refresh_script(module, inprocess=True)
+
+    def test_nonzero_system_exit_becomes_adhd_error(self, project):
+        module = _make_module(project, "import sys\ndef main():\n    sys.exit(2)\n")
+
+        with pytest.raises(ADHDError, match="exited with status 2"):
+            ModulesController(project).run_module_refresh_script(module, inprocess=True)
+
+    def test_zero_system_exit_is_success(self, project):
+        module = _make_module(project, "import sys\ndef main():\n    sys.exit(0)\n")
+
+        ModulesController(project).run_module_refresh_script(module, inprocess=True)
+
+    def test_no_entry_point_falls_back_to_subprocess(self, project):
+        module = _make_module(
+            project,
+            "import os\nopen('marker.txt', 'a').write(f'{os.getpid()}\\n')\n",
+        )
+        # Simple script without relative imports runs as a plain file in the subprocess
+        ModulesController(project).run_module_refresh_script(module, inprocess=True)
+
+        pids = (project / "marker.txt").read_text().split()
+        assert len(pids) == 1  # never executed in-process before falling back
+        assert int(pids[0]) != os.getpid()
+
+    def test_each_run_executes_script_afresh(self, project):
+        module = _make_module(
+            project,
+            "open('marker.txt', 'a').write('body\\n')\n\ndef main():\n    open('marker.txt', 'a').write('main\\n')\n",
+        )
+        controller = ModulesController(project)
+
+        controller.run_module_refresh_script(module, inprocess=True)
+        controller.run_module_refresh_script(module, inprocess=True)
+
+        assert (project / "marker.txt").read_text().split() == ["body", "main", "body", "main"]
+
+    def test_edited_helper_is_reloaded(self, project):
+        module = _make_module(project, PID_SCRIPT)
+        controller = ModulesController(project)
+        controller.run_module_refresh_script(module, inprocess=True)
+
+        (module.path / "helper.py").write_text("VALUE = 'edited-helper'\n")
+        controller.run_module_refresh_script(module, inprocess=True)
+
+        assert (project / "marker.txt").read_text().split()[1] == "edited-helper"
+
+    def test_pyproject_flag_opts_module_in(self, project):
+        module = _make_module(project, PID_SCRIPT)
+        module.refresh_inprocess = True
+
+        ModulesController(project)._run_refresh_for_module(module)
+
+        pid, _ = (project / "marker.txt").read_text().split()
+        assert int(pid) == os.getpid()
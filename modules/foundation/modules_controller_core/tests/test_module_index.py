@@ -0,0 +1,137 @@
+"""Tests for the persisted module discovery index used by scan_all_modules.
+
+Uses real pyproject.toml files under tmp_path; no mocks.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from modules_controller_core.modules_controller import ModulesController
+from modules_controller_core.module_index import (
+    INDEX_DATA_DIR,
+    INDEX_FILENAME,
+    INDEX_VERSION,
+    ModuleIndex,
+)
+from modules_controller_core.tests.helpers import write_module
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def project(tmp_path):
+    write_module(tmp_path, "alpha", layer="foundation")
+    write_module(tmp_path, "beta", layer="dev")
+    return tmp_path
+
+
+def _index_file(root: Path) -> Path:
+    return root / INDEX_DATA_DIR / INDEX_FILENAME
+
+
+def _count_parses(controller: ModulesController, **scan_kwargs):
+    """Scan and return (report, number of pyproject.toml parses)."""
+    original = ModulesController.get_module_pyproject
+    calls = []
+
+    def _spy(self, module_path):
+        calls.append(Path(module_path).name)
+        return original(self, module_path)
+
+    with patch.object(ModulesController, "get_module_pyproject", _spy):
+        report = controller.scan_all_modules(**scan_kwargs)
+    return report, calls
+
+
+# ── tests ───────────────────────────────────────────────────────────────────
+
+
+class TestModuleIndex:
+    """Scans reuse cached pyproject data until files change."""
+
+    def test_first_scan_writes_index(self, project):
+        report = ModulesController(project).scan_all_modules()
+
+        assert {m.name for m in report.modules} == {"alpha", "beta"}
+        data = json.loads(_index_file(project).read_text())
+        assert data["version"] == INDEX_VERSION
+        assert set(data["modules"]) == {"modules/foundation/alpha", "modules/dev/beta"}
+
+    def test_second_scan_parses_nothing(self, project):
+        controller = ModulesController(project)
+        controller.scan_all_modules()
+
+        report, parsed = _count_parses(controller)
+
+        assert parsed == []
+        assert {m.name for m in report.modules} == {"alpha", "beta"}
+
+    def test_changed_pyproject_is_reparsed(self, project):
+        controller = ModulesController(project)
+        controller.scan_all_modules()
+        write_module(project, "beta", layer="dev", version="2.0.0-changed")
+
+        report, parsed = _count_parses(controller)
+
+        assert parsed == ["beta"]
+        beta = next(m for m in report.modules if m.name == "beta")
+        assert beta.version == "2.0.0-changed"
+
+    def test_new_and_removed_modules(self, project):
+        controller = ModulesController(project)
+        controller.scan_all_modules()
+        write_module(project, "gamma", layer="runtime")
+        (project / "modules" / "foundation" / "alpha" / "pyproject.toml").unlink()
+
+        report, parsed = _count_parses(controller)
+
+        assert parsed == ["gamma"]
+        assert {m.name for m in report.modules} == {"beta", "gamma"}
+        data = json.loads(_index_file(project).read_text())
+        assert "modules/foundation/alpha" not in data["modules"]
+
+    def test_rescan_ignores_index(self, project):
+        controller = ModulesController(project)
+        controller.scan_all_modules()
+
+        _, parsed = _count_parses(controller, rescan=True)
+
+        assert sorted(parsed) == ["alpha", "beta"]
+
+    def test_corrupt_index_falls_back_to_full_scan(self, project):
+        controller = ModulesController(project)
+        controller.scan_all_modules()
+        _index_file(project).write_text("{not json")
+
+        report, parsed = _count_parses(controller)
+
+        assert sorted(parsed) == ["alpha", "beta"]
+        assert len(report.modules) == 2
+        assert json.loads(_index_file(project).read_text())["version"] == INDEX_VERSION
+
+    def test_invalid_pyproject_cached_as_error(self, project):
+        bad_dir = project / "modules" / "dev" / "broken"
+        bad_dir.mkdir(parents=True)
+        (bad_dir / "pyproject.toml").write_text("[project]\nname = 'broken'\n")  # no [tool.adhd]
+        controller = ModulesController(project)
+        controller.scan_all_modules()
+
+        report, parsed = _count_parses(controller)
+
+        assert parsed == []
+        broken = next(m for m in report.issued_modules if m.name == "broken")
+        assert broken.version == "unknown"
+
+    def test_version_mismatch_discards_entries(self, project):
+        index_file = _index_file(project)
+        index_file.parent.mkdir(parents=True)
+        index_file.write_text(json.dumps({"version": INDEX_VERSION + 1, "modules": {}}))
+
+        index = ModuleIndex(project)
+        index.load()
+
+        assert index.lookup(project / "modules" / "dev" / "beta", (1, 2, 3)) is None
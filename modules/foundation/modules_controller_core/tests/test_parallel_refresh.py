@@ -0,0 +1,86 @@
+"""Tests for ModulesController parallel refresh (adhd refresh --jobs N).
+
+Uses real refresh.py scripts under tmp_path that append to a shared trace file,
+so dependency ordering and output buffering are observed end to end.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from modules_controller_core.modules_controller import ModuleInfo, ModulesController
+from modules_controller_core.module_types import ModuleLayer
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+
+def _make_module(root: Path, name: str, trace: Path, *, requirements=None, fail=False) -> ModuleInfo:
+    module_dir = root / "modules" / "foundation" / name
+    module_dir.mkdir(parents=True)
+    body = [
+        "import time",
+        f"print('start {name}')",
+        "time.sleep(0.05)",
+        f"print('end {name}')",
+        f"with open({str(trace)!r}, 'a') as f: f.write({name!r} + '\\n')",
+    ]
+    if fail:
+        body.append("raise SystemExit(3)")
+    (module_dir / "refresh.py").write_text("\n".join(body) + "\n")
+    return ModuleInfo(
+        name=name,
+        version="1.0.0",
+        layer=ModuleLayer.FOUNDATION,
+        path=module_dir,
+        requirements=requirements or [],
+    )
+
+
+@pytest.fixture
+def controller(tmp_path):
+    return ModulesController(tmp_path)
+
+
+# ── tests ───────────────────────────────────────────────────────────────────
+
+
+class TestParallelRefresh:
+    """_refresh_parallel schedules by dependency and buffers output per module."""
+
+    def test_dependencies_finish_before_dependents(self, controller, tmp_path):
+        trace = tmp_path / "trace.txt"
+        base = _make_module(tmp_path, "base_mod", trace)
+        left = _make_module(tmp_path, "left_mod", trace, requirements=["base-mod"])
+        right = _make_module(tmp_path, "right_mod", trace, requirements=["base-mod"])
+        top = _make_module(tmp_path, "top_mod", trace, requirements=["left-mod", "right-mod"])
+
+        controller._refresh_parallel([top, right, left, base], full=False, jobs=4)
+
+        order = trace.read_text().split()
+        assert order[0] == "base_mod"
+        assert set(order[1:3]) == {"left_mod", "right_mod"}
+        assert order[3] == "top_mod"
+
+    def test_output_is_not_interleaved(self, controller, tmp_path, capsys):
+        trace = tmp_path / "trace.txt"
+        modules = [_make_module(tmp_path, f"mod_{i}", trace) for i in range(4)]
+
+        controller._refresh_parallel(modules, full=False, jobs=4)
+
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+        assert len(lines) == 8
+        for i in range(0, 8, 2):
+            name = lines[i].split()[1]
+            assert lines[i] == f"start {name}"
+            assert lines[i + 1] == f"end {name}"
+
+    def test_failure_is_logged_and_dependents_still_run(self, controller, tmp_path, caplog):
+        trace = tmp_path / "trace.txt"
+        bad = _make_module(tmp_path, "bad_mod", trace, fail=True)
+        child = _make_module(tmp_path, "child_mod", trace, requirements=["bad-mod"])
+
+        controller._refresh_parallel([child, bad], full=False, jobs=2)
+
+        assert trace.read_text().split() == ["bad_mod", "child_mod"]
+        assert "refresh.py failed for bad_mod" in caplog.text
@@ -1,7 +1,8 @@
 """Tests for refresh_order — dependency-based module ordering for refresh.
 
 Tests sort_modules_for_refresh() for happy path, no-deps modules,
-cross-layer deps, and external dep filtering.
+cross-layer deps, and external dep filtering, plus prepare_refresh_sorter()
+scheduling.
 """
 
 import pytest
@@ -9,7 +10,8 @@ from pathlib import Path
 
 from modules_controller_core.modules_controller import ModuleInfo
 from modules_controller_core.module_types import ModuleLayer
-from modules_controller_core.refresh_order import sort_modules_for_refresh
+from modules_controller_core.refresh_order import prepare_refresh_sorter, sort_modules_for_refresh
+from exceptions_core import ADHDError
 
 
 def _make_module(
@@ -165,3 +167,33 @@ class TestSortModulesForRefresh:
         names = [m.name for m in result]
 
         assert names == ["base_mod", "dependent_mod"]
+
+
+class TestPrepareRefreshSorter:
+    """Test the incremental get_ready()/done() scheduling helper."""
+
+    def test_ready_batches_follow_dependencies(self):
+        """Independent modules are ready together; dependents wait for done()."""
+        d = _make_module("mod_d")
+        b = _make_module("mod_b", requirements=["mod-d"])
+        c = _make_module("mod_c", requirements=["mod-d"])
+        a = _make_module("mod_a", requirements=["mod-b", "mod-c"])
+
+        sorter, name_to_module = prepare_refresh_sorter([a, b, c, d])
+
+        assert set(name_to_module) == {"mod_a", "mod_b", "mod_c", "mod_d"}
+        assert set(sorter.get_ready()) == {"mod_d"}
+        sorter.done("mod_d")
+        assert set(sorter.get_ready()) == {"mod_b", "mod_c"}
+        sorter.done("mod_b")
+        assert sorter.get_ready() == ()
+        sorter.done("mod_c")
+        assert sorter.get_ready() == ("mod_a",)
+
+    def test_cycle_raises_adhd_error(self):
+        """Circular dependencies surface as ADHDError at prepare time."""
+        a = _make_module("mod_a", requirements=["mod-b"])
+        b = _make_module("mod_b", requirements=["mod-a"])
+
+        with pytest.raises(ADHDError, match="Circular dependency"):
+            prepare_refresh_sorter([a, b])
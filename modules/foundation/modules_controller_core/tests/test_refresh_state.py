@@ -0,0 +1,139 @@
+"""Tests for incremental refresh fingerprints (IncrementalRefresh).
+
+Uses real module directories under tmp_path; refresh scripts append to a
+trace file so the integration tests can count which modules actually ran.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from modules_controller_core.modules_controller import ModuleInfo, ModulesController
+from modules_controller_core.module_types import ModuleLayer
+from modules_controller_core.refresh_state import (
+    STATE_FILENAME,
+    IncrementalRefresh,
+    hash_module_tree,
+)
+from modules_controller_core.module_index import INDEX_DATA_DIR
+from modules_controller_core.tests.helpers import write_module
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+
+def _module_info(module_dir: Path, deps: list[str] | None = None) -> ModuleInfo:
+    return ModuleInfo(
+        name=module_dir.name,
+        version="1.0.0",
+        layer=ModuleLayer.FOUNDATION,
+        path=module_dir,
+        requirements=deps or [],
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    trace = tmp_path / "trace.txt"
+    write_module(tmp_path, "base_mod", trace=trace)
+    write_module(tmp_path, "mid_mod", trace=trace, deps=["base-mod"])
+    write_module(tmp_path, "leaf_mod", trace=trace)
+    return tmp_path, trace
+
+
+def _refresh(root: Path, **kwargs) -> list[str]:
+    """Run a full-project refresh and return the modules whose scripts ran."""
+    trace = root / "trace.txt"
+    trace.write_text("")
+    controller = ModulesController(root)
+    controller.scan_all_modules()
+    controller.refresh(skip_sync=True, **kwargs)
+    return trace.read_text().split()
+
+
+# ── tests ───────────────────────────────────────────────────────────────────
+
+
+class TestHashModuleTree:
+    """Tree hashing covers content and paths but skips caches."""
+
+    def test_content_change_changes_hash(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        before = hash_module_tree(tmp_path)
+        (tmp_path / "a.py").write_text("x = 2\n")
+        assert hash_module_tree(tmp_path) != before
+
+    def test_pycache_and_hidden_ignored(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        before = hash_module_tree(tmp_path)
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "a.cpython-311.pyc").write_bytes(b"\0")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref")
+        assert hash_module_tree(tmp_path) == before
+
+
+class TestIncrementalRefresh:
+    """Fingerprints decide which modules are skipped."""
+
+    def test_second_run_skips_everything(self, project):
+        root, _ = project
+        assert sorted(_refresh(root)) == ["base_mod", "leaf_mod", "mid_mod"]
+        assert _refresh(root) == []
+        assert (root / INDEX_DATA_DIR / STATE_FILENAME).exists()
+
+    def test_dependency_change_refreshes_dependents_only(self, project):
+        root, _ = project
+        _refresh(root)
+        (root / "modules" / "foundation" / "base_mod" / "extra.py").write_text("y = 1\n")
+
+        assert _refresh(root) == ["base_mod", "mid_mod"]
+
+    def test_force_runs_everything(self, project):
+        root, _ = project
+        _refresh(root)
+        assert sorted(_refresh(root, force=True)) == ["base_mod", "leaf_mod", "mid_mod"]
+
+    def test_parallel_mode_is_incremental(self, project):
+        root, _ = project
+        _refresh(root, jobs=3)
+        (root / "modules" / "foundation" / "leaf_mod" / "extra.py").write_text("z = 1\n")
+
+        assert _refresh(root, jobs=3) == ["leaf_mod"]
+
+    def test_failed_module_is_retried(self, project):
+        root, trace = project
+        script = root / "modules" / "foundation" / "leaf_mod" / "refresh.py"
+        script.write_text(script.read_text() + "raise SystemExit(1)\n")
+        _refresh(root)
+
+        assert _refresh(root) == ["leaf_mod"]
+
+    def test_full_tier_tracked_separately(self, project):
+        root, trace = project
+        full_script = root / "modules" / "foundation" / "leaf_mod" / "refresh_full.py"
+        full_script.write_text(f"with open({str(trace)!r}, 'a') as f: f.write('leaf_full\\n')\n")
+        _refresh(root)
+
+        assert _refresh(root, full=True) == ["leaf_mod", "leaf_full"]
+        assert _refresh(root, full=True) == []
+        assert _refresh(root) == []
+
+    def test_corrupt_state_treated_as_empty(self, project):
+        root, _ = project
+        _refresh(root)
+        (root / INDEX_DATA_DIR / STATE_FILENAME).write_text("[]")
+
+        assert sorted(_refresh(root)) == ["base_mod", "leaf_mod", "mid_mod"]
+
+    def test_fingerprint_includes_dependencies(self, project):
+        root, _ = project
+        foundation = root / "modules" / "foundation"
+        base = _module_info(foundation / "base_mod")
+        mid = _module_info(foundation / "mid_mod", deps=["base-mod"])
+
+        before = IncrementalRefresh(root, [base, mid]).fingerprint("mid_mod")
+        (foundation / "base_mod" / "extra.py").write_text("y = 1\n")
+        after = IncrementalRefresh(root, [base, mid]).fingerprint("mid_mod")
+
+        assert before != after
@@ -0,0 +1,125 @@
+"""Tests for refresh timing capture, history and profiling (RefreshTimer)."""
+
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+
+from modules_controller_core.modules_controller import ModuleInfo, ModulesController
+from modules_controller_core.module_index import INDEX_DATA_DIR
+from modules_controller_core.module_types import ModuleLayer
+from modules_controller_core.refresh_timing import (
+    HISTORY_LIMIT,
+    TIMINGS_FILENAME,
+    RefreshTimer,
+    ScriptTiming,
+    resource,
+)
+from modules_controller_core.tests.helpers import write_module
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+
+BUSY_SCRIPT = """\
+def spin():
+    return sum(i * i for i in range(200_000))
+
+spin()
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    write_module(tmp_path, "busy_mod", script=BUSY_SCRIPT)
+    write_module(tmp_path, "broken_mod", script="raise SystemExit(3)\n")
+    return tmp_path
+
+
+def _refresh(root: Path, **kwargs) -> None:
+    controller = ModulesController(root)
+    controller.scan_all_modules()
+    controller.refresh(skip_sync=True, force=True, **kwargs)
+
+
+def _history(root: Path) -> dict:
+    return json.loads((root / INDEX_DATA_DIR / TIMINGS_FILENAME).read_text())
+
+
+# ── tests ───────────────────────────────────────────────────────────────────
+
+
+class TestRefreshTimer:
+    """Measurement, history and summary formatting."""
+
+    def test_measure_records_failure(self, tmp_path):
+        timer = RefreshTimer(tmp_path)
+        module = ModuleInfo(name="m", version="1", layer=ModuleLayer.DEV, path=tmp_path)
+
+        with pytest.raises(RuntimeError):
+            with timer.measure(module, tmp_path / "refresh.py"):
+                raise RuntimeError("boom")
+
+        assert [(t.module, t.script, t.ok) for t in timer.timings] == [("m", "refresh.py", False)]
+
+    def test_concurrent_records_wall_only(self, tmp_path):
+        timer = RefreshTimer(tmp_path, concurrent=True)
+        module = ModuleInfo(name="m", version="1", layer=ModuleLayer.DEV, path=tmp_path)
+
+        with timer.measure(module, tmp_path / "refresh.py"):
+            pass
+
+        assert timer.timings[0].cpu is None
+        assert timer.timings[0].peak_rss_kb is None
+
+    def test_history_is_capped(self, tmp_path):
+        for _ in range(HISTORY_LIMIT + 3):
+            timer = RefreshTimer(tmp_path)
+            timer.timings.append(ScriptTiming(module="m", script="refresh.py", wall=1.0))
+            timer.save()
+
+        assert len(_history(tmp_path)["runs"]) == HISTORY_LIMIT
+
+    def test_summary_flags_regressions(self, tmp_path):
+        timer = RefreshTimer(tmp_path)
+        timer.timings = [
+            ScriptTiming(module="slow", script="refresh.py", wall=3.0),
+            ScriptTiming(module="steady", script="refresh.py", wall=1.0),
+        ]
+        previous = {("slow", "refresh.py"): 1.0, ("steady", "refresh.py"): 1.0}
+
+        lines = timer.format_summary(previous).splitlines()
+
+        slow_line = next(line for line in lines if line.strip().startswith("slow"))
+        steady_line = next(line for line in lines if line.strip().startswith("steady"))
+        assert "slower" in slow_line
+        assert "slower" not in steady_line
+
+
+class TestRefreshTimingIntegration:
+    """adhd refresh records timings for every script that ran."""
+
+    def test_refresh_writes_history(self, project):
+        _refresh(project)
+
+        (run,) = _history(project)["runs"]
+        by_module = {t["module"]: t for t in run["timings"]}
+        assert by_module["busy_mod"]["ok"] is True
+        assert by_module["broken_mod"]["ok"] is False
+        if resource is not None:
+            assert by_module["busy_mod"]["cpu"] > 0
+
+    def test_profile_writes_prof_per_module(self, project):
+        _refresh(project, profile=True)
+
+        prof = project / INDEX_DATA_DIR / "profiles" / "busy_mod.refresh.prof"
+        stats = pstats.Stats(str(prof))
+        assert any(func[2] == "spin" for func in stats.stats)
+
+    def test_parallel_refresh_is_timed(self, project):
+        _refresh(project, jobs=2)
+
+        (run,) = _history(project)["runs"]
+        assert run["jobs"] == 2
+        assert {t["module"] for t in run["timings"]} == {"busy_mod", "broken_mod"}
@@ -0,0 +1,210 @@
+"""Tests for adhd refresh --watch (RefreshWatcher).
+
+Uses real module directories under tmp_path; refresh scripts append to a
+trace file so tests can see which modules ran and in what order. Time is
+driven by a fake clock, so no test actually sleeps.
+"""
+
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+from modules_controller_core.modules_controller import ModulesController
+from modules_controller_core.refresh_watcher import RefreshWatcher, diff_snapshots, snapshot_tree
+from modules_controller_core.tests.helpers import write_module
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def project(tmp_path):
+    trace = tmp_path / "trace.txt"
+    trace.write_text("")
+    write_module(tmp_path, "base_mod", trace=trace)
+    write_module(tmp_path, "mid_mod", trace=trace, deps=["base-mod"])
+    write_module(tmp_path, "top_mod", trace=trace, deps=["mid-mod"])
+    write_module(tmp_path, "leaf_mod", trace=trace)
+    return tmp_path, trace
+
+
+def _watcher(root: Path, clock: FakeClock | None = None) -> RefreshWatcher:
+    clock = clock or FakeClock()
+    controller = ModulesController(root)
+    controller.scan_all_modules()
+    return RefreshWatcher(controller, interval=0.1, debounce=0.3, clock=clock, sleep=clock.sleep)
+
+
+def _ran(trace: Path) -> list[str]:
+    return trace.read_text().split()
+
+
+# ── tests ───────────────────────────────────────────────────────────────────
+
+
+class TestSnapshots:
+    """Polling snapshots detect edits, additions and deletions."""
+
+    def test_diff_detects_all_change_kinds(self, tmp_path):
+        (tmp_path / "keep.py").write_text("a")
+        (tmp_path / "edit.py").write_text("a")
+        (tmp_path / "gone.py").write_text("a")
+        before = snapshot_tree(tmp_path)
+        (tmp_path / "edit.py").write_text("bb")
+        (tmp_path / "gone.py").unlink()
+        (tmp_path / "new.py").write_text("a")
+
+        changed = diff_snapshots(before, snapshot_tree(tmp_path))
+
+        assert {Path(p).name for p in changed} == {"edit.py", "gone.py", "new.py"}
+
+    def test_caches_and_hidden_files_ignored(self, tmp_path):
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "x.pyc").write_bytes(b"\0")
+        (tmp_path / ".hidden").write_text("a")
+        assert snapshot_tree(tmp_path) == {}
+
+
+class TestAffectedModules:
+    """Changed paths map to owners plus transitive dependents."""
+
+    def test_change_refreshes_module_and_dependents_in_order(self, project):
+        root, trace = project
+        watcher = _watcher(root)
+        changed = str(root / "modules" / "foundation" / "base_mod" / "data.flow")
+
+        names = [m.name for m in watcher.affected_modules([changed])]
+
+        assert names == ["base_mod", "mid_mod", "top_mod"]
+
+    def test_leaf_change_touches_only_leaf(self, project):
+        root, _ = project
+        watcher = _watcher(root)
+        changed = str(root / "modules" / "foundation" / "leaf_mod" / "x.py")
+
+        assert [m.name for m in watcher.affected_modules([changed])] == ["leaf_mod"]
+
+    def test_new_module_triggers_rescan(self, project):
+        root, trace = project
+        watcher = _watcher(root)
+        write_module(root, "fresh_mod", trace=trace, deps=["leaf-mod"])
+
+        names = [m.name for m in watcher.affected_modules(watcher.poll())]
+
+        assert names == ["fresh_mod"]
+
+
+class TestWatchLoop:
+    """Debounced polling runs one batch per burst of changes."""
+
+    def test_burst_is_debounced_into_one_batch(self, project):
+        root, trace = project
+        clock = FakeClock()
+        watcher = _watcher(root, clock)
+        mid = root / "modules" / "foundation" / "mid_mod"
+        (mid / "a.py").write_text("1")
+        (mid / "b.py").write_text("2")
+
+        watcher.watch(max_batches=1)
+
+        assert _ran(trace) == ["mid_mod", "top_mod"]
+        assert clock.now >= 0.3
+
+    def test_script_writes_do_not_retrigger(self, project):
+        root, trace = project
+        leaf = root / "modules" / "foundation" / "leaf_mod"
+        (leaf / "refresh.py").write_text(
+            f"open({str(leaf / 'generated.py')!r}, 'a').write('x')\n"
+            f"open({str(trace)!r}, 'a').write('leaf_mod\\n')\n"
+        )
+        watcher = _watcher(root)
+        (leaf / "input.py").write_text("1")
+
+        watcher.watch(max_batches=1)
+
+        assert _ran(trace) == ["leaf_mod"]
+        assert watcher.poll() == set()
+
+    def test_edit_during_batch_triggers_next_batch(self, project, monkeypatch):
+        root, trace = project
+        watcher = _watcher(root)
+        leaf = root / "modules" / "foundation" / "leaf_mod"
+        run_refresh = watcher.controller._run_refresh_for_module
+
+        def run_and_edit_leaf(module, **kwargs):
+            if module.name == "mid_mod":
+                (leaf / "saved_mid_batch.py").write_text("1")
+            return run_refresh(module, **kwargs)
+
+        monkeypatch.setattr(watcher.controller, "_run_refresh_for_module", run_and_edit_leaf)
+        (root / "modules" / "foundation" / "mid_mod" / "a.py").write_text("1")
+
+        watcher.watch(max_batches=1)
+        changed = watcher.poll()
+
+        assert _ran(trace) == ["mid_mod", "top_mod"]
+        assert {Path(p).name for p in changed} == {"saved_mid_batch.py"}
+        assert watcher.refresh_changed(changed) == ["leaf_mod"]
+
+
+class TestInprocessWatch:
+    """Watch mode with --inprocess picks up edited refresh scripts and helpers."""
+
+    @pytest.fixture
+    def inproc_project(self, project):
+        root, trace = project
+        saved_path, saved_modules = list(sys.path), set(sys.modules)
+        name = f"watch_{uuid.uuid4().hex[:8]}"
+        module_dir = write_module(root, name, trace=trace)
+        (module_dir / "__init__.py").write_text("")
+        (module_dir / "helper.py").write_text("LABEL = 'helper-v1'\n")
+        self._write_script(module_dir, trace, "script-v1")
+        yield root, trace, module_dir
+        sys.path[:] = saved_path
+        for module_name in set(sys.modules) - saved_modules:
+            del sys.modules[module_name]
+
+    @staticmethod
+    def _write_script(module_dir: Path, trace: Path, label: str) -> None:
+        (module_dir / "refresh.py").write_text(
+            "import os\nfrom .helper import LABEL\n\n"
+            "def main():\n"
+            f"    open({str(trace)!r}, 'a').write(f'{label} {{LABEL}} {{os.getpid()}}\\n')\n"
+        )
+
+    def test_edits_between_passes_run_new_code(self, inproc_project):
+        root, trace, module_dir = inproc_project
+        controller = ModulesController(root)
+        controller.scan_all_modules()
+        clock = FakeClock()
+        watcher = RefreshWatcher(controller, inprocess=True, interval=0.1, debounce=0.3,
+                                 clock=clock, sleep=clock.sleep)
+
+        (module_dir / "input.py").write_text("1")
+        watcher.watch(max_batches=1)
+        self._write_script(module_dir, trace, "script-v2")
+        watcher.watch(max_batches=1)
+        (module_dir / "helper.py").write_text("LABEL = 'helper-v2'\n")
+        watcher.watch(max_batches=1)
+
+        pid = os.getpid()
+        assert trace.read_text().splitlines() == [
+            f"script-v1 helper-v1 {pid}",
+            f"script-v2 helper-v1 {pid}",
+            f"script-v2 helper-v2 {pid}",
+        ]
+